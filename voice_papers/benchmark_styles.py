@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Script to benchmark the render cost of the waveform styles and backgrounds."""
+
+import sys
+import click
+from pathlib import Path
+from voice_papers.video.benchmark import (
+    DEFAULT_TOLERANCE,
+    benchmark_cases,
+    compare_results,
+    load_results,
+    run_benchmark,
+    save_results,
+)
+
+
+def _split(value: str) -> list:
+    return (
+        [name.strip() for name in value.split(",") if name.strip()] if value else None
+    )
+
+
+@click.command()
+@click.option(
+    "--styles",
+    "-w",
+    help="Comma-separated waveform styles to measure (default: all)",
+)
+@click.option(
+    "--backgrounds",
+    "-b",
+    help="Comma-separated dynamic backgrounds to measure (default: all)",
+)
+@click.option(
+    "--orientation",
+    type=click.Choice(["vertical", "horizontal", "both"]),
+    default="both",
+    help="Orientation(s) to render",
+)
+@click.option(
+    "--full-matrix",
+    is_flag=True,
+    help="Measure every style over every background instead of each on its own",
+)
+@click.option("--frames", type=int, default=30, help="Timed frames per case")
+@click.option("--warmup", type=int, default=5, help="Untimed frames rendered first")
+@click.option(
+    "--background-scale",
+    type=float,
+    default=1.0,
+    help="Resolution scale of the dynamic backgrounds (as in create_video.py)",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(path_type=Path),
+    default=Path("benchmark_results.json"),
+    help="JSON file the results are written to",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, path_type=Path),
+    help="Earlier results to compare against; exits with 1 on regressions",
+)
+@click.option(
+    "--tolerance",
+    type=float,
+    default=DEFAULT_TOLERANCE,
+    help="Allowed ms/frame slowdown over the baseline (0.25 = 25%)",
+)
+def main(
+    styles,
+    backgrounds,
+    orientation,
+    full_matrix,
+    frames,
+    warmup,
+    background_scale,
+    output,
+    baseline,
+    tolerance,
+):
+    """Measure ms/frame, allocations and peak RSS of each render style."""
+    orientations = (
+        ("vertical", "horizontal") if orientation == "both" else (orientation,)
+    )
+    cases = benchmark_cases(
+        _split(styles), _split(backgrounds), orientations, full_matrix
+    )
+
+    click.echo(f"🏁 Benchmarking {len(cases)} cases, {frames} frames each")
+    results = run_benchmark(cases, frames, warmup, background_scale)
+    save_results(
+        results,
+        output,
+        frames=frames,
+        warmup=warmup,
+        background_scale=background_scale,
+    )
+    click.echo(f"💾 Results saved to: {output}")
+
+    slowest = sorted(results, key=lambda r: r["ms_per_frame"], reverse=True)[:5]
+    click.echo("🐢 Slowest cases:")
+    for result in slowest:
+        click.echo(
+            f"   {result['ms_per_frame']:8.1f} ms/frame  {result['waveform_style']}"
+            f" / {result['dynamic_background']} / {result['orientation']}"
+        )
+
+    if baseline:
+        regressions = compare_results(results, load_results(baseline), tolerance)
+        if not regressions:
+            click.echo(f"✅ No regressions against {baseline}")
+            return
+        click.echo(f"❌ {len(regressions)} regressions against {baseline}:")
+        for regression in regressions:
+            click.echo(
+                f"   {regression['waveform_style']} / "
+                f"{regression['dynamic_background']} / {regression['orientation']}: "
+                f"{regression['baseline_ms']:.1f} -> "
+                f"{regression['ms_per_frame']:.1f} ms/frame (x{regression['ratio']})"
+            )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -152,6 +152,17 @@ from voice_papers.video import create_vertical_video, create_horizontal_video
     is_flag=True,
     help="Create a 10-second preview instead of full video",
 )
+@click.option(
+    "--proxy",
+    is_flag=True,
+    help="Fast low-resolution draft for trying styles and palettes: same rendering, encoded at --proxy-scale of the size, 12 fps, ultrafast preset",
+)
+@click.option(
+    "--proxy-scale",
+    default=0.33,
+    type=click.FloatRange(0.1, 1.0),
+    help="Fraction of the output resolution used by --proxy",
+)
 @click.option(
     "--particle-colors",
     "--pc",
@@ -205,6 +216,70 @@ from voice_papers.video import create_vertical_video, create_horizontal_video
     "--pcc",
     help="Colores personalizados para partículas como valores RGB separados por comas: '255,0,0,0,255,0,0,0,255' para gradiente rojo-verde-azul",
 )
+@click.option(
+    "--workers",
+    "-j",
+    default=1,
+    type=click.IntRange(min=0),
+    help="Number of parallel render processes (0 = all cores). Each process renders and encodes its own segment of the timeline",
+)
+@click.option(
+    "--output-backend",
+    default="ffmpeg",
+    type=click.Choice(["ffmpeg", "opencv"]),
+    help="ffmpeg: stream raw frames into ffmpeg (single H.264 encode + audio mux). opencv: legacy mp4v temp file re-encoded afterwards",
+)
+@click.option(
+    "--encoder-preset",
+    default="medium",
+    type=click.Choice(
+        [
+            "ultrafast",
+            "superfast",
+            "veryfast",
+            "faster",
+            "fast",
+            "medium",
+            "slow",
+            "slower",
+            "veryslow",
+        ]
+    ),
+    help="libx264 encoder preset",
+)
+@click.option(
+    "--crf",
+    default=23,
+    type=click.IntRange(0, 51),
+    help="libx264 constant rate factor (lower = better quality, bigger file)",
+)
+@click.option(
+    "--encoder-threads",
+    default=0,
+    type=click.IntRange(min=0),
+    help="libx264 encoder threads (0 = let ffmpeg decide)",
+)
+@click.option(
+    "--no-feature-cache",
+    is_flag=True,
+    help="Re-analyse the audio instead of using the cached features next to it",
+)
+@click.option(
+    "--no-background-cache",
+    is_flag=True,
+    help="Rebuild the static background instead of reusing the cached one (projects/background_cache, or $BACKGROUND_CACHE_DIR)",
+)
+@click.option(
+    "--background-scale",
+    default=1.0,
+    type=click.FloatRange(0.1, 1.0),
+    help="Compute the dynamic background at this fraction of the output resolution and upscale it (e.g. 0.5 is ~4x cheaper)",
+)
+@click.option(
+    "--render-report",
+    is_flag=True,
+    help="Time each render stage and write p50/p95/max ms per stage, fps and wall time to <output>.render.json",
+)
 def main(
     audio_path: Path,
     output: Path,
@@ -216,9 +291,20 @@ def main(
     dynamic_background: str,
     orientation: str,
     preview: bool,
+    proxy: bool,
+    proxy_scale: float,
     particle_colors: str,
     particle_gradient: str,
     particle_custom_colors: str,
+    workers: int,
+    output_backend: str,
+    encoder_preset: str,
+    crf: int,
+    encoder_threads: int,
+    no_feature_cache: bool,
+    no_background_cache: bool,
+    background_scale: float,
+    render_report: bool,
 ):
     """Create a video from an audio file with animated waveform.
 
@@ -228,8 +314,10 @@ def main(
     # Determine output path
     if not output:
         preview_suffix = "_preview" if preview else ""
+        proxy_suffix = "_proxy" if proxy else ""
         output = (
-            audio_path.parent / f"{audio_path.stem}_{orientation}{preview_suffix}.mp4"
+            audio_path.parent
+            / f"{audio_path.stem}_{orientation}{preview_suffix}{proxy_suffix}.mp4"
         )
 
     resolution = "1080x1920" if orientation == "vertical" else "1920x1080"
@@ -244,14 +332,21 @@ def main(
     click.echo(f"🎨  Particle colors: {particle_colors}")
     if dynamic_background != "none":
         click.echo(f"🌊  Dynamic background: {dynamic_background}")
+        if background_scale < 1.0:
+            click.echo(f"🔍  Background computed at {background_scale:.0%} resolution")
     if particle_gradient:
         click.echo(f"🌈  Particle gradient: {particle_gradient}")
     if particle_custom_colors:
         click.echo(f"🎨  Particle custom colors: {particle_custom_colors}")
     if preview:
         click.echo(f"⏱️  Preview mode: 10 seconds maximum")
+    if proxy:
+        click.echo(f"🧪  Proxy mode: draft at {proxy_scale:.0%} resolution, 12 fps")
     if custom_colors:
         click.echo(f"🎨  Custom colors: {custom_colors}")
+    if workers != 1:
+        click.echo(f"⚡  Render workers: {workers if workers else 'all cores'}")
+    click.echo(f"🎞️  Encoder: {output_backend} (libx264 preset={encoder_preset}, crf={crf})")
 
     # Parse custom colors if provided
     parsed_colors = None
@@ -312,6 +407,16 @@ def main(
             particle_color_scheme=particle_colors,
             particle_gradient_style=particle_gradient,
             particle_custom_colors=parsed_particle_colors,
+            workers=workers,
+            output_backend=output_backend,
+            encoder_preset=encoder_preset,
+            crf=crf,
+            encoder_threads=encoder_threads,
+            feature_cache=not no_feature_cache,
+            background_scale=background_scale,
+            proxy_scale=proxy_scale if proxy else None,
+            render_report=render_report,
+            background_cache=not no_background_cache,
         )
     else:
         success = create_vertical_video(
@@ -328,6 +433,16 @@ def main(
             particle_color_scheme=particle_colors,
             particle_gradient_style=particle_gradient,
             particle_custom_colors=parsed_particle_colors,
+            workers=workers,
+            output_backend=output_backend,
+            encoder_preset=encoder_preset,
+            crf=crf,
+            encoder_threads=encoder_threads,
+            feature_cache=not no_feature_cache,
+            background_scale=background_scale,
+            proxy_scale=proxy_scale if proxy else None,
+            render_report=render_report,
+            background_cache=not no_background_cache,
         )
 
     if success:
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Test the per-video-frame audio timeline built from the audio features."""
+
+import math
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add the project to the path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from voice_papers.video.benchmark import synthetic_audio_features
+from voice_papers.video.video_creator import (
+    AUDIO_FEATURE_PARAMS,
+    VerticalVideoCreator,
+)
+
+DURATION = 4.0
+BEAT_INTERVAL = 0.5  # synthetic_audio_features puts a beat every half second
+
+
+def reference_envelope(amplitude: np.ndarray, fps: int, time_constant: float):
+    """The follower written out frame by frame."""
+    coef = math.exp(-1.0 / (time_constant * fps))
+    level = 0.0
+    envelope = []
+    for value in amplitude.tolist():
+        level = coef * level + (1.0 - coef) * value
+        envelope.append(level)
+    return np.asarray(envelope)
+
+
+def test_timeline_aligned_to_fps():
+    """Every track has one entry per video frame at the requested fps."""
+    print("🧪 Testing audio timeline shape and beat alignment...")
+    creator = VerticalVideoCreator()
+    features = synthetic_audio_features(DURATION)
+
+    hop_seconds = AUDIO_FEATURE_PARAMS["hop_length"] / AUDIO_FEATURE_PARAMS["sr"]
+
+    for fps in (creator.fps, 24, 25, 60):
+        timeline = creator.build_audio_timeline(features, fps)
+        frame_count = int(DURATION * fps)
+
+        assert timeline["fps"] == fps
+        for key, dtype in (
+            ("amplitude", np.float32),
+            ("spectral", np.float32),
+            ("beat", np.bool_),
+            ("envelope_fast", np.float32),
+            ("envelope_slow", np.float32),
+        ):
+            track = timeline[key]
+            assert track.shape == (frame_count,), f"{key} at {fps} fps: {track.shape}"
+            assert track.dtype == dtype, f"{key} at {fps} fps: {track.dtype}"
+
+        # Beats are only known to the analysis hop, so a flag may sit up to
+        # half a hop beyond the nearest frame
+        beat_times = np.arange(0, DURATION, BEAT_INTERVAL)
+        beat_frames = np.flatnonzero(timeline["beat"])
+        message = f"beats at {fps} fps land on {beat_frames.tolist()}"
+        assert len(beat_frames) == len(beat_times), message
+        error = np.abs(beat_frames - beat_times * fps).max()
+        assert error <= 0.5 + hop_seconds * fps / 2, message
+        print(f"   {fps} fps: {frame_count} frames, beats on {beat_frames.tolist()}")
+    print("✅ Timeline tracks match the frame grid")
+
+
+def test_envelopes_follow_amplitude():
+    """The followers smooth the amplitude, the slow one more than the fast one."""
+    print("🧪 Testing envelope followers...")
+    creator = VerticalVideoCreator()
+    fps = creator.fps
+    timeline = creator.build_audio_timeline(synthetic_audio_features(DURATION), fps)
+    amplitude = timeline["amplitude"]
+
+    for key, time_constant in (("envelope_fast", 0.15), ("envelope_slow", 0.8)):
+        envelope = timeline[key]
+        expected = reference_envelope(amplitude, fps, time_constant)
+        assert np.allclose(envelope, expected, atol=1e-6), f"{key} differs"
+        assert envelope.min() >= 0.0 and envelope.max() <= 1.0, key
+
+    def roughness(track):
+        return float(np.abs(np.diff(track)).mean())
+
+    fast = roughness(timeline["envelope_fast"])
+    slow = roughness(timeline["envelope_slow"])
+    print(
+        f"   mean step: amplitude {roughness(amplitude):.4f}, "
+        f"fast {fast:.4f}, slow {slow:.4f}"
+    )
+    assert slow < fast < roughness(amplitude), "followers should smooth in order"
+    print("✅ Envelopes follow the amplitude")
+
+
+if __name__ == "__main__":
+    try:
+        test_timeline_aligned_to_fps()
+        test_envelopes_follow_amplitude()
+        print("\n🎉 All audio timeline tests passed!")
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        sys.exit(1)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Smoke test for create_videos(): several outputs from one pass over the audio."""
+
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the project to the path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from voice_papers.video import create_videos
+from voice_papers.video.video_creator import PROXY_FPS, VerticalVideoCreator
+
+DURATION = 1.0
+
+
+def test_shared_background_rendered_once():
+    """Two outputs with the same background render it once per frame."""
+    print("🧪 Testing batch render with a shared dynamic background...")
+    if not shutil.which("ffmpeg"):
+        print("⚠️  ffmpeg not found, skipping")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        audio_path = tmp / "episode.wav"
+        subprocess.run(
+            [
+                "ffmpeg", "-v", "error", "-f", "lavfi",
+                "-i", "sine=frequency=440:duration=2", str(audio_path),
+            ],
+            check=True,
+        )
+
+        # Count the frames handed to the background renderer
+        background_frames = []
+        render_background = VerticalVideoCreator._render_background
+
+        def counting_render_background(self, frame_idx, *args):
+            background_frames.append(frame_idx)
+            return render_background(self, frame_idx, *args)
+
+        outputs = [
+            {
+                "output_path": tmp / "circular.mp4",
+                "waveform_style": "circular",
+                "dynamic_background": "flowing-gradient",
+            },
+            {
+                "output_path": tmp / "sine.mp4",
+                "waveform_style": "sine",
+                "dynamic_background": "flowing-gradient",
+            },
+        ]
+
+        VerticalVideoCreator._render_background = counting_render_background
+        try:
+            success = create_videos(
+                audio_path,
+                outputs,
+                no_unsplash=True,
+                preview_duration=DURATION,
+                feature_cache=False,
+                proxy_scale=0.25,
+                background_cache=False,
+            )
+        finally:
+            VerticalVideoCreator._render_background = render_background
+
+        assert success, "Batch render should succeed"
+        for output in outputs:
+            path = output["output_path"]
+            assert path.exists() and path.stat().st_size > 0, path
+        print("✅ Both outputs written")
+
+        total_frames = int(DURATION * PROXY_FPS)
+        assert background_frames == list(range(total_frames)), background_frames
+        print(f"✅ Shared background rendered once for each of {total_frames} frames")
+
+
+if __name__ == "__main__":
+    try:
+        test_shared_background_rendered_once()
+        print("\n🎉 All batch render tests passed!")
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        sys.exit(1)
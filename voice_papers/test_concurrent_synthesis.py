@@ -0,0 +1,566 @@
+#!/usr/bin/env python3
+"""Test concurrent chunk synthesis and the chunk cache against a local stub of the ElevenLabs API."""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add the project to the path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import httpx
+import requests
+
+from voice_papers.voice.elevenlabs_improved import ElevenLabsImprovedSynthesizer
+from voice_papers.voice.http_clients import (
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_POOL_SIZE,
+    HTTP_TIMEOUT,
+    get_httpx_client,
+    get_requests_session,
+    request_timeout,
+)
+from voice_papers.voice.rate_limiter import DEFAULT_RETRY_POLICY, RetryPolicy
+
+# Seconds the stub takes per request
+LATENCY = 0.3
+
+
+class StubTTSHandler(BaseHTTPRequestHandler):
+    """Answers text-to-speech requests with the chunk text as "audio"."""
+
+    # Keep connections open between requests, as the real API does
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        # One handler per TCP connection
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+
+        with server.lock:
+            server.in_flight += 1
+            server.peak_in_flight = max(server.peak_in_flight, server.in_flight)
+            request_id = f"req-{len(server.requests)}"
+            server.requests.append(
+                {
+                    "request_id": request_id,
+                    "text": body["text"],
+                    "previous_request_ids": body.get("previous_request_ids") or [],
+                    "arrived": time.monotonic(),
+                }
+            )
+            # Scripted error responses are handed out in arrival order
+            error = server.errors.pop(0) if server.errors else None
+        try:
+            time.sleep(LATENCY)
+            if "FAIL" in body["text"] and server.fail_marked:
+                error = (400, {})
+            if error is not None:
+                status, headers = error
+                if status == 429:
+                    server.throttled_at = time.monotonic()
+                detail = b'{"detail": "stub failure"}'
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(detail)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(detail)
+                return
+
+            audio = body["text"].encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "audio/mpeg")
+            self.send_header("Content-Length", str(len(audio)))
+            self.send_header("request-id", request_id)
+            self.send_header("character-cost", str(len(body["text"]) // 2))
+            self.end_headers()
+            self.wfile.write(audio)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server():
+    """Start the stub on a free local port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubTTSHandler)
+    server.lock = threading.Lock()
+    server.connections = 0
+    server.in_flight = 0
+    server.peak_in_flight = 0
+    server.requests = []
+    server.fail_marked = False
+    # (status, headers) answered to the next requests instead of audio
+    server.errors = []
+    server.throttled_at = None
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_synthesizer(server, cache_dir: Path, api_key: str = "test-key"):
+    # Rate limiters are shared per API key; a new key starts a fresh one
+    host, port = server.server_address
+    synth = ElevenLabsImprovedSynthesizer(
+        api_key=api_key, base_url=f"http://{host}:{port}"
+    )
+    # Small chunks so the test text splits into many of them
+    synth.DURATION_BASED_LIMITS = {"default": 120}
+    synth.chunk_cache_dir = cache_dir
+    return synth
+
+
+def make_fast_synthesizer(server, cache_dir: Path, api_key: str):
+    """Synthesizer with a limiter of its own, paced at 20 requests/s."""
+    previous = os.environ.get("ELEVENLABS_REQUESTS_PER_SECOND")
+    os.environ["ELEVENLABS_REQUESTS_PER_SECOND"] = "20"
+    try:
+        return make_synthesizer(server, cache_dir, api_key)
+    finally:
+        if previous is None:
+            del os.environ["ELEVENLABS_REQUESTS_PER_SECOND"]
+        else:
+            os.environ["ELEVENLABS_REQUESTS_PER_SECOND"] = previous
+
+
+def record_limits(limiter):
+    """Log the concurrency cap after every success and 429 seen by ``limiter``."""
+    history = []
+    throttled = threading.Event()
+    on_success, on_throttled = limiter.on_success, limiter.on_throttled
+
+    def success():
+        on_success()
+        history.append(limiter.concurrent_limit)
+
+    def throttle(retry_after=None):
+        on_throttled(retry_after)
+        history.append(limiter.concurrent_limit)
+        throttled.set()
+
+    limiter.on_success = success
+    limiter.on_throttled = throttle
+    return history, throttled
+
+
+def make_text(paragraphs: int, marker: str = "", words: int = 2) -> str:
+    return "\n\n".join(
+        f"Paragraph {i:02d}{marker if i == 5 else ''} "
+        + "of the stub script, long enough to fill one chunk. " * words
+        for i in range(paragraphs)
+    )
+
+
+def test_concurrent_synthesis():
+    """Windows run in parallel, continuity stays inside each window."""
+    print("🧪 Testing concurrent synthesis with stitch windows...")
+    server = start_stub_server()
+    text = make_text(8)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        synth = make_synthesizer(server, Path(tmp) / "cache")
+        output = Path(tmp) / "episode.mp3"
+        start = time.perf_counter()
+        success, state = synth.synthesize_with_state(
+            text, output, model="multilingual", max_concurrency=4, stitch_window=2
+        )
+        elapsed = time.perf_counter() - start
+
+        assert success, "Synthesis should succeed"
+        assert state["total_chunks"] == 8, state["total_chunks"]
+        assert len(state["completed_chunks"]) == 8
+        print(f"✅ 8 chunks in {elapsed:.2f}s (serial would be ≥{8 * LATENCY:.1f}s)")
+
+        assert server.peak_in_flight > 1, "Requests should overlap"
+        print(f"✅ Peak requests in flight: {server.peak_in_flight}")
+
+        # Chunk 2k is first in its window, chunk 2k+1 links only to chunk 2k
+        by_text = {r["text"]: r for r in server.requests}
+        chunks = synth._split_text_into_chunks(text, 120)
+        for i, chunk in enumerate(chunks):
+            request = by_text[chunk]
+            if i % 2 == 0:
+                assert request["previous_request_ids"] == [], (i, request)
+            else:
+                expected = by_text[chunks[i - 1]]["request_id"]
+                assert request["previous_request_ids"] == [expected], (i, request)
+        print("✅ previous_request_ids stay inside each stitch window")
+
+        # Audio (the stub echoes the text) is stitched in text order
+        assert output.read_bytes() == "".join(chunks).encode()
+        print("✅ Output stitched in text order")
+
+        expected_credits = sum(len(chunk) // 2 for chunk in chunks)
+        assert state["total_credits"] == expected_credits
+        assert [info["index"] for info in state["chunks_info"]] == list(range(8))
+        print(f"✅ Credits accounted: {state['total_credits']:,}")
+
+    server.shutdown()
+
+
+def test_concurrent_resume():
+    """A failed chunk is retried on resume without re-sending the others."""
+    print("\n🧪 Testing resume after a failed chunk...")
+    server = start_stub_server()
+    text = make_text(8, marker=" FAIL")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        synth = make_synthesizer(server, Path(tmp) / "cache")
+        output = Path(tmp) / "episode.mp3"
+
+        server.fail_marked = True
+        success, state = synth.synthesize_with_state(
+            text, output, model="multilingual", max_concurrency=3
+        )
+        assert state["failed_chunks"] == ["chunk_005"], state["failed_chunks"]
+        print(f"✅ First run: {len(state['completed_chunks'])} completed, 1 failed")
+
+        server.fail_marked = False
+        server.requests.clear()
+        success, state = synth.synthesize_with_state(
+            text, output, model="multilingual", max_concurrency=3
+        )
+        assert success
+        assert len(server.requests) == 1, len(server.requests)
+        assert "FAIL" in server.requests[0]["text"]
+        assert state["failed_chunks"] == []
+        assert len(state["completed_chunks"]) == 8
+        assert len(state["chunks_info"]) == 8
+        # Chunk 5 is the last of window 3-5, so it links to chunks 3 and 4
+        assert len(server.requests[0]["previous_request_ids"]) == 2
+        print("✅ Resume only re-sent the failed chunk, linked to its window")
+
+    server.shutdown()
+
+
+def test_edited_script_uses_chunk_cache():
+    """Editing one paragraph only re-synthesizes the chunk that contains it."""
+    print("\n🧪 Testing incremental re-synthesis of an edited script...")
+    server = start_stub_server()
+    # Short paragraphs, three to a chunk
+    text = make_text(12, words=1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        synth = make_synthesizer(server, Path(tmp) / "cache")
+        synth.DURATION_BASED_LIMITS = {"default": 200}
+        output = Path(tmp) / "episode.mp3"
+        success, state = synth.synthesize_with_state(
+            text, output, model="multilingual", max_concurrency=3
+        )
+        assert success
+        first_requests = len(server.requests)
+        assert first_requests == 4, first_requests
+        print(f"✅ First run: {first_requests} chunks synthesized")
+
+        # A typo fix that makes paragraph 03 longer. Splitting from scratch
+        # would push paragraph 05 into the next chunk and shift every chunk
+        # after it; the previous boundaries keep chunks 0, 2 and 3 intact
+        edited = text.replace("Paragraph 03 of", "Paragraph 03, fixed, of")
+        server.requests.clear()
+        success, state = synth.synthesize_with_state(
+            edited, output, model="multilingual", max_concurrency=3
+        )
+        assert success
+        sent = sorted(request["text"] for request in server.requests)
+        assert len(sent) == 2, sent
+        assert "Paragraph 03, fixed" in sent[0] and "Paragraph 05" in sent[1], sent
+        assert len(state["cached_chunks"]) == 3, state["cached_chunks"]
+        assert state["total_credits"] == sum(len(text) // 2 for text in sent)
+
+        plan = json.loads(
+            (output.parent / ".episode_state" / "chunk_plan.json").read_text()
+        )
+        assert " ".join(plan["chunks"]).split() == edited.split()
+        assert output.read_bytes().decode() == "".join(plan["chunks"])
+        print(
+            f"✅ Edit re-synthesized {len(sent)} chunks, reused {len(state['cached_chunks'])} from cache"
+        )
+
+        # Shortening paragraph 04 makes room for paragraph 05 again: the edited
+        # chunk takes the short chunk after it back instead of leaving it apart
+        edited = edited.replace("Paragraph 04 of the stub", "Paragraph 04 of the")
+        server.requests.clear()
+        success, state = synth.synthesize_with_state(
+            edited, output, model="multilingual", max_concurrency=3
+        )
+        assert success
+        assert len(server.requests) == 1, [r["text"] for r in server.requests]
+        sent = server.requests[0]["text"]
+        assert "Paragraph 03, fixed" in sent and "Paragraph 05" in sent, sent
+        assert state["total_chunks"] == 4, state["total_chunks"]
+        print("✅ Second edit merged the short chunk back: 4 chunks again")
+
+        # The original script under another output: all chunks are cached
+        server.requests.clear()
+        success, state = synth.synthesize_with_state(
+            text, Path(tmp) / "copy.mp3", model="multilingual"
+        )
+        assert success and not server.requests
+        print("✅ Unchanged script synthesized with no requests")
+
+        # Different voice settings are a different chunk
+        success, state = synth.synthesize_with_state(
+            text, Path(tmp) / "other.mp3", model="multilingual", stability=0.9
+        )
+        assert len(server.requests) == state["total_chunks"]
+        print("✅ Other voice settings miss the cache")
+
+    server.shutdown()
+
+
+def test_small_edits_keep_sentence_chunks():
+    """Chunks split inside long paragraphs are reused across repeated edits."""
+    print("\n🧪 Testing repeated edits of sentence-split chunks...")
+    server = start_stub_server()
+    # Paragraphs longer than the limit are split between sentences
+    text = "\n\n".join(
+        " ".join(
+            f"Sentence {i} of paragraph {p} runs long enough to matter."
+            for i in range(6)
+        )
+        for p in range(3)
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        synth = make_synthesizer(server, Path(tmp) / "cache")
+        output = Path(tmp) / "episode.mp3"
+        success, state = synth.synthesize_with_state(
+            text, output, model="multilingual", max_concurrency=3
+        )
+        assert success
+        chunk_count = state["total_chunks"]
+        assert chunk_count == 9, chunk_count
+        print(f"✅ First run: {chunk_count} chunks")
+
+        edits = [
+            # A typo fix inside one chunk
+            [("Sentence 3 of paragraph 1 runs", "Sentence 3 of paragraph 1 ran")],
+            # Another one, plus a reflowed line that only changes whitespace
+            [
+                ("Sentence 4 of paragraph 2 runs", "Sentence 4 of paragraph 2 ran"),
+                ("Sentence 1 of paragraph 0", "Sentence 1 of\n  paragraph 0"),
+            ],
+        ]
+        for replacements in edits:
+            for old, new in replacements:
+                text = text.replace(old, new)
+            server.requests.clear()
+            success, state = synth.synthesize_with_state(
+                text, output, model="multilingual", max_concurrency=3
+            )
+            assert success
+            sent = [request["text"] for request in server.requests]
+            assert len(sent) == 1 and replacements[0][1] in sent[0], sent
+            assert state["total_chunks"] == chunk_count, state["total_chunks"]
+            assert len(state["cached_chunks"]) == chunk_count - 1
+            print(f"✅ Edit re-synthesized 1 chunk, still {chunk_count} chunks")
+
+        # Sentences keep their own punctuation
+        assert output.read_bytes().decode().count("..") == 0
+
+    server.shutdown()
+
+
+def reset_counters(server):
+    with server.lock:
+        server.connections = 0
+        server.peak_in_flight = 0
+        server.requests.clear()
+
+
+def test_clients_shared_across_synthesizers():
+    """Synthesizers reuse one keep-alive connection pool with bounded size."""
+    print("\n🧪 Testing shared HTTP clients...")
+    server = start_stub_server()
+    host, port = server.server_address
+    url = f"http://{host}:{port}/v1/text-to-speech/stub"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        synths = [make_synthesizer(server, Path(tmp) / "cache") for _ in range(3)]
+        assert all(synth.client is synths[0].client for synth in synths)
+        for i, synth in enumerate(synths):
+            success, _ = synth.synthesize_with_state(
+                f"Episode {i}, one short chunk.",
+                Path(tmp) / str(i) / "episode.mp3",
+                model="multilingual",
+                chunk_cache=False,
+            )
+            assert success
+        assert len(server.requests) == 3, len(server.requests)
+        assert server.connections == 1, server.connections
+        print("✅ 3 ElevenLabs synthesizers: one client, 3 requests, 1 connection")
+
+    # The requests session (Cartesia) is shared the same way
+    reset_counters(server)
+    for i in range(3):
+        session = get_requests_session("cartesia")
+        assert session is get_requests_session("cartesia")
+        response = session.post(
+            url, json={"text": f"Request {i}."}, timeout=request_timeout()
+        )
+        assert response.status_code == 200, response.status_code
+    assert server.connections == 1, server.connections
+    assert request_timeout() == (HTTP_CONNECT_TIMEOUT, HTTP_TIMEOUT)
+    print("✅ requests session: 3 requests, 1 connection")
+
+    # More simultaneous requests than the pool allows wait for a connection
+    client = get_httpx_client("elevenlabs")
+    assert client.timeout == httpx.Timeout(HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT)
+    reset_counters(server)
+    burst = HTTP_POOL_SIZE + 6
+
+    def post(i):
+        return client.post(url, json={"text": f"Burst {i}."}).status_code
+
+    with ThreadPoolExecutor(max_workers=burst) as pool:
+        statuses = list(pool.map(post, range(burst)))
+    assert statuses == [200] * burst, statuses
+    assert server.peak_in_flight == HTTP_POOL_SIZE, server.peak_in_flight
+    assert server.connections <= HTTP_POOL_SIZE, server.connections
+    print(
+        f"✅ {burst} simultaneous requests: {server.peak_in_flight} in flight, "
+        f"{server.connections} new connections (pool size {HTTP_POOL_SIZE})"
+    )
+
+    server.shutdown()
+
+
+def test_retry_after_pauses_shared_limiter():
+    """A 429 with Retry-After holds back every synthesizer on the same key."""
+    print("\n🧪 Testing Retry-After on the shared rate limiter...")
+    server = start_stub_server()
+    server.errors = [(429, {"Retry-After": "1"})]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        first = make_synthesizer(server, Path(tmp) / "cache", "retry-after-key")
+        second = make_synthesizer(server, Path(tmp) / "cache", "retry-after-key")
+        assert first.rate_limiter is second.rate_limiter
+        _, throttled = record_limits(first.rate_limiter)
+
+        results = {}
+
+        def synthesize(name, synth, text):
+            results[name] = synth.synthesize_with_state(
+                text, Path(tmp) / name / "episode.mp3", model="multilingual"
+            )
+
+        thread = threading.Thread(
+            target=synthesize, args=("first", first, "The first episode.")
+        )
+        thread.start()
+        # The second synthesizer starts while the limiter is paused
+        assert throttled.wait(5), "The 429 should reach the limiter"
+        synthesize("second", second, "The second episode.")
+        thread.join()
+
+        assert results["first"][0] and results["second"][0]
+        assert len(server.requests) == 3, len(server.requests)
+        waits = [r["arrived"] - server.throttled_at for r in server.requests[1:]]
+        assert min(waits) >= 1.0, waits
+        print(
+            "✅ Retry and the other synthesizer waited "
+            + ", ".join(f"{wait:.2f}s" for wait in waits)
+        )
+
+    server.shutdown()
+
+
+def test_concurrency_cap_recovers():
+    """A 429 lowers the concurrency cap; successes raise it back."""
+    print("\n🧪 Testing concurrency cap back-off and recovery...")
+    server = start_stub_server()
+    server.errors = [(429, {})]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        synth = make_fast_synthesizer(server, Path(tmp) / "cache", "cap-key")
+        limiter = synth.rate_limiter
+        history, _ = record_limits(limiter)
+        success, state = synth.synthesize_with_state(
+            make_text(12),
+            Path(tmp) / "episode.mp3",
+            model="multilingual",
+            max_concurrency=4,
+        )
+        assert success
+        assert len(server.requests) == 13, len(server.requests)
+
+        cap = limiter.max_concurrent
+        shrunk = history.index(cap - 1)
+        assert cap in history[shrunk:], history
+        assert limiter.concurrent_limit == cap and limiter.rate == limiter.max_rate
+        print(f"✅ Cap after each response: {history}")
+
+    server.shutdown()
+
+
+def test_fatal_and_retryable_statuses():
+    """Bad requests fail at once; 408, 409, 429 and 5xx are retried."""
+    print("\n🧪 Testing fatal vs retryable responses...")
+    server = start_stub_server()
+    base_delay = DEFAULT_RETRY_POLICY.base_delay
+    DEFAULT_RETRY_POLICY.base_delay = 0.05
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            synth = make_fast_synthesizer(server, Path(tmp) / "cache", "status-key")
+            for status in (400, 401, 422, 408, 409, 429, 500, 503):
+                server.errors = [(status, {})]
+                server.requests.clear()
+                success, state = synth.synthesize_with_state(
+                    f"Answered with {status} first.",
+                    Path(tmp) / str(status) / "episode.mp3",
+                    model="multilingual",
+                    chunk_cache=False,
+                )
+                retryable = status in (408, 409, 429) or status >= 500
+                assert success == retryable, (status, state["failed_chunks"])
+                sent = len(server.requests)
+                assert sent == (2 if retryable else 1), (status, sent)
+                outcome = "retried" if retryable else "fatal"
+                print(f"   {status}: {sent} request(s), {outcome}")
+    finally:
+        DEFAULT_RETRY_POLICY.base_delay = base_delay
+    server.shutdown()
+
+    # Without a response, only timeouts and connection errors are transient
+    policy = RetryPolicy()
+    for error in (
+        httpx.ConnectError("refused"),
+        httpx.ReadTimeout("timed out"),
+        httpx.RemoteProtocolError("dropped"),
+        requests.ConnectionError("refused"),
+        requests.Timeout("timed out"),
+    ):
+        assert policy.classify(error)[0], error
+    assert not policy.classify(ValueError("connection timed out"))[0]
+    print("✅ Status codes and exception types classified")
+
+
+if __name__ == "__main__":
+    try:
+        test_concurrent_synthesis()
+        test_concurrent_resume()
+        test_edited_script_uses_chunk_cache()
+        test_small_edits_keep_sentence_chunks()
+        test_clients_shared_across_synthesizers()
+        test_retry_after_pauses_shared_limiter()
+        test_concurrency_cap_recovers()
+        test_fatal_and_retryable_statuses()
+        print("\n🎉 All concurrent synthesis tests passed!")
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        sys.exit(1)
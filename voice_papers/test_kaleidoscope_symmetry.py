@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Test the wedge/remap SymmetryCanvas against drawing every copy directly."""
+
+import math
+import sys
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+# Add the project to the path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from voice_papers.video.kaleidoscope import SymmetryCanvas, symmetry_maps
+
+WIDTH, HEIGHT = 1080, 1920
+CENTER = (WIDTH // 2, HEIGHT // 2)
+
+# Remapping rounds every pixel to the nearest source pixel, so outlines may
+# land one pixel off. Pixels whose colour is not found within one pixel in
+# the reference (or the other way round) must stay below this share of the
+# drawn pixels.
+TOLERANCE = 0.01
+
+
+def segment_colors(segments: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.integers(64, 256, (segments, 3), dtype=np.uint8)
+
+
+def motif_layers(segments: int) -> list:
+    """Layers of ``(kind, points, size, colors)`` in segment 0, as styles build them."""
+    angle = np.linspace(0, 2 * math.pi / segments, 12)
+    arc = np.stack(
+        [CENTER[0] + 260 * np.cos(angle), CENTER[1] + 260 * np.sin(angle)], axis=1
+    )
+    spoke = [CENTER, (CENTER[0] + 300.5, CENTER[1] + 40.25)]
+    petal = [
+        CENTER,
+        (CENTER[0] + 150.0, CENTER[1] - 60.0),
+        (CENTER[0] + 230.0, CENTER[1] + 20.0),
+        (CENTER[0] + 120.0, CENTER[1] + 90.0),
+    ]
+    return [
+        [
+            # Overlapping filled petals: every copy covers its neighbours
+            ("poly", petal, None, segment_colors(segments, 1)),
+            ("line", spoke, 3, segment_colors(segments, 2)),
+        ],
+        [
+            ("polyline", arc, 2, segment_colors(segments, 3)),
+            (
+                "circle",
+                (CENTER[0] + 180.7, CENTER[1] + 75.2),
+                (14, -1),
+                (255, 255, 255),
+            ),
+            (
+                "circle",
+                (CENTER[0] + 90.0, CENTER[1] - 30.0),
+                (40, 2),
+                segment_colors(segments, 4),
+            ),
+        ],
+    ]
+
+
+def draw_canvas(frame, segments: int, layers: list):
+    canvas = SymmetryCanvas(WIDTH, HEIGHT, CENTER, segments)
+    for layer in layers:
+        for kind, points, size, colors in layer:
+            if kind == "poly":
+                canvas.fill_poly(points, colors)
+            elif kind == "line":
+                canvas.line(points[0], points[1], colors, size)
+            elif kind == "polyline":
+                canvas.polyline(points, colors, size)
+            else:
+                canvas.circle(points, size[0], colors, size[1])
+        canvas.next_layer()
+    canvas.render(frame)
+
+
+def draw_reference(frame, segments: int, layers: list):
+    """Rotate and draw every copy, segment by segment within each layer."""
+    for layer in layers:
+        for copy in range(segments):
+            phase = np.exp(2j * math.pi * copy / segments)
+            for kind, points, size, colors in layer:
+                points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+                offsets = (
+                    points[:, 0] - CENTER[0] + 1j * (points[:, 1] - CENTER[1])
+                ) * phase
+                pixels = np.stack(
+                    [offsets.real + CENTER[0], offsets.imag + CENTER[1]], axis=1
+                ).astype(np.int32)
+                color = np.broadcast_to(np.asarray(colors, np.uint8), (segments, 3))
+                color = color[copy].tolist()
+                if kind == "poly":
+                    cv2.fillPoly(frame, [pixels], color)
+                elif kind in ("line", "polyline"):
+                    cv2.polylines(frame, [pixels], False, color, size)
+                else:
+                    cv2.circle(frame, pixels[0].tolist(), size[0], color, size[1])
+
+
+def unmatched(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Pixels of ``a`` whose colour is nowhere within one pixel in ``b``."""
+    padded = np.pad(b, ((1, 1), (1, 1), (0, 0)), mode="edge")
+    missing = np.ones(a.shape[:2], dtype=bool)
+    for dy in range(3):
+        for dx in range(3):
+            window = padded[dy : dy + a.shape[0], dx : dx + a.shape[1]]
+            missing &= np.any(window != a, axis=2)
+    return missing
+
+
+def test_matches_direct_drawing():
+    """Every segment count renders like drawing each copy in turn."""
+    print("🧪 Testing SymmetryCanvas against direct drawing...")
+    for segments in (3, 4, 6, 8, 12, 16):
+        layers = motif_layers(segments)
+        expected = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+        actual = expected.copy()
+        draw_reference(expected, segments, layers)
+        draw_canvas(actual, segments, layers)
+
+        drawn = np.count_nonzero(expected.any(axis=2))
+        off = np.count_nonzero(
+            unmatched(actual, expected) | unmatched(expected, actual)
+        )
+        exact = np.count_nonzero(np.any(actual != expected, axis=2))
+        print(
+            f"   {segments:2d} segments: {exact / drawn:6.2%} differ, "
+            f"{off / drawn:6.2%} more than a pixel off"
+        )
+        assert off <= TOLERANCE * drawn, f"{segments} segments: {off} of {drawn} px off"
+    print("✅ Wedge rendering matches direct drawing")
+
+
+def test_maps_are_cached():
+    """Maps are built once per size and segment count, and grow on demand."""
+    print("🧪 Testing symmetry map cache...")
+    small = symmetry_maps(WIDTH, HEIGHT, CENTER, 7, 100)
+    assert symmetry_maps(WIDTH, HEIGHT, CENTER, 7, 90) is small
+    large = symmetry_maps(WIDTH, HEIGHT, CENTER, 7, small[0] + 1)
+    assert large[0] > small[0]
+    assert symmetry_maps(WIDTH, HEIGHT, CENTER, 7, 100) is large
+    print("✅ Maps cached per frame size, centre and segment count")
+
+
+if __name__ == "__main__":
+    try:
+        test_matches_direct_drawing()
+        test_maps_are_cached()
+        print("\n🎉 All kaleidoscope symmetry tests passed!")
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        sys.exit(1)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Test frame-level MP3 stitching of synthesized audio chunks."""
+
+import os
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the project to the path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from voice_papers.voice.mp3_stitch import audio_frames, stitch_mp3_files
+
+# MPEG-1 Layer III, no CRC, 128 kbps, 44100 Hz, mono: 417-byte frames
+FRAME_HEADER = bytes([0xFF, 0xFB, 0x90, 0xC4])
+FRAME_LENGTH = 417
+
+
+def make_frame(fill: int) -> bytes:
+    return FRAME_HEADER + bytes([fill]) * (FRAME_LENGTH - 4)
+
+
+def make_chunk(frames: int, fill: int) -> bytes:
+    """An MP3 file as an encoder writes it: ID3v2, Xing frame, audio, ID3v1."""
+    id3v2 = b"ID3\x03\x00\x00\x00\x00\x00\x15" + b"\x00" * 21
+    xing = bytearray(FRAME_LENGTH)
+    xing[:4] = FRAME_HEADER
+    xing[21:37] = b"Info" + struct.pack(">III", 3, frames, 0)
+    audio = b"".join(make_frame(fill) for _ in range(frames))
+    id3v1 = b"TAG" + b"\x00" * 125
+    return id3v2 + bytes(xing) + audio + id3v1
+
+
+def test_headers_are_stripped():
+    """Only audio frames are copied, with one Info frame for the whole file."""
+    print("🧪 Testing per-file header stripping...")
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        paths = []
+        for i, frames in enumerate((3, 5, 2)):
+            path = tmp / f"chunk_{i:03d}.mp3"
+            path.write_bytes(make_chunk(frames, fill=i + 1))
+            paths.append(path)
+
+        output = tmp / "episode.mp3"
+        frames = stitch_mp3_files(paths, output)
+        data = output.read_bytes()
+
+        assert frames == 10, frames
+        assert b"ID3" not in data and b"TAG" not in data
+        assert data.count(b"Info") == 1
+        print("✅ ID3v2, per-file Info frames and ID3v1 tags removed")
+
+        # Info frame first, then every chunk's audio in order
+        expected_audio = b"".join(
+            make_frame(i + 1) for i, n in enumerate((3, 5, 2)) for _ in range(n)
+        )
+        assert data[FRAME_LENGTH:] == expected_audio
+        tag = data[21:37]
+        assert tag[:4] == b"Info", tag
+        assert struct.unpack(">III", tag[4:]) == (3, 10, len(data))
+        print("✅ One Info frame with the total frame and byte counts")
+
+        start, end, headers = audio_frames(data)
+        assert (start, end, len(headers)) == (FRAME_LENGTH, len(data), 10)
+        print("✅ Output parses as a clean frame sequence")
+
+
+def test_rejects_non_mp3():
+    """Data that is not a frame sequence raises instead of being glued."""
+    print("\n🧪 Testing non-MP3 input...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "chunk_000.mp3"
+        path.write_bytes(b"not audio at all")
+        try:
+            stitch_mp3_files([path], Path(tmp) / "out.mp3")
+        except ValueError as e:
+            print(f"✅ Rejected: {e}")
+            return
+        raise AssertionError("non-MP3 input should raise ValueError")
+
+
+def test_ffmpeg_decodes_stitched_audio():
+    """Real encoder output stitches into one stream ffmpeg decodes cleanly."""
+    print("\n🧪 Testing stitched ffmpeg-encoded chunks...")
+    if not shutil.which("ffmpeg"):
+        print("⚠️  ffmpeg not found, skipping")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        paths = []
+        for i in range(3):
+            path = tmp / f"chunk_{i:03d}.mp3"
+            subprocess.run(
+                [
+                    "ffmpeg", "-v", "error", "-f", "lavfi",
+                    "-i", f"sine=frequency={300 + 100 * i}:duration=2",
+                    "-ac", "1", "-ar", "44100", "-b:a", "128k",
+                    "-id3v2_version", "3", "-write_id3v1", "1", str(path),
+                ],
+                check=True,
+            )
+            paths.append(path)
+
+        output = tmp / "episode.mp3"
+        frames = stitch_mp3_files(paths, output)
+        result = subprocess.run(
+            ["ffmpeg", "-v", "error", "-i", str(output), "-f", "null", os.devnull],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0 and not result.stderr, result.stderr
+        duration = frames * 1152 / 44100
+        assert 5.9 < duration < 6.3, duration
+        print(f"✅ {frames} frames ({duration:.2f}s) decode without errors")
+
+
+if __name__ == "__main__":
+    try:
+        test_headers_are_stripped()
+        test_rejects_non_mp3()
+        test_ffmpeg_decodes_stitched_audio()
+        print("\n🎉 All MP3 stitching tests passed!")
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        sys.exit(1)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Test that segment rendering produces the same frames as a sequential pass."""
+
+import hashlib
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add the project to the path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from voice_papers.video.benchmark import synthetic_audio_features
+from voice_papers.video.video_creator import (
+    OUTPUT_SPEC_DEFAULTS,
+    VerticalVideoCreator,
+    _init_segment_worker,
+    _render_segment,
+    _split_frame_ranges,
+)
+
+DURATION = 2.0
+WORKERS = 2
+
+# Particle systems, a fractal, a symmetry style and a dynamic background
+CASES = [
+    ("particles", "none"),
+    ("swarm", "none"),
+    ("starfield", "none"),
+    ("julia", "none"),
+    ("kaleidoscope", "none"),
+    ("circular", "plasma"),
+]
+
+
+class FrameRecorder:
+    """Frame sink keeping a digest of every frame written to each path."""
+
+    def __init__(self, digests: list):
+        self.digests = digests
+
+    def write(self, frame: np.ndarray):
+        self.digests.append(hashlib.md5(frame.tobytes()).hexdigest())
+
+    def release(self):
+        pass
+
+
+def test_segments_match_sequential_pass():
+    """Frames rendered in whole-second segments match one sequential pass."""
+    print("🧪 Testing segment rendering against a sequential pass...")
+    creator = VerticalVideoCreator()
+    fps = creator.fps
+    total_frames = int(DURATION * fps)
+    audio_features = synthetic_audio_features(DURATION + 1)
+    audio_features["timeline"] = creator.build_audio_timeline(audio_features, fps)
+    bg_image = np.zeros((creator.height, creator.width, 3), dtype=np.uint8)
+    encoder_options = {
+        "backend": "ffmpeg",
+        "size": (creator.width, creator.height),
+        "fps": fps,
+        "preset": "ultrafast",
+        "crf": 23,
+        "threads": 0,
+    }
+    frame_ranges = _split_frame_ranges(total_frames, WORKERS * 4, fps)
+    assert len(frame_ranges) > 1, frame_ranges
+
+    # Record frames instead of encoding them
+    outputs = {}
+    open_frame_writer = VerticalVideoCreator._open_frame_writer
+
+    def recording_writer(self, video_path, *args):
+        return FrameRecorder(outputs.setdefault(str(video_path), []))
+
+    VerticalVideoCreator._open_frame_writer = recording_writer
+    try:
+        for waveform_style, background in CASES:
+            outputs.clear()
+            render_options = {
+                key: value
+                for key, value in OUTPUT_SPEC_DEFAULTS.items()
+                if key != "orientation"
+            }
+            render_options.update(
+                waveform_style=waveform_style,
+                dynamic_background=background,
+                background_scale=1.0,
+                fractal_threads=1,
+            )
+
+            creator._render_frames_to_file(
+                Path("sequential"),
+                0,
+                total_frames,
+                total_frames,
+                DURATION,
+                bg_image,
+                audio_features,
+                render_options,
+                encoder_options,
+                show_progress=False,
+            )
+
+            # What each worker process does, in this process
+            _init_segment_worker(
+                creator.orientation,
+                fps,
+                total_frames,
+                DURATION,
+                bg_image,
+                audio_features,
+                render_options,
+                encoder_options,
+            )
+            segments = []
+            for start, end in frame_ranges:
+                _render_segment(f"segment_{start}", start, end)
+                segments += outputs[f"segment_{start}"]
+
+            sequential = outputs["sequential"]
+            assert len(sequential) == len(segments) == total_frames
+            differing = [i for i in range(total_frames) if sequential[i] != segments[i]]
+            assert not differing, f"{waveform_style}/{background}: frames {differing}"
+            print(
+                f"✅ {waveform_style} / {background}: {total_frames} frames identical"
+            )
+    finally:
+        VerticalVideoCreator._open_frame_writer = open_frame_writer
+
+
+if __name__ == "__main__":
+    try:
+        test_segments_match_sequential_pass()
+        print("\n🎉 All parallel render tests passed!")
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        sys.exit(1)
@@ -15,4 +15,12 @@ CARTESIA_API_KEY = os.getenv("CARTESIA_API_KEY")
 PROJECT_ROOT = Path(__file__).parent.parent
 PROJECTS_DIR = PROJECT_ROOT / "projects"
 
+# Finished static video backgrounds (see video/background_cache.py)
+BACKGROUND_CACHE_DIR = Path(
+    os.getenv("BACKGROUND_CACHE_DIR", PROJECTS_DIR / "background_cache")
+)
+
+# Synthesized TTS chunks shared by every script (see voice/chunk_cache.py)
+TTS_CACHE_DIR = Path(os.getenv("TTS_CACHE_DIR", PROJECTS_DIR / "tts_cache"))
+
 PROJECTS_DIR.mkdir(exist_ok=True)
\ No newline at end of file
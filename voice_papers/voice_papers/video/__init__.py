@@ -3,7 +3,13 @@
 from .video_creator import (
     create_vertical_video,
     create_horizontal_video,
+    create_videos,
     VerticalVideoCreator,
 )
 
-__all__ = ["create_vertical_video", "create_horizontal_video", "VerticalVideoCreator"]
+__all__ = [
+    "create_vertical_video",
+    "create_horizontal_video",
+    "create_videos",
+    "VerticalVideoCreator",
+]
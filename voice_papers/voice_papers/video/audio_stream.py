@@ -0,0 +1,177 @@
+"""Block-wise audio analysis with bounded memory.
+
+``librosa.load`` decodes the whole episode into one float32 array, which for
+hour-long recordings means hundreds of MB held for the entire render. This
+module reads the file in blocks with soundfile, resamples each block with a
+streaming soxr resampler and emits RMS, spectral-centroid and onset-strength
+frames incrementally, so only the compact per-frame arrays are ever kept.
+
+The framing reproduces librosa's ``center=True`` defaults (zero padding of
+``frame_length // 2`` on both ends), so the frame grid matches the in-memory
+analysis.
+
+One deliberate difference: ``librosa.onset.onset_strength`` floors the mel
+spectrogram at 80 dB below its maximum over the whole file, which a single
+pass cannot know in advance. The floor here follows the running maximum, so
+until the loudest frame has been seen it sits lower than librosa's and very
+quiet passages early in a file can contribute slightly more onset strength.
+Once the running maximum reaches the global one (usually within the first
+seconds of speech) the envelopes are identical. The envelope only feeds
+beat tracking, and the difference is confined to near-silent frames.
+"""
+
+from pathlib import Path
+from typing import Optional
+
+import librosa
+import numpy as np
+import soundfile as sf
+import soxr
+
+
+def analyze_audio_stream(
+    audio_path: Path,
+    max_duration: Optional[float] = None,
+    sr: int = 22050,
+    frame_length: int = 2048,
+    hop_length: int = 512,
+    block_seconds: float = 10.0,
+) -> dict:
+    """Compute per-frame audio features without loading the whole file.
+
+    Args:
+        audio_path: Audio file readable by soundfile (wav, flac, ogg, mp3 ...)
+        max_duration: If provided, only analyse the first max_duration seconds
+        sr: Analysis sample rate (the audio is resampled to it)
+        frame_length: FFT / RMS window size in samples
+        hop_length: Hop between analysis frames in samples
+        block_seconds: Amount of audio decoded per block
+
+    Returns:
+        Dict with ``duration`` (seconds), ``rms``, ``spectral_centroids`` and
+        ``onset_envelope`` (one value per analysis frame).
+
+    Raises:
+        RuntimeError: If soundfile cannot decode the file (callers fall back
+            to ``librosa.load``).
+    """
+    info = sf.info(str(audio_path))
+    native_sr = info.samplerate
+    max_frames = -1 if max_duration is None else int(max_duration * native_sr)
+
+    analyzer = _StreamingAnalyzer(sr, frame_length, hop_length)
+    resampler = (
+        soxr.ResampleStream(native_sr, sr, 1, dtype="float32", quality="HQ")
+        if native_sr != sr
+        else None
+    )
+
+    blocksize = max(int(block_seconds * native_sr), frame_length)
+    for block in sf.blocks(
+        str(audio_path),
+        blocksize=blocksize,
+        frames=max_frames,
+        dtype="float32",
+        always_2d=True,
+    ):
+        mono = block.mean(axis=1) if block.shape[1] > 1 else block[:, 0]
+        if resampler is not None:
+            mono = resampler.resample_chunk(mono)
+        analyzer.feed(mono)
+
+    if resampler is not None:
+        analyzer.feed(resampler.resample_chunk(np.zeros(0, np.float32), last=True))
+
+    return analyzer.finish()
+
+
+class _StreamingAnalyzer:
+    """Accumulates samples and turns every complete frame into features."""
+
+    def __init__(self, sr: int, frame_length: int, hop_length: int):
+        self.sr = sr
+        self.frame_length = frame_length
+        self.hop_length = hop_length
+        self.mel_basis = librosa.filters.mel(sr=sr, n_fft=frame_length)
+        self.freqs = librosa.fft_frequencies(sr=sr, n_fft=frame_length)
+        self.window = librosa.filters.get_window(
+            "hann", frame_length, fftbins=True
+        ).astype(np.float32)
+
+        # Emulates center=True: frame t is centred on sample t * hop_length
+        self.pending = np.zeros(frame_length // 2, dtype=np.float32)
+        self.sample_count = 0
+        self.rms = []
+        self.centroids = []
+        self.onset = []
+        self.prev_mel_db = None
+        self.max_db = -np.inf
+
+    def feed(self, samples: np.ndarray):
+        if samples.size == 0:
+            return
+        self.sample_count += samples.size
+        self.pending = np.concatenate([self.pending, samples.astype(np.float32)])
+        self._consume()
+
+    def finish(self) -> dict:
+        # Trailing centre padding, then flush the remaining frames
+        self.pending = np.concatenate(
+            [self.pending, np.zeros(self.frame_length // 2, dtype=np.float32)]
+        )
+        self._consume()
+
+        rms = np.concatenate(self.rms) if self.rms else np.zeros(1, np.float32)
+        centroids = (
+            np.concatenate(self.centroids) if self.centroids else np.zeros(1, np.float32)
+        )
+
+        # Same lag + centring compensation librosa.onset.onset_strength applies
+        pad_width = 1 + self.frame_length // (2 * self.hop_length)
+        onset = np.concatenate([np.zeros(pad_width, np.float32)] + self.onset)
+        onset = onset[: len(rms)]
+
+        return {
+            "duration": self.sample_count / self.sr,
+            "rms": rms,
+            "spectral_centroids": centroids,
+            "onset_envelope": onset,
+        }
+
+    def _consume(self):
+        n = self.frame_length
+        hop = self.hop_length
+        if len(self.pending) < n:
+            return
+
+        frame_count = 1 + (len(self.pending) - n) // hop
+        frames = librosa.util.frame(
+            self.pending[: (frame_count - 1) * hop + n], frame_length=n, hop_length=hop
+        )
+
+        # RMS from the time-domain frames
+        self.rms.append(np.sqrt(np.mean(frames**2, axis=0)).astype(np.float32))
+
+        # One FFT per frame shared by the centroid and the onset envelope
+        magnitude = np.abs(np.fft.rfft(frames * self.window[:, None], axis=0))
+        norm = magnitude.sum(axis=0)
+        weighted = (self.freqs[:, None] * magnitude).sum(axis=0)
+        centroid = np.where(norm > 0, weighted / np.maximum(norm, 1e-12), 0.0)
+        self.centroids.append(centroid.astype(np.float32))
+
+        mel_db = librosa.power_to_db(self.mel_basis @ magnitude**2, top_db=None)
+        # power_to_db's top_db=80 floor, from the running rather than the
+        # global maximum (see the module docstring)
+        self.max_db = max(self.max_db, float(mel_db.max()))
+        mel_db = np.maximum(mel_db, self.max_db - 80.0)
+
+        if self.prev_mel_db is not None:
+            mel_db_lagged = np.concatenate([self.prev_mel_db[:, None], mel_db], axis=1)
+        else:
+            mel_db_lagged = mel_db
+        diff = np.maximum(0.0, mel_db_lagged[:, 1:] - mel_db_lagged[:, :-1])
+        # beat_track's default onset aggregation
+        self.onset.append(np.median(diff, axis=0).astype(np.float32))
+        self.prev_mel_db = mel_db[:, -1]
+
+        self.pending = self.pending[frame_count * hop :]
@@ -0,0 +1,81 @@
+"""On-disk cache for static background images.
+
+A static background is a gradient drawn row by row (or an Unsplash download)
+that is then resized, blurred and darkened, and it only depends on the output
+size and the gradient colours (or the image keywords). The finished BGR
+array is stored as a ``.npy`` file keyed by a hash of those parameters, so
+later renders, previews and batch runs with the same settings load it
+instead of rebuilding it, and gradient backgrounds never need the network.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from ..config import BACKGROUND_CACHE_DIR
+
+# Bump when the way backgrounds are built changes
+BACKGROUND_CACHE_VERSION = 1
+
+# Shared by every render (projects/background_cache unless BACKGROUND_CACHE_DIR
+# is set), whatever the working directory
+DEFAULT_BACKGROUND_CACHE_DIR = BACKGROUND_CACHE_DIR
+
+
+def background_cache_key(kind: str, width: int, height: int, params: dict) -> str:
+    """Cache key from the background kind, its size and its parameters."""
+    payload = json.dumps(
+        {
+            "version": BACKGROUND_CACHE_VERSION,
+            "kind": kind,
+            "size": [width, height],
+            "params": params,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def background_cache_path(cache_dir: Path, kind: str, key: str) -> Path:
+    """Location of the cache file for ``key``."""
+    return Path(cache_dir) / f"{kind}_{key[:16]}.npy"
+
+
+def load_background(cache_path: Path, shape: tuple) -> Optional[np.ndarray]:
+    """Load a cached background, or None if missing or unusable."""
+    if not cache_path.exists():
+        return None
+
+    try:
+        image = np.load(cache_path, allow_pickle=False)
+        if image.shape != tuple(shape) or image.dtype != np.uint8:
+            return None
+        return image
+    except Exception as e:
+        print(f"⚠️  Ignoring unreadable background cache {cache_path.name}: {e}")
+        return None
+
+
+def save_background(cache_path: Path, image: np.ndarray) -> bool:
+    """Write a background atomically; failure (e.g. read-only dir) is not fatal."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=cache_path.name, suffix=".tmp", dir=cache_path.parent
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, np.ascontiguousarray(image, dtype=np.uint8))
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        return True
+    except Exception as e:
+        print(f"⚠️  Could not write background cache {cache_path.name}: {e}")
+        return False
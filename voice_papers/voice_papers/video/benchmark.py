@@ -0,0 +1,231 @@
+"""Render benchmark for the waveform styles and dynamic backgrounds.
+
+Every case renders frames of one waveform style over one background in one
+orientation, driven by synthetic audio features (seeded, so every run sees
+the same amplitudes and beats), and reports:
+
+- ``ms_per_frame`` / ``ms_p95``: median and 95th percentile render time of a
+  frame (background plus waveform; encoding is not included)
+- ``alloc_mb``: peak memory allocated while rendering one steady-state frame
+- ``peak_rss_mb``: peak resident memory of the process that ran the case
+
+Each case runs in a fresh worker process so the peak RSS belongs to that
+case alone. Results are plain dicts that ``save_results`` writes as JSON and
+``compare_results`` checks against a stored baseline.
+"""
+
+import json
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from .styles import background_styles, waveform_styles
+from .video_creator import (
+    AUDIO_FEATURE_PARAMS,
+    OUTPUT_SPEC_DEFAULTS,
+    VerticalVideoCreator,
+)
+
+# Default slowdown over the baseline reported as a regression (25%)
+DEFAULT_TOLERANCE = 0.25
+
+_CASE_KEYS = ("waveform_style", "dynamic_background", "orientation")
+
+
+def synthetic_audio_features(duration: float, seed: int = 0) -> dict:
+    """Deterministic stand-in for ``extract_audio_features``.
+
+    Amplitude follows a slow swell with a beat every half second and some
+    seeded noise; the spectral centroid sweeps between 500 and 4500 Hz.
+    """
+    sr = AUDIO_FEATURE_PARAMS["sr"]
+    hop_length = AUDIO_FEATURE_PARAMS["hop_length"]
+    rng = np.random.default_rng(seed)
+
+    times = np.arange(max(int(duration * sr / hop_length), 1)) * hop_length / sr
+    swell = 0.5 + 0.3 * np.sin(2 * np.pi * times / 4.0)
+    pulse = np.exp(-((times % 0.5) / 0.08))
+    rms = 0.2 * (swell + 0.4 * pulse) + 0.02 * rng.random(len(times))
+    spectral_centroids = 2500 + 2000 * np.sin(2 * np.pi * times / 3.0)
+    beats = np.round(np.arange(0, duration, 0.5) * sr / hop_length).astype(int)
+
+    return {
+        "duration": duration,
+        "rms": rms.astype(np.float32),
+        "spectral_centroids": spectral_centroids.astype(np.float32),
+        "tempo": 120,
+        "beats": beats,
+        "sr": sr,
+    }
+
+
+def benchmark_cases(
+    waveforms: list = None,
+    backgrounds: list = None,
+    orientations: tuple = ("vertical", "horizontal"),
+    full_matrix: bool = False,
+) -> list:
+    """Cases to run, as ``(waveform_style, dynamic_background, orientation)``.
+
+    By default every waveform style is measured over a static background and
+    every dynamic background under the ``circular`` waveform, which isolates
+    the cost of each. ``full_matrix`` runs every combination instead.
+    """
+    waveforms = waveforms or waveform_styles(aliases=False)
+    backgrounds = backgrounds or background_styles(aliases=False)
+
+    if full_matrix:
+        pairs = [(w, b) for w in waveforms for b in ["none"] + backgrounds]
+    else:
+        pairs = [(w, "none") for w in waveforms]
+        pairs += [("circular", b) for b in backgrounds if b != "none"]
+    return [(w, b, o) for o in orientations for w, b in pairs]
+
+
+def run_case(
+    waveform_style: str,
+    dynamic_background: str,
+    orientation: str = "vertical",
+    frames: int = 30,
+    warmup: int = 5,
+    background_scale: float = 1.0,
+) -> dict:
+    """Render ``warmup + frames`` frames of one case and measure them."""
+    creator = VerticalVideoCreator(orientation)
+    total_frames = warmup + frames + 1
+    features = synthetic_audio_features(total_frames / creator.fps)
+    features["timeline"] = creator.build_audio_timeline(features)
+
+    render_options = {
+        key: value
+        for key, value in OUTPUT_SPEC_DEFAULTS.items()
+        if key != "orientation"
+    }
+    render_options.update(
+        waveform_style=waveform_style,
+        dynamic_background=dynamic_background,
+        background_scale=background_scale,
+    )
+    styles = creator.create_styles(render_options, total_frames, features["duration"])
+
+    # Static background: a plain vertical gradient
+    shade = np.linspace(40, 90, creator.height, dtype=np.float32)
+    bg_image = np.repeat(shade[:, None, None], creator.width, axis=1)
+    bg_image = np.repeat(bg_image, 3, axis=2).astype(np.uint8)
+    frame = np.empty((creator.height, creator.width, 3), dtype=np.uint8)
+
+    for frame_idx in range(warmup):
+        creator._render_frame(frame_idx, styles, bg_image, features, frame)
+
+    timings = []
+    for frame_idx in range(warmup, warmup + frames):
+        start = time.perf_counter()
+        creator._render_frame(frame_idx, styles, bg_image, features, frame)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    # Traced separately: tracemalloc slows allocation-heavy frames down
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    creator._render_frame(warmup + frames, styles, bg_image, features, frame)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "waveform_style": waveform_style,
+        "dynamic_background": dynamic_background,
+        "orientation": orientation,
+        "frames": frames,
+        "ms_per_frame": round(float(np.median(timings)), 2),
+        "ms_p95": round(float(np.percentile(timings, 95)), 2),
+        "alloc_mb": round((peak - baseline) / 2**20, 2),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    }
+
+
+def run_benchmark(
+    cases: list,
+    frames: int = 30,
+    warmup: int = 5,
+    background_scale: float = 1.0,
+) -> list:
+    """Run every case in its own worker process, printing progress."""
+    results = []
+    for i, (waveform_style, background, orientation) in enumerate(cases, 1):
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            result = pool.submit(
+                run_case,
+                waveform_style,
+                background,
+                orientation,
+                frames,
+                warmup,
+                background_scale,
+            ).result()
+        results.append(result)
+        print(
+            f"⏱️  [{i}/{len(cases)}] {waveform_style} / {background} / {orientation}: "
+            f"{result['ms_per_frame']:.1f} ms/frame, "
+            f"{result['alloc_mb']:.1f} MB alloc, {result['peak_rss_mb']:.0f} MB RSS"
+        )
+    return results
+
+
+def save_results(results: list, path: Path, **settings):
+    """Write results as JSON, together with the environment they came from."""
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "settings": settings,
+        "results": results,
+    }
+    Path(path).write_text(json.dumps(report, indent=2) + "\n")
+
+
+def load_results(path: Path) -> list:
+    """Results stored by ``save_results``."""
+    return json.loads(Path(path).read_text())["results"]
+
+
+def compare_results(
+    results: list, baseline: list, tolerance: float = DEFAULT_TOLERANCE
+) -> list:
+    """Cases whose ``ms_per_frame`` grew by more than ``tolerance`` over baseline.
+
+    Returns:
+        List of dicts with the case keys, ``baseline_ms``, ``ms_per_frame``
+        and their ``ratio``. Cases missing from the baseline are skipped.
+    """
+    previous = {tuple(r[key] for key in _CASE_KEYS): r for r in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get(tuple(result[key] for key in _CASE_KEYS))
+        if not before or before["ms_per_frame"] <= 0:
+            continue
+        ratio = result["ms_per_frame"] / before["ms_per_frame"]
+        if ratio > 1 + tolerance:
+            regressions.append(
+                {
+                    **{key: result[key] for key in _CASE_KEYS},
+                    "baseline_ms": before["ms_per_frame"],
+                    "ms_per_frame": result["ms_per_frame"],
+                    "ratio": round(ratio, 2),
+                }
+            )
+    return regressions
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident memory of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
@@ -0,0 +1,53 @@
+"""Reusable frame and scratch buffers for the render loop.
+
+A 1080x1920 frame is ~6 MB as uint8 and ~8 MB per float32 plane, and the
+render loop used to allocate several of each per frame: the output frame,
+every intermediate of the background expressions, the upscaled fractal.
+With a dynamic background that was 30-55 MB of short-lived arrays per frame.
+The render loop now keeps its frames in a ``FramePool`` and the drawing code
+writes its intermediates into named ``ScratchBuffers`` with ``out=`` /
+``dst=``, so a steady-state frame does close to no large allocations.
+"""
+
+import numpy as np
+
+
+class FramePool:
+    """A small set of equally shaped frames handed out and returned.
+
+    ``acquire`` returns a free frame (allocating one only when every frame is
+    in use) and ``release`` makes it available again. Frame contents are not
+    cleared in between.
+    """
+
+    def __init__(self, shape: tuple, count: int = 1, dtype=np.uint8):
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self._free = [np.empty(self.shape, self.dtype) for _ in range(count)]
+
+    def acquire(self) -> np.ndarray:
+        if self._free:
+            return self._free.pop()
+        return np.empty(self.shape, self.dtype)
+
+    def release(self, frame: np.ndarray):
+        self._free.append(frame)
+
+
+class ScratchBuffers:
+    """Named scratch arrays, allocated on first use and reused afterwards.
+
+    Callers own a name for as long as they use its buffer within one frame;
+    two expressions that are live at the same time need different names.
+    """
+
+    def __init__(self):
+        self._buffers = {}
+
+    def get(self, name: str, shape: tuple, dtype=np.float32) -> np.ndarray:
+        """Uninitialised ``shape`` buffer reserved for ``name``."""
+        key = (name, tuple(shape), np.dtype(dtype))
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            buffer = self._buffers[key] = np.empty(shape, dtype)
+        return buffer
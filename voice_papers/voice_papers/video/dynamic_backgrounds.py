@@ -5,10 +5,34 @@ Dynamic background methods for video creation.
 import numpy as np
 import cv2
 
+from .geometry import blend_colors, frame_geometry
+
+# Colour stops (RGB) of the fixed-palette backgrounds
+PLASMA_STOPS = (
+    (0.0, (20, 20, 100)),  # Deep blue
+    (0.33, (0, 255, 255)),  # Cyan
+    (0.66, (255, 0, 255)),  # Magenta
+    (0.99, (255, 255, 255)),  # White
+)
+ENERGY_STOPS = (
+    (0.0, (0, 50, 50)),
+    (0.5, (0, 150, 255)),  # Electric blue
+    (1.0, (255, 255, 255)),
+)
+
 
 class DynamicBackgrounds:
     """Mixin class for dynamic background methods."""
 
+    @staticmethod
+    def _map_color_stops(frame, values, stops):
+        """Fill a BGR frame from a piecewise-linear RGB colour map of ``values``."""
+        positions = [position for position, _ in stops]
+        for channel, component in enumerate((2, 1, 0)):
+            channel_stops = [color[component] for _, color in stops]
+            frame[:, :, channel] = np.interp(values, positions, channel_stops)
+        return frame
+
     def _create_flowing_gradient(
         self,
         frame,
@@ -19,6 +43,7 @@ class DynamicBackgrounds:
     ):
         """Create a flowing gradient background that changes with time and audio."""
         height, width = frame.shape[:2]
+        geometry = frame_geometry(width, height)
 
         # Get gradient colors
         colors = self._get_current_gradient_colors(gradient_style, custom_colors)
@@ -29,46 +54,25 @@ class DynamicBackgrounds:
         time_offset = current_time * 0.3
         audio_offset = amplitude * 50
 
-        for y in range(height):
-            for x in range(width):
-                # Create flowing pattern
-                wave1 = np.sin((x + y) * 0.01 + time_offset) * 0.3
-                wave2 = np.sin((x - y) * 0.008 + time_offset * 1.2) * 0.3
-                wave3 = np.sin(np.sqrt(x * x + y * y) * 0.005 + time_offset * 0.8) * 0.2
-
-                # Combine waves with audio influence
-                flow_factor = (wave1 + wave2 + wave3 + audio_offset * 0.01) * 0.5 + 0.5
-                flow_factor = np.clip(flow_factor, 0, 1)
-
-                # Interpolate between colors
-                if len(colors) == 2:
-                    r = int(
-                        colors[0][0] * (1 - flow_factor) + colors[1][0] * flow_factor
-                    )
-                    g = int(
-                        colors[0][1] * (1 - flow_factor) + colors[1][1] * flow_factor
-                    )
-                    b = int(
-                        colors[0][2] * (1 - flow_factor) + colors[1][2] * flow_factor
-                    )
-                else:
-                    # Multi-color gradient
-                    color_index = flow_factor * (len(colors) - 1)
-                    idx1 = int(color_index)
-                    idx2 = min(idx1 + 1, len(colors) - 1)
-                    t = color_index - idx1
+        # Create flowing pattern
+        flow_factor = geometry.wave(0.01, 0.01, time_offset) * 0.3
+        flow_factor += geometry.wave(0.008, -0.008, time_offset * 1.2) * 0.3
+        flow_factor += (
+            np.sin(geometry.origin_distance * 0.005 + time_offset * 0.8) * 0.2
+        )
 
-                    r = int(colors[idx1][0] * (1 - t) + colors[idx2][0] * t)
-                    g = int(colors[idx1][1] * (1 - t) + colors[idx2][1] * t)
-                    b = int(colors[idx1][2] * (1 - t) + colors[idx2][2] * t)
+        # Combine waves with audio influence
+        flow_factor += audio_offset * 0.01
+        flow_factor = np.clip(flow_factor * 0.5 + 0.5, 0, 1)
 
-                frame[y, x] = [b, g, r]  # BGR format
-
-        return frame
+        # Interpolate between colors (evenly spaced stops for multi-color)
+        stops = list(zip(np.linspace(0, 1, len(colors)), colors))
+        return self._map_color_stops(frame, flow_factor, stops)
 
     def _create_aurora_background(self, frame, amplitude, current_time):
         """Create aurora borealis effect."""
         height, width = frame.shape[:2]
+        geometry = frame_geometry(width, height)
 
         # Aurora colors (green, blue, purple)
         aurora_colors = [
@@ -78,82 +82,44 @@ class DynamicBackgrounds:
             (200, 50, 255),  # Purple
         ]
 
-        for y in range(height):
-            for x in range(width):
-                # Create flowing aurora waves
-                wave1 = np.sin(x * 0.02 + current_time * 2 + y * 0.01) * 0.5
-                wave2 = np.sin(x * 0.015 + current_time * 1.5 + y * 0.008) * 0.3
-                wave3 = np.sin(x * 0.01 + current_time + y * 0.005) * 0.2
-
-                # Combine waves with amplitude
-                intensity = (wave1 + wave2 + wave3 + amplitude * 0.5) * 0.3 + 0.1
-                intensity = np.clip(intensity, 0, 1)
+        # Create flowing aurora waves
+        intensity = geometry.wave(0.02, 0.01, current_time * 2) * 0.5
+        intensity += geometry.wave(0.015, 0.008, current_time * 1.5) * 0.3
+        intensity += geometry.wave(0.01, 0.005, current_time) * 0.2
 
-                # Vertical gradient effect (stronger at top)
-                vertical_factor = 1.0 - (y / height) * 0.7
-                intensity *= vertical_factor
+        # Combine waves with amplitude
+        intensity += amplitude * 0.5
+        intensity = np.clip(intensity * 0.3 + 0.1, 0, 1)
 
-                # Choose color based on position and time
-                color_idx = int(
-                    (x / width + current_time * 0.1) * len(aurora_colors)
-                ) % len(aurora_colors)
-                base_color = aurora_colors[color_idx]
+        # Vertical gradient effect (stronger at top)
+        intensity *= 1.0 - geometry.y_norm * 0.7
 
-                r = int(base_color[0] * intensity)
-                g = int(base_color[1] * intensity)
-                b = int(base_color[2] * intensity)
-
-                frame[y, x] = [b, g, r]
+        # Choose color based on position and time (one color per column)
+        color_idx = (
+            (geometry.x_norm[0] + current_time * 0.1) * len(aurora_colors)
+        ).astype(int) % len(aurora_colors)
+        column_colors = np.array(aurora_colors, dtype=np.float32)[color_idx, ::-1]
 
+        frame[:] = intensity[:, :, None] * column_colors[None, :, :]
         return frame
 
     def _create_plasma_background(self, frame, amplitude, current_time):
         """Create plasma energy effect."""
         height, width = frame.shape[:2]
+        geometry = frame_geometry(width, height)
 
-        for y in range(height):
-            for x in range(width):
-                # Create plasma effect with multiple sine waves
-                dx = x - width / 2
-                dy = y - height / 2
-                dist = np.sqrt(dx * dx + dy * dy)
-
-                plasma1 = np.sin(dist * 0.02 + current_time * 3)
-                plasma2 = np.sin((x + y) * 0.01 + current_time * 2)
-                plasma3 = np.sin((x - y) * 0.008 + current_time * 1.5)
-                plasma4 = np.sin(np.sqrt(x * y) * 0.01 + current_time * 2.5)
-
-                # Combine with amplitude
-                plasma_value = (
-                    plasma1 + plasma2 + plasma3 + plasma4 + amplitude
-                ) * 0.2 + 0.5
-                plasma_value = np.clip(plasma_value, 0, 1)
-
-                # Map to electric colors
-                if plasma_value < 0.33:
-                    # Deep blue to cyan
-                    t = plasma_value * 3
-                    r, g, b = (
-                        int(20 * (1 - t) + 0 * t),
-                        int(20 * (1 - t) + 255 * t),
-                        int(100 * (1 - t) + 255 * t),
-                    )
-                elif plasma_value < 0.66:
-                    # Cyan to magenta
-                    t = (plasma_value - 0.33) * 3
-                    r, g, b = (
-                        int(0 * (1 - t) + 255 * t),
-                        int(255 * (1 - t) + 0 * t),
-                        255,
-                    )
-                else:
-                    # Magenta to white
-                    t = (plasma_value - 0.66) * 3
-                    r, g, b = 255, int(0 * (1 - t) + 255 * t), 255
+        # Create plasma effect with multiple sine waves
+        plasma_value = np.sin(geometry.radius * 0.02 + current_time * 3)
+        plasma_value += geometry.wave(0.01, 0.01, current_time * 2)
+        plasma_value += geometry.wave(0.008, -0.008, current_time * 1.5)
+        plasma_value += np.sin(geometry.sqrt_abs_xy * 0.01 + current_time * 2.5)
 
-                frame[y, x] = [b, g, r]
+        # Combine with amplitude
+        plasma_value += amplitude
+        plasma_value = np.clip(plasma_value * 0.2 + 0.5, 0, 1)
 
-        return frame
+        # Map to electric colors (deep blue -> cyan -> magenta -> white)
+        return self._map_color_stops(frame, plasma_value, PLASMA_STOPS)
 
     def _create_breathing_colors_background(
         self,
@@ -165,6 +131,7 @@ class DynamicBackgrounds:
     ):
         """Create breathing color effect that pulses with audio."""
         height, width = frame.shape[:2]
+        geometry = frame_geometry(width, height)
 
         # Get base colors
         colors = self._get_current_gradient_colors(gradient_style, custom_colors)
@@ -176,32 +143,21 @@ class DynamicBackgrounds:
         audio_pulse = amplitude * 0.5 + 0.5
         combined_pulse = (breath_cycle + audio_pulse) * 0.5
 
-        center_x, center_y = width // 2, height // 2
-
-        for y in range(height):
-            for x in range(width):
-                # Distance from center
-                dx = x - center_x
-                dy = y - center_y
-                dist = np.sqrt(dx * dx + dy * dy) / max(width, height)
-
-                # Create breathing gradient
-                intensity = np.sin(dist * np.pi + combined_pulse * np.pi) * 0.5 + 0.5
+        # Create breathing gradient from the distance to the centre
+        intensity = (
+            np.sin(geometry.radius_norm * np.float32(np.pi) + combined_pulse * np.pi)
+            * 0.5
+            + 0.5
+        )
 
-                # Interpolate colors
-                r = int(colors[0][0] * (1 - intensity) + colors[1][0] * intensity)
-                g = int(colors[0][1] * (1 - intensity) + colors[1][1] * intensity)
-                b = int(colors[0][2] * (1 - intensity) + colors[1][2] * intensity)
-
-                frame[y, x] = [b, g, r]
-
-        return frame
+        return blend_colors(frame, intensity, colors[0], colors[1])
 
     def _create_nebula_background(
         self, frame, amplitude, current_time, frame_idx, total_frames
     ):
         """Create space nebula effect."""
         height, width = frame.shape[:2]
+        geometry = frame_geometry(width, height)
 
         # Nebula colors
         nebula_colors = [
@@ -212,123 +168,69 @@ class DynamicBackgrounds:
             (255, 150, 100),  # Orange
         ]
 
-        for y in range(height):
-            for x in range(width):
-                # Create nebula clouds with Perlin-like noise
-                noise1 = np.sin(x * 0.005 + current_time * 0.5) * np.cos(
-                    y * 0.008 + current_time * 0.3
-                )
-                noise2 = np.sin(x * 0.008 + y * 0.006 + current_time * 0.8)
-                noise3 = np.sin((x + y) * 0.003 + current_time * 0.2)
-
-                # Combine noises
-                cloud_density = (
-                    noise1 + noise2 + noise3 + amplitude * 0.3
-                ) * 0.25 + 0.5
-                cloud_density = np.clip(cloud_density, 0, 1)
-
-                # Add swirling effect
-                dx = x - width / 2
-                dy = y - height / 2
-                angle = np.arctan2(dy, dx) + current_time * 0.1
-                swirl = np.sin(angle * 3) * 0.1
-                cloud_density += swirl
-                cloud_density = np.clip(cloud_density, 0, 1)
-
-                # Map to nebula colors
-                color_idx = int(cloud_density * (len(nebula_colors) - 1))
-                color_t = (cloud_density * (len(nebula_colors) - 1)) - color_idx
-
-                if color_idx < len(nebula_colors) - 1:
-                    color1 = nebula_colors[color_idx]
-                    color2 = nebula_colors[color_idx + 1]
-                    r = int(color1[0] * (1 - color_t) + color2[0] * color_t)
-                    g = int(color1[1] * (1 - color_t) + color2[1] * color_t)
-                    b = int(color1[2] * (1 - color_t) + color2[2] * color_t)
-                else:
-                    r, g, b = nebula_colors[-1]
+        # Create nebula clouds with Perlin-like noise (the first term is a
+        # row times a column)
+        cloud_density = np.sin(geometry.x * 0.005 + current_time * 0.5) * np.cos(
+            geometry.y * 0.008 + current_time * 0.3
+        )
+        cloud_density += geometry.wave(0.008, 0.006, current_time * 0.8)
+        cloud_density += geometry.wave(0.003, 0.003, current_time * 0.2)
 
-                frame[y, x] = [b, g, r]
+        # Combine noises
+        cloud_density += amplitude * 0.3
+        cloud_density = np.clip(cloud_density * 0.25 + 0.5, 0, 1)
 
-        return frame
+        # Add swirling effect
+        cloud_density += np.sin((geometry.angle + current_time * 0.1) * 3) * 0.1
+        cloud_density = np.clip(cloud_density, 0, 1)
+
+        # Map to nebula colors
+        stops = list(zip(np.linspace(0, 1, len(nebula_colors)), nebula_colors))
+        return self._map_color_stops(frame, cloud_density, stops)
 
     def _create_energy_waves_background(self, frame, amplitude, current_time):
         """Create energy waves background."""
         height, width = frame.shape[:2]
+        geometry = frame_geometry(width, height)
 
-        center_x, center_y = width // 2, height // 2
+        # Create concentric energy waves
+        energy = np.sin(geometry.radius * 0.02 - current_time * 5) * 0.5
+        energy += np.sin(geometry.radius * 0.015 - current_time * 3) * 0.3
+        energy += np.sin(geometry.angle * 4 + current_time * 2) * 0.2
 
-        for y in range(height):
-            for x in range(width):
-                dx = x - center_x
-                dy = y - center_y
-                dist = np.sqrt(dx * dx + dy * dy)
-                angle = np.arctan2(dy, dx)
-
-                # Create concentric energy waves
-                wave1 = np.sin(dist * 0.02 - current_time * 5) * 0.5
-                wave2 = np.sin(dist * 0.015 - current_time * 3) * 0.3
-                wave3 = np.sin(angle * 4 + current_time * 2) * 0.2
-
-                # Combine with amplitude
-                energy = (wave1 + wave2 + wave3 + amplitude * 0.8) * 0.3 + 0.1
-                energy = np.clip(energy, 0, 1)
-
-                # Electric blue/cyan energy colors
-                if energy < 0.5:
-                    t = energy * 2
-                    r, g, b = (
-                        int(0 * t),
-                        int(50 * (1 - t) + 150 * t),
-                        int(50 * (1 - t) + 255 * t),
-                    )
-                else:
-                    t = (energy - 0.5) * 2
-                    r, g, b = (
-                        int(0 * (1 - t) + 255 * t),
-                        int(150 * (1 - t) + 255 * t),
-                        255,
-                    )
-
-                frame[y, x] = [b, g, r]
+        # Combine with amplitude
+        energy += amplitude * 0.8
+        energy = np.clip(energy * 0.3 + 0.1, 0, 1)
 
-        return frame
+        # Electric blue/cyan energy colors
+        return self._map_color_stops(frame, energy, ENERGY_STOPS)
 
     def _create_liquid_metal_background(self, frame, amplitude, current_time):
         """Create liquid metal effect."""
         height, width = frame.shape[:2]
+        geometry = frame_geometry(width, height)
+
+        # Create flowing metal effect
+        metal_value = geometry.wave(0.005, 0.005, current_time * 1.2) * 0.3
+        metal_value += np.sin(geometry.x * 0.01 + current_time * 2) * 0.4
+        metal_value += np.sin(geometry.y * 0.008 + current_time * 1.5) * 0.3
+
+        # Metallic ripples
+        metal_value += np.sin(geometry.radius * 0.03 + current_time * 4) * 0.2
+
+        # Combine with amplitude
+        metal_value += amplitude * 0.4
+        metal_value = np.clip(metal_value * 0.3 + 0.3, 0, 1)
 
-        for y in range(height):
-            for x in range(width):
-                # Create flowing metal effect
-                flow1 = np.sin(x * 0.01 + current_time * 2) * 0.4
-                flow2 = np.sin(y * 0.008 + current_time * 1.5) * 0.3
-                flow3 = np.sin((x + y) * 0.005 + current_time * 1.2) * 0.3
-
-                # Metallic ripples
-                dx = x - width / 2
-                dy = y - height / 2
-                dist = np.sqrt(dx * dx + dy * dy)
-                ripple = np.sin(dist * 0.03 + current_time * 4) * 0.2
-
-                # Combine with amplitude
-                metal_value = (
-                    flow1 + flow2 + flow3 + ripple + amplitude * 0.4
-                ) * 0.3 + 0.3
-                metal_value = np.clip(metal_value, 0, 1)
-
-                # Metallic silver/gold colors
-                base_color = int(metal_value * 200 + 55)
-                highlight = (
-                    int(metal_value * 100 + 155) if metal_value > 0.7 else base_color
-                )
-
-                r = min(255, int(base_color * 0.9 + highlight * 0.1))
-                g = min(255, int(base_color * 0.95 + highlight * 0.05))
-                b = base_color
-
-                frame[y, x] = [b, g, r]
+        # Metallic silver/gold colors
+        base_color = np.trunc(metal_value * 200 + 55)
+        highlight = np.where(
+            metal_value > 0.7, np.trunc(metal_value * 100 + 155), base_color
+        )
 
+        frame[:, :, 0] = base_color
+        frame[:, :, 1] = np.minimum(255, base_color * 0.95 + highlight * 0.05)
+        frame[:, :, 2] = np.minimum(255, base_color * 0.9 + highlight * 0.1)
         return frame
 
     def _create_cosmic_dust_background(self, frame, amplitude, current_time, frame_idx):
@@ -432,13 +334,11 @@ class DynamicBackgrounds:
         """Create morphing geometric shapes background."""
         height, width = frame.shape[:2]
 
-        # Gradient base
-        for y in range(height):
-            intensity = y / height
-            r = int(30 * (1 - intensity) + 80 * intensity)
-            g = int(20 * (1 - intensity) + 40 * intensity)
-            b = int(60 * (1 - intensity) + 120 * intensity)
-            frame[y, :] = [b, g, r]
+        # Gradient base (one colour per row)
+        intensity = np.arange(height) / height
+        frame[:, :, 0] = (60 * (1 - intensity) + 120 * intensity)[:, None]
+        frame[:, :, 1] = (20 * (1 - intensity) + 40 * intensity)[:, None]
+        frame[:, :, 2] = (30 * (1 - intensity) + 80 * intensity)[:, None]
 
         # Morphing shapes
         center_x, center_y = width // 2, height // 2
@@ -453,42 +353,20 @@ class DynamicBackgrounds:
         radius = size_factor * (1 + morph_factor * 0.5)
 
         # Create polygon points
-        points = []
-        for i in range(num_sides):
-            angle = (i / num_sides) * 2 * np.pi + shape_time
-            x = center_x + int(np.cos(angle) * radius)
-            y = center_y + int(np.sin(angle) * radius)
-            points.append((x, y))
-
-        # Fill polygon (simple fill)
-        if len(points) >= 3:
-            # Simple polygon fill using scanline
-            min_y = max(0, min(p[1] for p in points))
-            max_y = min(height - 1, max(p[1] for p in points))
-
-            shape_color = [
-                int(100 + amplitude * 100),
-                int(50 + amplitude * 50),
-                int(150 + amplitude * 100),
-            ]
-
-            for y in range(min_y, max_y + 1):
-                intersections = []
-                for i in range(len(points)):
-                    p1 = points[i]
-                    p2 = points[(i + 1) % len(points)]
-
-                    if (p1[1] <= y < p2[1]) or (p2[1] <= y < p1[1]):
-                        if p2[1] != p1[1]:
-                            x = p1[0] + (y - p1[1]) * (p2[0] - p1[0]) / (p2[1] - p1[1])
-                            intersections.append(int(x))
-
-                intersections.sort()
-                for i in range(0, len(intersections), 2):
-                    if i + 1 < len(intersections):
-                        x1 = max(0, intersections[i])
-                        x2 = min(width - 1, intersections[i + 1])
-                        for x in range(x1, x2 + 1):
-                            frame[y, x] = shape_color
+        angles = np.arange(num_sides) / num_sides * 2 * np.pi + shape_time
+        points = np.stack(
+            [
+                center_x + (np.cos(angles) * radius).astype(np.int32),
+                center_y + (np.sin(angles) * radius).astype(np.int32),
+            ],
+            axis=1,
+        ).astype(np.int32)
+
+        shape_color = (
+            int(100 + amplitude * 100),
+            int(50 + amplitude * 50),
+            int(150 + amplitude * 100),
+        )
+        cv2.fillConvexPoly(frame, points, shape_color)
 
         return frame
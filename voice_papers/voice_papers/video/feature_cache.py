@@ -0,0 +1,97 @@
+"""On-disk cache for extracted audio features.
+
+Decoding an episode and running beat tracking takes seconds to minutes, and
+the result only depends on the audio bytes and the analysis parameters. The
+features are stored as a small ``.npz`` file next to the audio so re-rendering
+the same episode in another style (or as a preview) skips the analysis.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+# Bump when the meaning of the cached arrays changes
+FEATURE_CACHE_VERSION = 2
+
+# Arrays and scalars persisted from the extract_audio_features() result
+_ARRAY_KEYS = ("rms", "spectral_centroids", "beats")
+_SCALAR_KEYS = ("duration", "tempo", "sr")
+
+
+def hash_file(path: Path, block_size: int = 1 << 20) -> str:
+    """SHA-256 of a file's contents, read in blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def feature_cache_key(
+    audio_path: Path, max_duration: Optional[float], params: dict
+) -> str:
+    """Cache key from the audio content, the analysed span and the parameters."""
+    payload = json.dumps(
+        {
+            "version": FEATURE_CACHE_VERSION,
+            "audio": hash_file(audio_path),
+            "max_duration": max_duration,
+            "params": params,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def feature_cache_path(audio_path: Path, key: str) -> Path:
+    """Location of the cache file for ``key`` (hidden, next to the audio)."""
+    audio_path = Path(audio_path)
+    return audio_path.parent / f".{audio_path.stem}_features_{key[:16]}.npz"
+
+
+def load_features(cache_path: Path, key: str) -> Optional[dict]:
+    """Load cached features, or None if missing, stale or unreadable."""
+    if not cache_path.exists():
+        return None
+
+    try:
+        with np.load(cache_path, allow_pickle=False) as data:
+            if str(data["key"]) != key:
+                return None
+            features = {name: data[name] for name in _ARRAY_KEYS}
+            features["duration"] = float(data["duration"])
+            features["tempo"] = float(data["tempo"])
+            features["sr"] = int(data["sr"])
+        return features
+    except Exception as e:
+        print(f"⚠️  Ignoring unreadable feature cache {cache_path.name}: {e}")
+        return None
+
+
+def save_features(cache_path: Path, key: str, features: dict) -> bool:
+    """Write features atomically; failure (e.g. read-only dir) is not fatal."""
+    arrays = {name: np.asarray(features[name]) for name in _ARRAY_KEYS}
+    scalars = {
+        name: np.asarray(np.asarray(features[name]).item()) for name in _SCALAR_KEYS
+    }
+
+    try:
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=cache_path.name, suffix=".tmp", dir=cache_path.parent
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, key=np.asarray(key), **arrays, **scalars)
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        return True
+    except Exception as e:
+        print(f"⚠️  Could not write feature cache {cache_path.name}: {e}")
+        return False
@@ -0,0 +1,121 @@
+"""Streaming video encoder that pipes raw frames into ffmpeg."""
+
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+
+class FFmpegPipeWriter:
+    """Write raw BGR frames straight into an ffmpeg subprocess.
+
+    Frames are encoded to H.264 as they arrive and, when an audio file is
+    given, the audio track is muxed in the same pass. This replaces the
+    ``cv2.VideoWriter`` temp file plus a second ffmpeg re-encode.
+
+    The interface mirrors ``cv2.VideoWriter`` (``write`` / ``release``) so the
+    render loop can use either backend.
+    """
+
+    def __init__(
+        self,
+        output_path: Path,
+        width: int,
+        height: int,
+        fps: int,
+        audio_path: Optional[Path] = None,
+        preset: str = "medium",
+        crf: int = 23,
+        threads: int = 0,
+    ):
+        """Start the ffmpeg process.
+
+        Args:
+            output_path: Path of the encoded video
+            width: Frame width in pixels
+            height: Frame height in pixels
+            fps: Frame rate of the incoming frames
+            audio_path: Optional audio file to mux into the output
+            preset: libx264 preset (ultrafast ... veryslow)
+            crf: libx264 constant rate factor (lower is better quality)
+            threads: Encoder threads (0 lets ffmpeg decide)
+        """
+        self.output_path = Path(output_path)
+        self.width = width
+        self.height = height
+        self.frame_bytes = width * height * 3
+
+        cmd = [
+            "ffmpeg",
+            "-y",
+            "-loglevel",
+            "error",
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "bgr24",
+            "-s",
+            f"{width}x{height}",
+            "-r",
+            str(fps),
+            "-i",
+            "-",
+        ]
+        if audio_path is not None:
+            cmd += ["-i", str(audio_path), "-map", "0:v", "-map", "1:a"]
+
+        cmd += [
+            "-c:v",
+            "libx264",
+            "-preset",
+            preset,
+            "-crf",
+            str(crf),
+            "-threads",
+            str(threads),
+            "-pix_fmt",
+            "yuv420p",
+        ]
+        if audio_path is not None:
+            cmd += ["-c:a", "aac", "-shortest"]
+        cmd.append(str(self.output_path))
+
+        # ffmpeg's stderr goes to a file so a chatty encoder can never block
+        # the pipe we are writing frames into
+        self._stderr = tempfile.TemporaryFile()
+        self.process = subprocess.Popen(
+            cmd, stdin=subprocess.PIPE, stderr=self._stderr
+        )
+
+    def write(self, frame: np.ndarray):
+        """Send one BGR frame to the encoder."""
+        if frame.shape != (self.height, self.width, 3):
+            raise ValueError(
+                f"Frame shape {frame.shape} does not match "
+                f"{(self.height, self.width, 3)}"
+            )
+        try:
+            self.process.stdin.write(np.ascontiguousarray(frame).data)
+        except BrokenPipeError:
+            self.process.wait()
+            raise RuntimeError(f"ffmpeg exited early: {self._read_stderr()}")
+
+    def release(self):
+        """Flush the encoder and wait for ffmpeg to finish writing the file."""
+        if self.process.stdin and not self.process.stdin.closed:
+            try:
+                self.process.stdin.close()
+            except BrokenPipeError:
+                pass
+        returncode = self.process.wait()
+        error = self._read_stderr()
+        self._stderr.close()
+
+        if returncode != 0:
+            raise RuntimeError(f"ffmpeg encode failed: {error}")
+
+    def _read_stderr(self) -> str:
+        self._stderr.seek(0)
+        return self._stderr.read().decode(errors="replace").strip()
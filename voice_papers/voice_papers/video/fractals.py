@@ -0,0 +1,109 @@
+"""Escape-time fractal kernel.
+
+The previous Julia renderer iterated the whole grid with boolean-mask fancy
+indexing and took ``np.abs`` twice per iteration, so it had to run at a
+fraction of the output resolution and only every few frames. This kernel
+keeps the still-bounded points of a tile in a compact complex64 array that
+shrinks as points escape, updates it in place, tests the squared magnitude
+against the bailout and records a smooth (fractional) escape count for every
+pixel.
+
+Tiles are small enough to stay in cache and can be spread across a thread
+pool; NumPy releases the GIL inside the arithmetic, so tiles run concurrently.
+"""
+
+from concurrent.futures import Executor
+
+import numpy as np
+
+# Escape radius. Larger than the minimal 2 so the smooth count is continuous
+BAILOUT_RADIUS = 4.0
+
+# Points iterated together; small enough for the working arrays to stay in cache
+TILE_POINTS = 1 << 16
+
+_LOG2 = np.log(2.0)
+
+
+def julia_escape_counts(
+    x: np.ndarray,
+    y: np.ndarray,
+    c: complex,
+    max_iter: int,
+    pool: Executor = None,
+) -> np.ndarray:
+    """Smooth escape counts of the Julia set ``z -> z**2 + c``.
+
+    Args:
+        x: Real part of each column of the grid
+        y: Imaginary part of each row of the grid
+        c: Julia constant
+        max_iter: Iteration limit; points that never escape get ``max_iter``
+        pool: Executor the tiles are spread across (None renders them in
+            turn); callers keep one pool for a whole render
+
+    Returns:
+        ``(len(y), len(x))`` float32 array of counts in ``[0, max_iter]``.
+    """
+    x = np.asarray(x, dtype=np.float32)
+    y = np.asarray(y, dtype=np.float32)
+    counts = np.empty((len(y), len(x)), dtype=np.float32)
+
+    rows_per_tile = max(1, TILE_POINTS // max(1, len(x)))
+    tiles = [
+        (start, min(start + rows_per_tile, len(y)))
+        for start in range(0, len(y), rows_per_tile)
+    ]
+
+    def render_tile(tile):
+        start, stop = tile
+        counts[start:stop] = _escape_counts(x, y[start:stop], c, max_iter)
+
+    if pool is not None and len(tiles) > 1:
+        list(pool.map(render_tile, tiles))
+    else:
+        for tile in tiles:
+            render_tile(tile)
+    return counts
+
+
+def _escape_counts(x: np.ndarray, y: np.ndarray, c: complex, max_iter: int):
+    """Escape counts for one tile of rows (see ``julia_escape_counts``)."""
+    size = len(x) * len(y)
+    z = np.empty((len(y), len(x)), dtype=np.complex64)
+    z.real = x[None, :]
+    z.imag = y[:, None]
+    z = z.ravel()
+    counts = np.full(size, max_iter, dtype=np.float32)
+    active = np.arange(size)
+
+    c = np.complex64(c)
+    bailout = np.float32(BAILOUT_RADIUS**2)
+    magnitude = np.empty(size, dtype=np.float32)
+    imag_sq = np.empty(size, dtype=np.float32)
+
+    for i in range(max_iter):
+        n = active.size
+        np.multiply(z.real, z.real, out=magnitude[:n])
+        np.multiply(z.imag, z.imag, out=imag_sq[:n])
+        magnitude[:n] += imag_sq[:n]
+
+        escaped = magnitude[:n] > bailout
+        if escaped.any():
+            # Smooth count: i + 1 - log2(log|z|), with log|z| = log(|z|^2) / 2
+            log_modulus = np.log(magnitude[:n][escaped]) * 0.5
+            counts[active[escaped]] = i + 1 - np.log2(log_modulus / _LOG2)
+
+            # Keep iterating only the points that are still bounded
+            bounded = ~escaped
+            active = active[bounded]
+            if active.size == 0:
+                break
+            z = z[bounded]
+
+        # z = z**2 + c, in place
+        np.multiply(z, z, out=z)
+        z += c
+
+    np.clip(counts, 0, max_iter, out=counts)
+    return counts.reshape(len(y), len(x))
@@ -0,0 +1,157 @@
+"""Per-resolution coordinate grids shared by the procedural backgrounds.
+
+The full-frame backgrounds (plasma, aurora, nebula, ...) used to build fresh
+``np.meshgrid`` arrays, distance fields and angle fields on every frame even
+though those only depend on the frame size. ``frame_geometry`` builds them
+once per resolution as float32 and keeps them around for the whole render.
+
+Coordinates are always expressed in output pixels. A geometry can sample them
+on a smaller compute grid, so a background rendered at a reduced
+``background_scale`` shows the same pattern and only needs upscaling.
+"""
+
+from functools import cached_property, lru_cache
+
+import cv2
+import numpy as np
+
+
+def scaled_size(width: int, height: int, scale: float) -> tuple:
+    """Compute-grid size for rendering a ``width x height`` frame at ``scale``."""
+    if scale >= 1.0:
+        return width, height
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def _axis(size: int, samples: int) -> np.ndarray:
+    """Output-pixel coordinates of ``samples`` evenly spaced pixel centres."""
+    if samples == size:
+        return np.arange(size, dtype=np.float32)
+    # Centre of each compute pixel mapped back onto the output pixel grid
+    return ((np.arange(samples) + 0.5) * (size / samples) - 0.5).astype(np.float32)
+
+
+class FrameGeometry:
+    """Coordinate grids of one output size, sampled on a compute grid.
+
+    ``x`` is a ``(1, W)`` row and ``y`` a ``(H, 1)`` column so terms that only
+    depend on one axis broadcast instead of costing a full frame. Derived
+    full-frame fields are computed on first use and then reused.
+    """
+
+    def __init__(
+        self, width: int, height: int, compute_width: int, compute_height: int
+    ):
+        self.width = width
+        self.height = height
+        self.shape = (compute_height, compute_width)
+        self.max_side = max(width, height)
+
+        self.x = _axis(width, compute_width)[None, :]
+        self.y = _axis(height, compute_height)[:, None]
+        self.x_norm = self.x / np.float32(width)
+        self.y_norm = self.y / np.float32(height)
+
+        # Offsets from the frame centre
+        self.dx = self.x - np.float32(width / 2)
+        self.dy = self.y - np.float32(height / 2)
+
+    @cached_property
+    def x_plus_y(self) -> np.ndarray:
+        return self.x + self.y
+
+    @cached_property
+    def x_minus_y(self) -> np.ndarray:
+        return self.x - self.y
+
+    @cached_property
+    def x_times_y(self) -> np.ndarray:
+        return self.x * self.y
+
+    @cached_property
+    def sqrt_abs_xy(self) -> np.ndarray:
+        return np.sqrt(np.abs(self.x_times_y))
+
+    @cached_property
+    def origin_distance(self) -> np.ndarray:
+        """Distance from the top-left corner."""
+        return np.hypot(self.x, self.y)
+
+    @cached_property
+    def radius(self) -> np.ndarray:
+        """Distance from the frame centre."""
+        return np.hypot(self.dx, self.dy)
+
+    @cached_property
+    def radius_norm(self) -> np.ndarray:
+        """Distance from the centre relative to the longer frame side."""
+        return self.radius / np.float32(self.max_side)
+
+    @cached_property
+    def angle(self) -> np.ndarray:
+        """Angle around the frame centre in radians."""
+        return np.arctan2(self.dy, self.dx)
+
+    def wave(
+        self, fx: float, fy: float, phase: float, out=None, scratch=None
+    ) -> np.ndarray:
+        """``sin(fx * x + fy * y + phase)`` over the whole frame.
+
+        Expanded as ``sin(a)cos(b) + cos(a)sin(b)`` of a row and a column so
+        only the per-axis terms need trigonometry. ``out`` receives the result
+        and ``scratch`` holds the second term (both compute-grid float32
+        arrays); without them the arrays are allocated.
+        """
+        a = self.x * np.float32(fx)
+        b = self.y * np.float32(fy) + np.float32(phase)
+        result = np.multiply(np.sin(a), np.cos(b), out=out)
+        result += np.multiply(np.cos(a), np.sin(b), out=scratch)
+        return result
+
+
+@lru_cache(maxsize=8)
+def frame_geometry(
+    width: int, height: int, compute_width: int = None, compute_height: int = None
+) -> FrameGeometry:
+    """Shared geometry for a ``width x height`` output (optionally subsampled)."""
+    return FrameGeometry(
+        width, height, compute_width or width, compute_height or height
+    )
+
+
+def blend_colors(
+    frame: np.ndarray, factor: np.ndarray, color1, color2, scratch=None
+) -> np.ndarray:
+    """Fill a BGR frame with ``color1 * (1 - factor) + color2 * factor``.
+
+    Colours are RGB tuples; ``factor`` (0-1) broadcasts against the frame.
+    ``scratch`` is an optional float32 plane of the frame's size for the
+    per-channel values.
+    """
+    factor = np.broadcast_to(factor, frame.shape[:2])
+    for channel, component in enumerate((2, 1, 0)):
+        start = np.float32(color1[component])
+        delta = np.float32(color2[component] - color1[component])
+        value = np.multiply(factor, delta, out=scratch)
+        value += start
+        frame[:, :, channel] = value
+    return frame
+
+
+def sine_field(
+    base: np.ndarray, frequency: float, phase: float, weight: float = 1.0, out=None
+) -> np.ndarray:
+    """``sin(base * frequency + phase) * weight``, written into ``out``."""
+    result = np.multiply(base, frequency, out=out)
+    result += phase
+    np.sin(result, out=result)
+    if weight != 1.0:
+        result *= weight
+    return result
+
+
+def upscale(frame: np.ndarray, width: int, height: int) -> np.ndarray:
+    """Resize a reduced-resolution background to the output size."""
+    if frame.shape[1] == width and frame.shape[0] == height:
+        return frame
+    return cv2.resize(frame, (width, height), interpolation=cv2.INTER_LINEAR)
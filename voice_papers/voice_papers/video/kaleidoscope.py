@@ -0,0 +1,329 @@
+"""Rotational-symmetry renderer for the kaleidoscope styles.
+
+The kaleidoscope family draws the same motif once per segment, rotating every
+point in Python and issuing one OpenCV call per line and segment.
+``SymmetryCanvas`` collects the motif of segment 0 as batches of primitives
+and only rasterizes the copies that touch the first wedge (angles
+``[0, 2 * pi / segments)`` around the centre). Every other wedge is built with
+one ``cv2.remap`` through maps that rotate each pixel back into the first
+wedge; the maps only depend on the frame size, the centre and the segment
+count and are cached.
+
+The wedge is rasterized as labels rather than colours: each label remembers
+which primitive and which copy it came from, so wedge ``k`` shows the colours
+of segment ``copy + k`` as if every segment had been drawn. Where copies
+overlap, the copy drawn last wins inside the first wedge, which matches the
+per-segment order except where an overlap straddles the wrap from the last
+segment back to the first. Remapping also rounds every pixel to the nearest
+source pixel, so thin diagonal lines can come out up to a pixel off. Both
+only touch a small fraction of the drawn pixels.
+"""
+
+import math
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import cv2
+import numpy as np
+
+MAP_CACHE_SIZE = 8  # Cached map sets; k-laser changes its segment count
+MAP_RADIUS_STEP = 64  # Maps grow in steps so a pulsing motif reuses them
+
+_map_cache = OrderedDict()
+_map_lock = threading.Lock()
+
+
+@lru_cache(maxsize=2)
+def _polar_grid(width: int, height: int, center: tuple) -> tuple:
+    """Distance from ``center`` and angle (in turns) of every pixel."""
+    dx = np.arange(width, dtype=np.float32) - center[0]
+    dy = np.arange(height, dtype=np.float32)[:, None] - center[1]
+    distance = np.hypot(dx, dy)
+    turns = np.arctan2(dy, dx) / np.float32(2 * math.pi)
+    turns[turns < 0] += 1
+    return distance, turns
+
+
+def symmetry_maps(
+    width: int, height: int, center: tuple, segments: int, radius: int
+) -> tuple:
+    """Maps rotating every pixel around ``center`` into the first wedge.
+
+    The maps cover the square of ``radius`` (rounded up to
+    ``MAP_RADIUS_STEP``) around the centre, clipped to the frame. They are
+    cached per frame size, centre and segment count, and rebuilt larger when
+    a motif reaches further than the cached ones.
+
+    Returns:
+        ``(radius, origin, maps, wedge)``: the radius covered, the frame
+        position ``(x, y)`` of ``maps[0, 0]``, int16 ``(x, y)`` source
+        positions for ``cv2.remap`` relative to ``center - radius``, and the
+        int16 index of the wedge each pixel lies in. Wedge ``k`` covers
+        angles ``[k, k + 1) * 2 * pi / segments``.
+    """
+    key = (width, height, center, segments)
+    with _map_lock:
+        cached = _map_cache.get(key)
+        if cached is not None and cached[0] >= radius:
+            _map_cache.move_to_end(key)
+            return cached
+
+    radius = -(-radius // MAP_RADIUS_STEP) * MAP_RADIUS_STEP
+    center_x, center_y = center
+    x0, y0 = max(center_x - radius, 0), max(center_y - radius, 0)
+    x1 = min(center_x + radius + 1, width)
+    y1 = min(center_y + radius + 1, height)
+    distance, turns = _polar_grid(width, height, center)
+    distance = distance[y0:y1, x0:x1]
+
+    # Wedge index and the angle within the wedge, rotated back to the first
+    wedges = turns[y0:y1, x0:x1] * np.float32(segments)
+    wedge = wedges.astype(np.int16)
+    np.minimum(wedge, segments - 1, out=wedge)
+    wedges -= wedge
+    wedges *= np.float32(2 * math.pi / segments)
+    map_x, map_y = cv2.polarToCart(distance, wedges)
+    map_x += radius
+    map_y += radius
+    maps, _ = cv2.convertMaps(map_x, map_y, cv2.CV_16SC2, nninterpolation=True)
+
+    entry = (radius, (x0, y0), maps, wedge)
+    with _map_lock:
+        _map_cache[key] = entry
+        _map_cache.move_to_end(key)
+        while len(_map_cache) > MAP_CACHE_SIZE:
+            _map_cache.popitem(last=False)
+    return entry
+
+
+class SymmetryCanvas:
+    """Collects the motif of one segment and draws all rotated copies.
+
+    Coordinates are absolute pixel positions of the copy in segment 0. Colours
+    are one BGR colour, a ``(segments, 3)`` array with the colour of the copy
+    in every segment, or (for the batch methods ``lines``, ``polyline`` and
+    ``circles``) a ``(count, segments, 3)`` array with one such row per
+    primitive.
+
+    Primitives are drawn segment by segment. Call ``next_layer`` to draw what
+    follows over every copy of what came before instead, as the styles do
+    when they finish one ring or layer before starting the next.
+    """
+
+    def __init__(self, width: int, height: int, center: tuple, segments: int):
+        self.width = width
+        self.height = height
+        self.center = (int(center[0]), int(center[1]))
+        self.segments = segments
+        # Rotation of segment k as a unit complex number
+        self._phases = np.exp(2j * math.pi / segments * np.arange(segments))
+        # Layers of batches of primitives of one kind: (kind, offsets, size,
+        # colors) with offsets from the centre as complex (count, vertices)
+        # and colors (count, segments, 3), or (segments, 3) shared by the
+        # whole batch
+        self._layers = [[]]
+
+    def next_layer(self):
+        """Draw the primitives added from now on over all earlier copies."""
+        if self._layers[-1]:
+            self._layers.append([])
+
+    def line(self, start, end, colors, thickness: int = 1):
+        self.lines([start], [end], colors, thickness)
+
+    def lines(self, starts, ends, colors, thickness: int = 1):
+        """Add separate lines of one thickness."""
+        points = np.stack(
+            [np.asarray(starts, dtype=np.float64), np.asarray(ends, dtype=np.float64)],
+            axis=1,
+        )
+        self._add("line", points, thickness, colors)
+
+    def polyline(self, points, colors, thickness: int = 1, closed: bool = False):
+        """Add a polyline as individual lines."""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if closed and len(points) > 2:
+            points = np.vstack([points, points[:1]])
+        if len(points) < 2:
+            return
+        self._add(
+            "line", np.stack([points[:-1], points[1:]], axis=1), thickness, colors
+        )
+
+    def circle(self, center, radius: int, colors, thickness: int = -1):
+        self.circles([center], radius, colors, thickness)
+
+    def circles(self, centers, radius: int, colors, thickness: int = -1):
+        """Add circles of one size."""
+        centers = np.asarray(centers, dtype=np.float64).reshape(-1, 1, 2)
+        self._add("circle", centers, (radius, thickness), colors)
+
+    def fill_poly(self, points, colors):
+        self._add("poly", np.asarray(points, dtype=np.float64)[None], None, colors)
+
+    def _add(self, kind, points, size, colors):
+        center_x, center_y = self.center
+        offsets = (points[..., 0] - center_x) + 1j * (points[..., 1] - center_y)
+        colors = np.asarray(colors, dtype=np.uint8)
+        if colors.ndim < 3:
+            colors = np.broadcast_to(colors, (self.segments, 3))
+        self._layers[-1].append((kind, offsets, size, colors))
+
+    @staticmethod
+    def _padding(kind, size) -> float:
+        """How far a primitive's pixels reach beyond its vertices."""
+        if kind == "line":
+            return size / 2 + 1
+        if kind == "circle":
+            radius, thickness = size
+            return radius + max(thickness, 0) / 2 + 1
+        return 1
+
+    def _wedge_box(self, radius: int, start: int, stop: int) -> tuple:
+        """Bounding box ``(x0, x1, y0, y1)`` of wedges ``start:stop`` as offsets.
+
+        Two pixels of margin cover pixels that remapping rounds across a
+        wedge border.
+        """
+        segment_angle = 2 * math.pi / self.segments
+        low, high = start * segment_angle, stop * segment_angle
+        angles = [low, high] + [
+            quarter * math.pi / 2
+            for quarter in range(5)
+            if low < quarter * math.pi / 2 < high
+        ]
+        corners = np.append(radius * np.exp(1j * np.array(angles)), 0)
+        return (
+            corners.real.min() - 2,
+            corners.real.max() + 2,
+            corners.imag.min() - 2,
+            corners.imag.max() + 2,
+        )
+
+    def render(self, frame: np.ndarray):
+        """Draw every segment's copy of the collected primitives onto ``frame``."""
+        batches = [batch for layer in self._layers for batch in layer]
+        if not batches:
+            return
+        segments = self.segments
+        center_x, center_y = self.center
+
+        reach = max(
+            np.abs(offsets).max() + self._padding(kind, size)
+            for kind, offsets, size, _ in batches
+        )
+        reach = int(math.ceil(reach)) + 1
+        radius, (map_x, map_y), maps, wedge = symmetry_maps(
+            self.width, self.height, self.center, segments, reach
+        )
+
+        # Find the copies of every primitive that touch the first wedge, with
+        # label slots: one per shared-colour batch, one per primitive otherwise
+        box = self._wedge_box(reach, 0, 1)
+        tables = []
+        draws = []
+        touching = set()
+        for layer in self._layers:
+            layer_draws = []
+            for kind, offsets, size, colors in layer:
+                slot = sum(len(table) for table in tables)
+                tables.append(colors[None] if colors.ndim == 2 else colors)
+                rotated = offsets * self._phases[:, None, None]
+                pad = self._padding(kind, size)
+                touches = (
+                    (rotated.real.min(axis=2) - pad <= box[1])
+                    & (rotated.real.max(axis=2) + pad >= box[0])
+                    & (rotated.imag.min(axis=2) - pad <= box[3])
+                    & (rotated.imag.max(axis=2) + pad >= box[2])
+                )
+                pixels = np.empty(rotated.shape + (2,), dtype=np.int32)
+                pixels[..., 0] = rotated.real + center_x
+                pixels[..., 1] = rotated.imag + center_y
+                pixels -= (center_x - radius, center_y - radius)
+                copies = {
+                    copy: np.flatnonzero(touches[copy])
+                    for copy in np.flatnonzero(touches.any(axis=1)).tolist()
+                }
+                touching.update(copies)
+                layer_draws.append((kind, pixels, size, copies, slot, colors.ndim))
+            draws.append(layer_draws)
+        if not touching:
+            return
+
+        # Labels are 1 + slot * segments + copy. Wedge k shows a copy in the
+        # colour of segment copy + k, so the colour table has a row per wedge
+        colors = np.concatenate(tables)
+        rotate = (np.arange(segments)[:, None] + np.arange(segments)) % segments
+        table = np.zeros((segments, 1 + len(colors) * segments, 3), dtype=np.uint8)
+        table[:, 1:] = colors[:, rotate].transpose(1, 0, 2, 3).reshape(segments, -1, 3)
+        if table.shape[1] > np.iinfo(np.int16).max:
+            raise ValueError("Too many primitives for one SymmetryCanvas")
+
+        # Wedge k stacks the copies touching the first wedge in the order of
+        # the segments they become, copy + k. That order only changes where
+        # one of them wraps past the last segment, so the wedges between two
+        # such points share one rasterization of the first wedge
+        starts = sorted({0} | {(segments - copy) % segments for copy in touching})
+        for start, stop in zip(starts, starts[1:] + [segments]):
+            order = sorted(touching, key=lambda copy: (copy + start) % segments)
+            labels = self._rasterize(draws, order, radius)
+
+            # Build these wedges from the first one, then look the colours up
+            # with a second remap through the table
+            low_x, high_x, low_y, high_y = self._wedge_box(reach, start, stop)
+            x0 = max(center_x + int(math.floor(low_x)), 0, map_x)
+            y0 = max(center_y + int(math.floor(low_y)), 0, map_y)
+            x1 = min(center_x + int(math.ceil(high_x)) + 1, map_x + maps.shape[1])
+            y1 = min(center_y + int(math.ceil(high_y)) + 1, map_y + maps.shape[0])
+            if x0 >= x1 or y0 >= y1:
+                continue
+            rows = slice(y0 - map_y, y1 - map_y)
+            cols = slice(x0 - map_x, x1 - map_x)
+            remapped = cv2.remap(labels, maps[rows, cols], None, cv2.INTER_NEAREST)
+            lookup = cv2.merge([remapped.view(np.int16), wedge[rows, cols]])
+            pattern = cv2.remap(table, lookup, None, cv2.INTER_NEAREST)
+            mask = cv2.compare(remapped, 0, cv2.CMP_GT)
+            if stop - start < segments:
+                in_wedges = cv2.inRange(wedge[rows, cols], start, stop - 1)
+                mask = cv2.bitwise_and(mask, in_wedges)
+            cv2.copyTo(pattern, mask, frame[y0:y1, x0:x1])
+
+    def _rasterize(self, draws, order, radius: int) -> np.ndarray:
+        """Draw the copies in ``order`` that touch the first wedge as labels."""
+        segments = self.segments
+        labels = np.zeros((2 * radius + 1, 2 * radius + 1), dtype=np.uint16)
+        for layer_draws in draws:
+            for copy in order:
+                for kind, pixels, size, copies, slot, ndim in layer_draws:
+                    selected = copies.get(copy)
+                    if selected is None:
+                        continue
+                    pts = pixels[copy]
+                    if ndim == 2:
+                        label = 1 + slot * segments + copy
+                        if kind == "line":
+                            cv2.polylines(
+                                labels, list(pts[selected]), False, label, size
+                            )
+                        elif kind == "circle":
+                            circle_radius, thickness = size
+                            for (center,) in pts[selected].tolist():
+                                cv2.circle(
+                                    labels, center, circle_radius, label, thickness
+                                )
+                        else:
+                            cv2.fillPoly(labels, list(pts[selected]), label)
+                        continue
+                    for index in selected.tolist():
+                        label = 1 + (slot + index) * segments + copy
+                        if kind == "line":
+                            start, end = pts[index].tolist()
+                            cv2.line(labels, start, end, label, size)
+                        elif kind == "circle":
+                            circle_radius, thickness = size
+                            (center,) = pts[index].tolist()
+                            cv2.circle(labels, center, circle_radius, label, thickness)
+                        else:
+                            cv2.fillPoly(labels, [pts[index]], label)
+        return labels
@@ -0,0 +1,200 @@
+"""Precomputed colour tables for the particle colour schemes.
+
+Every particle, connection and glow used to get its colour from a branchy
+pure-Python HSV conversion behind a per-call scheme dispatch. HSV to RGB is
+separable: each channel is ``v * (1 - s) + v * s * p(h)`` where ``p`` is a
+fixed piecewise-linear pattern of the hue. ``p`` is tabulated once at 0.1°
+resolution, so a conversion is a table lookup plus a multiply-add, for one
+colour or for a whole array of them.
+
+A ``Palette`` resolves a colour scheme and its gradient colours once per
+render and exposes both a vectorized ``colors`` and a scalar ``color`` API.
+"""
+
+import numpy as np
+
+# Hue table resolution (entries per degree)
+HUE_LUT_RESOLUTION = 10
+HUE_LUT_SIZE = 360 * HUE_LUT_RESOLUTION + 1
+
+# Hue offsets of the discrete colour schemes
+_DISSONANT_OFFSETS = (150, 180, 210, 270)
+_TRIADIC_OFFSETS = (0, 120, 240)
+
+
+def _build_hue_pattern() -> np.ndarray:
+    """``p(h)`` per BGR channel for hues 0..360 (both ends included)."""
+    hue = np.arange(HUE_LUT_SIZE) / HUE_LUT_RESOLUTION
+    # Distance of the hue from each primary's peak, mapped to a 0-1 ramp
+    pattern = []
+    for offset in (1, 3, 5):  # B, G, R (peaks at 240, 120 and 0 degrees)
+        k = (offset + hue / 60.0) % 6
+        pattern.append(1 - np.clip(np.minimum(k, 4 - k), 0, 1))
+    return np.stack(pattern, axis=1)
+
+
+HUE_PATTERN = _build_hue_pattern()
+# Plain Python rows for the scalar path (faster than indexing NumPy per call)
+_HUE_PATTERN_ROWS = [tuple(row) for row in HUE_PATTERN.tolist()]
+
+
+def _hue_index(h):
+    """Table index for hue(s) in degrees, clamped to 0..360."""
+    return np.rint(np.clip(h, 0, 360) * HUE_LUT_RESOLUTION).astype(np.int64)
+
+
+def hsv_to_bgr(h, s, v) -> np.ndarray:
+    """Convert arrays of HSV values (hue 0-360, s/v 0-255) to BGR.
+
+    Returns an ``(N, 3)`` uint8 array (or ``(3,)`` for scalar input).
+    """
+    s = np.clip(np.asarray(s, dtype=np.float64), 0, 255) / 255.0
+    v = np.clip(np.asarray(v, dtype=np.float64), 0, 255)
+    pattern = HUE_PATTERN[_hue_index(np.asarray(h, dtype=np.float64))]
+
+    chroma = (v * s)[..., None]
+    bgr = (v[..., None] - chroma) + chroma * pattern
+    return bgr.astype(np.uint8)
+
+
+def hsv_to_bgr_scalar(h, s, v) -> tuple:
+    """Single-colour ``hsv_to_bgr`` returning a tuple of Python ints."""
+    h = 0 if h < 0 else 360 if h > 360 else h
+    s = 0 if s < 0 else 255 if s > 255 else s
+    v = 0 if v < 0 else 255 if v > 255 else v
+
+    p_b, p_g, p_r = _HUE_PATTERN_ROWS[int(h * HUE_LUT_RESOLUTION + 0.5)]
+    chroma = v * s / 255.0
+    base = v - chroma
+    return (
+        int(base + chroma * p_b),
+        int(base + chroma * p_g),
+        int(base + chroma * p_r),
+    )
+
+
+def rgb_to_hue(rgb) -> np.ndarray:
+    """Hue in degrees (0-360) of RGB colours."""
+    rgb = np.asarray(rgb, dtype=np.float64).reshape(-1, 3) / 255.0
+    r, g, b = rgb.T
+    max_val = rgb.max(axis=1)
+    diff = max_val - rgb.min(axis=1)
+    safe = np.where(diff == 0, 1, diff)
+
+    hue = np.where(
+        max_val == r,
+        (60 * ((g - b) / safe) + 360) % 360,
+        np.where(
+            max_val == g,
+            (60 * ((b - r) / safe) + 120) % 360,
+            (60 * ((r - g) / safe) + 240) % 360,
+        ),
+    )
+    return np.where(diff == 0, 0.0, hue)
+
+
+class Palette:
+    """Particle colours for one colour scheme and gradient, resolved once.
+
+    Colour schemes:
+        - "multicolor": Rainbow colors
+        - "background": Colors similar to the background gradient
+        - "dissonant": Contrasting/clashing colors
+        - "triadic": Triadic complementary color scheme
+        - "monochrome": Exact background gradient colors
+    """
+
+    def __init__(self, color_scheme: str = "multicolor", gradient_colors: list = None):
+        self.color_scheme = color_scheme
+        gradient_colors = gradient_colors or [(0, 0, 0)]
+        self.gradient_rgb = np.asarray(gradient_colors, dtype=np.float64)
+        self.gradient_hues = rgb_to_hue(self.gradient_rgb)
+
+        # Python copies for the scalar path
+        self._gradient_rgb_rows = [tuple(c) for c in self.gradient_rgb.tolist()]
+        self._gradient_hue_list = self.gradient_hues.tolist()
+
+    def colors(self, ids, base_hue: float, amplitude, time: float) -> np.ndarray:
+        """Colours for an array of particle ids.
+
+        ``amplitude`` may be a scalar or one value per particle. Returns an
+        ``(N, 3)`` uint8 array of BGR colours.
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        amplitude = np.broadcast_to(np.asarray(amplitude, dtype=np.float64), ids.shape)
+        scheme = self.color_scheme
+
+        if scheme == "background":
+            bg_hue = self.gradient_hues[ids % len(self.gradient_hues)]
+            # Slight variation while staying close to the background (±30°)
+            hue_variation = (ids * 5 + time * 10) % 60 - 30
+            brightness = np.trunc(100 + 100 * amplitude + (ids % 50))
+            saturation = np.minimum(255, 150 + np.trunc(50 * amplitude))
+            return hsv_to_bgr(
+                (bg_hue + hue_variation) % 360, saturation, np.minimum(255, brightness)
+            )
+        elif scheme == "dissonant":
+            offset = np.asarray(_DISSONANT_OFFSETS)[ids % len(_DISSONANT_OFFSETS)]
+            hue = (base_hue + offset + ids * 7) % 360
+            saturation = 220 + np.trunc(35 * amplitude)
+            brightness_base = np.where(ids % 2 == 0, 180, 80)
+            brightness = np.trunc(brightness_base + 75 * amplitude)
+            return hsv_to_bgr(
+                hue, np.minimum(255, saturation), np.minimum(255, brightness)
+            )
+        elif scheme == "triadic":
+            hue = (base_hue + np.asarray(_TRIADIC_OFFSETS)[ids % 3] + time * 5) % 360
+            saturation = 160 + np.trunc(60 * amplitude)
+            brightness = np.trunc(140 + 80 * amplitude + (ids % 40))
+            return hsv_to_bgr(
+                hue, np.minimum(255, saturation), np.minimum(255, brightness)
+            )
+        elif scheme == "monochrome":
+            rgb = self.gradient_rgb[ids % len(self.gradient_rgb)]
+            brightness_factor = (0.7 + 0.3 * amplitude)[:, None]
+            rgb = np.clip(np.trunc(rgb * brightness_factor), 0, 255)
+            return rgb[:, ::-1].astype(np.uint8)
+        else:  # multicolor (default)
+            hue = (base_hue + ids * 3 + time * 20) % 360
+            brightness = np.minimum(255, np.trunc(120 + 135 * amplitude))
+            return hsv_to_bgr(hue, 180, brightness)
+
+    def color(
+        self, particle_id: int, base_hue: float, amplitude: float, time: float
+    ) -> tuple:
+        """Colour of a single particle as a BGR tuple of ints."""
+        scheme = self.color_scheme
+
+        if scheme == "background":
+            bg_hue = self._gradient_hue_list[particle_id % len(self._gradient_hue_list)]
+            hue_variation = (particle_id * 5 + time * 10) % 60 - 30
+            brightness = int(100 + 100 * amplitude + (particle_id % 50))
+            saturation = min(255, 150 + int(50 * amplitude))
+            return hsv_to_bgr_scalar(
+                (bg_hue + hue_variation) % 360, saturation, min(255, brightness)
+            )
+        elif scheme == "dissonant":
+            offset = _DISSONANT_OFFSETS[particle_id % len(_DISSONANT_OFFSETS)]
+            hue = (base_hue + offset + particle_id * 7) % 360
+            saturation = 220 + int(35 * amplitude)
+            brightness_base = 180 if particle_id % 2 == 0 else 80
+            brightness = int(brightness_base + 75 * amplitude)
+            return hsv_to_bgr_scalar(hue, min(255, saturation), min(255, brightness))
+        elif scheme == "triadic":
+            hue = (base_hue + _TRIADIC_OFFSETS[particle_id % 3] + time * 5) % 360
+            saturation = 160 + int(60 * amplitude)
+            brightness = int(140 + 80 * amplitude + (particle_id % 40))
+            return hsv_to_bgr_scalar(hue, min(255, saturation), min(255, brightness))
+        elif scheme == "monochrome":
+            r, g, b = self._gradient_rgb_rows[
+                particle_id % len(self._gradient_rgb_rows)
+            ]
+            factor = 0.7 + 0.3 * amplitude
+            return (
+                max(0, min(255, int(b * factor))),
+                max(0, min(255, int(g * factor))),
+                max(0, min(255, int(r * factor))),
+            )
+        else:  # multicolor (default)
+            hue = (base_hue + particle_id * 3 + time * 20) % 360
+            return hsv_to_bgr_scalar(hue, 180, min(255, int(120 + 135 * amplitude)))
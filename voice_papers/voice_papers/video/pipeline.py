@@ -0,0 +1,89 @@
+"""Thread pipeline for overlapping the stages of the render loop.
+
+Rendering a frame is three steps that used to run strictly one after
+another: compute the background, draw the waveform on top and hand the frame
+to the encoder. NumPy, OpenCV and the pipe write into ffmpeg release the GIL
+for most of their work, so running each step on its own thread lets the
+background of frame n+1 be computed while frame n is drawn and frame n-1 is
+being written.
+
+Stages are connected by bounded queues. A stage that gets ahead blocks once
+its output queue is full, so the number of frames in flight (and the memory
+they use) stays fixed at ``len(stages) + (len(stages) - 1) * depth``.
+"""
+
+import queue
+import threading
+
+# How often blocked stages check whether another stage has failed (seconds)
+_POLL_INTERVAL = 0.1
+
+_DONE = object()
+
+
+def run_pipeline(items, stages: list, depth: int = 2):
+    """Pass every item through ``stages`` in order, one thread per stage.
+
+    Each stage is a callable taking the previous stage's result (the first
+    one takes the item); the last stage's results are discarded. Items are
+    processed in order. If a stage raises, the pipeline stops and the
+    exception is re-raised here.
+
+    Args:
+        items: Iterable of inputs to the first stage
+        stages: Callables applied one after another
+        depth: Capacity of the queue between two stages
+    """
+    stop = threading.Event()
+    errors = []
+    queues = [queue.Queue(maxsize=depth) for _ in stages[1:]]
+
+    def put(target, item) -> bool:
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def get(source):
+        while not stop.is_set():
+            try:
+                return source.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def run_stage(index: int):
+        stage = stages[index]
+        source = iter(items) if index == 0 else None
+        target = queues[index] if index < len(queues) else None
+        try:
+            while True:
+                if source is not None:
+                    item = next(source, _DONE)
+                else:
+                    item = get(queues[index - 1])
+                if item is _DONE:
+                    break
+                result = stage(item)
+                if target is not None and not put(target, result):
+                    return
+            if target is not None:
+                put(target, _DONE)
+        except BaseException as e:
+            errors.append(e)
+            stop.set()
+
+    threads = [
+        threading.Thread(target=run_stage, args=(index,), daemon=True)
+        for index in range(len(stages))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
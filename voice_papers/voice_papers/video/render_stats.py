@@ -0,0 +1,161 @@
+"""Per-stage timing of a render.
+
+``RenderStats`` times the stages of ``create_video`` (audio analysis,
+background acquisition, per-frame background and waveform drawing, frame
+writes and the final ffmpeg step) and writes them as a JSON report next to
+the output video, so a slow render shows which stage the time went to.
+
+Per-frame stages are recorded into fixed log-spaced histograms rather than
+lists of samples: memory stays constant over hours of frames, percentiles
+are accurate to the bucket width (5%), and histograms from the segment
+worker processes merge by adding their counts.
+"""
+
+import json
+import math
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+
+# Histogram buckets: 0.01 ms up to ~9 hours, each 5% wider than the last
+_MIN_MS = 0.01
+_GROWTH = 1.05
+_BUCKETS = 450
+
+
+class StageHistogram:
+    """Durations of one stage (in ms), bucketed on a log scale."""
+
+    def __init__(self):
+        self.counts = np.zeros(_BUCKETS, dtype=np.int64)
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = math.inf
+        self.max_ms = 0.0
+
+    def add(self, ms: float):
+        if ms > _MIN_MS:
+            bucket = min(int(math.log(ms / _MIN_MS, _GROWTH)), _BUCKETS - 1)
+        else:
+            bucket = 0
+        self.counts[bucket] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.min_ms = min(self.min_ms, ms)
+        self.max_ms = max(self.max_ms, ms)
+
+    def merge(self, other: "StageHistogram"):
+        self.counts += other.counts
+        self.count += other.count
+        self.total_ms += other.total_ms
+        self.min_ms = min(self.min_ms, other.min_ms)
+        self.max_ms = max(self.max_ms, other.max_ms)
+
+    def percentile(self, q: float) -> float:
+        """Approximate ``q``-th percentile (0-100) in ms."""
+        if not self.count:
+            return 0.0
+        bucket = int(np.searchsorted(np.cumsum(self.counts), q / 100 * self.count))
+        # Geometric middle of the bucket, within the range of the samples
+        estimate = _MIN_MS * _GROWTH ** (bucket + 0.5)
+        return min(max(estimate, self.min_ms), self.max_ms)
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "total_s": round(self.total_ms / 1000, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50), 3),
+            "p95_ms": round(self.percentile(95), 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class RenderStats:
+    """Stage timings, frame throughput and ETA of one render."""
+
+    def __init__(self):
+        self.stages = {}
+        self.started = time.perf_counter()
+        self.total_frames = 0
+        self.frames_done = 0
+        self._frames_started = None
+        self._frames_finished = None
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block as one sample of stage ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+    def record(self, name: str, ms: float):
+        histogram = self.stages.get(name)
+        if histogram is None:
+            histogram = self.stages[name] = StageHistogram()
+        histogram.add(ms)
+
+    def merge(self, other: "RenderStats"):
+        """Add the stage samples of ``other`` (e.g. from a worker process)."""
+        for name, histogram in other.stages.items():
+            self.stages.setdefault(name, StageHistogram()).merge(histogram)
+
+    def begin_frames(self, total_frames: int):
+        """Mark the start of the frame loop."""
+        self.total_frames = total_frames
+        self._frames_started = time.perf_counter()
+
+    def frames_written(self, count: int = 1):
+        self.frames_done += count
+        self._frames_finished = time.perf_counter()
+
+    def fps(self) -> float:
+        """Frames written per second of the frame loop so far."""
+        if self._frames_started is None or self._frames_finished is None:
+            return 0.0
+        elapsed = self._frames_finished - self._frames_started
+        return self.frames_done / elapsed if elapsed > 0 else 0.0
+
+    def eta(self) -> float:
+        """Estimated seconds until every frame is written."""
+        fps = self.fps()
+        if not fps:
+            return float("inf")
+        return max(self.total_frames - self.frames_done, 0) / fps
+
+    def progress_text(self) -> str:
+        eta = self.eta()
+        eta_text = "?" if math.isinf(eta) else _format_seconds(eta)
+        return f"{self.fps():.1f} fps, ETA {eta_text}"
+
+    def summary(self) -> dict:
+        return {
+            "wall_s": round(time.perf_counter() - self.started, 3),
+            "frames": self.frames_done,
+            "effective_fps": round(self.fps(), 2),
+            "stages": {
+                name: histogram.summary() for name, histogram in self.stages.items()
+            },
+        }
+
+    def write_report(self, path: Path, **metadata) -> Path:
+        """Write the summary (plus ``metadata``) as JSON to ``path``."""
+        report = {**metadata, **self.summary()}
+        Path(path).write_text(json.dumps(report, indent=2, default=str) + "\n")
+        return Path(path)
+
+
+def render_report_path(output_path: Path) -> Path:
+    """Report file stored next to ``output_path`` (``video.render.json``)."""
+    output_path = Path(output_path)
+    return output_path.with_name(f"{output_path.stem}.render.json")
+
+
+def _format_seconds(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
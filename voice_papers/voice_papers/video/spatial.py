@@ -0,0 +1,80 @@
+"""Uniform-grid neighbour search for point sets.
+
+Styles that connect nearby points (the network/web style) used to test every
+pair of points, which is quadratic in the point count. Bucketing the points
+into a grid whose cells are as large as the search radius means a point can
+only have neighbours in its own cell and the eight cells around it, so the
+candidate pairs stay proportional to the number of points for a given
+density.
+"""
+
+import numpy as np
+
+# Half of the 3x3 neighbourhood (plus the cell itself): every unordered pair
+# of adjacent cells is visited exactly once
+_FORWARD_CELLS = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+
+
+def neighbor_pairs(points: np.ndarray, radius: float) -> tuple:
+    """All pairs of points closer than ``radius`` to each other.
+
+    Args:
+        points: ``(N, 2)`` array of x, y coordinates
+        radius: Connection distance (pairs with distance < radius are returned)
+
+    Returns:
+        ``(i, j, distance)`` arrays with ``i < j``, sorted by ``i`` then ``j``.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    empty = (np.zeros(0, np.int64), np.zeros(0, np.int64), np.zeros(0))
+    if len(points) < 2 or radius <= 0:
+        return empty
+
+    cells = np.floor(points / radius).astype(np.int64)
+    cells -= cells.min(axis=0)
+    grid_height = int(cells[:, 1].max()) + 3  # Room for the -1/+1 offsets
+    cell_keys = (cells[:, 0] + 1) * grid_height + (cells[:, 1] + 1)
+
+    # Points sorted by cell; each cell is a contiguous run in `order`
+    order = np.argsort(cell_keys, kind="stable")
+    sorted_keys = cell_keys[order]
+
+    first, second = [], []
+    for dx, dy in _FORWARD_CELLS:
+        target = cell_keys + dx * grid_height + dy
+        start = np.searchsorted(sorted_keys, target, side="left")
+        stop = np.searchsorted(sorted_keys, target, side="right")
+        counts = stop - start
+        if not counts.any():
+            continue
+
+        # Expand every point into one candidate per point of the target cell
+        source = np.repeat(np.arange(len(points)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        candidate = order[np.repeat(start, counts) + offsets]
+
+        if dx == 0 and dy == 0:
+            # Same cell: keep each unordered pair once
+            keep = source < candidate
+            source, candidate = source[keep], candidate[keep]
+        first.append(source)
+        second.append(candidate)
+
+    if not first:
+        return empty
+
+    i = np.concatenate(first)
+    j = np.concatenate(second)
+    i, j = np.minimum(i, j), np.maximum(i, j)
+
+    distance = np.hypot(*(points[j] - points[i]).T)
+    close = distance < radius
+    i, j, distance = i[close], j[close], distance[close]
+
+    pair_order = np.lexsort((j, i))
+    return i[pair_order], j[pair_order], distance[pair_order]
+
+
+def neighbor_counts(count: int, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+    """Number of neighbours of each of ``count`` points from a pair list."""
+    return np.bincount(i, minlength=count) + np.bincount(j, minlength=count)
@@ -0,0 +1,308 @@
+"""Registry of waveform styles and dynamic backgrounds.
+
+``create_waveform_frame`` and ``create_dynamic_background`` used to pick the
+style with a long ``if/elif`` chain on every frame and forward a dozen render
+options to the drawing method each time. A style is now an object created
+once per render: ``setup`` resolves the options, warms the colour tables and
+allocates buffers, and ``render(frame_idx, features, out)`` draws one frame
+into a caller-provided buffer.
+
+New styles subclass ``StyleRenderer`` and register themselves with
+``register_waveform_style`` / ``register_background_style``. The existing
+styles are still drawn by the ``VerticalVideoCreator`` methods and are
+registered through ``CreatorStyle``.
+"""
+
+from functools import partial
+
+import cv2
+import numpy as np
+
+from .geometry import scaled_size
+
+# Render options forwarded to the creator's drawing methods
+COLOR_OPTIONS = ("gradient_style", "custom_colors")
+PARTICLE_OPTIONS = COLOR_OPTIONS + (
+    "particle_color_scheme",
+    "particle_gradient_style",
+    "particle_custom_colors",
+)
+FRACTAL_OPTIONS = COLOR_OPTIONS + ("fractal_threads",)
+
+# Render options callers may leave out, and the value used then
+OPTIONAL_OPTIONS = {"fractal_threads": None}
+
+# Per-frame arguments taken by the drawing methods (after the time)
+NO_FRAME_ARGS = ()
+FRAME_INDEX = ("frame_idx",)
+FRAME_TIMING = ("frame_idx", "total_frames")
+
+# Styles used for unknown names, as the old dispatch fell back to them
+DEFAULT_WAVEFORM_STYLE = "circular"
+DEFAULT_BACKGROUND_STYLE = "flowing-gradient"
+
+_WAVEFORM_STYLES = {}
+_BACKGROUND_STYLES = {}
+
+
+def register_waveform_style(*names):
+    """Class decorator registering a waveform ``StyleRenderer`` under ``names``."""
+
+    def decorator(factory):
+        for name in names:
+            _WAVEFORM_STYLES[name] = factory
+        return factory
+
+    return decorator
+
+
+def register_background_style(*names):
+    """Class decorator registering a background ``StyleRenderer`` under ``names``."""
+
+    def decorator(factory):
+        for name in names:
+            _BACKGROUND_STYLES[name] = factory
+        return factory
+
+    return decorator
+
+
+def waveform_styles(aliases: bool = True) -> list:
+    """Names of the registered waveform styles.
+
+    With ``aliases=False`` only the first name a renderer was registered
+    under is listed (``"julia"`` but not ``"mandelbrot"``).
+    """
+    return _style_names(_WAVEFORM_STYLES, aliases)
+
+
+def background_styles(aliases: bool = True) -> list:
+    """Names of the registered dynamic backgrounds (see ``waveform_styles``)."""
+    return _style_names(_BACKGROUND_STYLES, aliases)
+
+
+def _style_names(registry: dict, aliases: bool) -> list:
+    if aliases:
+        return sorted(registry)
+    first_names = {}
+    for name, factory in registry.items():
+        first_names.setdefault(id(factory), name)
+    return sorted(first_names.values())
+
+
+def create_waveform_style(
+    creator, render_options: dict, total_frames: int, duration: float
+):
+    """Waveform renderer for ``render_options["waveform_style"]``."""
+    factory = _WAVEFORM_STYLES.get(
+        render_options["waveform_style"], _WAVEFORM_STYLES[DEFAULT_WAVEFORM_STYLE]
+    )
+    return factory(creator, render_options, total_frames, duration)
+
+
+def create_background_style(
+    creator, render_options: dict, total_frames: int, duration: float
+):
+    """Dynamic background renderer, or None for a static background."""
+    style = render_options["dynamic_background"]
+    if style == "none":
+        return None
+    factory = _BACKGROUND_STYLES.get(
+        style, _BACKGROUND_STYLES[DEFAULT_BACKGROUND_STYLE]
+    )
+    return factory(creator, render_options, total_frames, duration)
+
+
+class StyleRenderer:
+    """One style of one render.
+
+    Args:
+        creator: ``VerticalVideoCreator`` the frames belong to (output size,
+            orientation and the shared colour tables)
+        render_options: Render options of the output (see ``create_video``)
+        total_frames: Number of frames in the render
+        duration: Rendered duration in seconds
+    """
+
+    def __init__(
+        self, creator, render_options: dict, total_frames: int, duration: float
+    ):
+        self.creator = creator
+        self.options = render_options
+        self.total_frames = total_frames
+        self.duration = duration
+        self.setup()
+
+    def setup(self):
+        """Precompute everything that does not change from frame to frame."""
+
+    def render(self, frame_idx: int, features: dict, out: np.ndarray):
+        """Draw frame ``frame_idx`` into ``out`` (a full-size BGR frame).
+
+        Waveform styles draw over the background already in ``out``;
+        backgrounds overwrite it.
+        """
+        raise NotImplementedError
+
+    def amplitude(self, features: dict, current_time: float) -> float:
+        """Normalised amplitude (0-1) at ``current_time`` seconds."""
+        return float(
+            features["timeline"]["amplitude"][
+                self.creator._timeline_index(features, current_time)
+            ]
+        )
+
+
+class CreatorStyle(StyleRenderer):
+    """Style drawn by one of the ``VerticalVideoCreator`` drawing methods.
+
+    Args:
+        method_name: Name of the ``_draw_*`` / ``_create_*`` method
+        frame_args: Per-frame arguments the method takes after the time
+            (``NO_FRAME_ARGS``, ``FRAME_INDEX`` or ``FRAME_TIMING``)
+        option_names: Render options the method takes after those
+    """
+
+    def __init__(self, method_name: str, frame_args: tuple, option_names: tuple, *args):
+        self.method_name = method_name
+        self.frame_args = frame_args
+        self.option_names = option_names
+        super().__init__(*args)
+
+    def setup(self):
+        self._draw = getattr(self.creator, self.method_name)
+        self._option_args = tuple(
+            (
+                self.options.get(name, OPTIONAL_OPTIONS[name])
+                if name in OPTIONAL_OPTIONS
+                else self.options[name]
+            )
+            for name in self.option_names
+        )
+
+        # Build the colour tables now instead of on the first frame
+        if "gradient_style" in self.option_names:
+            self.creator._get_current_gradient_colors(
+                self.options["gradient_style"], self.options["custom_colors"]
+            )
+        if "particle_color_scheme" in self.option_names:
+            self.creator._get_palette(
+                self.options["particle_color_scheme"],
+                self.options["particle_gradient_style"]
+                or self.options["gradient_style"],
+                self.options["particle_custom_colors"] or self.options["custom_colors"],
+            )
+
+    def _frame_args(self, frame_idx: int) -> tuple:
+        return (frame_idx, self.total_frames)[: len(self.frame_args)]
+
+
+class CreatorWaveformStyle(CreatorStyle):
+    """Waveform style drawn in place by a ``VerticalVideoCreator._draw_*`` method."""
+
+    def render(self, frame_idx: int, features: dict, out: np.ndarray):
+        current_time = (frame_idx / self.total_frames) * features["duration"]
+        self._draw(
+            out,
+            self.amplitude(features, current_time),
+            current_time,
+            features,
+            *self._frame_args(frame_idx),
+            *self._option_args,
+        )
+
+
+class CreatorBackgroundStyle(CreatorStyle):
+    """Dynamic background from a ``VerticalVideoCreator._create_*`` method.
+
+    The background is computed at ``render_options["background_scale"]`` in a
+    buffer allocated once, then upscaled into the output frame.
+    """
+
+    def setup(self):
+        super().setup()
+        creator = self.creator
+        self.size = (creator.width, creator.height)
+        compute_width, compute_height = scaled_size(
+            creator.width, creator.height, self.options["background_scale"]
+        )
+        self._buffer = None
+        if (compute_width, compute_height) != self.size:
+            self._buffer = np.empty((compute_height, compute_width, 3), np.uint8)
+
+    def render(self, frame_idx: int, features: dict, out: np.ndarray):
+        current_time = (frame_idx / self.total_frames) * self.duration
+        self.draw(out, self.amplitude(features, current_time), current_time, frame_idx)
+
+    def draw(self, out: np.ndarray, amplitude: float, current_time: float, frame_idx):
+        """Draw the background for an explicit time and amplitude."""
+        buffer = out if self._buffer is None else self._buffer
+        result = self._draw(
+            buffer,
+            amplitude,
+            current_time,
+            *self._frame_args(frame_idx),
+            *self._option_args,
+        )
+        if self._buffer is not None:
+            cv2.resize(result, self.size, dst=out, interpolation=cv2.INTER_LINEAR)
+        elif result is not out:
+            np.copyto(out, result)
+
+
+for _names, _method, _frame_args, _options in (
+    (("circular",), "_draw_waveform", NO_FRAME_ARGS, ()),
+    (("sine",), "_draw_sine_waveform", NO_FRAME_ARGS, ()),
+    (("mathematical", "fractal"), "_draw_mathematical_forms", FRAME_TIMING, ()),
+    (("julia", "mandelbrot"), "_draw_julia_fractal", FRAME_TIMING, FRACTAL_OPTIONS),
+    (
+        ("psychedelic", "circles"),
+        "_draw_psychedelic_circles",
+        FRAME_TIMING,
+        COLOR_OPTIONS,
+    ),
+    (("fluid", "liquid"), "_draw_fluid_waves", FRAME_TIMING, PARTICLE_OPTIONS),
+    (("particles", "sand"), "_draw_particle_fall", FRAME_TIMING, PARTICLE_OPTIONS),
+    (("morph", "shapes"), "_draw_morphing_shapes", FRAME_TIMING, COLOR_OPTIONS),
+    (("kaleidoscope", "mirror"), "_draw_kaleidoscope", FRAME_TIMING, PARTICLE_OPTIONS),
+    (("k-mandala",), "_draw_k_mandala", FRAME_TIMING, PARTICLE_OPTIONS),
+    (("k-crystal",), "_draw_k_crystal", FRAME_TIMING, PARTICLE_OPTIONS),
+    (("k-flower",), "_draw_k_flower", FRAME_TIMING, PARTICLE_OPTIONS),
+    (("k-sacred",), "_draw_k_sacred", FRAME_TIMING, PARTICLE_OPTIONS),
+    (("k-tribal",), "_draw_k_tribal", FRAME_TIMING, PARTICLE_OPTIONS),
+    (("k-laser",), "_draw_k_laser", FRAME_TIMING, PARTICLE_OPTIONS),
+    (("k-web",), "_draw_k_web", FRAME_TIMING, PARTICLE_OPTIONS),
+    (("k-spiral",), "_draw_k_spiral", FRAME_TIMING, PARTICLE_OPTIONS),
+    (("k-diamond",), "_draw_k_diamond", FRAME_TIMING, PARTICLE_OPTIONS),
+    (("k-stars",), "_draw_k_stars", FRAME_TIMING, PARTICLE_OPTIONS),
+    (("breathing", "zen"), "_draw_breathing_patterns", FRAME_TIMING, COLOR_OPTIONS),
+    (("matrix", "rain"), "_draw_matrix_rain", FRAME_TIMING, PARTICLE_OPTIONS),
+    (("starfield", "space"), "_draw_starfield", FRAME_TIMING, PARTICLE_OPTIONS),
+    (("network", "web"), "_draw_network_web", FRAME_TIMING, PARTICLE_OPTIONS),
+    (("swarm", "flock"), "_draw_particle_swarm", FRAME_TIMING, PARTICLE_OPTIONS),
+    (
+        ("explosion", "fireworks"),
+        "_draw_fireworks_explosion",
+        FRAME_TIMING,
+        PARTICLE_OPTIONS,
+    ),
+):
+    register_waveform_style(*_names)(
+        partial(CreatorWaveformStyle, _method, _frame_args, _options)
+    )
+
+for _name, _method, _frame_args in (
+    ("flowing-gradient", "_create_flowing_gradient", NO_FRAME_ARGS),
+    ("nebula", "_create_nebula_background", FRAME_TIMING),
+    ("aurora", "_create_aurora_background", NO_FRAME_ARGS),
+    ("plasma", "_create_plasma_background", NO_FRAME_ARGS),
+    ("liquid-metal", "_create_liquid_metal_background", NO_FRAME_ARGS),
+    ("cosmic-dust", "_create_cosmic_dust_background", FRAME_INDEX),
+    ("energy-waves", "_create_energy_waves_background", NO_FRAME_ARGS),
+    ("particle-field", "_create_particle_field_background", FRAME_INDEX),
+    ("morphing-shapes", "_create_morphing_shapes_background", FRAME_INDEX),
+    ("breathing-colors", "_create_breathing_colors_background", NO_FRAME_ARGS),
+):
+    register_background_style(_name)(
+        partial(CreatorBackgroundStyle, _method, _frame_args, COLOR_OPTIONS)
+    )
@@ -6,12 +6,230 @@ from pathlib import Path
 from typing import Optional
 import numpy as np
 import cv2
-from PIL import Image, ImageDraw, ImageFilter
+from PIL import Image, ImageFilter
 import librosa
+from scipy.signal import lfilter
 import tempfile
 import subprocess
 import os
 import math
+import shutil
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+
+from .audio_stream import analyze_audio_stream
+from .background_cache import (
+    DEFAULT_BACKGROUND_CACHE_DIR,
+    background_cache_key,
+    background_cache_path,
+    load_background,
+    save_background,
+)
+from .buffers import FramePool, ScratchBuffers
+from .feature_cache import (
+    feature_cache_key,
+    feature_cache_path,
+    load_features,
+    save_features,
+)
+from .ffmpeg_writer import FFmpegPipeWriter
+from .fractals import julia_escape_counts
+from .geometry import (
+    FrameGeometry,
+    blend_colors,
+    frame_geometry,
+    scaled_size,
+    sine_field,
+)
+from .kaleidoscope import SymmetryCanvas
+from .palette import Palette, hsv_to_bgr, hsv_to_bgr_scalar
+from .particles import (
+    new_particles,
+    on_screen,
+    splat_circles,
+    splat_cell_columns,
+    splat_lines,
+)
+from .pipeline import run_pipeline
+from .render_stats import RenderStats, render_report_path
+from .spatial import neighbor_counts, neighbor_pairs
+from .styles import create_background_style, create_waveform_style
+
+# Analysis parameters for extract_audio_features (part of the feature cache key)
+AUDIO_FEATURE_PARAMS = {"sr": 22050, "frame_length": 2048, "hop_length": 512}
+
+# Entries of the gradient lookup table used to color the Julia set
+JULIA_LUT_SIZE = 256
+
+# Proxy (draft) renders: frame rate and libx264 preset of the encode
+PROXY_FPS = 12
+PROXY_ENCODER_PRESET = "ultrafast"
+
+# Gradient backgrounds: RGB colour stops of each style, top to bottom
+GRADIENT_PRESETS = {
+    "default": [
+        (30, 50, 120),
+        (130, 130, 255),
+    ],  # Deep blue to purple (original)
+    "dark_teal_orange": [
+        (0, 40, 40),
+        (255, 140, 60),
+    ],  # Dark teal to vibrant orange
+    "sunset": [(255, 94, 77), (255, 154, 0), (255, 206, 84)],  # Sunset colors
+    "ocean": [(0, 119, 190), (0, 180, 216), (144, 224, 239)],  # Ocean blues
+    "purple_pink": [(106, 17, 203), (255, 61, 127)],  # Deep purple to pink
+    "forest": [
+        (34, 139, 34),
+        (107, 142, 35),
+        (255, 215, 0),
+    ],  # Forest green to gold
+    "midnight": [
+        (25, 25, 112),
+        (138, 43, 226),
+        (75, 0, 130),
+    ],  # Midnight blues and purples
+    "fire": [
+        (139, 0, 0),
+        (255, 69, 0),
+        (255, 215, 0),
+    ],  # Dark red to orange to gold
+    "arctic": [
+        (176, 224, 230),
+        (135, 206, 235),
+        (70, 130, 180),
+    ],  # Arctic blues
+    "cosmic": [
+        (75, 0, 130),
+        (138, 43, 226),
+        (255, 20, 147),
+        (255, 215, 0),
+    ],  # Deep space colors
+    # 20 NUEVOS GRADIENTES HERMOSOS
+    "cherry_blossom": [
+        (255, 183, 197),
+        (255, 105, 180),
+        (255, 20, 147),
+    ],  # Flor de cerezo
+    "tropical": [
+        (0, 255, 127),
+        (255, 215, 0),
+        (255, 69, 0),
+    ],  # Tropical verde-dorado-naranja
+    "lavender_mist": [
+        (230, 230, 250),
+        (147, 112, 219),
+        (138, 43, 226),
+    ],  # Niebla de lavanda
+    "golden_hour": [
+        (255, 223, 0),
+        (255, 140, 0),
+        (255, 69, 0),
+        (139, 0, 0),
+    ],  # Hora dorada
+    "emerald_sea": [
+        (0, 128, 128),
+        (32, 178, 170),
+        (72, 209, 204),
+        (175, 238, 238),
+    ],  # Mar esmeralda
+    "rose_gold": [
+        (183, 110, 121),
+        (255, 192, 203),
+        (255, 215, 0),
+    ],  # Oro rosa
+    "northern_lights": [
+        (0, 255, 127),
+        (0, 191, 255),
+        (138, 43, 226),
+        (255, 20, 147),
+    ],  # Aurora boreal
+    "desert_sand": [
+        (218, 165, 32),
+        (255, 215, 0),
+        (255, 160, 122),
+        (250, 128, 114),
+    ],  # Arena del desierto
+    "deep_ocean": [
+        (0, 0, 139),
+        (0, 100, 148),
+        (0, 191, 255),
+        (135, 206, 235),
+    ],  # Océano profundo
+    "neon_cyber": [
+        (255, 0, 255),
+        (0, 255, 255),
+        (57, 255, 20),
+        (255, 255, 0),
+    ],  # Neón cyberpunk
+    "autumn_leaves": [
+        (255, 69, 0),
+        (255, 140, 0),
+        (255, 215, 0),
+        (139, 69, 19),
+    ],  # Hojas de otoño
+    "moonlight": [
+        (25, 25, 112),
+        (72, 61, 139),
+        (176, 196, 222),
+        (245, 245, 245),
+    ],  # Luz de luna
+    "tropical_sunset": [
+        (255, 94, 77),
+        (255, 154, 0),
+        (255, 215, 0),
+        (255, 20, 147),
+        (138, 43, 226),
+    ],  # Atardecer tropical
+    "winter_frost": [
+        (176, 224, 230),
+        (173, 216, 230),
+        (135, 206, 235),
+        (70, 130, 180),
+        (25, 25, 112),
+    ],  # Escarcha invernal
+    "sakura_dream": [
+        (255, 228, 225),
+        (255, 182, 193),
+        (255, 105, 180),
+        (219, 112, 147),
+    ],  # Sueño de sakura
+    "volcanic": [
+        (139, 0, 0),
+        (178, 34, 34),
+        (255, 69, 0),
+        (255, 215, 0),
+        (255, 255, 255),
+    ],  # Volcánico
+    "electric_blue": [
+        (0, 0, 139),
+        (0, 191, 255),
+        (0, 255, 255),
+        (255, 255, 255),
+    ],  # Azul eléctrico
+    "jungle_green": [
+        (0, 100, 0),
+        (34, 139, 34),
+        (50, 205, 50),
+        (144, 238, 144),
+    ],  # Verde selva
+    "royal_purple": [
+        (75, 0, 130),
+        (106, 17, 203),
+        (138, 43, 226),
+        (218, 112, 214),
+    ],  # Púrpura real
+    "cotton_candy": [
+        (255, 192, 203),
+        (255, 182, 193),
+        (221, 160, 221),
+        (238, 130, 238),
+        (255, 20, 147),
+    ],  # Algodón de azúcar
+}
+
+# Blur applied to a freshly drawn gradient (before the background softening)
+GRADIENT_BLUR_RADIUS = 2
 
 
 class VerticalVideoCreator:
@@ -33,6 +251,45 @@ class VerticalVideoCreator:
             self.orientation = "vertical"
         self.fps = 30
 
+        # Colour tables resolved once and reused by every frame of a render
+        # (the pipelined render stages look them up from different threads)
+        self._palettes = {}
+        self._gradient_colors = {}
+        self._colors_lock = threading.RLock()
+
+        # Julia style: threads its tiles are spread across, and the pool
+        # they run on (created on first use, closed when the render ends)
+        self.fractal_threads = 1
+        self._fractal_pool = None
+
+        # Intermediates of the per-frame drawing code, reused across frames;
+        # one set per thread so pipelined stages never write the same buffer
+        self._scratch = threading.local()
+
+        # Frames queued between the pipelined render stages (0 renders each
+        # frame start to finish before the next one)
+        self.pipeline_depth = 2
+
+        # Stage timings of the current render (None unless a report is wanted)
+        self.stats = None
+
+        # Where finished static backgrounds are cached (see background_cache)
+        self.background_cache_dir = DEFAULT_BACKGROUND_CACHE_DIR
+
+    @property
+    def scratch(self) -> ScratchBuffers:
+        """Scratch buffers of the calling thread."""
+        buffers = getattr(self._scratch, "buffers", None)
+        if buffers is None:
+            buffers = self._scratch.buffers = ScratchBuffers()
+        return buffers
+
+    def _stage(self, name: str):
+        """Context timing stage ``name`` into ``self.stats`` (if enabled)."""
+        if self.stats is None:
+            return nullcontext()
+        return self.stats.stage(name)
+
     def get_random_unsplash_image(
         self, keywords: str = "abstract,gradient,texture"
     ) -> Optional[Path]:
@@ -56,6 +313,100 @@ class VerticalVideoCreator:
             print(f"Failed to download Unsplash image: {e}")
             return None
 
+    def load_background_image(self, bg_path: Path) -> np.ndarray:
+        """Load a background image at the output size, softened for contrast."""
+        return self.prepare_background(cv2.imread(str(bg_path)))
+
+    def prepare_background(self, image: np.ndarray) -> np.ndarray:
+        """Resize a BGR image to the output size, blurred and darkened."""
+        # Load and resize background
+        bg_image = cv2.resize(image, (self.width, self.height))
+
+        # Add slight blur and darken for better contrast
+        bg_image = cv2.GaussianBlur(bg_image, (15, 15), 0)
+        return cv2.addWeighted(bg_image, 0.7, np.zeros_like(bg_image), 0.3, 0)
+
+    def get_static_background(
+        self,
+        gradient_style: str = "default",
+        custom_colors: list = None,
+        no_unsplash: bool = False,
+        background_keywords: str = "abstract,gradient,minimal",
+        use_cache: bool = True,
+        download=None,
+    ) -> np.ndarray:
+        """Static background at the output size, ready to draw on.
+
+        An Unsplash image for ``background_keywords`` is used when available,
+        otherwise the gradient. Either is stored in the background cache
+        once prepared, so later renders with the same size and settings
+        (including the same keywords) reuse it without downloading or
+        redrawing anything.
+
+        Args:
+            use_cache: Read and write ``self.background_cache_dir``
+            download: Callable returning the path of an Unsplash image for
+                the keywords (or None), for callers sharing one download
+                between outputs. By default the image is downloaded here.
+        """
+        if not no_unsplash:
+
+            def build_unsplash():
+                if download is not None:
+                    bg_path = download(background_keywords)
+                    return self.load_background_image(bg_path) if bg_path else None
+
+                print("🖼️  Downloading background image...")
+                bg_path = self.get_random_unsplash_image(background_keywords)
+                if not bg_path:
+                    return None
+                try:
+                    return self.load_background_image(bg_path)
+                finally:
+                    os.unlink(bg_path)
+
+            bg_image = self._cached_background(
+                "unsplash",
+                {"keywords": background_keywords},
+                build_unsplash,
+                use_cache,
+            )
+            if bg_image is not None:
+                return bg_image
+            print(f"📸 Using gradient background: {gradient_style}...")
+        else:
+            print(f"🌈 Using gradient background: {gradient_style}...")
+
+        return self._cached_background(
+            "gradient",
+            {
+                "colors": self._gradient_stops(gradient_style, custom_colors),
+                "blur_radius": GRADIENT_BLUR_RADIUS,
+            },
+            lambda: self.prepare_background(
+                self.create_gradient_image(gradient_style, custom_colors)
+            ),
+            use_cache,
+        )
+
+    def _cached_background(
+        self, kind: str, params: dict, build, use_cache: bool
+    ) -> Optional[np.ndarray]:
+        """Background for ``params`` from the cache, or ``build()`` and store it."""
+        cache_path = None
+        if use_cache:
+            key = background_cache_key(kind, self.width, self.height, params)
+            cache_path = background_cache_path(self.background_cache_dir, kind, key)
+            bg_image = load_background(cache_path, (self.height, self.width, 3))
+            if bg_image is not None:
+                print(f"♻️  Using cached background: {cache_path.name}")
+                return bg_image
+
+        bg_image = build()
+        if bg_image is not None and cache_path is not None:
+            save_background(cache_path, bg_image)
+        return bg_image
+
     def create_dynamic_background(
         self,
         style: str,
@@ -65,62 +416,41 @@ class VerticalVideoCreator:
         total_frames: int,
         gradient_style: str = "default",
         custom_colors: list = None,
+        scale: float = 1.0,
     ) -> np.ndarray:
-        """Create dynamic animated background that responds to audio."""
-        height, width = self.height, self.width
-        frame = np.zeros((height, width, 3), dtype=np.uint8)
+        """Create dynamic animated background that responds to audio.
 
-        if style == "flowing-gradient":
-            return self._create_flowing_gradient(
-                frame, amplitude, current_time, gradient_style, custom_colors
-            )
-        elif style == "nebula":
-            return self._create_nebula_background(
-                frame,
-                amplitude,
-                current_time,
-                frame_idx,
-                total_frames,
-                gradient_style,
-                custom_colors,
-            )
-        elif style == "aurora":
-            return self._create_aurora_background(
-                frame, amplitude, current_time, gradient_style, custom_colors
-            )
-        elif style == "plasma":
-            return self._create_plasma_background(
-                frame, amplitude, current_time, gradient_style, custom_colors
-            )
-        elif style == "liquid-metal":
-            return self._create_liquid_metal_background(
-                frame, amplitude, current_time, gradient_style, custom_colors
-            )
-        elif style == "cosmic-dust":
-            return self._create_cosmic_dust_background(
-                frame, amplitude, current_time, frame_idx, gradient_style, custom_colors
-            )
-        elif style == "energy-waves":
-            return self._create_energy_waves_background(
-                frame, amplitude, current_time, gradient_style, custom_colors
-            )
-        elif style == "particle-field":
-            return self._create_particle_field_background(
-                frame, amplitude, current_time, frame_idx, gradient_style, custom_colors
-            )
-        elif style == "morphing-shapes":
-            return self._create_morphing_shapes_background(
-                frame, amplitude, current_time, frame_idx, gradient_style, custom_colors
-            )
-        elif style == "breathing-colors":
-            return self._create_breathing_colors_background(
-                frame, amplitude, current_time, gradient_style, custom_colors
-            )
-        else:
-            # Default to flowing gradient
-            return self._create_flowing_gradient(
-                frame, amplitude, current_time, gradient_style, custom_colors
-            )
+        Renders go through ``create_styles``, which sets each background up
+        once; this is the one-off equivalent for a given time and amplitude.
+
+        Args:
+            scale: Fraction of the output resolution the background is computed
+                at (e.g. 0.5). Smaller values are faster; the result is upscaled
+                to the output size, which suits these smooth gradients.
+        """
+        render_options = {
+            "dynamic_background": style,
+            "background_scale": scale,
+            "gradient_style": gradient_style,
+            "custom_colors": custom_colors,
+        }
+        frame = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        create_background_style(self, render_options, total_frames, None).draw(
+            frame, amplitude, current_time, frame_idx
+        )
+        return frame
+
+    def _background_geometry(self, frame: np.ndarray) -> FrameGeometry:
+        """Cached coordinate grids for a (possibly reduced) background buffer."""
+        compute_height, compute_width = frame.shape[:2]
+        return frame_geometry(self.width, self.height, compute_width, compute_height)
+
+    def _background_buffers(self, geometry: FrameGeometry, dtype=np.float32) -> tuple:
+        """Scratch planes ``(value, term, wave)`` on a background's compute grid."""
+        return tuple(
+            self.scratch.get(name, geometry.shape, dtype)
+            for name in ("background", "background_term", "background_wave")
+        )
 
     def _create_flowing_gradient(
         self,
@@ -131,55 +461,36 @@ class VerticalVideoCreator:
         custom_colors=None,
     ):
         """Create a flowing gradient background that changes with time and audio (optimized)."""
-        height, width = frame.shape[:2]
+        geometry = self._background_geometry(frame)
 
         # Get gradient colors
         colors = self._get_current_gradient_colors(gradient_style, custom_colors)
         if len(colors) < 2:
             colors = [(20, 20, 50), (100, 20, 150)]  # Default colors
 
-        # Create coordinate meshgrids
-        y_coords, x_coords = np.meshgrid(
-            np.arange(height), np.arange(width), indexing="ij"
-        )
-
-        # Create flowing effect with time and amplitude (vectorized)
+        # Create flowing effect with time and amplitude
         time_offset = current_time * 0.3
         audio_offset = amplitude * 50
 
-        # Create flowing pattern (vectorized)
-        wave1 = np.sin((x_coords + y_coords) * 0.01 + time_offset) * 0.3
-        wave2 = np.sin((x_coords - y_coords) * 0.008 + time_offset * 1.2) * 0.3
-        wave3 = (
-            np.sin(np.sqrt(x_coords**2 + y_coords**2) * 0.005 + time_offset * 0.8) * 0.2
+        # Create flowing pattern
+        flow_factor, term, wave = self._background_buffers(geometry)
+        geometry.wave(0.01, 0.01, time_offset, out=flow_factor, scratch=wave)
+        flow_factor *= 0.3
+        geometry.wave(0.008, -0.008, time_offset * 1.2, out=term, scratch=wave)
+        term *= 0.3
+        flow_factor += term
+        flow_factor += sine_field(
+            geometry.origin_distance, 0.005, time_offset * 0.8, 0.2, out=term
         )
 
         # Combine waves with audio influence
-        flow_factor = (wave1 + wave2 + wave3 + audio_offset * 0.01) * 0.5 + 0.5
-        flow_factor = np.clip(flow_factor, 0, 1)
+        flow_factor += audio_offset * 0.01
+        flow_factor *= 0.5
+        flow_factor += 0.5
+        np.clip(flow_factor, 0, 1, out=flow_factor)
 
         # Simple two-color interpolation (faster)
-        if len(colors) >= 2:
-            color1 = np.array(colors[0])
-            color2 = np.array(colors[1])
-
-            # Vectorized color interpolation
-            r = (color1[0] * (1 - flow_factor) + color2[0] * flow_factor).astype(
-                np.uint8
-            )
-            g = (color1[1] * (1 - flow_factor) + color2[1] * flow_factor).astype(
-                np.uint8
-            )
-            b = (color1[2] * (1 - flow_factor) + color2[2] * flow_factor).astype(
-                np.uint8
-            )
-
-            # Assign to frame (BGR format)
-            frame[:, :, 0] = b
-            frame[:, :, 1] = g
-            frame[:, :, 2] = r
-
-        return frame
+        return blend_colors(frame, flow_factor, colors[0], colors[1], scratch=term)
 
     def _create_aurora_background(
         self,
@@ -190,7 +501,7 @@ class VerticalVideoCreator:
         custom_colors=None,
     ):
         """Create aurora borealis effect with custom gradient colors (optimized)."""
-        height, width = frame.shape[:2]
+        geometry = self._background_geometry(frame)
 
         # Get gradient colors
         colors = self._get_current_gradient_colors(gradient_style, custom_colors)
@@ -201,51 +512,38 @@ class VerticalVideoCreator:
                 (200, 100, 255),
             ]  # Default aurora colors
 
-        # Create coordinate meshgrids
-        y_coords, x_coords = np.meshgrid(
-            np.arange(height), np.arange(width), indexing="ij"
-        )
-
-        # Create flowing aurora waves (vectorized)
-        wave1 = np.sin(x_coords * 0.02 + current_time * 2 + y_coords * 0.01) * 0.5
-        wave2 = np.sin(x_coords * 0.015 + current_time * 1.5 + y_coords * 0.008) * 0.3
-        wave3 = np.sin(x_coords * 0.01 + current_time + y_coords * 0.005) * 0.2
+        # Create flowing aurora waves
+        intensity, term, wave = self._background_buffers(geometry)
+        geometry.wave(0.02, 0.01, current_time * 2, out=intensity, scratch=wave)
+        intensity *= 0.5
+        for fx, fy, phase, weight in (
+            (0.015, 0.008, current_time * 1.5, 0.3),
+            (0.01, 0.005, current_time, 0.2),
+        ):
+            geometry.wave(fx, fy, phase, out=term, scratch=wave)
+            term *= weight
+            intensity += term
 
         # Combine waves with amplitude
-        intensity = (wave1 + wave2 + wave3 + amplitude * 0.5) * 0.3 + 0.1
-        intensity = np.clip(intensity, 0, 1)
+        intensity += amplitude * 0.5
+        intensity *= 0.3
+        intensity += 0.1
+        np.clip(intensity, 0, 1, out=intensity)
 
         # Vertical gradient effect (stronger at top)
-        vertical_factor = 1.0 - (y_coords / height) * 0.7
-        intensity *= vertical_factor
-
-        # Use custom gradient colors instead of fixed aurora colors
-        phase = x_coords / width + current_time * 0.1
-
-        # Interpolate between gradient colors based on phase
-        if len(colors) >= 3:
-            # Use three colors for aurora effect
-            color1 = np.array(colors[0])
-            color2 = np.array(colors[1])
-            color3 = np.array(colors[2]) if len(colors) > 2 else np.array(colors[0])
-        else:
-            # Use two colors and create a third
-            color1 = np.array(colors[0])
-            color2 = np.array(colors[1])
-            color3 = ((np.array(colors[0]) + np.array(colors[1])) / 2).astype(int)
-
-        # Create color variations using phase
-        phase_factor = (np.sin(phase * np.pi) + 1) / 2
-
-        # Interpolate between colors
-        r = (color1[0] * (1 - phase_factor) + color2[0] * phase_factor) * intensity
-        g = (color1[1] * (1 - phase_factor) + color2[1] * phase_factor) * intensity
-        b = (color1[2] * (1 - phase_factor) + color2[2] * phase_factor) * intensity
-
-        frame[:, :, 0] = np.clip(b, 0, 255).astype(np.uint8)
-        frame[:, :, 1] = np.clip(g, 0, 255).astype(np.uint8)
-        frame[:, :, 2] = np.clip(r, 0, 255).astype(np.uint8)
-
+        intensity *= 1.0 - geometry.y_norm * 0.7
+
+        # Colour only varies along x: interpolate the gradient colours per column
+        phase = geometry.x_norm + current_time * 0.1
+        phase_factor = ((np.sin(phase * np.pi) + 1) / 2)[0]
+        color1 = np.array(colors[0][::-1], dtype=np.float32)
+        color2 = np.array(colors[1][::-1], dtype=np.float32)
+        column_colors = color1 + (color2 - color1) * phase_factor[:, None]
+
+        for channel in range(3):
+            frame[:, :, channel] = np.multiply(
+                intensity, column_colors[:, channel], out=term
+            )
         return frame
 
     def _create_plasma_background(
@@ -257,7 +555,7 @@ class VerticalVideoCreator:
         custom_colors=None,
     ):
         """Create plasma energy effect with custom gradient colors (optimized)."""
-        height, width = frame.shape[:2]
+        geometry = self._background_geometry(frame)
 
         # Get gradient colors
         colors = self._get_current_gradient_colors(gradient_style, custom_colors)
@@ -268,61 +566,45 @@ class VerticalVideoCreator:
                 (255, 0, 255),
             ]  # Default plasma colors
 
-        # Create coordinate meshgrids
-        y_coords, x_coords = np.meshgrid(
-            np.arange(height), np.arange(width), indexing="ij"
-        )
-
-        # Create plasma effect with multiple sine waves (vectorized)
-        dx = x_coords - width / 2
-        dy = y_coords - height / 2
-        dist = np.sqrt(dx * dx + dy * dy)
-
-        plasma1 = np.sin(dist * 0.02 + current_time * 3)
-        plasma2 = np.sin((x_coords + y_coords) * 0.01 + current_time * 2)
-        plasma3 = np.sin((x_coords - y_coords) * 0.008 + current_time * 1.5)
-        plasma4 = np.sin(
-            np.sqrt(np.abs(x_coords * y_coords)) * 0.01 + current_time * 2.5
+        # Create plasma effect with multiple sine waves
+        plasma_value, term, wave = self._background_buffers(geometry)
+        sine_field(geometry.radius, 0.02, current_time * 3, out=plasma_value)
+        plasma_value += geometry.wave(0.01, 0.01, current_time * 2, term, wave)
+        plasma_value += geometry.wave(0.008, -0.008, current_time * 1.5, term, wave)
+        plasma_value += sine_field(
+            geometry.sqrt_abs_xy, 0.01, current_time * 2.5, out=term
         )
 
         # Combine with amplitude
-        plasma_value = (plasma1 + plasma2 + plasma3 + plasma4 + amplitude) * 0.2 + 0.5
-        plasma_value = np.clip(plasma_value, 0, 1)
+        plasma_value += amplitude
+        plasma_value *= 0.2
+        plasma_value += 0.5
+        np.clip(plasma_value, 0, 1, out=plasma_value)
 
-        # Use gradient colors for plasma effect
         if len(colors) >= 3:
-            color1 = np.array(colors[0])
-            color2 = np.array(colors[1])
-            color3 = np.array(colors[2])
+            gradient = np.array(colors[:3], dtype=np.float64)
         else:
-            color1 = np.array(colors[0])
-            color2 = np.array(colors[1])
             color3 = ((np.array(colors[0]) + np.array(colors[1])) / 2).astype(int)
-
-        # Map plasma values to gradient colors using sinusoidal interpolation
-        phase1 = plasma_value * np.pi
-        phase2 = plasma_value * np.pi + np.pi / 3
-        phase3 = plasma_value * np.pi + 2 * np.pi / 3
-
-        # Create color channels using gradient colors
-        factor1 = (np.sin(phase1) + 1) / 2
-        factor2 = (np.sin(phase2) + 1) / 2
-        factor3 = (np.sin(phase3) + 1) / 2
-
-        # Interpolate between gradient colors
-        r = (color1[0] * factor1 + color2[0] * factor2 + color3[0] * factor3) / 3
-        g = (color1[1] * factor1 + color2[1] * factor2 + color3[1] * factor3) / 3
-        b = (color1[2] * factor1 + color2[2] * factor2 + color3[2] * factor3) / 3
-
-        # Apply amplitude intensity
-        intensity = 0.5 + amplitude * 0.5
-        r = (r * intensity).astype(np.uint8)
-        g = (g * intensity).astype(np.uint8)
-        b = (b * intensity).astype(np.uint8)
-
-        frame[:, :, 0] = b
-        frame[:, :, 1] = g
-        frame[:, :, 2] = r
+            gradient = np.array([colors[0], colors[1], color3], dtype=np.float64)
+
+        # Each gradient colour is weighted by (sin(v*pi + k*pi/3) + 1) / 2, so
+        # a channel is a + b*sin(v*pi) + c*cos(v*pi) with per-channel constants
+        # (the factors are averaged and scaled by the amplitude intensity)
+        offsets = np.arange(3) * np.pi / 3
+        scale = (0.5 + amplitude * 0.5) / 6
+        constant = gradient.sum(axis=0) * scale
+        sin_weight = (np.cos(offsets) @ gradient) * scale
+        cos_weight = (np.sin(offsets) @ gradient) * scale
+
+        phase = plasma_value
+        phase *= np.float32(np.pi)
+        sin_phase = np.sin(phase, out=self.scratch.get("plasma_sin", geometry.shape))
+        cos_phase = np.cos(phase, out=self.scratch.get("plasma_cos", geometry.shape))
+        for channel, component in enumerate((2, 1, 0)):
+            value = np.multiply(sin_phase, np.float32(sin_weight[component]), out=term)
+            value += np.multiply(cos_phase, np.float32(cos_weight[component]), out=wave)
+            value += np.float32(constant[component])
+            frame[:, :, channel] = value
 
         return frame
 
@@ -335,46 +617,35 @@ class VerticalVideoCreator:
         custom_colors=None,
     ):
         """Create breathing color effect that pulses with audio (optimized)."""
-        height, width = frame.shape[:2]
+        geometry = self._background_geometry(frame)
 
         # Get base colors
         colors = self._get_current_gradient_colors(gradient_style, custom_colors)
         if len(colors) < 2:
             colors = [(50, 0, 100), (100, 50, 200)]
 
-        # Create coordinate meshgrids
-        y_coords, x_coords = np.meshgrid(
-            np.arange(height), np.arange(width), indexing="ij"
-        )
-
         # Create breathing effect
         breath_cycle = np.sin(current_time * 1.5) * 0.3 + 0.7
         audio_pulse = amplitude * 0.5 + 0.5
         combined_pulse = (breath_cycle + audio_pulse) * 0.5
 
-        center_x, center_y = width // 2, height // 2
-
-        # Distance from center (vectorized)
-        dx = x_coords - center_x
-        dy = y_coords - center_y
-        dist = np.sqrt(dx * dx + dy * dy) / max(width, height)
-
-        # Create breathing gradient (vectorized)
-        intensity = np.sin(dist * np.pi + combined_pulse * np.pi) * 0.5 + 0.5
-
-        # Interpolate colors (vectorized)
-        color1 = np.array(colors[0])
-        color2 = np.array(colors[1])
-
-        r = (color1[0] * (1 - intensity) + color2[0] * intensity).astype(np.uint8)
-        g = (color1[1] * (1 - intensity) + color2[1] * intensity).astype(np.uint8)
-        b = (color1[2] * (1 - intensity) + color2[2] * intensity).astype(np.uint8)
-
-        frame[:, :, 0] = b
-        frame[:, :, 1] = g
-        frame[:, :, 2] = r
+        # Create breathing gradient from the distance to the centre (the
+        # NumPy float64 pulse promotes the field to float64)
+        intensity, term, _ = self._background_buffers(geometry, np.float64)
+        np.add(
+            np.multiply(
+                geometry.radius_norm,
+                np.float32(np.pi),
+                out=self.scratch.get("background_wave", geometry.shape),
+            ),
+            combined_pulse * np.pi,
+            out=intensity,
+        )
+        np.sin(intensity, out=intensity)
+        intensity *= 0.5
+        intensity += 0.5
 
-        return frame
+        return blend_colors(frame, intensity, colors[0], colors[1], scratch=term)
 
     def _create_nebula_background(
         self,
@@ -387,7 +658,7 @@ class VerticalVideoCreator:
         custom_colors=None,
     ):
         """Create space nebula effect with custom gradient colors."""
-        height, width = frame.shape[:2]
+        geometry = self._background_geometry(frame)
 
         # Get gradient colors
         colors = self._get_current_gradient_colors(gradient_style, custom_colors)
@@ -398,47 +669,37 @@ class VerticalVideoCreator:
                 (0, 150, 255),
             ]  # Default nebula colors
 
-        # Simple nebula-like effect using gradients
-        y_coords, x_coords = np.meshgrid(
-            np.arange(height), np.arange(width), indexing="ij"
-        )
-
-        # Create swirling pattern
-        center_x, center_y = width // 2, height // 2
-        dx = x_coords - center_x
-        dy = y_coords - center_y
-        angle = np.arctan2(dy, dx) + current_time * 0.1
-        dist = np.sqrt(dx * dx + dy * dy) / max(width, height)
-
-        # Simple nebula effect
-        nebula_factor = np.sin(angle * 3 + dist * 5 + current_time) * 0.5 + 0.5
-        nebula_factor = np.clip(nebula_factor * (1 + amplitude), 0, 1)
+        # Create swirling pattern (the swirl angle turns by current_time * 0.1)
+        dist = geometry.radius_norm
+        swirl_phase = current_time * 0.1 * 3 + current_time
+        nebula_factor, value, term = self._background_buffers(geometry)
+        np.multiply(geometry.angle, 3, out=nebula_factor)
+        nebula_factor += np.multiply(dist, 5, out=term)
+        nebula_factor += swirl_phase
+        np.sin(nebula_factor, out=nebula_factor)
+        nebula_factor *= 0.5
+        nebula_factor += 0.5
+        nebula_factor *= 1 + amplitude
+        np.clip(nebula_factor, 0, 1, out=nebula_factor)
 
         # Use gradient colors instead of fixed colors
+        color1 = colors[0]
+        color2 = colors[1]
         if len(colors) >= 3:
-            color1 = np.array(colors[0])
-            color2 = np.array(colors[1])
-            color3 = np.array(colors[2])
+            color3 = colors[2]
         else:
-            color1 = np.array(colors[0])
-            color2 = np.array(colors[1])
             color3 = ((np.array(colors[0]) + np.array(colors[1])) / 2).astype(int)
 
-        # Interpolate between colors based on nebula factor
-        factor = nebula_factor
-        r = (
-            color1[0] * factor + color2[0] * (1 - factor) + color3[0] * dist * 0.5
-        ).astype(np.uint8)
-        g = (
-            color1[1] * factor + color2[1] * (1 - factor) + color3[1] * dist * 0.5
-        ).astype(np.uint8)
-        b = (
-            color1[2] * factor + color2[2] * (1 - factor) + color3[2] * dist * 0.5
-        ).astype(np.uint8)
-
-        frame[:, :, 0] = np.clip(b, 0, 255)
-        frame[:, :, 1] = np.clip(g, 0, 255)
-        frame[:, :, 2] = np.clip(r, 0, 255)
+        # Interpolate between colors based on nebula factor, plus a radial tint
+        for channel, component in enumerate((2, 1, 0)):
+            np.multiply(
+                nebula_factor,
+                np.float32(color1[component] - color2[component]),
+                out=value,
+            )
+            value += np.float32(color2[component])
+            value += np.multiply(dist, np.float32(color3[component] * 0.5), out=term)
+            frame[:, :, channel] = np.clip(value, 0, 255, out=value)
 
         return frame
 
@@ -451,7 +712,7 @@ class VerticalVideoCreator:
         custom_colors=None,
     ):
         """Create energy waves background with custom gradient colors (optimized)."""
-        height, width = frame.shape[:2]
+        geometry = self._background_geometry(frame)
 
         # Get gradient colors
         colors = self._get_current_gradient_colors(gradient_style, custom_colors)
@@ -462,46 +723,20 @@ class VerticalVideoCreator:
                 (255, 255, 0),
             ]  # Default energy colors
 
-        # Create coordinate meshgrids
-        y_coords, x_coords = np.meshgrid(
-            np.arange(height), np.arange(width), indexing="ij"
-        )
-
-        center_x, center_y = width // 2, height // 2
-        dx = x_coords - center_x
-        dy = y_coords - center_y
-        dist = np.sqrt(dx * dx + dy * dy)
-        angle = np.arctan2(dy, dx)
-
-        # Create concentric energy waves (vectorized)
-        wave1 = np.sin(dist * 0.02 - current_time * 5) * 0.5
-        wave2 = np.sin(dist * 0.015 - current_time * 3) * 0.3
-        wave3 = np.sin(angle * 4 + current_time * 2) * 0.2
+        # Create concentric energy waves
+        energy, term, _ = self._background_buffers(geometry)
+        sine_field(geometry.radius, 0.02, -(current_time * 5), 0.5, out=energy)
+        energy += sine_field(geometry.radius, 0.015, -(current_time * 3), 0.3, term)
+        energy += sine_field(geometry.angle, 4, current_time * 2, 0.2, out=term)
 
         # Combine with amplitude
-        energy = (wave1 + wave2 + wave3 + amplitude * 0.8) * 0.3 + 0.1
-        energy = np.clip(energy, 0, 1)
-
-        # Use gradient colors for energy waves
-        if len(colors) >= 2:
-            color1 = np.array(colors[0])
-            color2 = np.array(colors[1])
-
-            # Interpolate between colors based on energy intensity
-            r = (color1[0] * (1 - energy) + color2[0] * energy).astype(np.uint8)
-            g = (color1[1] * (1 - energy) + color2[1] * energy).astype(np.uint8)
-            b = (color1[2] * (1 - energy) + color2[2] * energy).astype(np.uint8)
-        else:
-            # Fallback to default
-            r = (energy * 255 * 0.5).astype(np.uint8)
-            g = (energy * 255 * 0.8).astype(np.uint8)
-            b = (energy * 255).astype(np.uint8)
+        energy += amplitude * 0.8
+        energy *= 0.3
+        energy += 0.1
+        np.clip(energy, 0, 1, out=energy)
 
-        frame[:, :, 0] = b
-        frame[:, :, 1] = g
-        frame[:, :, 2] = r
-
-        return frame
+        # Interpolate between colors based on energy intensity
+        return blend_colors(frame, energy, colors[0], colors[1], scratch=term)
 
     def _create_liquid_metal_background(
         self,
@@ -512,60 +747,31 @@ class VerticalVideoCreator:
         custom_colors=None,
     ):
         """Create liquid metal effect with custom gradient colors (optimized)."""
-        height, width = frame.shape[:2]
+        geometry = self._background_geometry(frame)
 
         # Get gradient colors
         colors = self._get_current_gradient_colors(gradient_style, custom_colors)
         if len(colors) < 2:
             colors = [(192, 192, 192), (255, 215, 0)]  # Default silver/gold colors
 
-        # Create coordinate meshgrids
-        y_coords, x_coords = np.meshgrid(
-            np.arange(height), np.arange(width), indexing="ij"
-        )
-
-        # Create flowing metal effect (vectorized)
-        flow1 = np.sin(x_coords * 0.01 + current_time * 2) * 0.4
-        flow2 = np.sin(y_coords * 0.008 + current_time * 1.5) * 0.3
-        flow3 = np.sin((x_coords + y_coords) * 0.005 + current_time * 1.2) * 0.3
+        # Create flowing metal effect (the first two flows are one row/column)
+        metal_value, term, wave = self._background_buffers(geometry)
+        geometry.wave(0.005, 0.005, current_time * 1.2, out=metal_value, scratch=wave)
+        metal_value *= 0.3
+        metal_value += np.sin(geometry.x * 0.01 + current_time * 2) * 0.4
+        metal_value += np.sin(geometry.y * 0.008 + current_time * 1.5) * 0.3
 
         # Metallic ripples
-        dx = x_coords - width / 2
-        dy = y_coords - height / 2
-        dist = np.sqrt(dx * dx + dy * dy)
-        ripple = np.sin(dist * 0.03 + current_time * 4) * 0.2
+        metal_value += sine_field(geometry.radius, 0.03, current_time * 4, 0.2, term)
 
         # Combine with amplitude
-        metal_value = (flow1 + flow2 + flow3 + ripple + amplitude * 0.4) * 0.3 + 0.3
-        metal_value = np.clip(metal_value, 0, 1)
-
-        # Use gradient colors for metallic effect
-        if len(colors) >= 2:
-            color1 = np.array(colors[0])
-            color2 = np.array(colors[1])
-
-            # Interpolate between colors based on metal value
-            r = (color1[0] * (1 - metal_value) + color2[0] * metal_value).astype(
-                np.uint8
-            )
-            g = (color1[1] * (1 - metal_value) + color2[1] * metal_value).astype(
-                np.uint8
-            )
-            b = (color1[2] * (1 - metal_value) + color2[2] * metal_value).astype(
-                np.uint8
-            )
-        else:
-            # Fallback to default metallic colors
-            base_color = (metal_value * 200 + 55).astype(np.uint8)
-            r = (base_color * 0.9).astype(np.uint8)
-            g = (base_color * 0.95).astype(np.uint8)
-            b = base_color
+        metal_value += amplitude * 0.4
+        metal_value *= 0.3
+        metal_value += 0.3
+        np.clip(metal_value, 0, 1, out=metal_value)
 
-        frame[:, :, 0] = b
-        frame[:, :, 1] = g
-        frame[:, :, 2] = r
-
-        return frame
+        # Interpolate between colors based on metal value
+        return blend_colors(frame, metal_value, colors[0], colors[1], scratch=term)
 
     def _create_cosmic_dust_background(
         self,
@@ -577,7 +783,7 @@ class VerticalVideoCreator:
         custom_colors=None,
     ):
         """Create cosmic dust field effect with custom gradient colors."""
-        height, width = frame.shape[:2]
+        geometry = self._background_geometry(frame)
 
         # Get gradient colors
         colors = self._get_current_gradient_colors(gradient_style, custom_colors)
@@ -588,46 +794,21 @@ class VerticalVideoCreator:
                 (255, 100, 50),
             ]  # Default cosmic colors
 
-        # Simple cosmic dust effect using noise
-        y_coords, x_coords = np.meshgrid(
-            np.arange(height), np.arange(width), indexing="ij"
-        )
-
         # Create dust-like pattern
-        dust1 = np.sin(x_coords * 0.05 + current_time * 0.5) * 0.3
-        dust2 = np.sin(y_coords * 0.07 + current_time * 0.3) * 0.3
-        dust3 = np.sin((x_coords + y_coords) * 0.03 + current_time * 0.8) * 0.4
+        dust_intensity, term, wave = self._background_buffers(geometry)
+        geometry.wave(0.03, 0.03, current_time * 0.8, out=dust_intensity, scratch=wave)
+        dust_intensity *= 0.4
+        dust_intensity += np.sin(geometry.x * 0.05 + current_time * 0.5) * 0.3
+        dust_intensity += np.sin(geometry.y * 0.07 + current_time * 0.3) * 0.3
 
         # Combine dust patterns
-        dust_intensity = (dust1 + dust2 + dust3 + amplitude * 0.5) * 0.2 + 0.1
-        dust_intensity = np.clip(dust_intensity, 0, 1)
-
-        # Use gradient colors for cosmic dust
-        if len(colors) >= 2:
-            color1 = np.array(colors[0])
-            color2 = np.array(colors[1])
-
-            # Interpolate between colors based on dust intensity
-            r = (color1[0] * (1 - dust_intensity) + color2[0] * dust_intensity).astype(
-                np.uint8
-            )
-            g = (color1[1] * (1 - dust_intensity) + color2[1] * dust_intensity).astype(
-                np.uint8
-            )
-            b = (color1[2] * (1 - dust_intensity) + color2[2] * dust_intensity).astype(
-                np.uint8
-            )
-        else:
-            # Fallback to default space colors
-            r = (dust_intensity * 80 + 10).astype(np.uint8)
-            g = (dust_intensity * 60 + 10).astype(np.uint8)
-            b = (dust_intensity * 150 + 20).astype(np.uint8)
+        dust_intensity += amplitude * 0.5
+        dust_intensity *= 0.2
+        dust_intensity += 0.1
+        np.clip(dust_intensity, 0, 1, out=dust_intensity)
 
-        frame[:, :, 0] = b
-        frame[:, :, 1] = g
-        frame[:, :, 2] = r
-
-        return frame
+        # Interpolate between colors based on dust intensity
+        return blend_colors(frame, dust_intensity, colors[0], colors[1], scratch=term)
 
     def _create_particle_field_background(
         self,
@@ -639,7 +820,7 @@ class VerticalVideoCreator:
         custom_colors=None,
     ):
         """Create particle field background with custom gradient colors."""
-        height, width = frame.shape[:2]
+        geometry = self._background_geometry(frame)
 
         # Get gradient colors
         colors = self._get_current_gradient_colors(gradient_style, custom_colors)
@@ -650,48 +831,24 @@ class VerticalVideoCreator:
                 (100, 255, 0),
             ]  # Default particle colors
 
-        # Simple particle field effect
-        y_coords, x_coords = np.meshgrid(
-            np.arange(height), np.arange(width), indexing="ij"
-        )
-
         # Create particle-like pattern
-        particle1 = np.sin(x_coords * 0.08 + current_time * 2) * 0.4
-        particle2 = np.sin(y_coords * 0.06 + current_time * 1.5) * 0.3
-        particle3 = np.sin((x_coords * y_coords) * 0.0001 + current_time * 3) * 0.3
+        particle_intensity, term, _ = self._background_buffers(geometry)
+        sine_field(
+            geometry.x_times_y, 0.0001, current_time * 3, 0.3, out=particle_intensity
+        )
+        particle_intensity += np.sin(geometry.x * 0.08 + current_time * 2) * 0.4
+        particle_intensity += np.sin(geometry.y * 0.06 + current_time * 1.5) * 0.3
 
         # Combine particle patterns
-        particle_intensity = (
-            particle1 + particle2 + particle3 + amplitude * 0.8
-        ) * 0.3 + 0.2
-        particle_intensity = np.clip(particle_intensity, 0, 1)
-
-        # Use gradient colors for particle field
-        if len(colors) >= 2:
-            color1 = np.array(colors[0])
-            color2 = np.array(colors[1])
-
-            # Interpolate between colors based on particle intensity
-            r = (
-                color1[0] * (1 - particle_intensity) + color2[0] * particle_intensity
-            ).astype(np.uint8)
-            g = (
-                color1[1] * (1 - particle_intensity) + color2[1] * particle_intensity
-            ).astype(np.uint8)
-            b = (
-                color1[2] * (1 - particle_intensity) + color2[2] * particle_intensity
-            ).astype(np.uint8)
-        else:
-            # Fallback to default energy field colors
-            r = (particle_intensity * 100 + 20).astype(np.uint8)
-            g = (particle_intensity * 150 + 20).astype(np.uint8)
-            b = (particle_intensity * 200 + 40).astype(np.uint8)
-
-        frame[:, :, 0] = b
-        frame[:, :, 1] = g
-        frame[:, :, 2] = r
-
-        return frame
+        particle_intensity += amplitude * 0.8
+        particle_intensity *= 0.3
+        particle_intensity += 0.2
+        np.clip(particle_intensity, 0, 1, out=particle_intensity)
+
+        # Interpolate between colors based on particle intensity
+        return blend_colors(
+            frame, particle_intensity, colors[0], colors[1], scratch=term
+        )
 
     def _create_morphing_shapes_background(
         self,
@@ -703,7 +860,7 @@ class VerticalVideoCreator:
         custom_colors=None,
     ):
         """Create morphing geometric shapes background with custom gradient colors."""
-        height, width = frame.shape[:2]
+        geometry = self._background_geometry(frame)
 
         # Get gradient colors
         colors = self._get_current_gradient_colors(gradient_style, custom_colors)
@@ -714,235 +871,39 @@ class VerticalVideoCreator:
                 (200, 200, 60),
             ]  # Default morphing colors
 
-        # Simple morphing effect using sinusoidal patterns
-        y_coords, x_coords = np.meshgrid(
-            np.arange(height), np.arange(width), indexing="ij"
-        )
-
-        # Create morphing pattern
-        center_x, center_y = width // 2, height // 2
-        dx = x_coords - center_x
-        dy = y_coords - center_y
-        dist = np.sqrt(dx * dx + dy * dy) / max(width, height) * 2
-        angle = np.arctan2(dy, dx)
-
         # Morphing based on time and amplitude
         morph_time = current_time * 0.5
-        morph_pattern = np.sin(angle * 4 + morph_time) * np.sin(
-            dist * 3 + morph_time * 2
-        )
-        morph_intensity = (morph_pattern + amplitude * 0.8) * 0.4 + 0.3
-        morph_intensity = np.clip(morph_intensity, 0, 1)
-
-        # Use gradient colors for morphing shapes
-        if len(colors) >= 2:
-            color1 = np.array(colors[0])
-            color2 = np.array(colors[1])
-
-            # Interpolate between colors based on morph intensity
-            r = (
-                color1[0] * (1 - morph_intensity) + color2[0] * morph_intensity
-            ).astype(np.uint8)
-            g = (
-                color1[1] * (1 - morph_intensity) + color2[1] * morph_intensity
-            ).astype(np.uint8)
-            b = (
-                color1[2] * (1 - morph_intensity) + color2[2] * morph_intensity
-            ).astype(np.uint8)
-        else:
-            # Fallback to default morphing colors
-            r = (morph_intensity * 150 + 30).astype(np.uint8)
-            g = (morph_intensity * 80 + 20).astype(np.uint8)
-            b = (morph_intensity * 200 + 60).astype(np.uint8)
-
-        frame[:, :, 0] = b
-        frame[:, :, 1] = g
-        frame[:, :, 2] = r
-
-        return frame
-
-    def create_fallback_background(
+        morph_intensity, term, _ = self._background_buffers(geometry)
+        sine_field(geometry.angle, 4, morph_time, out=morph_intensity)
+        morph_intensity *= sine_field(geometry.radius_norm, 6, morph_time * 2, out=term)
+        morph_intensity += amplitude * 0.8
+        morph_intensity *= 0.4
+        morph_intensity += 0.3
+        np.clip(morph_intensity, 0, 1, out=morph_intensity)
+
+        # Interpolate between colors based on morph intensity
+        return blend_colors(frame, morph_intensity, colors[0], colors[1], scratch=term)
+
+    def create_gradient_image(
         self, gradient_style: str = "default", custom_colors: list = None
-    ) -> Path:
-        """Create a gradient background with various styles.
-
-        Args:
-            gradient_style: Style of gradient ("default", "dark_teal_orange", "sunset", "ocean",
-                          "purple_pink", "forest", "midnight", "fire", "arctic", "cosmic")
-            custom_colors: List of RGB tuples for custom gradient, e.g. [(255,0,0), (0,255,0), (0,0,255)]
-        """
-        image = Image.new("RGB", (self.width, self.height))
-        draw = ImageDraw.Draw(image)
-
-        # Define predefined gradient styles
-        gradient_presets = {
-            "default": [
-                (30, 50, 120),
-                (130, 130, 255),
-            ],  # Deep blue to purple (original)
-            "dark_teal_orange": [
-                (0, 40, 40),
-                (255, 140, 60),
-            ],  # Dark teal to vibrant orange
-            "sunset": [(255, 94, 77), (255, 154, 0), (255, 206, 84)],  # Sunset colors
-            "ocean": [(0, 119, 190), (0, 180, 216), (144, 224, 239)],  # Ocean blues
-            "purple_pink": [(106, 17, 203), (255, 61, 127)],  # Deep purple to pink
-            "forest": [
-                (34, 139, 34),
-                (107, 142, 35),
-                (255, 215, 0),
-            ],  # Forest green to gold
-            "midnight": [
-                (25, 25, 112),
-                (138, 43, 226),
-                (75, 0, 130),
-            ],  # Midnight blues and purples
-            "fire": [
-                (139, 0, 0),
-                (255, 69, 0),
-                (255, 215, 0),
-            ],  # Dark red to orange to gold
-            "arctic": [
-                (176, 224, 230),
-                (135, 206, 235),
-                (70, 130, 180),
-            ],  # Arctic blues
-            "cosmic": [
-                (75, 0, 130),
-                (138, 43, 226),
-                (255, 20, 147),
-                (255, 215, 0),
-            ],  # Deep space colors
-            # 20 NUEVOS GRADIENTES HERMOSOS
-            "cherry_blossom": [
-                (255, 183, 197),
-                (255, 105, 180),
-                (255, 20, 147),
-            ],  # Flor de cerezo
-            "tropical": [
-                (0, 255, 127),
-                (255, 215, 0),
-                (255, 69, 0),
-            ],  # Tropical verde-dorado-naranja
-            "lavender_mist": [
-                (230, 230, 250),
-                (147, 112, 219),
-                (138, 43, 226),
-            ],  # Niebla de lavanda
-            "golden_hour": [
-                (255, 223, 0),
-                (255, 140, 0),
-                (255, 69, 0),
-                (139, 0, 0),
-            ],  # Hora dorada
-            "emerald_sea": [
-                (0, 128, 128),
-                (32, 178, 170),
-                (72, 209, 204),
-                (175, 238, 238),
-            ],  # Mar esmeralda
-            "rose_gold": [
-                (183, 110, 121),
-                (255, 192, 203),
-                (255, 215, 0),
-            ],  # Oro rosa
-            "northern_lights": [
-                (0, 255, 127),
-                (0, 191, 255),
-                (138, 43, 226),
-                (255, 20, 147),
-            ],  # Aurora boreal
-            "desert_sand": [
-                (218, 165, 32),
-                (255, 215, 0),
-                (255, 160, 122),
-                (250, 128, 114),
-            ],  # Arena del desierto
-            "deep_ocean": [
-                (0, 0, 139),
-                (0, 100, 148),
-                (0, 191, 255),
-                (135, 206, 235),
-            ],  # Océano profundo
-            "neon_cyber": [
-                (255, 0, 255),
-                (0, 255, 255),
-                (57, 255, 20),
-                (255, 255, 0),
-            ],  # Neón cyberpunk
-            "autumn_leaves": [
-                (255, 69, 0),
-                (255, 140, 0),
-                (255, 215, 0),
-                (139, 69, 19),
-            ],  # Hojas de otoño
-            "moonlight": [
-                (25, 25, 112),
-                (72, 61, 139),
-                (176, 196, 222),
-                (245, 245, 245),
-            ],  # Luz de luna
-            "tropical_sunset": [
-                (255, 94, 77),
-                (255, 154, 0),
-                (255, 215, 0),
-                (255, 20, 147),
-                (138, 43, 226),
-            ],  # Atardecer tropical
-            "winter_frost": [
-                (176, 224, 230),
-                (173, 216, 230),
-                (135, 206, 235),
-                (70, 130, 180),
-                (25, 25, 112),
-            ],  # Escarcha invernal
-            "sakura_dream": [
-                (255, 228, 225),
-                (255, 182, 193),
-                (255, 105, 180),
-                (219, 112, 147),
-            ],  # Sueño de sakura
-            "volcanic": [
-                (139, 0, 0),
-                (178, 34, 34),
-                (255, 69, 0),
-                (255, 215, 0),
-                (255, 255, 255),
-            ],  # Volcánico
-            "electric_blue": [
-                (0, 0, 139),
-                (0, 191, 255),
-                (0, 255, 255),
-                (255, 255, 255),
-            ],  # Azul eléctrico
-            "jungle_green": [
-                (0, 100, 0),
-                (34, 139, 34),
-                (50, 205, 50),
-                (144, 238, 144),
-            ],  # Verde selva
-            "royal_purple": [
-                (75, 0, 130),
-                (106, 17, 203),
-                (138, 43, 226),
-                (218, 112, 214),
-            ],  # Púrpura real
-            "cotton_candy": [
-                (255, 192, 203),
-                (255, 182, 193),
-                (221, 160, 221),
-                (238, 130, 238),
-                (255, 20, 147),
-            ],  # Algodón de azúcar
-        }
+    ) -> np.ndarray:
+        """Gradient background as a BGR array (see ``create_fallback_background``)."""
+        image = self._draw_gradient(gradient_style, custom_colors)
+        return np.ascontiguousarray(np.asarray(image)[:, :, ::-1])
 
-        # Use custom colors if provided, otherwise use preset
+    @staticmethod
+    def _gradient_stops(gradient_style: str, custom_colors: list = None) -> list:
+        """RGB colour stops of a gradient: the custom colours or the preset."""
         if custom_colors and len(custom_colors) >= 2:
-            colors = custom_colors
-        else:
-            colors = gradient_presets.get(gradient_style, gradient_presets["default"])
+            return [tuple(color) for color in custom_colors]
+        return GRADIENT_PRESETS.get(gradient_style, GRADIENT_PRESETS["default"])
 
-        # Create gradient
+    def _draw_gradient(self, gradient_style: str, custom_colors: list = None):
+        """Vertical gradient at the output size as a blurred PIL image."""
+        colors = self._gradient_stops(gradient_style, custom_colors)
+
+        # One colour per row
+        rows = np.empty((self.height, 3), dtype=np.uint8)
         num_colors = len(colors)
         if num_colors == 2:
             # Simple two-color gradient
@@ -951,8 +912,11 @@ class VerticalVideoCreator:
                 r = int(colors[0][0] + (colors[1][0] - colors[0][0]) * ratio)
                 g = int(colors[0][1] + (colors[1][1] - colors[0][1]) * ratio)
                 b = int(colors[0][2] + (colors[1][2] - colors[0][2]) * ratio)
-                color = (max(0, min(255, r)), max(0, min(255, g)), max(0, min(255, b)))
-                draw.line([(0, y), (self.width, y)], fill=color)
+                rows[y] = (
+                    max(0, min(255, r)),
+                    max(0, min(255, g)),
+                    max(0, min(255, b)),
+                )
         else:
             # Multi-color gradient
             for y in range(self.height):
@@ -969,11 +933,33 @@ class VerticalVideoCreator:
                 r = int(color1[0] + (color2[0] - color1[0]) * local_ratio)
                 g = int(color1[1] + (color2[1] - color1[1]) * local_ratio)
                 b = int(color1[2] + (color2[2] - color1[2]) * local_ratio)
-                color = (max(0, min(255, r)), max(0, min(255, g)), max(0, min(255, b)))
-                draw.line([(0, y), (self.width, y)], fill=color)
+                rows[y] = (
+                    max(0, min(255, r)),
+                    max(0, min(255, g)),
+                    max(0, min(255, b)),
+                )
+
+        # Every pixel of a row has the row's colour
+        image = Image.fromarray(
+            np.ascontiguousarray(
+                np.broadcast_to(rows[:, None], (self.height, self.width, 3))
+            )
+        )
 
         # Add some blur for smoothness
-        image = image.filter(ImageFilter.GaussianBlur(radius=2))
+        return image.filter(ImageFilter.GaussianBlur(radius=GRADIENT_BLUR_RADIUS))
+
+    def create_fallback_background(
+        self, gradient_style: str = "default", custom_colors: list = None
+    ) -> Path:
+        """Create a gradient background with various styles.
+
+        Args:
+            gradient_style: Style of gradient ("default", "dark_teal_orange", "sunset", "ocean",
+                          "purple_pink", "forest", "midnight", "fire", "arctic", "cosmic")
+            custom_colors: List of RGB tuples for custom gradient, e.g. [(255,0,0), (0,255,0), (0,0,255)]
+        """
+        image = self._draw_gradient(gradient_style, custom_colors)
 
         # Save to temporary file
         temp_dir = Path(tempfile.gettempdir())
@@ -985,51 +971,233 @@ class VerticalVideoCreator:
         return bg_path
 
     def extract_audio_features(
-        self, audio_path: Path, max_duration: float = None
+        self,
+        audio_path: Path,
+        max_duration: float = None,
+        use_cache: bool = True,
+        fps: int = None,
     ) -> tuple:
         """Extract audio features for waveform animation.
 
+        The audio is analysed block by block, so only the compact per-frame
+        arrays are kept in memory regardless of the episode length.
+
         Args:
             max_duration: If provided, only process first max_duration seconds of audio
+            use_cache: Reuse/store the analysis in a ``.npz`` cache next to the
+                audio file, keyed by its content hash, ``max_duration`` and the
+                feature parameters.
+            fps: Frame rate of the per-frame timeline (defaults to ``self.fps``)
         """
-        try:
-            # Load audio file
-            if max_duration is not None:
-                # Load only the first max_duration seconds
-                y, sr = librosa.load(str(audio_path), duration=max_duration)
-            else:
-                y, sr = librosa.load(str(audio_path))
-
-            # Get audio duration
-            duration = librosa.get_duration(y=y, sr=sr)
+        cache_path = cache_key = None
+        if use_cache:
+            try:
+                cache_key = feature_cache_key(
+                    audio_path, max_duration, AUDIO_FEATURE_PARAMS
+                )
+                cache_path = feature_cache_path(audio_path, cache_key)
+                features = load_features(cache_path, cache_key)
+                if features is not None:
+                    print(f"♻️  Using cached audio features: {cache_path.name}")
+                    features["timeline"] = self.build_audio_timeline(features, fps)
+                    return features
+            except Exception as e:
+                print(f"⚠️  Audio feature cache unavailable: {e}")
+                cache_path = None
 
-            # Extract features for visualization
-            # RMS energy for overall amplitude
-            rms = librosa.feature.rms(y=y, frame_length=2048, hop_length=512)[0]
+        try:
+            try:
+                features = self._analyze_audio_streaming(audio_path, max_duration)
+            except RuntimeError as e:
+                # soundfile cannot decode this container; decode it in one go
+                print(f"⚠️  Streaming decode unavailable ({e}), loading full audio")
+                features = self._analyze_audio_in_memory(audio_path, max_duration)
 
-            # Spectral centroid for frequency content
-            spectral_centroids = librosa.feature.spectral_centroid(y=y, sr=sr)[0]
+            if cache_path is not None:
+                save_features(cache_path, cache_key, features)
 
-            # Tempo and beat tracking
-            try:
-                tempo, beats = librosa.beat.beat_track(y=y, sr=sr)
-            except:
-                tempo = 120  # Default tempo
-                beats = np.arange(0, len(y), sr // 2)  # Default beats every 0.5 seconds
-
-            return {
-                "duration": duration,
-                "rms": rms,
-                "spectral_centroids": spectral_centroids,
-                "tempo": tempo,
-                "beats": beats,
-                "sr": sr,
-                "audio_data": y,
-            }
+            features["timeline"] = self.build_audio_timeline(features, fps)
+            return features
         except Exception as e:
             print(f"Error extracting audio features: {e}")
             return None
 
+    def _analyze_audio_streaming(
+        self, audio_path: Path, max_duration: float = None
+    ) -> dict:
+        """Block-wise analysis with bounded memory (see ``audio_stream``)."""
+        hop_length = AUDIO_FEATURE_PARAMS["hop_length"]
+        analysis = analyze_audio_stream(
+            audio_path,
+            max_duration,
+            sr=AUDIO_FEATURE_PARAMS["sr"],
+            frame_length=AUDIO_FEATURE_PARAMS["frame_length"],
+            hop_length=hop_length,
+        )
+        tempo, beats = self._track_beats(
+            analysis["onset_envelope"], analysis["duration"]
+        )
+
+        return {
+            "duration": analysis["duration"],
+            "rms": analysis["rms"],
+            "spectral_centroids": analysis["spectral_centroids"],
+            "tempo": tempo,
+            "beats": beats,
+            "sr": AUDIO_FEATURE_PARAMS["sr"],
+        }
+
+    def _analyze_audio_in_memory(
+        self, audio_path: Path, max_duration: float = None
+    ) -> dict:
+        """Fallback analysis that decodes the whole file with librosa.load."""
+        sr = AUDIO_FEATURE_PARAMS["sr"]
+        frame_length = AUDIO_FEATURE_PARAMS["frame_length"]
+        hop_length = AUDIO_FEATURE_PARAMS["hop_length"]
+
+        # duration=None loads the whole file
+        y, sr = librosa.load(str(audio_path), sr=sr, duration=max_duration)
+        duration = librosa.get_duration(y=y, sr=sr)
+
+        # RMS energy for overall amplitude
+        rms = librosa.feature.rms(
+            y=y, frame_length=frame_length, hop_length=hop_length
+        )[0]
+
+        # Spectral centroid for frequency content
+        spectral_centroids = librosa.feature.spectral_centroid(
+            y=y, sr=sr, n_fft=frame_length, hop_length=hop_length
+        )[0]
+
+        onset_envelope = librosa.onset.onset_strength(
+            y=y, sr=sr, hop_length=hop_length, aggregate=np.median
+        )
+        tempo, beats = self._track_beats(onset_envelope, duration)
+
+        return {
+            "duration": duration,
+            "rms": rms,
+            "spectral_centroids": spectral_centroids,
+            "tempo": tempo,
+            "beats": beats,
+            "sr": sr,
+        }
+
+    def _track_beats(
+        self, onset_envelope: np.ndarray, duration: float, window_seconds: float = 120.0
+    ) -> tuple:
+        """Tempo and beat frames from an onset envelope.
+
+        The tempo estimate builds a tempogram over the whole envelope, which
+        grows to gigabytes on hour-long episodes. It is estimated per window
+        instead (median across windows) and handed to ``beat_track``.
+        """
+        sr = AUDIO_FEATURE_PARAMS["sr"]
+        hop_length = AUDIO_FEATURE_PARAMS["hop_length"]
+        try:
+            window = max(int(window_seconds * sr / hop_length), 1)
+            tempos = [
+                librosa.feature.tempo(
+                    onset_envelope=onset_envelope[start : start + window],
+                    sr=sr,
+                    hop_length=hop_length,
+                )[0]
+                for start in range(0, len(onset_envelope), window)
+                # A short tail says little about the tempo
+                if start == 0 or len(onset_envelope) - start >= window // 4
+            ]
+            return librosa.beat.beat_track(
+                onset_envelope=onset_envelope,
+                sr=sr,
+                hop_length=hop_length,
+                bpm=float(np.median(tempos)),
+            )
+        except Exception:
+            # Default tempo, beats every 0.5 seconds (as analysis frame indices)
+            beats = librosa.time_to_frames(
+                np.arange(0, duration, 0.5), sr=sr, hop_length=hop_length
+            )
+            return 120, beats
+
+    def build_audio_timeline(self, audio_features: dict, fps: int = None) -> dict:
+        """Resample the audio analysis onto the video frame grid.
+
+        The raw features live on librosa's hop grid; renderers only ever need
+        one value per video frame. Building the timeline once per render turns
+        every per-frame lookup (including the amplitude normalisation) into an
+        O(1) array read.
+
+        Args:
+            audio_features: Dict returned by ``extract_audio_features``
+            fps: Frame rate of the timeline (defaults to ``self.fps``)
+
+        Returns:
+            Dict of float32/bool arrays with one entry per video frame:
+            ``amplitude`` (rms normalised to 0-1), ``spectral`` (spectral
+            centroid in Hz), ``beat`` (a beat falls in this frame) and the
+            smoothed ``envelope_fast`` / ``envelope_slow`` amplitude followers.
+        """
+        fps = fps or self.fps
+        duration = audio_features["duration"]
+        rms = np.asarray(audio_features["rms"], dtype=np.float32)
+        spectral = np.asarray(audio_features["spectral_centroids"], dtype=np.float32)
+        frame_count = max(int(duration * fps), 1)
+
+        # Same frame -> analysis index mapping the renderers used to do inline
+        frame_times = np.arange(frame_count) / frame_count
+        rms_idx = np.minimum((frame_times * len(rms)).astype(np.int64), len(rms) - 1)
+        spectral_idx = np.minimum(
+            (frame_times * len(spectral)).astype(np.int64), len(spectral) - 1
+        )
+
+        max_amplitude = float(rms.max()) if len(rms) else 0.0
+        if max_amplitude > 0:
+            amplitude = rms[rms_idx] / max_amplitude
+        else:
+            amplitude = np.zeros(frame_count, dtype=np.float32)
+
+        # Beats are analysis frame indices; flag the video frame nearest each
+        beat = np.zeros(frame_count, dtype=bool)
+        beats = np.asarray(audio_features.get("beats", []))
+        if beats.size:
+            beat_times = librosa.frames_to_time(
+                beats,
+                sr=audio_features["sr"],
+                hop_length=AUDIO_FEATURE_PARAMS["hop_length"],
+            )
+            beat_frames = np.rint(beat_times * fps).astype(np.int64)
+            beat[beat_frames[(beat_frames >= 0) & (beat_frames < frame_count)]] = True
+
+        return {
+            "fps": fps,
+            "amplitude": amplitude.astype(np.float32),
+            "spectral": spectral[spectral_idx],
+            "beat": beat,
+            "envelope_fast": self._smooth_envelope(amplitude, fps, 0.15),
+            "envelope_slow": self._smooth_envelope(amplitude, fps, 0.8),
+        }
+
+    @staticmethod
+    def _smooth_envelope(
+        amplitude: np.ndarray, fps: int, time_constant: float
+    ) -> np.ndarray:
+        """One-pole low-pass follower over a per-frame amplitude curve.
+
+        ``time_constant`` is in seconds; the follower starts from silence.
+        """
+        coef = np.exp(-1.0 / max(time_constant * fps, 1e-6))
+        envelope = lfilter([1.0 - coef], [1.0, -coef], amplitude.astype(np.float64))
+        return envelope.astype(np.float32)
+
+    def _timeline_index(self, audio_features: dict, current_time: float) -> int:
+        """Index of the timeline entry for ``current_time`` seconds."""
+        timeline = audio_features["timeline"]
+        frame_count = len(timeline["amplitude"])
+        # Round rather than floor: frame times are i / n * duration, so this
+        # lands back on i without floating point drift.
+        idx = int(round(current_time * frame_count / audio_features["duration"]))
+        return min(max(idx, 0), frame_count - 1)
+
     def create_waveform_frame(
         self,
         bg_image: np.ndarray,
@@ -1043,378 +1211,62 @@ class VerticalVideoCreator:
         particle_gradient_style: str = None,
         particle_custom_colors: list = None,
     ) -> np.ndarray:
-        """Create a single frame with waveform animation."""
+        """Create a single frame with waveform animation.
+
+        Renders go through ``create_styles``, which sets each style up once;
+        this is the one-off equivalent.
+        """
         frame = bg_image.copy()
 
         if audio_features is None:
             return frame
 
-        # Calculate current time position
-        current_time = (frame_idx / total_frames) * audio_features["duration"]
+        render_options = {
+            "waveform_style": style,
+            "gradient_style": gradient_style,
+            "custom_colors": custom_colors,
+            "particle_color_scheme": particle_color_scheme,
+            "particle_gradient_style": particle_gradient_style,
+            "particle_custom_colors": particle_custom_colors,
+        }
+        create_waveform_style(
+            self, render_options, total_frames, audio_features["duration"]
+        ).render(frame_idx, audio_features, frame)
+        return frame
 
-        # Get current audio amplitude
-        rms_idx = min(
-            int(current_time * len(audio_features["rms"]) / audio_features["duration"]),
-            len(audio_features["rms"]) - 1,
-        )
-        current_amplitude = audio_features["rms"][rms_idx]
+    def _draw_waveform(
+        self,
+        frame: np.ndarray,
+        amplitude: float,
+        current_time: float,
+        audio_features: dict,
+    ):
+        """Draw animated waveform on the frame."""
+        center_x = self.width // 2
+        center_y = self.height // 2
 
-        # Normalize amplitude (0-1)
-        max_amplitude = np.max(audio_features["rms"])
-        normalized_amplitude = (
-            current_amplitude / max_amplitude if max_amplitude > 0 else 0
-        )
+        # Create circular waveform - adjust size based on orientation
+        num_bars = 64
+        if self.orientation == "horizontal":
+            max_radius = min(280, self.height // 4)  # Fit within horizontal frame
+            min_radius = max(60, self.height // 12)
+        else:
+            max_radius = 200
+            min_radius = 80
+
+        for i in range(num_bars):
+            angle = (2 * np.pi * i) / num_bars
+
+            # Create animated effect based on audio
+            bar_amplitude = amplitude * (1 + 0.3 * np.sin(current_time * 2 + i * 0.1))
+            bar_height = min_radius + (max_radius - min_radius) * bar_amplitude
 
-        # Create waveform visualization based on style
-        if style == "sine":
-            self._draw_sine_waveform(
-                frame, normalized_amplitude, current_time, audio_features
+            # Calculate bar positions (clamp to frame bounds)
+            inner_x = int(
+                np.clip(center_x + min_radius * np.cos(angle), 0, self.width - 1)
             )
-        elif style == "mathematical" or style == "fractal":
-            self._draw_mathematical_forms(
-                frame,
-                normalized_amplitude,
-                current_time,
-                audio_features,
-                frame_idx,
-                total_frames,
-            )
-        elif style == "julia" or style == "mandelbrot":
-            self._draw_julia_fractal(
-                frame,
-                normalized_amplitude,
-                current_time,
-                audio_features,
-                frame_idx,
-                total_frames,
-                gradient_style,
-                custom_colors,
-            )
-        elif style == "psychedelic" or style == "circles":
-            self._draw_psychedelic_circles(
-                frame,
-                normalized_amplitude,
-                current_time,
-                audio_features,
-                frame_idx,
-                total_frames,
-                gradient_style,
-                custom_colors,
-            )
-        elif style == "fluid" or style == "liquid":
-            self._draw_fluid_waves(
-                frame,
-                normalized_amplitude,
-                current_time,
-                audio_features,
-                frame_idx,
-                total_frames,
-                gradient_style,
-                custom_colors,
-                particle_color_scheme,
-                particle_gradient_style,
-                particle_custom_colors,
-            )
-        elif style == "particles" or style == "sand":
-            self._draw_particle_fall(
-                frame,
-                normalized_amplitude,
-                current_time,
-                audio_features,
-                frame_idx,
-                total_frames,
-                gradient_style,
-                custom_colors,
-                particle_color_scheme,
-                particle_gradient_style,
-                particle_custom_colors,
-            )
-        elif style == "morph" or style == "shapes":
-            self._draw_morphing_shapes(
-                frame,
-                normalized_amplitude,
-                current_time,
-                audio_features,
-                frame_idx,
-                total_frames,
-                gradient_style,
-                custom_colors,
-            )
-        elif style == "kaleidoscope" or style == "mirror":
-            self._draw_kaleidoscope(
-                frame,
-                normalized_amplitude,
-                current_time,
-                audio_features,
-                frame_idx,
-                total_frames,
-                gradient_style,
-                custom_colors,
-                particle_color_scheme,
-                particle_gradient_style,
-                particle_custom_colors,
-            )
-        elif style == "k-mandala":
-            self._draw_k_mandala(
-                frame,
-                normalized_amplitude,
-                current_time,
-                audio_features,
-                frame_idx,
-                total_frames,
-                gradient_style,
-                custom_colors,
-                particle_color_scheme,
-                particle_gradient_style,
-                particle_custom_colors,
-            )
-        elif style == "k-crystal":
-            self._draw_k_crystal(
-                frame,
-                normalized_amplitude,
-                current_time,
-                audio_features,
-                frame_idx,
-                total_frames,
-                gradient_style,
-                custom_colors,
-                particle_color_scheme,
-                particle_gradient_style,
-                particle_custom_colors,
-            )
-        elif style == "k-flower":
-            self._draw_k_flower(
-                frame,
-                normalized_amplitude,
-                current_time,
-                audio_features,
-                frame_idx,
-                total_frames,
-                gradient_style,
-                custom_colors,
-                particle_color_scheme,
-                particle_gradient_style,
-                particle_custom_colors,
-            )
-        elif style == "k-sacred":
-            self._draw_k_sacred(
-                frame,
-                normalized_amplitude,
-                current_time,
-                audio_features,
-                frame_idx,
-                total_frames,
-                gradient_style,
-                custom_colors,
-                particle_color_scheme,
-                particle_gradient_style,
-                particle_custom_colors,
-            )
-        elif style == "k-tribal":
-            self._draw_k_tribal(
-                frame,
-                normalized_amplitude,
-                current_time,
-                audio_features,
-                frame_idx,
-                total_frames,
-                gradient_style,
-                custom_colors,
-                particle_color_scheme,
-                particle_gradient_style,
-                particle_custom_colors,
-            )
-        elif style == "k-laser":
-            self._draw_k_laser(
-                frame,
-                normalized_amplitude,
-                current_time,
-                audio_features,
-                frame_idx,
-                total_frames,
-                gradient_style,
-                custom_colors,
-                particle_color_scheme,
-                particle_gradient_style,
-                particle_custom_colors,
-            )
-        elif style == "k-web":
-            self._draw_k_web(
-                frame,
-                normalized_amplitude,
-                current_time,
-                audio_features,
-                frame_idx,
-                total_frames,
-                gradient_style,
-                custom_colors,
-                particle_color_scheme,
-                particle_gradient_style,
-                particle_custom_colors,
-            )
-        elif style == "k-spiral":
-            self._draw_k_spiral(
-                frame,
-                normalized_amplitude,
-                current_time,
-                audio_features,
-                frame_idx,
-                total_frames,
-                gradient_style,
-                custom_colors,
-                particle_color_scheme,
-                particle_gradient_style,
-                particle_custom_colors,
-            )
-        elif style == "k-diamond":
-            self._draw_k_diamond(
-                frame,
-                normalized_amplitude,
-                current_time,
-                audio_features,
-                frame_idx,
-                total_frames,
-                gradient_style,
-                custom_colors,
-                particle_color_scheme,
-                particle_gradient_style,
-                particle_custom_colors,
-            )
-        elif style == "k-stars":
-            self._draw_k_stars(
-                frame,
-                normalized_amplitude,
-                current_time,
-                audio_features,
-                frame_idx,
-                total_frames,
-                gradient_style,
-                custom_colors,
-                particle_color_scheme,
-                particle_gradient_style,
-                particle_custom_colors,
-            )
-        elif style == "breathing" or style == "zen":
-            self._draw_breathing_patterns(
-                frame,
-                normalized_amplitude,
-                current_time,
-                audio_features,
-                frame_idx,
-                total_frames,
-                gradient_style,
-                custom_colors,
-            )
-        elif style == "matrix" or style == "rain":
-            self._draw_matrix_rain(
-                frame,
-                normalized_amplitude,
-                current_time,
-                audio_features,
-                frame_idx,
-                total_frames,
-                gradient_style,
-                custom_colors,
-                particle_color_scheme,
-                particle_gradient_style,
-                particle_custom_colors,
-            )
-        elif style == "starfield" or style == "space":
-            self._draw_starfield(
-                frame,
-                normalized_amplitude,
-                current_time,
-                audio_features,
-                frame_idx,
-                total_frames,
-                gradient_style,
-                custom_colors,
-                particle_color_scheme,
-                particle_gradient_style,
-                particle_custom_colors,
-            )
-        elif style == "network" or style == "web":
-            self._draw_network_web(
-                frame,
-                normalized_amplitude,
-                current_time,
-                audio_features,
-                frame_idx,
-                total_frames,
-                gradient_style,
-                custom_colors,
-                particle_color_scheme,
-                particle_gradient_style,
-                particle_custom_colors,
-            )
-        elif style == "swarm" or style == "flock":
-            self._draw_particle_swarm(
-                frame,
-                normalized_amplitude,
-                current_time,
-                audio_features,
-                frame_idx,
-                total_frames,
-                gradient_style,
-                custom_colors,
-                particle_color_scheme,
-                particle_gradient_style,
-                particle_custom_colors,
-            )
-        elif style == "explosion" or style == "fireworks":
-            self._draw_fireworks_explosion(
-                frame,
-                normalized_amplitude,
-                current_time,
-                audio_features,
-                frame_idx,
-                total_frames,
-                gradient_style,
-                custom_colors,
-                particle_color_scheme,
-                particle_gradient_style,
-                particle_custom_colors,
-            )
-        else:
-            self._draw_waveform(
-                frame, normalized_amplitude, current_time, audio_features
-            )
-
-        return frame
-
-    def _draw_waveform(
-        self,
-        frame: np.ndarray,
-        amplitude: float,
-        current_time: float,
-        audio_features: dict,
-    ):
-        """Draw animated waveform on the frame."""
-        center_x = self.width // 2
-        center_y = self.height // 2
-
-        # Create circular waveform - adjust size based on orientation
-        num_bars = 64
-        if self.orientation == "horizontal":
-            max_radius = min(280, self.height // 4)  # Fit within horizontal frame
-            min_radius = max(60, self.height // 12)
-        else:
-            max_radius = 200
-            min_radius = 80
-
-        for i in range(num_bars):
-            angle = (2 * np.pi * i) / num_bars
-
-            # Create animated effect based on audio
-            bar_amplitude = amplitude * (1 + 0.3 * np.sin(current_time * 2 + i * 0.1))
-            bar_height = min_radius + (max_radius - min_radius) * bar_amplitude
-
-            # Calculate bar positions (clamp to frame bounds)
-            inner_x = int(
-                np.clip(center_x + min_radius * np.cos(angle), 0, self.width - 1)
-            )
-            inner_y = int(
-                np.clip(center_y + min_radius * np.sin(angle), 0, self.height - 1)
+            inner_y = int(
+                np.clip(center_y + min_radius * np.sin(angle), 0, self.height - 1)
             )
             outer_x = int(
                 np.clip(center_x + bar_height * np.cos(angle), 0, self.width - 1)
@@ -1424,15 +1276,9 @@ class VerticalVideoCreator:
             )
 
             # Color based on frequency content (if available)
-            spectral_idx = min(
-                int(
-                    current_time
-                    * len(audio_features["spectral_centroids"])
-                    / audio_features["duration"]
-                ),
-                len(audio_features["spectral_centroids"]) - 1,
-            )
-            spectral_value = audio_features["spectral_centroids"][spectral_idx]
+            spectral_value = audio_features["timeline"]["spectral"][
+                self._timeline_index(audio_features, current_time)
+            ]
 
             # Map spectral centroid to color (clamp to valid range)
             hue = int(
@@ -1684,15 +1530,9 @@ class VerticalVideoCreator:
         enhanced_amplitude = amplitude * (1 + 0.5 * np.sin(current_time * 4))
 
         # Color palette based on audio frequency content
-        spectral_idx = min(
-            int(
-                current_time
-                * len(audio_features["spectral_centroids"])
-                / audio_features["duration"]
-            ),
-            len(audio_features["spectral_centroids"]) - 1,
-        )
-        spectral_value = audio_features["spectral_centroids"][spectral_idx]
+        spectral_value = audio_features["timeline"]["spectral"][
+            self._timeline_index(audio_features, current_time)
+        ]
 
         # Create dynamic color scheme
         hue_shift = (spectral_value / 4000) * 360 + current_time * 30
@@ -1920,32 +1760,8 @@ class VerticalVideoCreator:
             )
 
     def _hsv_to_bgr(self, h, s, v):
-        """Convert HSV to BGR color space for OpenCV."""
-        # Normalize values
-        h = max(0, min(360, h)) / 360.0
-        s = max(0, min(255, s)) / 255.0
-        v = max(0, min(255, v)) / 255.0
-
-        # HSV to RGB conversion
-        c = v * s
-        x = c * (1 - abs((h * 6) % 2 - 1))
-        m = v - c
-
-        if 0 <= h < 1 / 6:
-            r, g, b = c, x, 0
-        elif 1 / 6 <= h < 2 / 6:
-            r, g, b = x, c, 0
-        elif 2 / 6 <= h < 3 / 6:
-            r, g, b = 0, c, x
-        elif 3 / 6 <= h < 4 / 6:
-            r, g, b = 0, x, c
-        elif 4 / 6 <= h < 5 / 6:
-            r, g, b = x, 0, c
-        else:
-            r, g, b = c, 0, x
-
-        # Convert to 0-255 range and BGR format for OpenCV
-        return (int((b + m) * 255), int((g + m) * 255), int((r + m) * 255))
+        """Convert HSV to BGR color space for OpenCV (hue 0-360, s/v 0-255)."""
+        return hsv_to_bgr_scalar(h, s, v)
 
     def _get_particle_color(
         self,
@@ -1977,177 +1793,57 @@ class VerticalVideoCreator:
             particle_gradient_style: Specific gradient style for particles (overrides gradient_style)
             particle_custom_colors: Custom colors specific for particles (overrides custom_colors)
         """
-        # Determine which gradient colors to use for particles
-        effective_gradient_style = (
-            particle_gradient_style if particle_gradient_style else gradient_style
-        )
-        effective_custom_colors = (
-            particle_custom_colors if particle_custom_colors else custom_colors
+        palette = self._get_palette(
+            color_scheme,
+            particle_gradient_style if particle_gradient_style else gradient_style,
+            particle_custom_colors if particle_custom_colors else custom_colors,
         )
+        return palette.color(particle_id, base_hue, amplitude, time)
 
-        if color_scheme == "background":
-            return self._get_background_similar_color(
-                particle_id,
-                base_hue,
-                amplitude,
-                time,
-                effective_gradient_style,
-                effective_custom_colors,
-            )
-        elif color_scheme == "dissonant":
-            return self._get_dissonant_color(particle_id, base_hue, amplitude, time)
-        elif color_scheme == "triadic":
-            return self._get_triadic_color(particle_id, base_hue, amplitude, time)
-        elif color_scheme == "monochrome":
-            return self._get_monochrome_color(
-                particle_id,
-                base_hue,
-                amplitude,
-                time,
-                effective_gradient_style,
-                effective_custom_colors,
-            )
-        else:  # multicolor (default)
-            return self._get_multicolor_particle(particle_id, base_hue, amplitude, time)
-
-    def _get_multicolor_particle(
-        self, particle_id: int, base_hue: int, amplitude: float, time: float
-    ) -> tuple:
-        """Generate rainbow/multicolor particle (existing behavior)."""
-        particle_hue = (base_hue + particle_id * 3 + time * 20) % 360
-        particle_brightness = int(120 + 135 * amplitude)
-        return self._hsv_to_bgr(particle_hue, 180, min(255, particle_brightness))
-
-    def _get_background_similar_color(
+    def _get_particle_colors(
         self,
-        particle_id: int,
+        particle_ids: np.ndarray,
         base_hue: int,
-        amplitude: float,
+        amplitude,
         time: float,
-        gradient_style: str,
-        custom_colors: list,
-    ) -> tuple:
-        """Generate colors similar to the background gradient."""
-        # Get background gradient colors
-        gradient_colors = self._get_current_gradient_colors(
-            gradient_style, custom_colors
-        )
-
-        # Pick a base color from the gradient
-        color_index = particle_id % len(gradient_colors)
-        base_color = gradient_colors[color_index]
-
-        # Convert to HSV for easier manipulation
-        base_hue_bg = self._rgb_to_hsv(base_color[0], base_color[1], base_color[2])[0]
-
-        # Add slight variation while staying close to background
-        hue_variation = (particle_id * 5 + time * 10) % 60 - 30  # ±30 degrees
-        final_hue = (base_hue_bg + hue_variation) % 360
-
-        # Brightness varies with audio
-        brightness = int(100 + 100 * amplitude + (particle_id % 50))
-
-        # Saturation slightly higher than background for visibility
-        saturation = min(255, 150 + int(50 * amplitude))
-
-        return self._hsv_to_bgr(final_hue, saturation, min(255, brightness))
-
-    def _get_dissonant_color(
-        self, particle_id: int, base_hue: int, amplitude: float, time: float
-    ) -> tuple:
-        """Generate dissonant/contrasting colors that clash."""
-        # Use split-complementary + harsh transitions for discord
-        offset_options = [150, 180, 210, 270]  # Harsh angular separations
-        offset = offset_options[particle_id % len(offset_options)]
-
-        dissonant_hue = (base_hue + offset + particle_id * 7) % 360
-
-        # High saturation for maximum clash
-        saturation = 220 + int(35 * amplitude)
-
-        # Varied brightness with sharp contrasts
-        brightness_base = 180 if particle_id % 2 == 0 else 80
-        brightness = int(brightness_base + 75 * amplitude)
+        gradient_style: str = "default",
+        custom_colors: list = None,
+        color_scheme: str = "multicolor",
+        particle_gradient_style: str = None,
+        particle_custom_colors: list = None,
+    ) -> np.ndarray:
+        """Vectorized ``_get_particle_color`` for a whole batch of particles.
 
-        return self._hsv_to_bgr(
-            dissonant_hue, min(255, saturation), min(255, brightness)
+        ``amplitude`` may be a scalar or one value per particle. Returns an
+        ``(N, 3)`` uint8 array of BGR colours.
+        """
+        palette = self._get_palette(
+            color_scheme,
+            particle_gradient_style if particle_gradient_style else gradient_style,
+            particle_custom_colors if particle_custom_colors else custom_colors,
         )
-
-    def _get_triadic_color(
-        self, particle_id: int, base_hue: int, amplitude: float, time: float
-    ) -> tuple:
-        """Generate triadic complementary colors (three colors 120° apart)."""
-        # Three colors equally spaced on color wheel
-        triadic_offsets = [0, 120, 240]
-        color_index = particle_id % 3
-        triadic_hue = (base_hue + triadic_offsets[color_index] + time * 5) % 360
-
-        # Harmonious saturation and brightness
-        saturation = 160 + int(60 * amplitude)
-        brightness = int(140 + 80 * amplitude + (particle_id % 40))
-
-        return self._hsv_to_bgr(triadic_hue, min(255, saturation), min(255, brightness))
-
-    def _get_monochrome_color(
-        self,
-        particle_id: int,
-        base_hue: int,
-        amplitude: float,
-        time: float,
-        gradient_style: str,
-        custom_colors: list,
-    ) -> tuple:
-        """Generate monochrome colors using exact background gradient colors."""
-        # Get background gradient colors
-        gradient_colors = self._get_current_gradient_colors(
-            gradient_style, custom_colors
+        return palette.colors(particle_ids, base_hue, amplitude, time)
+
+    def _get_palette(
+        self, color_scheme: str, gradient_style: str, custom_colors: list = None
+    ) -> Palette:
+        """Palette for a colour scheme and gradient, built once per creator."""
+        key = (
+            color_scheme,
+            gradient_style,
+            tuple(map(tuple, custom_colors)) if custom_colors else None,
         )
-
-        # Use only colors from the gradient - cycle through them
-        color_index = particle_id % len(gradient_colors)
-        base_color = gradient_colors[color_index]
-
-        # Very minimal variation - just brightness changes with audio
-        brightness_factor = 0.7 + 0.3 * amplitude  # Range: 0.7 to 1.0
-
-        # Apply brightness variation to the exact gradient color
-        adjusted_r = int(base_color[0] * brightness_factor)
-        adjusted_g = int(base_color[1] * brightness_factor)
-        adjusted_b = int(base_color[2] * brightness_factor)
-
-        # Ensure values stay in valid range
-        adjusted_r = max(0, min(255, adjusted_r))
-        adjusted_g = max(0, min(255, adjusted_g))
-        adjusted_b = max(0, min(255, adjusted_b))
-
-        # Return in BGR format for OpenCV
-        return (adjusted_b, adjusted_g, adjusted_r)
-
-    def _rgb_to_hsv(self, r: int, g: int, b: int) -> tuple:
-        """Convert RGB to HSV values."""
-        r, g, b = r / 255.0, g / 255.0, b / 255.0
-
-        max_val = max(r, g, b)
-        min_val = min(r, g, b)
-        diff = max_val - min_val
-
-        # Hue calculation
-        if diff == 0:
-            h = 0
-        elif max_val == r:
-            h = (60 * ((g - b) / diff) + 360) % 360
-        elif max_val == g:
-            h = (60 * ((b - r) / diff) + 120) % 360
-        else:
-            h = (60 * ((r - g) / diff) + 240) % 360
-
-        # Saturation calculation
-        s = 0 if max_val == 0 else (diff / max_val) * 255
-
-        # Value calculation
-        v = max_val * 255
-
-        return (h, s, v)
+        with self._colors_lock:
+            palette = self._palettes.get(key)
+            if palette is None:
+                gradient_colors = None
+                if color_scheme in ("background", "monochrome"):
+                    gradient_colors = self._get_current_gradient_colors(
+                        gradient_style, custom_colors
+                    )
+                palette = Palette(color_scheme, gradient_colors)
+                self._palettes[key] = palette
+            return palette
 
     def _draw_julia_fractal(
         self,
@@ -2159,325 +1855,136 @@ class VerticalVideoCreator:
         total_frames: int,
         gradient_style: str = "default",
         custom_colors: list = None,
+        fractal_threads: int = None,
     ):
-        """Draw Julia set with infinite zoom that responds to audio."""
-
-        # Only recalculate Julia every few frames for better performance
-        if not hasattr(self, "_julia_cache") or frame_idx % 3 == 0:
-            # Visually interesting and colorful zoom locations (avoiding black areas)
-            zoom_points = [
-                (-0.7269, 0.1889),  # Classic spiral - very colorful
-                (-0.74529, 0.11307),  # Beautiful spirals - lots of detail
-                (-0.7463, 0.1102),  # Elephant valley - intricate patterns
-                (-0.16, 1.0407),  # Top area - colorful swirls
-                (-0.8, 0.156),  # Detailed fractal boundary
-                (-0.74343, 0.13182),  # Lightning pattern - high contrast
-            ]
+        """Draw Julia set with infinite zoom that responds to audio.
 
-            # Cycle through zoom points based on time (faster cycling)
-            cycle_time = 20.0  # 20 seconds per zoom point (faster)
-            point_index = int(current_time / cycle_time) % len(zoom_points)
-            local_time = (current_time % cycle_time) / cycle_time
-
-            # Current zoom point
-            center_x, center_y = zoom_points[point_index]
-
-            # Slower, more controlled zoom to stay in interesting areas
-            base_zoom = 2.0 ** (local_time * 8)  # Much slower zoom
-            audio_zoom_factor = 1 + amplitude * 0.15
-            zoom = base_zoom * audio_zoom_factor
-
-            # Limit zoom to avoid getting too deep into black areas
-            zoom = min(zoom, 1000)  # Max zoom cap
-
-            # Audio-reactive center perturbation
-            perturbation = amplitude * 0.0005  # Reduced perturbation
-            center_x += perturbation * math.sin(current_time * 3)
-            center_y += perturbation * math.cos(current_time * 4)
-
-            # Calculate Julia parameters
-            width_range = 3.0 / zoom
-            height_range = width_range * (self.height / self.width)
-
-            x_min = center_x - width_range / 2
-            x_max = center_x + width_range / 2
-            y_min = center_y - height_range / 2
-            y_max = center_y + height_range / 2
-
-            # Ultra-low iterations for maximum speed
-            max_iter = min(20 + int(amplitude * 15), 35)  # Máximo 35 iteraciones
-
-            # Extremely aggressive resolution scaling
-            if zoom > 500:  # High zoom
-                scale_factor = 0.15  # Very low resolution
-            elif zoom > 100:  # Medium zoom
-                scale_factor = 0.2
-            elif zoom > 50:  # Low zoom
-                scale_factor = 0.25
-            else:
-                scale_factor = 0.3  # Still very reduced
-
-            # Calculate actual dimensions
-            calc_width = int(self.width * scale_factor)
-            calc_height = int(self.height * scale_factor)
-
-            # Create coordinate arrays for vectorized computation
-            x = np.linspace(x_min, x_max, calc_width)
-            y = np.linspace(y_min, y_max, calc_height)
-            X, Y = np.meshgrid(x, y)
-            C = X + 1j * Y
-
-            # Calculate Julia set
-            julia_set = self._calculate_julia_vectorized(C, max_iter)
-
-            # Resize back to full resolution if needed (using faster interpolation)
-            if scale_factor < 1.0:
-                julia_set = cv2.resize(
-                    julia_set.astype(np.float32),
-                    (self.width, self.height),
-                    interpolation=cv2.INTER_NEAREST,  # Much faster than INTER_LINEAR
-                ).astype(np.int32)
-
-            # Get background gradient colors for the fractal
-            gradient_colors = self._get_current_gradient_colors(
-                gradient_style, custom_colors
-            )
+        ``fractal_threads`` overrides ``self.fractal_threads`` for one render.
+        """
+        # Visually interesting and colorful zoom locations (avoiding black areas)
+        zoom_points = [
+            (-0.7269, 0.1889),  # Classic spiral - very colorful
+            (-0.74529, 0.11307),  # Beautiful spirals - lots of detail
+            (-0.7463, 0.1102),  # Elephant valley - intricate patterns
+            (-0.16, 1.0407),  # Top area - colorful swirls
+            (-0.8, 0.156),  # Detailed fractal boundary
+            (-0.74343, 0.13182),  # Lightning pattern - high contrast
+        ]
 
-            # Color the fractal using the background gradient
-            colored_fractal = self._color_julia(
-                julia_set, max_iter, gradient_colors, amplitude, current_time
-            )
+        # Cycle through zoom points based on time (faster cycling)
+        cycle_time = 20.0  # 20 seconds per zoom point (faster)
+        point_index = int(current_time / cycle_time) % len(zoom_points)
+        local_time = (current_time % cycle_time) / cycle_time
 
-            # Check if the area is too dark/black and adjust alpha accordingly
-            # Calculate average brightness to avoid showing boring black areas
-            gray_fractal = cv2.cvtColor(colored_fractal, cv2.COLOR_BGR2GRAY)
-            avg_brightness = np.mean(gray_fractal)
+        # Current zoom point
+        center_x, center_y = zoom_points[point_index]
 
-            # If area is too dark, reduce visibility to let background show more
-            if avg_brightness < 30:  # Very dark area
-                alpha = 0.3 + amplitude * 0.1  # Show more background
-            elif avg_brightness < 60:  # Somewhat dark
-                alpha = 0.5 + amplitude * 0.1
-            else:  # Good colorful area
-                alpha = 0.8 + amplitude * 0.1
+        # Slower, more controlled zoom to stay in interesting areas
+        base_zoom = 2.0 ** (local_time * 8)  # Much slower zoom
+        audio_zoom_factor = 1 + amplitude * 0.15
+        zoom = base_zoom * audio_zoom_factor
 
-            # Cache the result
-            self._julia_cache = (colored_fractal, alpha)
+        # Limit zoom to avoid getting too deep into black areas
+        zoom = min(zoom, 1000)  # Max zoom cap
 
-        # Use cached Julia calculation
-        colored_fractal, alpha = self._julia_cache
-        frame[:] = cv2.addWeighted(frame, 1 - alpha, colored_fractal, alpha, 0)
+        # Audio-reactive center perturbation
+        perturbation = amplitude * 0.0005  # Reduced perturbation
+        center_x += perturbation * math.sin(current_time * 3)
+        center_y += perturbation * math.cos(current_time * 4)
 
-        # Add pulsing center point
-        center_screen_x = self.width // 2
-        center_screen_y = self.height // 2
-        pulse_radius = int(3 + amplitude * 8)
-        pulse_color = (255, 255, 255)
-        cv2.circle(
-            frame, (center_screen_x, center_screen_y), pulse_radius, pulse_color, 1
-        )
+        # Calculate Julia parameters
+        width_range = 3.0 / zoom
+        height_range = width_range * (self.height / self.width)
+
+        x_min = center_x - width_range / 2
+        x_max = center_x + width_range / 2
+        y_min = center_y - height_range / 2
+        y_max = center_y + height_range / 2
+
+        # Iteration budget grows with the audio
+        max_iter = min(20 + int(amplitude * 15), 35)
+
+        # Iterate every output pixel
+        x = np.linspace(x_min, x_max, self.width)
+        y = np.linspace(y_min, y_max, self.height)
 
-    def _calculate_julia_vectorized(self, C: np.ndarray, max_iter: int) -> np.ndarray:
-        """Calculate Julia set using optimized vectorized operations."""
         # Julia set uses a fixed constant c and starts with Z = pixel coordinates
         # Using c = -0.7 + 0.27015i for a nice looking Julia set
-        julia_c = -0.7 + 0.27015j
+        julia_set = julia_escape_counts(
+            x,
+            y,
+            -0.7 + 0.27015j,
+            max_iter,
+            pool=self._fractal_executor(fractal_threads or self.fractal_threads),
+        )
+
+        # Get background gradient colors for the fractal
+        gradient_colors = self._get_current_gradient_colors(
+            gradient_style, custom_colors
+        )
 
-        Z = C.copy()  # Start with pixel coordinates
-        iterations = np.zeros(C.shape, dtype=np.int32)
+        # Color the fractal using the background gradient
+        colored_fractal = self._color_julia(
+            julia_set, max_iter, gradient_colors, amplitude, current_time
+        )
 
-        # Very simplified Julia calculation for speed
-        for i in range(max_iter):
-            # Find points that haven't diverged yet
-            mask = np.abs(Z) <= 2
+        # Check if the area is too dark/black and adjust alpha accordingly
+        # Calculate average brightness to avoid showing boring black areas
+        gray_fractal = cv2.cvtColor(colored_fractal, cv2.COLOR_BGR2GRAY)
+        avg_brightness = np.mean(gray_fractal)
 
-            if not np.any(mask):
-                break
+        # If area is too dark, reduce visibility to let background show more
+        if avg_brightness < 30:  # Very dark area
+            alpha = 0.3 + amplitude * 0.1  # Show more background
+        elif avg_brightness < 60:  # Somewhat dark
+            alpha = 0.5 + amplitude * 0.1
+        else:  # Good colorful area
+            alpha = 0.8 + amplitude * 0.1
 
-            # Julia set iteration: Z = Z^2 + c
-            Z[mask] = Z[mask] ** 2 + julia_c
+        cv2.addWeighted(frame, 1 - alpha, colored_fractal, alpha, 0, dst=frame)
 
-            # Mark newly diverged points
-            newly_diverged = (np.abs(Z) > 2) & (iterations == 0)
-            iterations[newly_diverged] = i
+        # Add pulsing center point
+        center_screen_x = self.width // 2
+        center_screen_y = self.height // 2
+        pulse_radius = int(3 + amplitude * 8)
+        pulse_color = (255, 255, 255)
+        cv2.circle(
+            frame, (center_screen_x, center_screen_y), pulse_radius, pulse_color, 1
+        )
 
-        # Points that never diverged get max_iter
-        iterations[iterations == 0] = max_iter
+    def _fractal_executor(self, threads: int) -> Optional[ThreadPoolExecutor]:
+        """Thread pool for ``threads`` fractal workers, kept for the render."""
+        if threads <= 1:
+            return None
+        if self._fractal_pool is None or self._fractal_pool[0] != threads:
+            self._close_fractal_pool()
+            self._fractal_pool = (threads, ThreadPoolExecutor(max_workers=threads))
+        return self._fractal_pool[1]
 
-        return iterations
+    def _close_fractal_pool(self):
+        """Shut down the fractal thread pool, if a render started one."""
+        if self._fractal_pool is not None:
+            self._fractal_pool[1].shutdown()
+            self._fractal_pool = None
 
     def _get_current_gradient_colors(
         self, gradient_style: str = "default", custom_colors: list = None
     ) -> list:
         """Get the current gradient colors to use for Julia coloring."""
-        # Define the same gradient presets as in create_fallback_background
-        gradient_presets = {
-            "default": [
-                (30, 50, 120),
-                (130, 130, 255),
-            ],  # Deep blue to purple (original)
-            "dark_teal_orange": [
-                (0, 40, 40),
-                (255, 140, 60),
-            ],  # Dark teal to vibrant orange
-            "sunset": [(255, 94, 77), (255, 154, 0), (255, 206, 84)],  # Sunset colors
-            "ocean": [(0, 119, 190), (0, 180, 216), (144, 224, 239)],  # Ocean blues
-            "purple_pink": [(106, 17, 203), (255, 61, 127)],  # Deep purple to pink
-            "forest": [
-                (34, 139, 34),
-                (107, 142, 35),
-                (255, 215, 0),
-            ],  # Forest green to gold
-            "midnight": [
-                (25, 25, 112),
-                (138, 43, 226),
-                (75, 0, 130),
-            ],  # Midnight blues and purples
-            "fire": [
-                (139, 0, 0),
-                (255, 69, 0),
-                (255, 215, 0),
-            ],  # Dark red to orange to gold
-            "arctic": [
-                (176, 224, 230),
-                (135, 206, 235),
-                (70, 130, 180),
-            ],  # Arctic blues
-            "cosmic": [
-                (75, 0, 130),
-                (138, 43, 226),
-                (255, 20, 147),
-                (255, 215, 0),
-            ],  # Deep space colors
-            # 20 NUEVOS GRADIENTES HERMOSOS
-            "cherry_blossom": [
-                (255, 183, 197),
-                (255, 105, 180),
-                (255, 20, 147),
-            ],  # Flor de cerezo
-            "tropical": [
-                (0, 255, 127),
-                (255, 215, 0),
-                (255, 69, 0),
-            ],  # Tropical verde-dorado-naranja
-            "lavender_mist": [
-                (230, 230, 250),
-                (147, 112, 219),
-                (138, 43, 226),
-            ],  # Niebla de lavanda
-            "golden_hour": [
-                (255, 223, 0),
-                (255, 140, 0),
-                (255, 69, 0),
-                (139, 0, 0),
-            ],  # Hora dorada
-            "emerald_sea": [
-                (0, 128, 128),
-                (32, 178, 170),
-                (72, 209, 204),
-                (175, 238, 238),
-            ],  # Mar esmeralda
-            "rose_gold": [
-                (183, 110, 121),
-                (255, 192, 203),
-                (255, 215, 0),
-            ],  # Oro rosa
-            "northern_lights": [
-                (0, 255, 127),
-                (0, 191, 255),
-                (138, 43, 226),
-                (255, 20, 147),
-            ],  # Aurora boreal
-            "desert_sand": [
-                (218, 165, 32),
-                (255, 215, 0),
-                (255, 160, 122),
-                (250, 128, 114),
-            ],  # Arena del desierto
-            "deep_ocean": [
-                (0, 0, 139),
-                (0, 100, 148),
-                (0, 191, 255),
-                (135, 206, 235),
-            ],  # Océano profundo
-            "neon_cyber": [
-                (255, 0, 255),
-                (0, 255, 255),
-                (57, 255, 20),
-                (255, 255, 0),
-            ],  # Neón cyberpunk
-            "autumn_leaves": [
-                (255, 69, 0),
-                (255, 140, 0),
-                (255, 215, 0),
-                (139, 69, 19),
-            ],  # Hojas de otoño
-            "moonlight": [
-                (25, 25, 112),
-                (72, 61, 139),
-                (176, 196, 222),
-                (245, 245, 245),
-            ],  # Luz de luna
-            "tropical_sunset": [
-                (255, 94, 77),
-                (255, 154, 0),
-                (255, 215, 0),
-                (255, 20, 147),
-                (138, 43, 226),
-            ],  # Atardecer tropical
-            "winter_frost": [
-                (176, 224, 230),
-                (173, 216, 230),
-                (135, 206, 235),
-                (70, 130, 180),
-                (25, 25, 112),
-            ],  # Escarcha invernal
-            "sakura_dream": [
-                (255, 228, 225),
-                (255, 182, 193),
-                (255, 105, 180),
-                (219, 112, 147),
-            ],  # Sueño de sakura
-            "volcanic": [
-                (139, 0, 0),
-                (178, 34, 34),
-                (255, 69, 0),
-                (255, 215, 0),
-                (255, 255, 255),
-            ],  # Volcánico
-            "electric_blue": [
-                (0, 0, 139),
-                (0, 191, 255),
-                (0, 255, 255),
-                (255, 255, 255),
-            ],  # Azul eléctrico
-            "jungle_green": [
-                (0, 100, 0),
-                (34, 139, 34),
-                (50, 205, 50),
-                (144, 238, 144),
-            ],  # Verde selva
-            "royal_purple": [
-                (75, 0, 130),
-                (106, 17, 203),
-                (138, 43, 226),
-                (218, 112, 214),
-            ],  # Púrpura real
-            "cotton_candy": [
-                (255, 192, 203),
-                (255, 182, 193),
-                (221, 160, 221),
-                (238, 130, 238),
-                (255, 20, 147),
-            ],  # Algodón de azúcar
-        }
+        cache_key = (
+            gradient_style,
+            tuple(map(tuple, custom_colors)) if custom_colors else None,
+        )
+        with self._colors_lock:
+            if cache_key in self._gradient_colors:
+                return list(self._gradient_colors[cache_key])
 
         # Use custom colors if provided, otherwise use preset
         if custom_colors and len(custom_colors) >= 2:
             base_colors = custom_colors
         else:
-            base_colors = gradient_presets.get(
-                gradient_style, gradient_presets["default"]
+            base_colors = GRADIENT_PRESETS.get(
+                gradient_style, GRADIENT_PRESETS["default"]
             )
 
         # Extend the colors for more variety in the fractal
@@ -2497,7 +2004,11 @@ class VerticalVideoCreator:
         # Add black for the set interior
         extended_colors.append((0, 0, 0))
 
-        return extended_colors
+        with self._colors_lock:
+            extended_colors = self._gradient_colors.setdefault(
+                cache_key, extended_colors
+            )
+        return list(extended_colors)
 
     def _color_julia(
         self,
@@ -2507,56 +2018,46 @@ class VerticalVideoCreator:
         amplitude: float,
         current_time: float,
     ) -> np.ndarray:
-        """Color the Julia set using gradient colors with audio responsiveness - VECTORIZED."""
-        height, width = iterations.shape
-        colored = np.zeros((height, width, 3), dtype=np.uint8)
+        """Color the Julia set using gradient colors with audio responsiveness - VECTORIZED.
 
+        ``iterations`` may hold smooth (fractional) escape counts, in which
+        case neighbouring gradient colors are blended instead of banded.
+        """
         # Normalize iterations
         normalized_iter = iterations.astype(np.float32) / max_iter
 
         # Audio-reactive color cycling (reduced range)
         color_shift = (current_time * 30 + amplitude * 50) % 180  # Reduced to HSV range
 
-        # Create masks for points in and out of the set
-        in_set_mask = iterations >= max_iter
-        out_set_mask = ~in_set_mask
+        # Small audio-reactive wobble of the color position
+        adjusted_ratios = np.sin(normalized_iter * 4 + current_time)
+        adjusted_ratios *= amplitude * 0.1
+        adjusted_ratios += normalized_iter
+        np.clip(adjusted_ratios, 0, 1, out=adjusted_ratios)
+
+        # Gradient position -> BGR lookup table, blending neighbouring colors
+        palette = np.asarray(gradient_colors, dtype=np.float32)
+        num_colors = max(len(gradient_colors) - 1, 1)
+        position = np.linspace(0, 1, JULIA_LUT_SIZE) * (num_colors - 1)
+        lower = np.clip(position.astype(np.int32), 0, num_colors - 1)
+        upper = np.minimum(lower + 1, num_colors - 1)
+        blend = (position - lower)[:, None]
+        lut = palette[lower] * (1 - blend) + palette[upper] * blend
+
+        # Minimal color shift (only when significant audio)
+        if color_shift != 0 and amplitude > 0.3:
+            shift_amount = int(color_shift / 60) % 3  # Simple RGB channel rotation
+            if shift_amount == 1:
+                lut = lut[:, [1, 2, 0]]  # R->G, G->B, B->R
+            elif shift_amount == 2:
+                lut = lut[:, [2, 0, 1]]  # R->B, G->R, B->G
+
+        lut = lut[:, [2, 1, 0]].astype(np.uint8)  # RGB to BGR for OpenCV
+        indices = (adjusted_ratios * (JULIA_LUT_SIZE - 1)).astype(np.uint8)
+        colored = cv2.LUT(cv2.cvtColor(indices, cv2.COLOR_GRAY2BGR), lut[:, None, :])
 
         # Points in the set are black
-        colored[in_set_mask] = [0, 0, 0]
-
-        if np.any(out_set_mask):
-            # Vectorized processing for points outside the set
-            iter_ratios = normalized_iter[out_set_mask]
-
-            # Simplified coloring for maximum speed - minimal processing
-            audio_variations = amplitude * 0.1 * np.sin(iter_ratios * 4 + current_time)
-            adjusted_ratios = np.clip(iter_ratios + audio_variations, 0, 1)
-
-            # Direct color mapping without interpolation (much faster)
-            num_colors = len(gradient_colors) - 1
-            color_indices = (adjusted_ratios * (num_colors - 1)).astype(np.int32)
-            color_indices = np.clip(color_indices, 0, num_colors - 1)
-
-            # Direct color assignment (no interpolation for speed)
-            interpolated_colors = np.array(
-                [gradient_colors[i] for i in color_indices], dtype=np.uint8
-            )
-
-            # Minimal color shift (only when significant audio)
-            if color_shift != 0 and amplitude > 0.3:
-                shift_amount = int(color_shift / 60) % 3  # Simple RGB channel rotation
-                if shift_amount == 1:
-                    interpolated_colors = interpolated_colors[
-                        :, [1, 2, 0]
-                    ]  # R->G, G->B, B->R
-                elif shift_amount == 2:
-                    interpolated_colors = interpolated_colors[
-                        :, [2, 0, 1]
-                    ]  # R->B, G->R, B->G
-
-            # Assign colors to output array (BGR format for OpenCV)
-            colored[out_set_mask] = interpolated_colors[:, [2, 1, 0]]  # RGB to BGR
-
+        np.copyto(colored, 0, where=(iterations >= max_iter)[:, :, None])
         return colored
 
     def _draw_psychedelic_circles(
@@ -2578,15 +2079,9 @@ class VerticalVideoCreator:
         enhanced_amplitude = amplitude * (1 + 0.7 * np.sin(current_time * 6))
 
         # Color palette based on audio frequency content
-        spectral_idx = min(
-            int(
-                current_time
-                * len(audio_features["spectral_centroids"])
-                / audio_features["duration"]
-            ),
-            len(audio_features["spectral_centroids"]) - 1,
-        )
-        spectral_value = audio_features["spectral_centroids"][spectral_idx]
+        spectral_value = audio_features["timeline"]["spectral"][
+            self._timeline_index(audio_features, current_time)
+        ]
 
         # Create dynamic color scheme
         hue_shift = (spectral_value / 4000) * 360 + current_time * 50
@@ -2749,15 +2244,9 @@ class VerticalVideoCreator:
         enhanced_amplitude = amplitude * (1 + 0.8 * np.sin(current_time * 3))
 
         # Color palette
-        spectral_idx = min(
-            int(
-                current_time
-                * len(audio_features["spectral_centroids"])
-                / audio_features["duration"]
-            ),
-            len(audio_features["spectral_centroids"]) - 1,
-        )
-        spectral_value = audio_features["spectral_centroids"][spectral_idx]
+        spectral_value = audio_features["timeline"]["spectral"][
+            self._timeline_index(audio_features, current_time)
+        ]
         hue_shift = (spectral_value / 4000) * 360 + current_time * 20
         base_hue = int(hue_shift) % 360
 
@@ -2906,81 +2395,73 @@ class VerticalVideoCreator:
         enhanced_amplitude = amplitude * (1 + 0.6 * np.sin(current_time * 4))
 
         # Color palette
-        spectral_idx = min(
-            int(
-                current_time
-                * len(audio_features["spectral_centroids"])
-                / audio_features["duration"]
-            ),
-            len(audio_features["spectral_centroids"]) - 1,
-        )
-        spectral_value = audio_features["spectral_centroids"][spectral_idx]
+        spectral_value = audio_features["timeline"]["spectral"][
+            self._timeline_index(audio_features, current_time)
+        ]
         base_hue = int((spectral_value / 4000) * 360 + current_time * 15) % 360
 
         # Number of particles based on audio
         particle_count = int(150 + enhanced_amplitude * 200)
+        particles = new_particles(np.arange(particle_count))
+        i = particles["id"]
 
-        for i in range(particle_count):
-            # Each particle has its own lifecycle
-            particle_phase = (
-                current_time * (0.8 + i * 0.002) + i * 2.1
-            ) % 8  # 8 second cycle
+        # Each particle has its own lifecycle (8 second cycle)
+        particle_phase = (current_time * (0.8 + i * 0.002) + i * 2.1) % 8
 
-            # Particle start position (top of screen)
-            start_x = int(i * 7.3) % self.width  # Pseudo-random but consistent
+        # Particle start position (top of screen), pseudo-random but consistent
+        start_x = (i * 7.3).astype(np.int64) % self.width
 
-            # Particle falls with slight horizontal drift
-            drift = 30 * math.sin(i * 0.1 + current_time * 0.5)
-            particle_x = int(start_x + drift)
+        # Particle falls with slight horizontal drift
+        drift = 30 * np.sin(i * 0.1 + current_time * 0.5)
+        particles["x"] = np.trunc(start_x + drift)
 
-            # Particle y position based on fall time
-            fall_speed = 50 + enhanced_amplitude * 100 + (i % 5) * 10
-            particle_y = int(-20 + particle_phase * fall_speed)
+        # Particle y position based on fall time
+        fall_speed = 50 + enhanced_amplitude * 100 + (i % 5) * 10
+        particles["y"] = np.trunc(-20 + particle_phase * fall_speed)
 
-            # Only draw if particle is on screen
-            if 0 <= particle_x < self.width and 0 <= particle_y < self.height:
-                # Particle size varies
-                particle_size = max(
-                    1, int(2 + enhanced_amplitude * 4 + 2 * math.sin(i * 0.3))
-                )
+        # Particle size varies
+        particles["size"] = np.maximum(
+            1, np.trunc(2 + enhanced_amplitude * 4 + 2 * np.sin(i * 0.3))
+        )
 
-                # Particle color varies with position and audio
-                particle_color = self._get_particle_color(
-                    i,
-                    base_hue,
-                    enhanced_amplitude,
-                    current_time,
-                    gradient_style,
-                    custom_colors,
-                    particle_color_scheme,
-                    particle_gradient_style,
-                    particle_custom_colors,
-                )
+        # Only draw particles that are on screen
+        particles = on_screen(particles, self.width, self.height)
 
-                cv2.circle(
-                    frame, (particle_x, particle_y), particle_size, particle_color, -1
-                )
+        # Particle color varies with position and audio
+        colors = self._get_particle_colors(
+            particles["id"],
+            base_hue,
+            enhanced_amplitude,
+            current_time,
+            gradient_style,
+            custom_colors,
+            particle_color_scheme,
+            particle_gradient_style,
+            particle_custom_colors,
+        )
+        splat_circles(frame, particles["x"], particles["y"], particles["size"], colors)
 
-                # Add glow effect for some particles
-                if i % 5 == 0:  # Every 5th particle gets glow
-                    glow_color = self._get_particle_color(
-                        i + 1000,
-                        base_hue,
-                        enhanced_amplitude * 0.5,
-                        current_time,
-                        gradient_style,
-                        custom_colors,
-                        particle_color_scheme,
-                        particle_gradient_style,
-                        particle_custom_colors,
-                    )
-                    cv2.circle(
-                        frame,
-                        (particle_x, particle_y),
-                        particle_size + 2,
-                        glow_color,
-                        1,
-                    )
+        # Add glow effect for some particles (every 5th particle gets glow)
+        glowing = particles[particles["id"] % 5 == 0]
+        glow_colors = self._get_particle_colors(
+            glowing["id"] + 1000,
+            base_hue,
+            enhanced_amplitude * 0.5,
+            current_time,
+            gradient_style,
+            custom_colors,
+            particle_color_scheme,
+            particle_gradient_style,
+            particle_custom_colors,
+        )
+        splat_circles(
+            frame,
+            glowing["x"],
+            glowing["y"],
+            glowing["size"] + 2,
+            glow_colors,
+            thickness=1,
+        )
 
         # Add particle accumulation at bottom
         self._draw_particle_accumulation(
@@ -2992,17 +2473,17 @@ class VerticalVideoCreator:
         accumulation_height = int(20 + amplitude * 40)
 
         # Create wavy accumulation line
-        points = []
-        for x in range(0, self.width, 4):
-            wave_offset = 10 * amplitude * math.sin(x * 0.02 + time * 2)
-            y = self.height - accumulation_height + int(wave_offset)
-            points.append((x, y))
+        xs = np.arange(0, self.width, 4)
+        wave_offset = np.trunc(10 * amplitude * np.sin(xs * 0.02 + time * 2))
+        ys = (self.height - accumulation_height + wave_offset).astype(np.int32)
+        points = np.stack([xs, ys], axis=1).astype(np.int32)
 
         # Fill the accumulation area
         if len(points) > 2:
             # Create polygon points for filled area
-            polygon_points = points + [(self.width, self.height), (0, self.height)]
-            polygon_points = np.array(polygon_points, np.int32)
+            polygon_points = np.vstack(
+                [points, [(self.width, self.height), (0, self.height)]]
+            ).astype(np.int32)
 
             # Gradient fill
             accumulation_color = self._hsv_to_bgr(
@@ -3011,11 +2492,13 @@ class VerticalVideoCreator:
             cv2.fillPoly(frame, [polygon_points], accumulation_color)
 
             # Add texture to accumulation
-            for i in range(0, len(points) - 1, 2):
-                texture_color = self._hsv_to_bgr(
-                    (base_hue + i * 2) % 360, 100, int(150 + 50 * amplitude)
-                )
-                cv2.line(frame, points[i], points[i + 1], texture_color, 2)
+            starts = np.arange(0, len(points) - 1, 2)
+            texture_colors = hsv_to_bgr(
+                (base_hue + starts * 2) % 360, 100, int(150 + 50 * amplitude)
+            ).tolist()
+            segments = points.tolist()
+            for i, color in zip(starts.tolist(), texture_colors):
+                cv2.line(frame, segments[i], segments[i + 1], color, 2)
 
     def _draw_morphing_shapes(
         self,
@@ -3036,15 +2519,9 @@ class VerticalVideoCreator:
         enhanced_amplitude = amplitude * (1 + 0.7 * np.sin(current_time * 5))
 
         # Color system
-        spectral_idx = min(
-            int(
-                current_time
-                * len(audio_features["spectral_centroids"])
-                / audio_features["duration"]
-            ),
-            len(audio_features["spectral_centroids"]) - 1,
-        )
-        spectral_value = audio_features["spectral_centroids"][spectral_idx]
+        spectral_value = audio_features["timeline"]["spectral"][
+            self._timeline_index(audio_features, current_time)
+        ]
         base_hue = int((spectral_value / 4000) * 360 + current_time * 25) % 360
 
         # Shape morphing cycle (triangle -> square -> pentagon -> hexagon -> circle)
@@ -3184,15 +2661,9 @@ class VerticalVideoCreator:
         enhanced_amplitude = amplitude * (1 + 0.9 * np.sin(current_time * 6))
 
         # Color system
-        spectral_idx = min(
-            int(
-                current_time
-                * len(audio_features["spectral_centroids"])
-                / audio_features["duration"]
-            ),
-            len(audio_features["spectral_centroids"]) - 1,
-        )
-        spectral_value = audio_features["spectral_centroids"][spectral_idx]
+        spectral_value = audio_features["timeline"]["spectral"][
+            self._timeline_index(audio_features, current_time)
+        ]
         base_hue = int((spectral_value / 4000) * 360 + current_time * 35) % 360
 
         # Kaleidoscope has multiple symmetrical segments
@@ -3234,95 +2705,43 @@ class VerticalVideoCreator:
 
             pattern_elements.append(line_points)
 
-        # Draw the pattern in all segments with symmetry
-        for segment in range(num_segments):
-            segment_rotation = segment * segment_angle
-
-            for line_points in pattern_elements:
-                if len(line_points) > 1:
-                    # Color for this segment and line using particle color scheme
-                    line_color = self._get_particle_color(
-                        segment * 1000 + len(line_points),
-                        base_hue,
-                        enhanced_amplitude,
-                        current_time,
-                        gradient_style,
-                        custom_colors,
-                        particle_color_scheme,
-                        particle_gradient_style,
-                        particle_custom_colors,
-                    )
-
-                    # Draw the line in this segment
-                    rotated_points = []
-                    for px, py in line_points:
-                        # Rotate point around center
-                        rel_x = px - center_x
-                        rel_y = py - center_y
-
-                        rot_x = rel_x * math.cos(segment_rotation) - rel_y * math.sin(
-                            segment_rotation
-                        )
-                        rot_y = rel_x * math.sin(segment_rotation) + rel_y * math.cos(
-                            segment_rotation
-                        )
-
-                        final_x = int(center_x + rot_x)
-                        final_y = int(center_y + rot_y)
-
-                        if 0 <= final_x < self.width and 0 <= final_y < self.height:
-                            rotated_points.append((final_x, final_y))
-
-                    # Draw the rotated line
-                    for i in range(len(rotated_points) - 1):
-                        cv2.line(
-                            frame,
-                            rotated_points[i],
-                            rotated_points[i + 1],
-                            line_color,
-                            3,
-                        )
-
-                    # Also draw mirrored version for extra symmetry
-                    mirrored_points = []
-                    for px, py in line_points:
-                        # Mirror across the segment line and then rotate
-                        rel_x = px - center_x
-                        rel_y = -(py - center_y)  # Mirror across horizontal
-
-                        rot_x = rel_x * math.cos(segment_rotation) - rel_y * math.sin(
-                            segment_rotation
-                        )
-                        rot_y = rel_x * math.sin(segment_rotation) + rel_y * math.cos(
-                            segment_rotation
-                        )
-
-                        final_x = int(center_x + rot_x)
-                        final_y = int(center_y + rot_y)
+        # Every segment draws the same lines rotated: collect the first segment
+        segment_ids = np.arange(num_segments) * 1000
+        canvas = SymmetryCanvas(
+            self.width, self.height, (center_x, center_y), num_segments
+        )
+        for line_points in pattern_elements:
+            # Color for each segment's copy of the line using particle color scheme
+            line_colors = self._get_particle_colors(
+                segment_ids + len(line_points),
+                base_hue,
+                enhanced_amplitude,
+                current_time,
+                gradient_style,
+                custom_colors,
+                particle_color_scheme,
+                particle_gradient_style,
+                particle_custom_colors,
+            )
+            canvas.polyline(line_points, line_colors, 3)
 
-                        if 0 <= final_x < self.width and 0 <= final_y < self.height:
-                            mirrored_points.append((final_x, final_y))
+            # Also draw mirrored version (across horizontal) for extra symmetry,
+            # with slightly different color
+            mirror_colors = self._get_particle_colors(
+                segment_ids + len(line_points) + 500,
+                base_hue,
+                enhanced_amplitude * 0.7,
+                current_time,
+                gradient_style,
+                custom_colors,
+                particle_color_scheme,
+                particle_gradient_style,
+                particle_custom_colors,
+            )
+            mirrored_points = [(px, 2 * center_y - py) for px, py in line_points]
+            canvas.polyline(mirrored_points, mirror_colors, 2)
 
-                    # Draw mirrored line with slightly different color
-                    mirror_color = self._get_particle_color(
-                        segment * 1000 + len(line_points) + 500,
-                        base_hue,
-                        enhanced_amplitude * 0.7,
-                        current_time,
-                        gradient_style,
-                        custom_colors,
-                        particle_color_scheme,
-                        particle_gradient_style,
-                        particle_custom_colors,
-                    )
-                    for i in range(len(mirrored_points) - 1):
-                        cv2.line(
-                            frame,
-                            mirrored_points[i],
-                            mirrored_points[i + 1],
-                            mirror_color,
-                            2,
-                        )
+        canvas.render(frame)
 
         # Add central mandala-like pattern
         self._draw_kaleidoscope_center(
@@ -3354,42 +2773,37 @@ class VerticalVideoCreator:
         particle_custom_colors=None,
     ):
         """Draw the central mandala pattern for the kaleidoscope."""
-        # Central rotating elements
+        # Central rotating elements: every element is the first one rotated
         num_elements = 12
-        for i in range(num_elements):
-            angle = (i * 2 * math.pi / num_elements) + time * 2
-
-            # Multiple concentric elements
-            for radius_mult in [0.3, 0.5, 0.7]:
-                element_radius = int(30 + amplitude * 60) * radius_mult
-
-                element_x = int(center_x + element_radius * math.cos(angle))
-                element_y = int(center_y + element_radius * math.sin(angle))
+        element_ids = np.arange(num_elements)
+        angle = time * 2
+        canvas = SymmetryCanvas(
+            self.width, self.height, (center_x, center_y), num_elements
+        )
 
-                if 0 <= element_x < self.width and 0 <= element_y < self.height:
-                    element_size = max(2, int(4 + amplitude * 8 * radius_mult))
-                    element_color = self._get_particle_color(
-                        i + int(radius_mult * 1000),
-                        base_hue,
-                        amplitude,
-                        time,
-                        gradient_style,
-                        custom_colors,
-                        particle_color_scheme,
-                        particle_gradient_style,
-                        particle_custom_colors,
-                    )
+        # Multiple concentric elements
+        for radius_mult in [0.3, 0.5, 0.7]:
+            element_radius = int(30 + amplitude * 60) * radius_mult
+            element_position = (
+                center_x + element_radius * math.cos(angle),
+                center_y + element_radius * math.sin(angle),
+            )
+            element_size = max(2, int(4 + amplitude * 8 * radius_mult))
+            element_colors = self._get_particle_colors(
+                element_ids + int(radius_mult * 1000),
+                base_hue,
+                amplitude,
+                time,
+                gradient_style,
+                custom_colors,
+                particle_color_scheme,
+                particle_gradient_style,
+                particle_custom_colors,
+            )
+            canvas.circle(element_position, element_size, element_colors)
+            canvas.circle(element_position, element_size + 1, (255, 255, 255), 1)
 
-                    cv2.circle(
-                        frame, (element_x, element_y), element_size, element_color, -1
-                    )
-                    cv2.circle(
-                        frame,
-                        (element_x, element_y),
-                        element_size + 1,
-                        (255, 255, 255),
-                        1,
-                    )
+        canvas.render(frame)
 
     def _draw_breathing_patterns(
         self,
@@ -3417,15 +2831,9 @@ class VerticalVideoCreator:
         enhanced_amplitude = amplitude * (0.5 + 0.5 * breathing_amplitude)
 
         # Color system
-        spectral_idx = min(
-            int(
-                current_time
-                * len(audio_features["spectral_centroids"])
-                / audio_features["duration"]
-            ),
-            len(audio_features["spectral_centroids"]) - 1,
-        )
-        spectral_value = audio_features["spectral_centroids"][spectral_idx]
+        spectral_value = audio_features["timeline"]["spectral"][
+            self._timeline_index(audio_features, current_time)
+        ]
         base_hue = int((spectral_value / 4000) * 360 + current_time * 10) % 360
 
         # Multiple concentric breathing rings
@@ -3643,78 +3051,65 @@ class VerticalVideoCreator:
         enhanced_amplitude = amplitude * (1 + 0.8 * np.sin(current_time * 4))
 
         # Color system
-        spectral_idx = min(
-            int(
-                current_time
-                * len(audio_features["spectral_centroids"])
-                / audio_features["duration"]
-            ),
-            len(audio_features["spectral_centroids"]) - 1,
-        )
-        spectral_value = audio_features["spectral_centroids"][spectral_idx]
+        spectral_value = audio_features["timeline"]["spectral"][
+            self._timeline_index(audio_features, current_time)
+        ]
         base_hue = int((spectral_value / 4000) * 360 + current_time * 25) % 360
 
         # 12-fold symmetry for traditional mandala
         num_segments = 12
-        segment_angle = 2 * math.pi / num_segments
+        rotation = current_time * 0.5
+
+        # Element colors for every ring, element and segment
+        element_ids = (
+            np.arange(5)[:, None, None] * 100
+            + np.arange(8)[None, :, None]
+            + np.arange(num_segments) * 1000
+        )
+        element_colors = self._get_particle_colors(
+            element_ids.ravel(),
+            base_hue,
+            enhanced_amplitude,
+            current_time,
+            gradient_style,
+            custom_colors,
+            particle_color_scheme,
+            particle_gradient_style,
+            particle_custom_colors,
+        ).reshape(5, 8, num_segments, 3)
+        element_size = max(2, int(3 + enhanced_amplitude * 6))
 
-        # Multiple concentric rings
+        # Multiple concentric rings, each one the first segment's elements
+        # repeated around the centre
+        canvas = SymmetryCanvas(
+            self.width, self.height, (center_x, center_y), num_segments
+        )
         for ring in range(5):
             ring_radius = 50 + ring * (40 + enhanced_amplitude * 20)
 
-            # Create geometric patterns in each ring
-            for segment in range(num_segments):
-                segment_rotation = segment * segment_angle + current_time * 0.5
-
-                # Create intricate geometric elements
-                for element in range(8):
-                    element_angle = element * math.pi / 4
-                    element_distance = ring_radius + element * 8
-
-                    # Calculate positions with rotation
-                    rel_x = element_distance * math.cos(element_angle)
-                    rel_y = element_distance * math.sin(element_angle)
-
-                    # Rotate around segment
-                    rot_x = rel_x * math.cos(segment_rotation) - rel_y * math.sin(
-                        segment_rotation
-                    )
-                    rot_y = rel_x * math.sin(segment_rotation) + rel_y * math.cos(
-                        segment_rotation
-                    )
-
-                    final_x = int(center_x + rot_x)
-                    final_y = int(center_y + rot_y)
-
-                    if 0 <= final_x < self.width and 0 <= final_y < self.height:
-                        # Element color using particle scheme
-                        element_color = self._get_particle_color(
-                            segment * 1000 + ring * 100 + element,
-                            base_hue,
-                            enhanced_amplitude,
-                            current_time,
-                            gradient_style,
-                            custom_colors,
-                            particle_color_scheme,
-                            particle_gradient_style,
-                            particle_custom_colors,
-                        )
-
-                        # Draw geometric element
-                        element_size = max(2, int(3 + enhanced_amplitude * 6))
-                        cv2.circle(
-                            frame, (final_x, final_y), element_size, element_color, -1
-                        )
+            # Create intricate geometric elements
+            element_angle = np.arange(8) * math.pi / 4 + rotation
+            element_distance = ring_radius + np.arange(8) * 8
+            element_positions = np.stack(
+                [
+                    center_x + element_distance * np.cos(element_angle),
+                    center_y + element_distance * np.sin(element_angle),
+                ],
+                axis=1,
+            )
+            canvas.circles(element_positions, element_size, element_colors[ring])
+
+            # Connect to center with sacred lines
+            if ring == 0:  # Only innermost ring connects to center
+                canvas.lines(
+                    np.broadcast_to((center_x, center_y), element_positions.shape),
+                    element_positions,
+                    element_colors[ring],
+                    1,
+                )
+            canvas.next_layer()
 
-                        # Connect to center with sacred lines
-                        if ring == 0:  # Only innermost ring connects to center
-                            cv2.line(
-                                frame,
-                                (center_x, center_y),
-                                (final_x, final_y),
-                                element_color,
-                                1,
-                            )
+        canvas.render(frame)
 
         # Central sacred symbol
         central_radius = int(15 + enhanced_amplitude * 25)
@@ -3753,88 +3148,69 @@ class VerticalVideoCreator:
         enhanced_amplitude = amplitude * (1 + 0.9 * np.sin(current_time * 5))
 
         # Color system
-        spectral_idx = min(
-            int(
-                current_time
-                * len(audio_features["spectral_centroids"])
-                / audio_features["duration"]
-            ),
-            len(audio_features["spectral_centroids"]) - 1,
-        )
-        spectral_value = audio_features["spectral_centroids"][spectral_idx]
+        spectral_value = audio_features["timeline"]["spectral"][
+            self._timeline_index(audio_features, current_time)
+        ]
         base_hue = int((spectral_value / 4000) * 360 + current_time * 20) % 360
 
         # 6-fold symmetry like crystals
         num_segments = 6
         segment_angle = 2 * math.pi / num_segments
+        rotation = current_time * 0.3
 
-        # Draw crystal facets
-        for segment in range(num_segments):
-            segment_rotation = segment * segment_angle + current_time * 0.3
-
-            # Create crystal structure with angular lines
-            for layer in range(4):
-                layer_distance = 60 + layer * (30 + enhanced_amplitude * 20)
-
-                # Create angular crystal lines
-                crystal_points = []
-                for point in range(5):
-                    point_angle = point * math.pi / 8
-                    point_distance = layer_distance + point * 10
-
-                    rel_x = point_distance * math.cos(point_angle)
-                    rel_y = point_distance * math.sin(point_angle)
-
-                    # Rotate
-                    rot_x = rel_x * math.cos(segment_rotation) - rel_y * math.sin(
-                        segment_rotation
-                    )
-                    rot_y = rel_x * math.sin(segment_rotation) + rel_y * math.cos(
-                        segment_rotation
-                    )
-
-                    final_x = int(center_x + rot_x)
-                    final_y = int(center_y + rot_y)
-
-                    if 0 <= final_x < self.width and 0 <= final_y < self.height:
-                        crystal_points.append((final_x, final_y))
-
-                # Draw crystal structure
-                if len(crystal_points) > 1:
-                    crystal_color = self._get_particle_color(
-                        segment * 1000 + layer * 100,
-                        base_hue,
-                        enhanced_amplitude,
-                        current_time,
-                        gradient_style,
-                        custom_colors,
-                        particle_color_scheme,
-                        particle_gradient_style,
-                        particle_custom_colors,
-                    )
+        # Colors for every layer and segment
+        crystal_colors = self._get_particle_colors(
+            (np.arange(4)[:, None] * 100 + np.arange(num_segments) * 1000).ravel(),
+            base_hue,
+            enhanced_amplitude,
+            current_time,
+            gradient_style,
+            custom_colors,
+            particle_color_scheme,
+            particle_gradient_style,
+            particle_custom_colors,
+        ).reshape(4, num_segments, 3)
 
-                    # Draw angular crystal facets
-                    for i in range(len(crystal_points) - 1):
-                        cv2.line(
-                            frame,
-                            crystal_points[i],
-                            crystal_points[i + 1],
-                            crystal_color,
-                            2,
-                        )
+        # Angular crystal lines of the first segment, for every layer
+        layer_distance = 60 + np.arange(4)[:, None] * (30 + enhanced_amplitude * 20)
+        point_angle = np.arange(5) * math.pi / 8
+        point_distance = layer_distance + np.arange(5) * 10
+        crystal_offsets = point_distance * np.exp(1j * (point_angle + rotation))
 
-                    # Mirror lines for crystalline symmetry
-                    for i in range(len(crystal_points)):
-                        mirror_x = 2 * center_x - crystal_points[i][0]
-                        mirror_y = crystal_points[i][1]
-                        if 0 <= mirror_x < self.width and 0 <= mirror_y < self.height:
-                            cv2.line(
-                                frame,
-                                crystal_points[i],
-                                (mirror_x, mirror_y),
-                                crystal_color,
-                                1,
-                            )
+        # Draw crystal facets, every segment's copy rotated from the first
+        canvas = SymmetryCanvas(
+            self.width, self.height, (center_x, center_y), num_segments
+        )
+        for layer in range(4):
+            offsets = crystal_offsets[layer]
+            canvas.polyline(
+                np.stack([center_x + offsets.real, center_y + offsets.imag], axis=1),
+                crystal_colors[layer],
+                2,
+            )
+        canvas.render(frame)
+
+        # Mirror lines for crystalline symmetry. Mirroring across the vertical
+        # axis is not a rotation of the first segment, so every copy is drawn
+        segment_offsets = crystal_offsets * np.exp(
+            1j * segment_angle * np.arange(num_segments)
+        ).reshape(-1, 1, 1)
+        crystal_points = np.stack(
+            [center_x + segment_offsets.real, center_y + segment_offsets.imag],
+            axis=-1,
+        ).astype(np.int32)
+        mirror_points = crystal_points.copy()
+        mirror_points[..., 0] = 2 * center_x - mirror_points[..., 0]
+        mirror_lines = np.stack([crystal_points, mirror_points], axis=-2)
+        for segment in range(num_segments):
+            for layer in range(4):
+                cv2.polylines(
+                    frame,
+                    list(mirror_lines[segment, layer]),
+                    False,
+                    crystal_colors[layer, segment].tolist(),
+                    1,
+                )
 
         # Central crystal core
         core_size = int(10 + enhanced_amplitude * 20)
@@ -3879,102 +3255,71 @@ class VerticalVideoCreator:
         enhanced_amplitude = amplitude * (1 + 0.7 * np.sin(current_time * 3))
 
         # Color system
-        spectral_idx = min(
-            int(
-                current_time
-                * len(audio_features["spectral_centroids"])
-                / audio_features["duration"]
-            ),
-            len(audio_features["spectral_centroids"]) - 1,
-        )
-        spectral_value = audio_features["spectral_centroids"][spectral_idx]
+        spectral_value = audio_features["timeline"]["spectral"][
+            self._timeline_index(audio_features, current_time)
+        ]
         base_hue = int((spectral_value / 4000) * 360 + current_time * 15) % 360
 
         # 8-fold flower symmetry
         num_petals = 8
-        petal_angle = 2 * math.pi / num_petals
+        petal_ids = np.arange(num_petals) * 100
+        t = np.linspace(0, 1, 20)
 
-        # Multiple flower layers
+        # Multiple flower layers; every petal is the layer's first petal rotated
+        canvas = SymmetryCanvas(
+            self.width, self.height, (center_x, center_y), num_petals
+        )
         for layer in range(3):
             layer_size = 1.0 - layer * 0.3
             layer_rotation = current_time * (0.5 + layer * 0.2)
+            cos_rotation = math.cos(layer_rotation)
+            sin_rotation = math.sin(layer_rotation)
+
+            # Organic petal shape using sine curves
+            petal_radius = (80 + enhanced_amplitude * 60) * layer_size
+            petal_width = 30 * layer_size
+            curve_x = petal_radius * t
+            curve_y = (
+                petal_width
+                * np.sin(t * math.pi)
+                * (1 + 0.3 * np.sin(t * 4 * math.pi + current_time * 2))
+            )
+            petal_points = np.stack(
+                [
+                    center_x + curve_x * cos_rotation - curve_y * sin_rotation,
+                    center_y + curve_x * sin_rotation + curve_y * cos_rotation,
+                ],
+                axis=1,
+            )
 
-            for petal in range(num_petals):
-                petal_rotation = petal * petal_angle + layer_rotation
-
-                # Create organic petal shape with curves
-                petal_points = []
-                for t in np.linspace(0, 1, 20):
-                    # Petal shape using sine curves for organic feel
-                    petal_radius = (80 + enhanced_amplitude * 60) * layer_size
-                    petal_width = 30 * layer_size
-
-                    # Create petal curve
-                    curve_x = petal_radius * t
-                    curve_y = (
-                        petal_width
-                        * math.sin(t * math.pi)
-                        * (1 + 0.3 * math.sin(t * 4 * math.pi + current_time * 2))
-                    )
-
-                    # Rotate petal
-                    rot_x = curve_x * math.cos(petal_rotation) - curve_y * math.sin(
-                        petal_rotation
-                    )
-                    rot_y = curve_x * math.sin(petal_rotation) + curve_y * math.cos(
-                        petal_rotation
-                    )
-
-                    final_x = int(center_x + rot_x)
-                    final_y = int(center_y + rot_y)
-
-                    if 0 <= final_x < self.width and 0 <= final_y < self.height:
-                        petal_points.append((final_x, final_y))
+            # Petal center line
+            center_curve = petal_radius * np.linspace(0, 1, 10) * 0.7
+            center_points = np.stack(
+                [
+                    center_x + center_curve * cos_rotation,
+                    center_y + center_curve * sin_rotation,
+                ],
+                axis=1,
+            )
 
-                # Draw petal
-                if len(petal_points) > 1:
-                    petal_color = self._get_particle_color(
-                        petal * 100 + layer * 10,
-                        base_hue,
-                        enhanced_amplitude,
-                        current_time,
-                        gradient_style,
-                        custom_colors,
-                        particle_color_scheme,
-                        particle_gradient_style,
-                        particle_custom_colors,
-                    )
+            petal_colors = self._get_particle_colors(
+                petal_ids + layer * 10,
+                base_hue,
+                enhanced_amplitude,
+                current_time,
+                gradient_style,
+                custom_colors,
+                particle_color_scheme,
+                particle_gradient_style,
+                particle_custom_colors,
+            )
+            thickness = max(1, int(3 * layer_size + enhanced_amplitude * 2))
 
-                    # Draw smooth petal lines
-                    for i in range(len(petal_points) - 1):
-                        thickness = max(1, int(3 * layer_size + enhanced_amplitude * 2))
-                        cv2.line(
-                            frame,
-                            petal_points[i],
-                            petal_points[i + 1],
-                            petal_color,
-                            thickness,
-                        )
+            canvas.polyline(petal_points, petal_colors, thickness)
+            canvas.polyline(center_points, petal_colors, 1)
+            canvas.next_layer()
 
-                    # Draw petal center line
-                    center_points = []
-                    for t in np.linspace(0, 1, 10):
-                        curve_x = (petal_radius * t) * 0.7
-                        rot_x = curve_x * math.cos(petal_rotation)
-                        rot_y = curve_x * math.sin(petal_rotation)
-                        final_x = int(center_x + rot_x)
-                        final_y = int(center_y + rot_y)
-                        if 0 <= final_x < self.width and 0 <= final_y < self.height:
-                            center_points.append((final_x, final_y))
-
-                    for i in range(len(center_points) - 1):
-                        cv2.line(
-                            frame,
-                            center_points[i],
-                            center_points[i + 1],
-                            petal_color,
-                            1,
-                        )
+        canvas.render(frame)
 
         # Flower center with stamens
         center_radius = int(15 + enhanced_amplitude * 20)
@@ -4030,73 +3375,81 @@ class VerticalVideoCreator:
         enhanced_amplitude = amplitude * (1 + 0.6 * np.sin(current_time * 2))
 
         # Color system
-        spectral_idx = min(
-            int(
-                current_time
-                * len(audio_features["spectral_centroids"])
-                / audio_features["duration"]
-            ),
-            len(audio_features["spectral_centroids"]) - 1,
-        )
-        spectral_value = audio_features["spectral_centroids"][spectral_idx]
+        spectral_value = audio_features["timeline"]["spectral"][
+            self._timeline_index(audio_features, current_time)
+        ]
         base_hue = int((spectral_value / 4000) * 360 + current_time * 10) % 360
 
         # Sacred geometry: Flower of Life pattern
         sacred_radius = 40 + enhanced_amplitude * 30
 
-        # 6-fold symmetry
-        for ring in range(3):
-            ring_distance = ring * sacred_radius * 1.2
+        # Central circle
+        circle_color = self._get_particle_color(
+            0,
+            base_hue,
+            enhanced_amplitude,
+            current_time,
+            gradient_style,
+            custom_colors,
+            particle_color_scheme,
+            particle_gradient_style,
+            particle_custom_colors,
+        )
+        cv2.circle(frame, (center_x, center_y), int(sacred_radius), circle_color, 2)
 
-            if ring == 0:
-                # Central circle
-                circle_color = self._get_particle_color(
-                    0,
-                    base_hue,
-                    enhanced_amplitude,
-                    current_time,
-                    gradient_style,
-                    custom_colors,
-                    particle_color_scheme,
-                    particle_gradient_style,
-                    particle_custom_colors,
-                )
-                cv2.circle(
-                    frame, (center_x, center_y), int(sacred_radius), circle_color, 2
-                )
-            else:
-                # Surrounding circles
-                for circle in range(6 * ring):
-                    circle_angle = circle * 2 * math.pi / (6 * ring)
-                    circle_x = int(center_x + ring_distance * math.cos(circle_angle))
-                    circle_y = int(center_y + ring_distance * math.sin(circle_angle))
-
-                    circle_color = self._get_particle_color(
-                        ring * 1000 + circle,
-                        base_hue,
-                        enhanced_amplitude,
-                        current_time,
-                        gradient_style,
-                        custom_colors,
-                        particle_color_scheme,
-                        particle_gradient_style,
-                        particle_custom_colors,
-                    )
-                    cv2.circle(
-                        frame, (circle_x, circle_y), int(sacred_radius), circle_color, 2
-                    )
+        # 6-fold symmetry: the surrounding rings hold one and two circles per
+        # segment, every other segment's circles rotated from the first
+        num_segments = 6
+        canvas = SymmetryCanvas(
+            self.width, self.height, (center_x, center_y), num_segments
+        )
+        for ring in range(1, 3):
+            ring_distance = ring * sacred_radius * 1.2
+            circle_angle = np.arange(ring) * 2 * math.pi / (6 * ring)
+            circle_ids = ring * 1000 + np.arange(ring)[:, None] + ring * np.arange(
+                num_segments
+            )
+            circle_colors = self._get_particle_colors(
+                circle_ids.ravel(),
+                base_hue,
+                enhanced_amplitude,
+                current_time,
+                gradient_style,
+                custom_colors,
+                particle_color_scheme,
+                particle_gradient_style,
+                particle_custom_colors,
+            ).reshape(ring, num_segments, 3)
+            canvas.circles(
+                np.stack(
+                    [
+                        center_x + ring_distance * np.cos(circle_angle),
+                        center_y + ring_distance * np.sin(circle_angle),
+                    ],
+                    axis=1,
+                ),
+                int(sacred_radius),
+                circle_colors,
+                2,
+            )
+            canvas.next_layer()
+        canvas.render(frame)
 
-        # Add merkaba (star tetrahedron)
+        # Add merkaba (star tetrahedron): each triangle is its first side
+        # rotated by a third of a turn
         merkaba_size = 80 + enhanced_amplitude * 40
+        canvas = SymmetryCanvas(self.width, self.height, (center_x, center_y), 3)
         for direction in [1, -1]:  # Upward and downward triangles
-            triangle_points = []
-            for vertex in range(3):
-                vertex_angle = vertex * 2 * math.pi / 3 + current_time * direction * 0.5
-                vertex_x = int(center_x + merkaba_size * math.cos(vertex_angle))
-                vertex_y = int(
-                    center_y + merkaba_size * math.sin(vertex_angle) * direction
-                )
-                triangle_points.append((vertex_x, vertex_y))
+            vertex_angle = (
+                np.arange(2) * 2 * math.pi / 3 + current_time * direction * 0.5
+            )
+            triangle_points = np.stack(
+                [
+                    center_x + merkaba_size * np.cos(vertex_angle),
+                    center_y + merkaba_size * np.sin(vertex_angle) * direction,
+                ],
+                axis=1,
+            )
 
             merkaba_color = self._get_particle_color(
                 6666 + direction,
@@ -4109,13 +3462,9 @@ class VerticalVideoCreator:
                 particle_gradient_style,
                 particle_custom_colors,
             )
-
-            # Draw triangle
-            for i in range(3):
-                next_i = (i + 1) % 3
-                cv2.line(
-                    frame, triangle_points[i], triangle_points[next_i], merkaba_color, 3
-                )
+            canvas.line(triangle_points[0], triangle_points[1], merkaba_color, 3)
+            canvas.next_layer()
+        canvas.render(frame)
 
         # Sacred spiral
         spiral_points = []
@@ -4161,88 +3510,72 @@ class VerticalVideoCreator:
         enhanced_amplitude = amplitude * (1 + 1.0 * np.sin(current_time * 4))
 
         # Color system
-        spectral_idx = min(
-            int(
-                current_time
-                * len(audio_features["spectral_centroids"])
-                / audio_features["duration"]
-            ),
-            len(audio_features["spectral_centroids"]) - 1,
-        )
-        spectral_value = audio_features["spectral_centroids"][spectral_idx]
+        spectral_value = audio_features["timeline"]["spectral"][
+            self._timeline_index(audio_features, current_time)
+        ]
         base_hue = int((spectral_value / 4000) * 360 + current_time * 30) % 360
 
         # 4-fold symmetry for tribal patterns
         num_segments = 4
         segment_angle = 2 * math.pi / num_segments
+        rotation = current_time * 0.4
 
-        # Draw tribal patterns
+        # Colors for every layer and segment
+        tribal_colors = self._get_particle_colors(
+            (np.arange(3)[:, None] * 100 + np.arange(num_segments) * 1000).ravel(),
+            base_hue,
+            enhanced_amplitude,
+            current_time,
+            gradient_style,
+            custom_colors,
+            particle_color_scheme,
+            particle_gradient_style,
+            particle_custom_colors,
+        ).reshape(3, num_segments, 3)
+
+        # Tribal zigzag patterns of the first segment, for every layer
+        step = np.arange(8)
+        layer_distance = 60 + np.arange(3)[:, None] * (40 + enhanced_amplitude * 30)
+        step_distance = layer_distance + step * 15
+        zigzag_offset = (step % 2) * 20 - 10  # Zigzag pattern
+        step_angle = step * math.pi / 16
+        tribal_offsets = (
+            step_distance * np.cos(step_angle)
+            + zigzag_offset
+            + 1j * step_distance * np.sin(step_angle)
+        ) * np.exp(1j * rotation)
+
+        # Bold tribal lines, every segment's copy rotated from the first
+        canvas = SymmetryCanvas(
+            self.width, self.height, (center_x, center_y), num_segments
+        )
+        for layer in range(3):
+            offsets = tribal_offsets[layer]
+            canvas.polyline(
+                np.stack([center_x + offsets.real, center_y + offsets.imag], axis=1),
+                tribal_colors[layer],
+                4,
+            )
+        canvas.render(frame)
+
+        # Tribal diamonds/rhombs. Their corners are offset along the frame
+        # axes rather than rotated, so every copy is drawn
+        segment_offsets = tribal_offsets * np.exp(
+            1j * segment_angle * np.arange(num_segments)
+        ).reshape(-1, 1, 1)
+        tribal_points = np.stack(
+            [center_x + segment_offsets.real, center_y + segment_offsets.imag],
+            axis=-1,
+        ).astype(np.int32)
+        corners = tribal_points[:, :, 0:6:2]
+        diamonds = np.stack(
+            [corners, corners + 10, tribal_points[:, :, 1:7:2], corners - 10], axis=-2
+        )
         for segment in range(num_segments):
-            segment_rotation = segment * segment_angle + current_time * 0.4
-
-            # Create bold angular tribal shapes
             for layer in range(3):
-                layer_distance = 60 + layer * (40 + enhanced_amplitude * 30)
-
-                # Tribal zigzag patterns
-                tribal_points = []
-                for step in range(8):
-                    step_distance = layer_distance + step * 15
-                    zigzag_offset = (step % 2) * 20 - 10  # Zigzag pattern
-
-                    step_angle = step * math.pi / 16
-                    rel_x = step_distance * math.cos(step_angle) + zigzag_offset
-                    rel_y = step_distance * math.sin(step_angle)
-
-                    # Rotate
-                    rot_x = rel_x * math.cos(segment_rotation) - rel_y * math.sin(
-                        segment_rotation
-                    )
-                    rot_y = rel_x * math.sin(segment_rotation) + rel_y * math.cos(
-                        segment_rotation
-                    )
-
-                    final_x = int(center_x + rot_x)
-                    final_y = int(center_y + rot_y)
-
-                    if 0 <= final_x < self.width and 0 <= final_y < self.height:
-                        tribal_points.append((final_x, final_y))
-
-                # Draw tribal patterns
-                if len(tribal_points) > 1:
-                    tribal_color = self._get_particle_color(
-                        segment * 1000 + layer * 100,
-                        base_hue,
-                        enhanced_amplitude,
-                        current_time,
-                        gradient_style,
-                        custom_colors,
-                        particle_color_scheme,
-                        particle_gradient_style,
-                        particle_custom_colors,
-                    )
-
-                    # Bold tribal lines
-                    for i in range(len(tribal_points) - 1):
-                        cv2.line(
-                            frame,
-                            tribal_points[i],
-                            tribal_points[i + 1],
-                            tribal_color,
-                            4,
-                        )
-
-                    # Tribal diamonds/rhombs
-                    for i in range(0, len(tribal_points) - 2, 2):
-                        diamond_points = [
-                            tribal_points[i],
-                            (tribal_points[i][0] + 10, tribal_points[i][1] + 10),
-                            tribal_points[i + 1],
-                            (tribal_points[i][0] - 10, tribal_points[i][1] - 10),
-                        ]
-                        cv2.fillPoly(
-                            frame, [np.array(diamond_points, np.int32)], tribal_color
-                        )
+                color = tribal_colors[layer, segment].tolist()
+                for diamond in diamonds[segment, layer]:
+                    cv2.fillPoly(frame, [diamond], color)
 
         # Central tribal totem
         totem_height = int(60 + enhanced_amplitude * 40)
@@ -4286,87 +3619,65 @@ class VerticalVideoCreator:
         enhanced_amplitude = amplitude * (1 + 1.2 * np.sin(current_time * 8))
 
         # Color system
-        spectral_idx = min(
-            int(
-                current_time
-                * len(audio_features["spectral_centroids"])
-                / audio_features["duration"]
-            ),
-            len(audio_features["spectral_centroids"]) - 1,
-        )
-        spectral_value = audio_features["spectral_centroids"][spectral_idx]
+        spectral_value = audio_features["timeline"]["spectral"][
+            self._timeline_index(audio_features, current_time)
+        ]
         base_hue = int((spectral_value / 4000) * 360 + current_time * 50) % 360
 
-        # Multiple laser beams
+        # Multiple laser beams, every beam the first one rotated
         num_lasers = int(16 + enhanced_amplitude * 16)
+        laser_ids = np.arange(num_lasers)
+        laser_angle = current_time * 2
+        laser_length = 200 + enhanced_amplitude * 150
+        laser_thickness = max(1, int(2 + enhanced_amplitude * 6))
+        center = (center_x, center_y)
+
+        laser_colors = self._get_particle_colors(
+            laser_ids,
+            base_hue,
+            enhanced_amplitude,
+            current_time,
+            gradient_style,
+            custom_colors,
+            particle_color_scheme,
+            particle_gradient_style,
+            particle_custom_colors,
+        )
+        glow_colors = self._get_particle_colors(
+            laser_ids + 10000,
+            base_hue,
+            enhanced_amplitude * 0.3,
+            current_time,
+            gradient_style,
+            custom_colors,
+            particle_color_scheme,
+            particle_gradient_style,
+            particle_custom_colors,
+        )
 
-        for laser in range(num_lasers):
-            laser_angle = laser * 2 * math.pi / num_lasers + current_time * 2
-            laser_length = 200 + enhanced_amplitude * 150
-
-            # Laser beam end point
-            end_x = int(center_x + laser_length * math.cos(laser_angle))
-            end_y = int(center_y + laser_length * math.sin(laser_angle))
-
-            # Ensure within bounds
-            if 0 <= end_x < self.width and 0 <= end_y < self.height:
-                laser_color = self._get_particle_color(
-                    laser,
-                    base_hue,
-                    enhanced_amplitude,
-                    current_time,
-                    gradient_style,
-                    custom_colors,
-                    particle_color_scheme,
-                    particle_gradient_style,
-                    particle_custom_colors,
-                )
-
-                # Main laser beam
-                laser_thickness = max(1, int(2 + enhanced_amplitude * 6))
-                cv2.line(
-                    frame,
-                    (center_x, center_y),
-                    (end_x, end_y),
-                    laser_color,
-                    laser_thickness,
-                )
-
-                # Laser glow effect
-                glow_color = self._get_particle_color(
-                    laser + 10000,
-                    base_hue,
-                    enhanced_amplitude * 0.3,
-                    current_time,
-                    gradient_style,
-                    custom_colors,
-                    particle_color_scheme,
-                    particle_gradient_style,
-                    particle_custom_colors,
-                )
-                cv2.line(
-                    frame,
-                    (center_x, center_y),
-                    (end_x, end_y),
-                    glow_color,
-                    max(1, laser_thickness + 4),
-                )
-
-                # Laser reflections (shorter beams)
-                for reflection in range(3):
-                    refl_angle = laser_angle + (reflection - 1) * 0.1
-                    refl_length = laser_length * 0.3
-                    refl_end_x = int(center_x + refl_length * math.cos(refl_angle))
-                    refl_end_y = int(center_y + refl_length * math.sin(refl_angle))
-
-                    if 0 <= refl_end_x < self.width and 0 <= refl_end_y < self.height:
-                        cv2.line(
-                            frame,
-                            (center_x, center_y),
-                            (refl_end_x, refl_end_y),
-                            glow_color,
-                            1,
-                        )
+        # Main laser beam, its glow and reflections (shorter beams)
+        canvas = SymmetryCanvas(self.width, self.height, center, num_lasers)
+        laser_end = (
+            center_x + laser_length * math.cos(laser_angle),
+            center_y + laser_length * math.sin(laser_angle),
+        )
+        canvas.line(center, laser_end, laser_colors, laser_thickness)
+        canvas.line(center, laser_end, glow_colors, max(1, laser_thickness + 4))
+        refl_angle = laser_angle + (np.arange(3) - 1) * 0.1
+        refl_length = laser_length * 0.3
+        canvas.lines(
+            np.broadcast_to(center, (3, 2)),
+            np.stack(
+                [
+                    center_x + refl_length * np.cos(refl_angle),
+                    center_y + refl_length * np.sin(refl_angle),
+                ],
+                axis=1,
+            ),
+            glow_colors,
+            1,
+        )
+        canvas.render(frame)
 
         # Central laser core
         core_radius = int(8 + enhanced_amplitude * 20)
@@ -4410,42 +3721,42 @@ class VerticalVideoCreator:
         enhanced_amplitude = amplitude * (1 + 0.8 * np.sin(current_time * 3))
 
         # Color system
-        spectral_idx = min(
-            int(
-                current_time
-                * len(audio_features["spectral_centroids"])
-                / audio_features["duration"]
-            ),
-            len(audio_features["spectral_centroids"]) - 1,
-        )
-        spectral_value = audio_features["spectral_centroids"][spectral_idx]
+        spectral_value = audio_features["timeline"]["spectral"][
+            self._timeline_index(audio_features, current_time)
+        ]
         base_hue = int((spectral_value / 4000) * 360 + current_time * 20) % 360
 
         # Web parameters
         num_radials = 16  # Radial threads
         num_rings = 8  # Concentric rings
 
-        # Draw radial threads
-        for radial in range(num_radials):
-            radial_angle = radial * 2 * math.pi / num_radials + current_time * 0.1
-            thread_length = 200 + enhanced_amplitude * 100
-
-            end_x = int(center_x + thread_length * math.cos(radial_angle))
-            end_y = int(center_y + thread_length * math.sin(radial_angle))
-
-            if 0 <= end_x < self.width and 0 <= end_y < self.height:
-                thread_color = self._get_particle_color(
-                    radial,
-                    base_hue,
-                    enhanced_amplitude,
-                    current_time,
-                    gradient_style,
-                    custom_colors,
-                    particle_color_scheme,
-                    particle_gradient_style,
-                    particle_custom_colors,
-                )
-                cv2.line(frame, (center_x, center_y), (end_x, end_y), thread_color, 1)
+        # Draw radial threads, every thread the first one rotated
+        thread_length = 200 + enhanced_amplitude * 100
+        radial_angle = current_time * 0.1
+        thread_colors = self._get_particle_colors(
+            np.arange(num_radials),
+            base_hue,
+            enhanced_amplitude,
+            current_time,
+            gradient_style,
+            custom_colors,
+            particle_color_scheme,
+            particle_gradient_style,
+            particle_custom_colors,
+        )
+        canvas = SymmetryCanvas(
+            self.width, self.height, (center_x, center_y), num_radials
+        )
+        canvas.line(
+            (center_x, center_y),
+            (
+                center_x + thread_length * math.cos(radial_angle),
+                center_y + thread_length * math.sin(radial_angle),
+            ),
+            thread_colors,
+            1,
+        )
+        canvas.render(frame)
 
         # Draw concentric web rings
         for ring in range(1, num_rings + 1):
@@ -4530,66 +3841,56 @@ class VerticalVideoCreator:
         enhanced_amplitude = amplitude * (1 + 0.9 * np.sin(current_time * 4))
 
         # Color system
-        spectral_idx = min(
-            int(
-                current_time
-                * len(audio_features["spectral_centroids"])
-                / audio_features["duration"]
-            ),
-            len(audio_features["spectral_centroids"]) - 1,
-        )
-        spectral_value = audio_features["spectral_centroids"][spectral_idx]
+        spectral_value = audio_features["timeline"]["spectral"][
+            self._timeline_index(audio_features, current_time)
+        ]
         base_hue = int((spectral_value / 4000) * 360 + current_time * 25) % 360
 
-        # Multiple spiral arms
+        # Multiple spiral arms. Arms alternate direction, so arms 0, 2, 4 and
+        # 1, 3, 5 are the first two arms rotated by a third of a turn
         num_spirals = 6
-
-        for spiral_id in range(num_spirals):
+        num_segments = num_spirals // 2
+        t = np.linspace(0, 6 * math.pi, 150)
+        spiral_radius = 5 + t * (8 + enhanced_amplitude * 5)
+        thickness = max(1, int(2 + enhanced_amplitude * 3))
+        particle_size = max(1, int(3 + enhanced_amplitude * 4))
+
+        canvas = SymmetryCanvas(
+            self.width, self.height, (center_x, center_y), num_segments
+        )
+        for spiral_id in range(num_spirals // num_segments):
             spiral_offset = spiral_id * 2 * math.pi / num_spirals
             spiral_direction = 1 if spiral_id % 2 == 0 else -1  # Alternate directions
 
-            spiral_points = []
-            for t in np.linspace(0, 6 * math.pi, 150):
-                # Logarithmic spiral
-                spiral_radius = 5 + t * (8 + enhanced_amplitude * 5)
-                spiral_angle = t * spiral_direction + spiral_offset + current_time * 0.5
-
-                spiral_x = int(center_x + spiral_radius * math.cos(spiral_angle))
-                spiral_y = int(center_y + spiral_radius * math.sin(spiral_angle))
-
-                if 0 <= spiral_x < self.width and 0 <= spiral_y < self.height:
-                    spiral_points.append((spiral_x, spiral_y))
+            # Logarithmic spiral
+            spiral_angle = t * spiral_direction + spiral_offset + current_time * 0.5
+            spiral_points = np.stack(
+                [
+                    center_x + spiral_radius * np.cos(spiral_angle),
+                    center_y + spiral_radius * np.sin(spiral_angle),
+                ],
+                axis=1,
+            )
 
-            # Draw spiral
-            if len(spiral_points) > 1:
-                for i in range(len(spiral_points) - 1):
-                    spiral_color = self._get_particle_color(
-                        spiral_id * 1000 + i,
-                        base_hue,
-                        enhanced_amplitude,
-                        current_time,
-                        gradient_style,
-                        custom_colors,
-                        particle_color_scheme,
-                        particle_gradient_style,
-                        particle_custom_colors,
-                    )
+            # One color per spiral line in every rotated copy of this arm
+            arm_ids = (spiral_id + 2 * np.arange(num_segments)) * 1000
+            spiral_colors = self._get_particle_colors(
+                (np.arange(len(t) - 1)[:, None] + arm_ids).ravel(),
+                base_hue,
+                enhanced_amplitude,
+                current_time,
+                gradient_style,
+                custom_colors,
+                particle_color_scheme,
+                particle_gradient_style,
+                particle_custom_colors,
+            ).reshape(len(t) - 1, num_segments, 3)
 
-                    thickness = max(1, int(2 + enhanced_amplitude * 3))
-                    cv2.line(
-                        frame,
-                        spiral_points[i],
-                        spiral_points[i + 1],
-                        spiral_color,
-                        thickness,
-                    )
+            # Draw spiral, with a particle on every 8th point
+            canvas.polyline(spiral_points, spiral_colors, thickness)
+            canvas.circles(spiral_points[:-1:8], particle_size, spiral_colors[::8])
 
-                    # Add spiral particles
-                    if i % 8 == 0:  # Every 8th point gets a particle
-                        particle_size = max(1, int(3 + enhanced_amplitude * 4))
-                        cv2.circle(
-                            frame, spiral_points[i], particle_size, spiral_color, -1
-                        )
+        canvas.render(frame)
 
         # Central spiral core
         core_radius = int(12 + enhanced_amplitude * 18)
@@ -4627,118 +3928,82 @@ class VerticalVideoCreator:
         enhanced_amplitude = amplitude * (1 + 0.8 * np.sin(current_time * 6))
 
         # Color system
-        spectral_idx = min(
-            int(
-                current_time
-                * len(audio_features["spectral_centroids"])
-                / audio_features["duration"]
-            ),
-            len(audio_features["spectral_centroids"]) - 1,
-        )
-        spectral_value = audio_features["spectral_centroids"][spectral_idx]
+        spectral_value = audio_features["timeline"]["spectral"][
+            self._timeline_index(audio_features, current_time)
+        ]
         base_hue = int((spectral_value / 4000) * 360 + current_time * 30) % 360
 
         # 4-fold diamond symmetry
         num_segments = 4
-        segment_angle = 2 * math.pi / num_segments
+        canvas = SymmetryCanvas(
+            self.width, self.height, (center_x, center_y), num_segments
+        )
+        facet_angles = np.arange(6) * math.pi / 3
+        ray_angles = np.arange(3) * math.pi / 6
+        segment_ids = np.arange(num_segments) * 1000
 
-        # Multiple diamond layers
+        # Multiple diamond layers, every segment's facet the first one rotated
         for layer in range(4):
             layer_size = 50 + layer * (30 + enhanced_amplitude * 20)
             layer_rotation = current_time * (0.3 + layer * 0.1)
 
-            for segment in range(num_segments):
-                segment_rotation = segment * segment_angle + layer_rotation
-
-                # Create diamond facet
-                diamond_points = []
-                facet_angles = [
-                    0,
-                    math.pi / 3,
-                    2 * math.pi / 3,
-                    math.pi,
-                    4 * math.pi / 3,
-                    5 * math.pi / 3,
-                ]
-
-                for facet_angle in facet_angles:
-                    facet_distance = layer_size * (
-                        0.8 + 0.4 * math.sin(facet_angle * 2 + current_time * 3)
-                    )
-
-                    rel_x = facet_distance * math.cos(facet_angle)
-                    rel_y = facet_distance * math.sin(facet_angle)
-
-                    # Rotate
-                    rot_x = rel_x * math.cos(segment_rotation) - rel_y * math.sin(
-                        segment_rotation
-                    )
-                    rot_y = rel_x * math.sin(segment_rotation) + rel_y * math.cos(
-                        segment_rotation
-                    )
-
-                    final_x = int(center_x + rot_x)
-                    final_y = int(center_y + rot_y)
-
-                    if 0 <= final_x < self.width and 0 <= final_y < self.height:
-                        diamond_points.append((final_x, final_y))
-
-                # Draw diamond facets
-                if len(diamond_points) > 2:
-                    diamond_color = self._get_particle_color(
-                        segment * 1000 + layer * 100,
-                        base_hue,
-                        enhanced_amplitude,
-                        current_time,
-                        gradient_style,
-                        custom_colors,
-                        particle_color_scheme,
-                        particle_gradient_style,
-                        particle_custom_colors,
-                    )
+            # Create diamond facet
+            facet_distance = layer_size * (
+                0.8 + 0.4 * np.sin(facet_angles * 2 + current_time * 3)
+            )
+            facet_angle = facet_angles + layer_rotation
+            diamond_points = np.stack(
+                [
+                    center_x + facet_distance * np.cos(facet_angle),
+                    center_y + facet_distance * np.sin(facet_angle),
+                ],
+                axis=1,
+            )
+            diamond_colors = self._get_particle_colors(
+                segment_ids + layer * 100,
+                base_hue,
+                enhanced_amplitude,
+                current_time,
+                gradient_style,
+                custom_colors,
+                particle_color_scheme,
+                particle_gradient_style,
+                particle_custom_colors,
+            )
 
-                    # Fill diamond facet
-                    cv2.fillPoly(
-                        frame, [np.array(diamond_points, np.int32)], diamond_color
-                    )
+            # Fill diamond facet, then its outline
+            canvas.fill_poly(diamond_points, diamond_colors)
+            canvas.polyline(diamond_points, (255, 255, 255), 1, closed=True)
 
-                    # Diamond outline
-                    for i in range(len(diamond_points)):
-                        next_i = (i + 1) % len(diamond_points)
-                        cv2.line(
-                            frame,
-                            diamond_points[i],
-                            diamond_points[next_i],
-                            (255, 255, 255),
-                            1,
-                        )
+            # Prismatic light rays
+            ray_angle = ray_angles + layer_rotation
+            ray_length = layer_size * 0.3
+            ray_colors = self._get_particle_colors(
+                (np.arange(3)[:, None] + segment_ids + layer * 100 + 10000).ravel(),
+                base_hue,
+                enhanced_amplitude * 0.5,
+                current_time,
+                gradient_style,
+                custom_colors,
+                particle_color_scheme,
+                particle_gradient_style,
+                particle_custom_colors,
+            ).reshape(3, num_segments, 3)
+            canvas.lines(
+                np.broadcast_to((center_x, center_y), (3, 2)),
+                np.stack(
+                    [
+                        center_x + ray_length * np.cos(ray_angle),
+                        center_y + ray_length * np.sin(ray_angle),
+                    ],
+                    axis=1,
+                ),
+                ray_colors,
+                2,
+            )
+            canvas.next_layer()
 
-                    # Prismatic light rays
-                    for ray in range(3):
-                        ray_angle = segment_rotation + ray * math.pi / 6
-                        ray_length = layer_size * 0.3
-                        ray_end_x = int(center_x + ray_length * math.cos(ray_angle))
-                        ray_end_y = int(center_y + ray_length * math.sin(ray_angle))
-
-                        if 0 <= ray_end_x < self.width and 0 <= ray_end_y < self.height:
-                            ray_color = self._get_particle_color(
-                                segment * 1000 + layer * 100 + ray + 10000,
-                                base_hue,
-                                enhanced_amplitude * 0.5,
-                                current_time,
-                                gradient_style,
-                                custom_colors,
-                                particle_color_scheme,
-                                particle_gradient_style,
-                                particle_custom_colors,
-                            )
-                            cv2.line(
-                                frame,
-                                (center_x, center_y),
-                                (ray_end_x, ray_end_y),
-                                ray_color,
-                                2,
-                            )
+        canvas.render(frame)
 
         # Central diamond core
         core_points = [
@@ -4784,15 +4049,9 @@ class VerticalVideoCreator:
         enhanced_amplitude = amplitude * (1 + 1.0 * np.sin(current_time * 5))
 
         # Color system
-        spectral_idx = min(
-            int(
-                current_time
-                * len(audio_features["spectral_centroids"])
-                / audio_features["duration"]
-            ),
-            len(audio_features["spectral_centroids"]) - 1,
-        )
-        spectral_value = audio_features["spectral_centroids"][spectral_idx]
+        spectral_value = audio_features["timeline"]["spectral"][
+            self._timeline_index(audio_features, current_time)
+        ]
         base_hue = int((spectral_value / 4000) * 360 + current_time * 40) % 360
 
         # Multiple star layers with different point counts
@@ -4806,62 +4065,62 @@ class VerticalVideoCreator:
             star_radius = base_radius + enhanced_amplitude * 40
             rotation = current_time * (0.5 + config_idx * 0.2)
 
-            # Create star points
-            star_points = []
-            for point in range(num_points * 2):  # Outer and inner points
-                point_angle = point * math.pi / num_points + rotation
-
-                if point % 2 == 0:  # Outer points
-                    point_distance = star_radius
-                else:  # Inner points
-                    point_distance = star_radius * 0.4
-
-                point_x = int(center_x + point_distance * math.cos(point_angle))
-                point_y = int(center_y + point_distance * math.sin(point_angle))
-
-                if 0 <= point_x < self.width and 0 <= point_y < self.height:
-                    star_points.append((point_x, point_y))
-
-            # Draw star
-            if len(star_points) > 2:
-                star_color = self._get_particle_color(
-                    config_idx * 1000 + num_points,
-                    base_hue,
-                    enhanced_amplitude,
-                    current_time,
-                    gradient_style,
-                    custom_colors,
-                    particle_color_scheme,
-                    particle_gradient_style,
-                    particle_custom_colors,
-                )
+            # Create the star's first outer point, the inner points on either
+            # side of it and the next outer point; every other point is one
+            # of these rotated
+            point_angle = np.arange(-1, 3) * math.pi / num_points + rotation
+            point_distance = np.array([0.4, 1.0, 0.4, 1.0]) * star_radius
+            inner_before, outer, inner_after, next_outer = np.stack(
+                [
+                    center_x + point_distance * np.cos(point_angle),
+                    center_y + point_distance * np.sin(point_angle),
+                ],
+                axis=1,
+            )
+            star_color = self._get_particle_color(
+                config_idx * 1000 + num_points,
+                base_hue,
+                enhanced_amplitude,
+                current_time,
+                gradient_style,
+                custom_colors,
+                particle_color_scheme,
+                particle_gradient_style,
+                particle_custom_colors,
+            )
+            canvas = SymmetryCanvas(
+                self.width, self.height, (center_x, center_y), num_points
+            )
 
-                # Fill star
-                cv2.fillPoly(frame, [np.array(star_points, np.int32)], star_color)
+            # Fill star, one kite per point
+            canvas.fill_poly(
+                [(center_x, center_y), inner_before, outer, inner_after], star_color
+            )
+            canvas.next_layer()
 
-                # Star outline
-                for i in range(len(star_points)):
-                    next_i = (i + 1) % len(star_points)
-                    cv2.line(
-                        frame, star_points[i], star_points[next_i], (255, 255, 255), 1
-                    )
+            # Star outline
+            canvas.lines(
+                [outer, inner_after],
+                [inner_after, next_outer],
+                (255, 255, 255),
+                1,
+            )
+            canvas.next_layer()
 
-                # Star rays (from center to outer points)
-                for point in range(0, len(star_points), 2):  # Only outer points
-                    ray_color = self._get_particle_color(
-                        config_idx * 1000 + num_points + point + 5000,
-                        base_hue,
-                        enhanced_amplitude * 0.7,
-                        current_time,
-                        gradient_style,
-                        custom_colors,
-                        particle_color_scheme,
-                        particle_gradient_style,
-                        particle_custom_colors,
-                    )
-                    cv2.line(
-                        frame, (center_x, center_y), star_points[point], ray_color, 2
-                    )
+            # Star rays (from center to outer points)
+            ray_colors = self._get_particle_colors(
+                config_idx * 1000 + num_points + 2 * np.arange(num_points) + 5000,
+                base_hue,
+                enhanced_amplitude * 0.7,
+                current_time,
+                gradient_style,
+                custom_colors,
+                particle_color_scheme,
+                particle_gradient_style,
+                particle_custom_colors,
+            )
+            canvas.line((center_x, center_y), outer, ray_colors, 2)
+            canvas.render(frame)
 
         # Central stellar core with pulsing
         core_radius = int(8 + enhanced_amplitude * 25)
@@ -4941,106 +4200,71 @@ class VerticalVideoCreator:
         enhanced_amplitude = amplitude * (1 + 0.9 * np.sin(current_time * 7))
 
         # Color system - Matrix green but can vary with audio
-        spectral_idx = min(
-            int(
-                current_time
-                * len(audio_features["spectral_centroids"])
-                / audio_features["duration"]
-            ),
-            len(audio_features["spectral_centroids"]) - 1,
-        )
-        spectral_value = audio_features["spectral_centroids"][spectral_idx]
+        spectral_value = audio_features["timeline"]["spectral"][
+            self._timeline_index(audio_features, current_time)
+        ]
         base_hue = int((spectral_value / 4000) * 360 + current_time * 10) % 360
 
         # Create MANY vertical streams (very dense)
         num_streams = int(80 + enhanced_amplitude * 120)  # Lots of streams
         stream_width = max(1, self.width // num_streams)
+        stream = np.arange(num_streams)
+        stream_x = stream * stream_width + (stream_width // 2)
 
-        # Characters to use for matrix effect
-        matrix_chars = (
-            "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ!@#$%^&*(){}[]|\\:;\"'<>,.?/~`"
-        )
-
-        for stream in range(num_streams):
-            stream_x = stream * stream_width + (stream_width // 2)
+        # Each stream has its own speed; all share the length
+        stream_speed = 80 + enhanced_amplitude * 200 + (stream % 7) * 20
+        stream_length = int(100 + enhanced_amplitude * 300)
 
-            # Each stream has its own speed and character density
-            stream_speed = 80 + enhanced_amplitude * 200 + (stream % 7) * 20
-            stream_density = (
-                0.6 + enhanced_amplitude * 0.4
-            )  # How dense the characters are
-
-            # Stream length varies
-            stream_length = int(100 + enhanced_amplitude * 300)
-
-            # Calculate stream head position
-            stream_phase = (current_time * stream_speed + stream * 50) % (
-                self.height + stream_length
-            )
-            stream_head_y = int(stream_phase - stream_length)
-
-            # Draw characters along this stream
-            char_spacing = 20  # Pixels between characters
-            for char_pos in range(0, stream_length, char_spacing):
-                char_y = stream_head_y + char_pos
-
-                if 0 <= char_y < self.height:
-                    # Character brightness fades from head to tail
-                    brightness_factor = 1.0 - (char_pos / stream_length)
-                    char_brightness = int(
-                        255 * brightness_factor * (0.5 + 0.5 * enhanced_amplitude)
-                    )
+        # Calculate stream head positions
+        stream_phase = (current_time * stream_speed + stream * 50) % (
+            self.height + stream_length
+        )
+        stream_head_y = (stream_phase - stream_length).astype(np.int64)
 
-                    # Character color using new scheme
-                    char_color = self._get_particle_color(
-                        stream * 1000 + char_pos,
-                        base_hue,
-                        enhanced_amplitude,
-                        current_time,
-                        gradient_style,
-                        custom_colors,
-                        particle_color_scheme,
-                        particle_gradient_style,
-                        particle_custom_colors,
-                    )
+        # Character cells along every stream, (stream, cell) arrays
+        char_spacing = 20  # Pixels between characters
+        char_pos = np.arange(0, stream_length, char_spacing)
+        char_y = stream_head_y[:, None] + char_pos[None, :]
+        char_ids = stream[:, None] * 1000 + char_pos[None, :]
 
-                    # Pick a random character (but consistent for this position)
-                    char_index = (
-                        stream * 7 + char_pos // char_spacing + int(current_time * 10)
-                    ) % len(matrix_chars)
-                    matrix_char = matrix_chars[char_index]
+        # The first 3 characters of each stream get a bright head highlight
+        heads = slice(0, 3)
 
-                    # Draw character (using simple rectangle for performance)
-                    char_size = max(2, int(4 + enhanced_amplitude * 6))
-                    cv2.rectangle(
-                        frame,
-                        (stream_x - char_size // 2, char_y - char_size // 2),
-                        (stream_x + char_size // 2, char_y + char_size // 2),
-                        char_color,
-                        -1,
-                    )
+        cell_colors = self._get_particle_colors(
+            char_ids.ravel(),
+            base_hue,
+            enhanced_amplitude,
+            current_time,
+            gradient_style,
+            custom_colors,
+            particle_color_scheme,
+            particle_gradient_style,
+            particle_custom_colors,
+        ).reshape(char_ids.shape + (3,))
+        head_colors = self._get_particle_colors(
+            char_ids[:, heads].ravel() + 50000,
+            base_hue,
+            enhanced_amplitude,
+            current_time,
+            gradient_style,
+            custom_colors,
+            particle_color_scheme,
+            particle_gradient_style,
+            particle_custom_colors,
+        ).reshape(char_ids[:, heads].shape + (3,))
 
-                    # Add extra brightness to stream head
-                    if char_pos < char_spacing * 3:  # First 3 characters are brightest
-                        head_brightness = int(255 * (1 + enhanced_amplitude))
-                        head_color = self._get_particle_color(
-                            stream * 1000 + char_pos + 50000,
-                            base_hue,
-                            enhanced_amplitude,
-                            current_time,
-                            gradient_style,
-                            custom_colors,
-                            particle_color_scheme,
-                            particle_gradient_style,
-                            particle_custom_colors,
-                        )
-                        cv2.rectangle(
-                            frame,
-                            (stream_x - 1, char_y - 1),
-                            (stream_x + 1, char_y + 1),
-                            head_color,
-                            -1,
-                        )
+        # Characters are drawn as square cells (blocks rather than glyphs, for
+        # performance), each stream's cells and then its head highlights
+        char_size = max(2, int(4 + enhanced_amplitude * 6))
+        visible = (char_y >= 0) & (char_y < self.height)
+        splat_cell_columns(
+            frame,
+            stream_x,
+            [
+                (char_y, visible, cell_colors, char_size // 2),
+                (char_y[:, heads], visible[:, heads], head_colors, 1),
+            ],
+        )
 
         # Add horizontal glitch lines occasionally
         if enhanced_amplitude > 0.7:
@@ -5119,95 +4343,106 @@ class VerticalVideoCreator:
         enhanced_amplitude = amplitude * (1 + 0.8 * np.sin(current_time * 5))
 
         # Color system
-        spectral_idx = min(
-            int(
-                current_time
-                * len(audio_features["spectral_centroids"])
-                / audio_features["duration"]
-            ),
-            len(audio_features["spectral_centroids"]) - 1,
-        )
-        spectral_value = audio_features["spectral_centroids"][spectral_idx]
+        spectral_value = audio_features["timeline"]["spectral"][
+            self._timeline_index(audio_features, current_time)
+        ]
         base_hue = int((spectral_value / 4000) * 360 + current_time * 15) % 360
 
         # MASSIVE number of stars
         star_count = int(400 + enhanced_amplitude * 600)  # Very dense starfield
 
+        # Stars move from center outward (warp speed effect)
+        center_x = self.width // 2
+        center_y = self.height // 2
+
         # Multiple layers of stars moving at different speeds
         for layer in range(4):  # 4 depth layers
             layer_speed = (layer + 1) * (20 + enhanced_amplitude * 80)
             layer_star_count = star_count // (layer + 1)  # More stars in closer layers
 
-            for star in range(layer_star_count):
-                # Star position with movement
-                star_seed = star * 7.91 + layer * 1000  # Pseudo-random but consistent
+            star = np.arange(max(layer_star_count, 0))
+            stars = new_particles(star + layer * 1000)
+            star_seed = star * 7.91 + layer * 1000  # Pseudo-random but consistent
 
-                # Star moves from center outward (warp speed effect)
-                center_x = self.width // 2
-                center_y = self.height // 2
+            # Initial position (when star was "born")
+            initial_angle = (star_seed * 0.01) % (2 * math.pi)
 
-                # Initial position (when star was "born")
-                initial_angle = (star_seed * 0.01) % (2 * math.pi)
+            # Current distance from center based on time
+            current_distance = (current_time * layer_speed + star_seed * 10) % 1000
 
-                # Current distance from center based on time
-                current_distance = (current_time * layer_speed + star_seed * 10) % 1000
+            stars["x"] = center_x + current_distance * np.cos(initial_angle)
+            stars["y"] = center_y + current_distance * np.sin(initial_angle)
 
-                star_x = center_x + current_distance * math.cos(initial_angle)
-                star_y = center_y + current_distance * math.sin(initial_angle)
-
-                # Only draw if star is on screen
-                if 0 <= star_x < self.width and 0 <= star_y < self.height:
-                    # Star size based on layer and audio
-                    star_size = max(1, int(1 + layer + enhanced_amplitude * 4))
-
-                    # Star brightness based on distance and audio
-                    distance_factor = min(1.0, current_distance / 300)
-                    star_brightness = int(
-                        100 + 155 * distance_factor * (0.5 + 0.5 * enhanced_amplitude)
-                    )
+            # Only draw stars that are on screen
+            visible = (
+                (stars["x"] >= 0)
+                & (stars["x"] < self.width)
+                & (stars["y"] >= 0)
+                & (stars["y"] < self.height)
+            )
+            stars = stars[visible]
+            initial_angle = initial_angle[visible]
+            current_distance = current_distance[visible]
 
-                    # Star color using new scheme
-                    star_color = self._get_particle_color(
-                        star + layer * 1000,
-                        base_hue,
-                        enhanced_amplitude,
-                        current_time,
-                        gradient_style,
-                        custom_colors,
-                        particle_color_scheme,
-                        particle_gradient_style,
-                        particle_custom_colors,
-                    )
+            # Star size based on layer and audio
+            star_size = max(1, int(1 + layer + enhanced_amplitude * 4))
 
-                    cv2.circle(
-                        frame, (int(star_x), int(star_y)), star_size, star_color, -1
-                    )
+            # Star color using new scheme
+            star_colors = self._get_particle_colors(
+                stars["id"],
+                base_hue,
+                enhanced_amplitude,
+                current_time,
+                gradient_style,
+                custom_colors,
+                particle_color_scheme,
+                particle_gradient_style,
+                particle_custom_colors,
+            )
+            splat_circles(
+                frame,
+                stars["x"].astype(np.int64),
+                stars["y"].astype(np.int64),
+                star_size,
+                star_colors,
+            )
 
-                    # Add star trails for faster moving stars
-                    if layer >= 2 and current_distance > 100:
-                        trail_length = min(20, int(current_distance * 0.1))
-                        trail_x = star_x - trail_length * math.cos(initial_angle)
-                        trail_y = star_y - trail_length * math.sin(initial_angle)
-
-                        if 0 <= trail_x < self.width and 0 <= trail_y < self.height:
-                            trail_color = self._get_particle_color(
-                                star + layer * 1000 + 10000,
-                                base_hue,
-                                enhanced_amplitude * 0.3,
-                                current_time,
-                                gradient_style,
-                                custom_colors,
-                                particle_color_scheme,
-                                particle_gradient_style,
-                                particle_custom_colors,
-                            )
-                            cv2.line(
-                                frame,
-                                (int(trail_x), int(trail_y)),
-                                (int(star_x), int(star_y)),
-                                trail_color,
-                                1,
-                            )
+            # Add star trails for faster moving stars
+            if layer >= 2:
+                trailing = current_distance > 100
+                trail_length = np.minimum(
+                    20, (current_distance[trailing] * 0.1).astype(np.int64)
+                )
+                star_x = stars["x"][trailing]
+                star_y = stars["y"][trailing]
+                trail_x = star_x - trail_length * np.cos(initial_angle[trailing])
+                trail_y = star_y - trail_length * np.sin(initial_angle[trailing])
+
+                visible = (
+                    (trail_x >= 0)
+                    & (trail_x < self.width)
+                    & (trail_y >= 0)
+                    & (trail_y < self.height)
+                )
+                trail_colors = self._get_particle_colors(
+                    stars["id"][trailing][visible] + 10000,
+                    base_hue,
+                    enhanced_amplitude * 0.3,
+                    current_time,
+                    gradient_style,
+                    custom_colors,
+                    particle_color_scheme,
+                    particle_gradient_style,
+                    particle_custom_colors,
+                )
+                splat_lines(
+                    frame,
+                    trail_x[visible].astype(np.int64),
+                    trail_y[visible].astype(np.int64),
+                    star_x[visible].astype(np.int64),
+                    star_y[visible].astype(np.int64),
+                    trail_colors,
+                )
 
         # Add space debris/particles
         self._draw_space_debris(
@@ -5249,34 +4484,32 @@ class VerticalVideoCreator:
     ):
         """Draw space debris and floating particles."""
         debris_count = int(50 + amplitude * 100)
+        debris = new_particles(np.arange(max(debris_count, 0)))
+        debris_id = debris["id"]
 
-        for debris in range(debris_count):
-            # Debris floating in different directions
-            debris_angle = (debris * 0.17 + time * 0.3) % (2 * math.pi)
-            debris_speed = 20 + debris % 40
-
-            debris_x = int(
-                (debris * 53 + time * debris_speed) % (self.width + 100) - 50
-            )
-            debris_y = int(
-                (debris * 71 + time * debris_speed * 0.7) % (self.height + 100) - 50
-            )
-
-            if 0 <= debris_x < self.width and 0 <= debris_y < self.height:
-                debris_size = max(1, int(2 + amplitude * 5))
-                debris_color = self._get_particle_color(
-                    debris,
-                    base_hue,
-                    amplitude,
-                    time,
-                    gradient_style,
-                    custom_colors,
-                    particle_color_scheme,
-                    particle_gradient_style,
-                    particle_custom_colors,
-                )
+        # Debris floating in different directions
+        debris_speed = 20 + debris_id % 40
+        debris["x"] = np.trunc(
+            (debris_id * 53 + time * debris_speed) % (self.width + 100) - 50
+        )
+        debris["y"] = np.trunc(
+            (debris_id * 71 + time * debris_speed * 0.7) % (self.height + 100) - 50
+        )
+        debris = on_screen(debris, self.width, self.height)
 
-                cv2.circle(frame, (debris_x, debris_y), debris_size, debris_color, -1)
+        debris_size = max(1, int(2 + amplitude * 5))
+        debris_colors = self._get_particle_colors(
+            debris["id"],
+            base_hue,
+            amplitude,
+            time,
+            gradient_style,
+            custom_colors,
+            particle_color_scheme,
+            particle_gradient_style,
+            particle_custom_colors,
+        )
+        splat_circles(frame, debris["x"], debris["y"], debris_size, debris_colors)
 
     def _draw_comets(
         self,
@@ -5321,31 +4554,30 @@ class VerticalVideoCreator:
 
                     cv2.circle(frame, (comet_x, comet_y), comet_size, comet_color, -1)
 
-                    # Comet tail
+                    # Comet tail, one fading disc per segment
                     tail_length = 40 + int(amplitude * 60)
-                    for tail_seg in range(tail_length):
-                        tail_x = comet_x - tail_seg * 2
-                        tail_y = comet_y + tail_seg // 2
-
-                        if 0 <= tail_x < self.width and 0 <= tail_y < self.height:
-                            tail_color = self._get_particle_color(
-                                comet + tail_seg * 100,
-                                base_hue,
-                                amplitude * (1 - tail_seg / tail_length),
-                                time,
-                                gradient_style,
-                                custom_colors,
-                                particle_color_scheme,
-                                particle_gradient_style,
-                                particle_custom_colors,
-                            )
-                            cv2.circle(
-                                frame,
-                                (tail_x, tail_y),
-                                max(1, comet_size - tail_seg // 8),
-                                tail_color,
-                                -1,
-                            )
+                    tail_seg = np.arange(tail_length)
+                    tail = new_particles(comet + tail_seg * 100)
+                    tail["x"] = comet_x - tail_seg * 2
+                    tail["y"] = comet_y + tail_seg // 2
+                    tail["size"] = np.maximum(1, comet_size - tail_seg // 8)
+                    tail["amplitude"] = amplitude * (1 - tail_seg / tail_length)
+                    tail = on_screen(tail, self.width, self.height)
+
+                    tail_colors = self._get_particle_colors(
+                        tail["id"],
+                        base_hue,
+                        tail["amplitude"],
+                        time,
+                        gradient_style,
+                        custom_colors,
+                        particle_color_scheme,
+                        particle_gradient_style,
+                        particle_custom_colors,
+                    )
+                    splat_circles(
+                        frame, tail["x"], tail["y"], tail["size"], tail_colors
+                    )
 
     def _draw_network_web(
         self,
@@ -5366,117 +4598,87 @@ class VerticalVideoCreator:
         enhanced_amplitude = amplitude * (1 + 1.0 * np.sin(current_time * 6))
 
         # Color system
-        spectral_idx = min(
-            int(
-                current_time
-                * len(audio_features["spectral_centroids"])
-                / audio_features["duration"]
-            ),
-            len(audio_features["spectral_centroids"]) - 1,
-        )
-        spectral_value = audio_features["spectral_centroids"][spectral_idx]
+        spectral_value = audio_features["timeline"]["spectral"][
+            self._timeline_index(audio_features, current_time)
+        ]
         base_hue = int((spectral_value / 4000) * 360 + current_time * 20) % 360
 
         # LOTS of network nodes
         node_count = int(80 + enhanced_amplitude * 120)
         connection_distance = 120 + enhanced_amplitude * 80  # How far nodes can connect
 
-        # Generate node positions
-        nodes = []
-        for node in range(node_count):
-            # Nodes move slowly around the screen
-            node_phase_x = (node * 0.13 + current_time * 0.2) % (2 * math.pi)
-            node_phase_y = (node * 0.17 + current_time * 0.15) % (2 * math.pi)
-
-            base_x = (node * 37) % self.width
-            base_y = (node * 71) % self.height
-
-            # Add movement
-            movement_radius = 30 + enhanced_amplitude * 50
-            node_x = base_x + movement_radius * math.cos(node_phase_x)
-            node_y = base_y + movement_radius * math.sin(node_phase_y)
-
-            # Keep nodes on screen
-            node_x = max(20, min(self.width - 20, node_x))
-            node_y = max(20, min(self.height - 20, node_y))
-
-            nodes.append((int(node_x), int(node_y), node))
-
-        # Draw connections between nearby nodes
-        for i, (x1, y1, id1) in enumerate(nodes):
-            for j, (x2, y2, id2) in enumerate(nodes[i + 1 :], i + 1):
-                distance = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
-
-                if distance < connection_distance:
-                    # Connection strength based on distance and audio
-                    connection_strength = 1.0 - (distance / connection_distance)
-                    connection_brightness = int(
-                        100 + 155 * connection_strength * enhanced_amplitude
-                    )
+        # Generate node positions (nodes move slowly around the screen)
+        node = np.arange(node_count)
+        node_phase_x = (node * 0.13 + current_time * 0.2) % (2 * math.pi)
+        node_phase_y = (node * 0.17 + current_time * 0.15) % (2 * math.pi)
+
+        base_x = (node * 37) % self.width
+        base_y = (node * 71) % self.height
+
+        # Add movement, keeping nodes on screen
+        movement_radius = 30 + enhanced_amplitude * 50
+        node_x = np.clip(
+            base_x + movement_radius * np.cos(node_phase_x), 20, self.width - 20
+        ).astype(np.int64)
+        node_y = np.clip(
+            base_y + movement_radius * np.sin(node_phase_y), 20, self.height - 20
+        ).astype(np.int64)
+
+        # Only pairs within connection_distance, from a per-frame grid index
+        first, second, distance = neighbor_pairs(
+            np.stack([node_x, node_y], axis=1), connection_distance
+        )
 
-                    # Connection color using new scheme
-                    connection_color = self._get_particle_color(
-                        id1 + id2,
-                        base_hue,
-                        enhanced_amplitude * connection_strength,
-                        current_time,
-                        gradient_style,
-                        custom_colors,
-                        particle_color_scheme,
-                        particle_gradient_style,
-                        particle_custom_colors,
-                    )
+        # Connection strength based on distance and audio
+        connection_strength = 1.0 - (distance / connection_distance)
 
-                    # Line thickness based on connection strength
-                    line_thickness = max(
-                        1, int(1 + 3 * connection_strength * enhanced_amplitude)
-                    )
-
-                    cv2.line(
-                        frame, (x1, y1), (x2, y2), connection_color, line_thickness
-                    )
+        # Connection colors using new scheme
+        connection_colors = self._get_particle_colors(
+            first + second,
+            base_hue,
+            enhanced_amplitude * connection_strength,
+            current_time,
+            gradient_style,
+            custom_colors,
+            particle_color_scheme,
+            particle_gradient_style,
+            particle_custom_colors,
+        )
 
-                    # Add data packets moving along connections
-                    if (
-                        connection_strength > 0.7
-                        and enhanced_amplitude > 0.5
-                        and distance > 1
-                    ):
-                        packet_progress = (current_time * 100 + id1 * 50) % int(
-                            distance
-                        )
-                        packet_ratio = packet_progress / distance
-
-                        packet_x = int(x1 + (x2 - x1) * packet_ratio)
-                        packet_y = int(y1 + (y2 - y1) * packet_ratio)
-
-                        packet_color = self._get_particle_color(
-                            id1 + id2 + 10000,
-                            base_hue,
-                            enhanced_amplitude,
-                            current_time,
-                            gradient_style,
-                            custom_colors,
-                            particle_color_scheme,
-                            particle_gradient_style,
-                            particle_custom_colors,
-                        )
-                        cv2.circle(frame, (packet_x, packet_y), 3, packet_color, -1)
-
-        # Draw nodes
-        for x, y, node_id in nodes:
-            # Node size based on how many connections it has
-            node_connections = sum(
-                1
-                for x2, y2, _ in nodes
-                if math.sqrt((x2 - x) ** 2 + (y2 - y) ** 2) < connection_distance
+        # Line thickness based on connection strength
+        line_thickness = np.maximum(
+            1, np.trunc(1 + 3 * connection_strength * enhanced_amplitude)
+        ).astype(np.int64)
+
+        for x1, y1, x2, y2, color, thickness in zip(
+            node_x[first].tolist(),
+            node_y[first].tolist(),
+            node_x[second].tolist(),
+            node_y[second].tolist(),
+            connection_colors.tolist(),
+            line_thickness.tolist(),
+        ):
+            cv2.line(frame, (x1, y1), (x2, y2), color, thickness)
+
+        # Add data packets moving along strong connections
+        if enhanced_amplitude > 0.5:
+            carrying = (connection_strength > 0.7) & (distance > 1)
+            packet_first = first[carrying]
+            packet_second = second[carrying]
+            packet_distance = distance[carrying]
+
+            packet_progress = (current_time * 100 + packet_first * 50) % np.trunc(
+                packet_distance
             )
+            packet_ratio = packet_progress / packet_distance
 
-            node_size = max(3, int(4 + node_connections * 2 + enhanced_amplitude * 5))
+            x1 = node_x[packet_first]
+            y1 = node_y[packet_first]
+            packet_x = np.trunc(x1 + (node_x[packet_second] - x1) * packet_ratio)
+            packet_y = np.trunc(y1 + (node_y[packet_second] - y1) * packet_ratio)
 
-            # Node color using new scheme
-            node_color = self._get_particle_color(
-                node_id,
+            packet_colors = self._get_particle_colors(
+                packet_first + packet_second + 10000,
                 base_hue,
                 enhanced_amplitude,
                 current_time,
@@ -5486,26 +4688,60 @@ class VerticalVideoCreator:
                 particle_gradient_style,
                 particle_custom_colors,
             )
+            splat_circles(frame, packet_x, packet_y, 3, packet_colors)
 
-            cv2.circle(frame, (x, y), node_size, node_color, -1)
+        # Node size based on how many connections it has (counting itself)
+        node_connections = neighbor_counts(node_count, first, second) + 1
+        node_size = np.maximum(
+            3, np.trunc(4 + node_connections * 2 + enhanced_amplitude * 5)
+        ).astype(np.int64)
 
-            # Node pulse effect
-            if enhanced_amplitude > 0.6:
-                pulse_size = node_size + int(
-                    5 * enhanced_amplitude * math.sin(current_time * 8 + node_id)
-                )
-                pulse_color = self._get_particle_color(
-                    node_id + 5000,
-                    base_hue,
-                    enhanced_amplitude * 0.5,
-                    current_time,
-                    gradient_style,
-                    custom_colors,
-                    particle_color_scheme,
-                    particle_gradient_style,
-                    particle_custom_colors,
-                )
-                cv2.circle(frame, (x, y), pulse_size, pulse_color, 1)
+        # Node colors using new scheme
+        node_colors = self._get_particle_colors(
+            node,
+            base_hue,
+            enhanced_amplitude,
+            current_time,
+            gradient_style,
+            custom_colors,
+            particle_color_scheme,
+            particle_gradient_style,
+            particle_custom_colors,
+        )
+        # Node pulse effect
+        pulse = enhanced_amplitude > 0.6
+        pulse_size = np.maximum(
+            node_size
+            + np.trunc(5 * enhanced_amplitude * np.sin(current_time * 8 + node)).astype(
+                np.int64
+            ),
+            0,
+        )
+        pulse_colors = self._get_particle_colors(
+            node + 5000,
+            base_hue,
+            enhanced_amplitude * 0.5,
+            current_time,
+            gradient_style,
+            custom_colors,
+            particle_color_scheme,
+            particle_gradient_style,
+            particle_custom_colors,
+        )
+
+        # Nodes are large, so they stay cv2.circle calls; each pulse ring is
+        # drawn right after its node so later nodes overlap it
+        for x, y, size, color, ring, ring_color in zip(
+            node_x.tolist(),
+            node_y.tolist(),
+            node_size.tolist(),
+            node_colors.tolist(),
+            pulse_size.tolist(),
+            pulse_colors.tolist(),
+        ):
+            cv2.circle(frame, (x, y), size, color, -1)
+            if pulse:
+                cv2.circle(frame, (x, y), ring, ring_color, 1)
 
     def _draw_particle_swarm(
         self,
@@ -5526,15 +4762,9 @@ class VerticalVideoCreator:
         enhanced_amplitude = amplitude * (1 + 0.9 * np.sin(current_time * 8))
 
         # Color system
-        spectral_idx = min(
-            int(
-                current_time
-                * len(audio_features["spectral_centroids"])
-                / audio_features["duration"]
-            ),
-            len(audio_features["spectral_centroids"]) - 1,
-        )
-        spectral_value = audio_features["spectral_centroids"][spectral_idx]
+        spectral_value = audio_features["timeline"]["spectral"][
+            self._timeline_index(audio_features, current_time)
+        ]
         base_hue = int((spectral_value / 4000) * 360 + current_time * 25) % 360
 
         # MASSIVE swarm
@@ -5543,6 +4773,7 @@ class VerticalVideoCreator:
         # Multiple swarms with different behaviors
         num_swarms = 3
         swarm_size = swarm_count // num_swarms
+        particle = np.arange(max(swarm_size, 0))
 
         for swarm_id in range(num_swarms):
             # Each swarm has a different movement pattern
@@ -5557,93 +4788,91 @@ class VerticalVideoCreator:
                 current_time * 0.3 + swarm_id * 1.5
             )
 
-            # Draw particles in this swarm
-            for particle in range(swarm_size):
-                particle_id = swarm_id * swarm_size + particle
-
-                # Particle orbits around swarm center with some chaos
-                base_angle = (particle * 0.1 + current_time * swarm_speed * 0.01) % (
-                    2 * math.pi
-                )
-                chaos_angle = 0.5 * math.sin(current_time * 3 + particle * 0.2)
-                final_angle = base_angle + chaos_angle
+            particles = new_particles(swarm_id * swarm_size + particle)
 
-                # Distance from center varies
-                base_distance = swarm_radius * (
-                    0.3 + 0.7 * ((particle * 7) % 100) / 100
-                )
-                distance_variation = (
-                    enhanced_amplitude
-                    * 50
-                    * math.sin(current_time * 4 + particle * 0.3)
-                )
-                final_distance = base_distance + distance_variation
-
-                particle_x = int(center_x + final_distance * math.cos(final_angle))
-                particle_y = int(center_y + final_distance * math.sin(final_angle))
-
-                # Only draw if on screen
-                if 0 <= particle_x < self.width and 0 <= particle_y < self.height:
-                    # Particle size varies
-                    particle_size = max(
-                        1,
-                        int(
-                            2
-                            + enhanced_amplitude * 4
-                            + math.sin(particle * 0.1 + current_time * 6)
-                        ),
-                    )
+            # Particles orbit around swarm center with some chaos
+            base_angle = (particle * 0.1 + current_time * swarm_speed * 0.01) % (
+                2 * math.pi
+            )
+            chaos_angle = 0.5 * np.sin(current_time * 3 + particle * 0.2)
+            final_angle = base_angle + chaos_angle
 
-                    # Particle color using new scheme
-                    particle_color = self._get_particle_color(
-                        particle_id,
-                        base_hue,
-                        enhanced_amplitude,
-                        current_time,
-                        gradient_style,
-                        custom_colors,
-                        particle_color_scheme,
-                        particle_gradient_style,
-                        particle_custom_colors,
-                    )
+            # Distance from center varies
+            base_distance = swarm_radius * (0.3 + 0.7 * ((particle * 7) % 100) / 100)
+            distance_variation = (
+                enhanced_amplitude * 50 * np.sin(current_time * 4 + particle * 0.3)
+            )
+            final_distance = base_distance + distance_variation
+
+            particles["x"] = np.trunc(center_x + final_distance * np.cos(final_angle))
+            particles["y"] = np.trunc(center_y + final_distance * np.sin(final_angle))
+
+            # Particle size varies
+            particles["size"] = np.maximum(
+                1,
+                np.trunc(
+                    2
+                    + enhanced_amplitude * 4
+                    + np.sin(particle * 0.1 + current_time * 6)
+                ),
+            )
 
-                    cv2.circle(
-                        frame,
-                        (particle_x, particle_y),
-                        particle_size,
-                        particle_color,
-                        -1,
-                    )
+            # Only draw particles that are on screen
+            visible = (
+                (particles["x"] >= 0)
+                & (particles["x"] < self.width)
+                & (particles["y"] >= 0)
+                & (particles["y"] < self.height)
+            )
+            drawn = particles[visible]
 
-                    # Add motion trails for some particles
-                    if particle % 5 == 0:  # Every 5th particle gets a trail
-                        trail_angle = final_angle - 0.2
-                        trail_x = int(
-                            center_x + (final_distance - 20) * math.cos(trail_angle)
-                        )
-                        trail_y = int(
-                            center_y + (final_distance - 20) * math.sin(trail_angle)
-                        )
+            # Particle color using new scheme
+            colors = self._get_particle_colors(
+                drawn["id"],
+                base_hue,
+                enhanced_amplitude,
+                current_time,
+                gradient_style,
+                custom_colors,
+                particle_color_scheme,
+                particle_gradient_style,
+                particle_custom_colors,
+            )
+            splat_circles(frame, drawn["x"], drawn["y"], drawn["size"], colors)
+
+            # Add motion trails for some particles (every 5th particle)
+            trailing = visible & (particle % 5 == 0)
+            trail_angle = final_angle[trailing] - 0.2
+            trail_distance = final_distance[trailing] - 20
+            trail_x = np.trunc(center_x + trail_distance * np.cos(trail_angle))
+            trail_y = np.trunc(center_y + trail_distance * np.sin(trail_angle))
+            trail_visible = (
+                (trail_x >= 0)
+                & (trail_x < self.width)
+                & (trail_y >= 0)
+                & (trail_y < self.height)
+            )
+            heads = particles[trailing][trail_visible]
 
-                        if 0 <= trail_x < self.width and 0 <= trail_y < self.height:
-                            trail_color = self._get_particle_color(
-                                particle_id + 10000,
-                                base_hue,
-                                enhanced_amplitude * 0.5,
-                                current_time,
-                                gradient_style,
-                                custom_colors,
-                                particle_color_scheme,
-                                particle_gradient_style,
-                                particle_custom_colors,
-                            )
-                            cv2.line(
-                                frame,
-                                (trail_x, trail_y),
-                                (particle_x, particle_y),
-                                trail_color,
-                                1,
-                            )
+            trail_colors = self._get_particle_colors(
+                heads["id"] + 10000,
+                base_hue,
+                enhanced_amplitude * 0.5,
+                current_time,
+                gradient_style,
+                custom_colors,
+                particle_color_scheme,
+                particle_gradient_style,
+                particle_custom_colors,
+            )
+            splat_lines(
+                frame,
+                trail_x[trail_visible],
+                trail_y[trail_visible],
+                heads["x"],
+                heads["y"],
+                trail_colors,
+            )
 
         # Add inter-swarm connections
         self._draw_swarm_connections(
@@ -5653,36 +4882,30 @@ class VerticalVideoCreator:
     def _draw_swarm_connections(self, frame, amplitude, time, base_hue, num_swarms):
         """Draw connections between different swarms."""
         if amplitude > 0.7:  # Only when audio is strong
-            for swarm1 in range(num_swarms):
-                for swarm2 in range(swarm1 + 1, num_swarms):
-                    # Connection between swarm centers
-                    center1_x = self.width // 2 + 200 * math.cos(
-                        time * 0.5 + swarm1 * 2
-                    )
-                    center1_y = self.height // 2 + 100 * math.sin(
-                        time * 0.3 + swarm1 * 1.5
-                    )
-
-                    center2_x = self.width // 2 + 200 * math.cos(
-                        time * 0.5 + swarm2 * 2
-                    )
-                    center2_y = self.height // 2 + 100 * math.sin(
-                        time * 0.3 + swarm2 * 1.5
-                    )
-
-                    # Energy beam between swarms
-                    beam_hue = (base_hue + (swarm1 + swarm2) * 40) % 360
-                    beam_color = self._hsv_to_bgr(
-                        beam_hue, 255, int(100 + 100 * amplitude)
-                    )
-
-                    cv2.line(
-                        frame,
-                        (int(center1_x), int(center1_y)),
-                        (int(center2_x), int(center2_y)),
-                        beam_color,
-                        2,
-                    )
+            # Swarm centers, computed once instead of per pair
+            swarm = np.arange(num_swarms)
+            center_x = (self.width // 2 + 200 * np.cos(time * 0.5 + swarm * 2)).astype(
+                np.int64
+            )
+            center_y = (
+                self.height // 2 + 100 * np.sin(time * 0.3 + swarm * 1.5)
+            ).astype(np.int64)
+
+            # Energy beam between every pair of swarms
+            swarm1, swarm2 = np.triu_indices(num_swarms, k=1)
+            beam_hue = (base_hue + (swarm1 + swarm2) * 40) % 360
+            beam_colors = hsv_to_bgr(beam_hue, 255, int(100 + 100 * amplitude))
+
+            for s1, s2, color in zip(
+                swarm1.tolist(), swarm2.tolist(), beam_colors.tolist()
+            ):
+                cv2.line(
+                    frame,
+                    (int(center_x[s1]), int(center_y[s1])),
+                    (int(center_x[s2]), int(center_y[s2])),
+                    color,
+                    2,
+                )
 
     def _draw_fireworks_explosion(
         self,
@@ -5703,20 +4926,21 @@ class VerticalVideoCreator:
         enhanced_amplitude = amplitude * (1 + 1.1 * np.sin(current_time * 9))
 
         # Color system
-        spectral_idx = min(
-            int(
-                current_time
-                * len(audio_features["spectral_centroids"])
-                / audio_features["duration"]
-            ),
-            len(audio_features["spectral_centroids"]) - 1,
-        )
-        spectral_value = audio_features["spectral_centroids"][spectral_idx]
+        spectral_value = audio_features["timeline"]["spectral"][
+            self._timeline_index(audio_features, current_time)
+        ]
         base_hue = int((spectral_value / 4000) * 360 + current_time * 30) % 360
 
         # Multiple simultaneous fireworks
         num_fireworks = int(4 + enhanced_amplitude * 8)
 
+        # LOTS of explosion particles
+        particles_per_firework = int(80 + enhanced_amplitude * 120)
+        particle = np.arange(max(particles_per_firework, 0))
+
+        # Particle direction and speed (random but consistent)
+        particle_speed = 0.5 + (particle % 10) * 0.1
+
         for firework_id in range(num_fireworks):
             # Each firework has its own lifecycle (3 second cycle)
             firework_cycle = 3
@@ -5738,70 +4962,55 @@ class VerticalVideoCreator:
                     150 * explosion_age * (1 + enhanced_amplitude * 0.5)
                 )
 
-                # LOTS of explosion particles
-                particles_per_firework = int(80 + enhanced_amplitude * 120)
-
-                for particle in range(particles_per_firework):
-                    # Particle direction (random but consistent)
-                    particle_angle = (particle * 0.1 + firework_id * 2) % (2 * math.pi)
-
-                    # Particle speed varies
-                    particle_speed = 0.5 + (particle % 10) * 0.1
-
-                    # Current particle position
-                    particle_distance = explosion_radius * particle_speed
-                    particle_x = int(
-                        fw_x + particle_distance * math.cos(particle_angle)
-                    )
-                    particle_y = int(
-                        fw_y
-                        + particle_distance * math.sin(particle_angle)
-                        + explosion_age * 50
-                    )  # Gravity
-
-                    if 0 <= particle_x < self.width and 0 <= particle_y < self.height:
-                        # Particle fades as explosion ages
-                        particle_brightness = int(
-                            255 * (1 - explosion_age) * (0.5 + 0.5 * enhanced_amplitude)
-                        )
+                particles = new_particles(firework_id * 1000 + particle)
+                particle_angle = (particle * 0.1 + firework_id * 2) % (2 * math.pi)
 
-                        # Particle color using new scheme
-                        particle_color = self._get_particle_color(
-                            firework_id * 1000 + particle,
-                            base_hue,
-                            enhanced_amplitude,
-                            current_time,
-                            gradient_style,
-                            custom_colors,
-                            particle_color_scheme,
-                            particle_gradient_style,
-                            particle_custom_colors,
-                        )
+                # Current particle position (with gravity)
+                particle_distance = explosion_radius * particle_speed
+                particles["x"] = np.trunc(
+                    fw_x + particle_distance * np.cos(particle_angle)
+                )
+                particles["y"] = np.trunc(
+                    fw_y
+                    + particle_distance * np.sin(particle_angle)
+                    + explosion_age * 50
+                )
 
-                        # Particle size decreases over time
-                        particle_size = max(
-                            1, int(4 * (1 - explosion_age) + enhanced_amplitude * 3)
-                        )
+                # Particle size decreases over time
+                particles["size"] = max(
+                    1, int(4 * (1 - explosion_age) + enhanced_amplitude * 3)
+                )
+                particles = on_screen(particles, self.width, self.height)
 
-                        cv2.circle(
-                            frame,
-                            (particle_x, particle_y),
-                            particle_size,
-                            particle_color,
-                            -1,
-                        )
+                # Particle color using new scheme
+                colors = self._get_particle_colors(
+                    particles["id"],
+                    base_hue,
+                    enhanced_amplitude,
+                    current_time,
+                    gradient_style,
+                    custom_colors,
+                    particle_color_scheme,
+                    particle_gradient_style,
+                    particle_custom_colors,
+                )
+                splat_circles(
+                    frame, particles["x"], particles["y"], particles["size"], colors
+                )
 
-                        # Add sparkle effect to some particles
-                        if particle % 8 == 0 and explosion_age < 0.5:
-                            sparkle_size = particle_size + 2
-                            sparkle_color = (255, 255, 255)
-                            cv2.circle(
-                                frame,
-                                (particle_x, particle_y),
-                                sparkle_size,
-                                sparkle_color,
-                                1,
-                            )
+                # Add sparkle effect to some particles
+                if explosion_age < 0.5:
+                    sparkles = particles[
+                        (particles["id"] - firework_id * 1000) % 8 == 0
+                    ]
+                    splat_circles(
+                        frame,
+                        sparkles["x"],
+                        sparkles["y"],
+                        sparkles["size"] + 2,
+                        (255, 255, 255),
+                        thickness=1,
+                    )
 
                 # Central explosion flash
                 if explosion_age < 0.3:
@@ -5842,30 +5051,31 @@ class VerticalVideoCreator:
     ):
         """Draw floating embers and sparkles in the background."""
         ember_count = int(50 + amplitude * 100)
+        embers = new_particles(np.arange(max(ember_count, 0)))
+        ember = embers["id"]
 
-        for ember in range(ember_count):
-            # Embers float down slowly
-            ember_x = int((ember * 43 + time * 20) % self.width)
-            ember_y = int((ember * 67 + time * 30) % self.height)
+        # Embers float down slowly
+        embers["x"] = np.trunc((ember * 43 + time * 20) % self.width)
+        embers["y"] = np.trunc((ember * 67 + time * 30) % self.height)
 
-            # Ember flicker
-            flicker = 0.5 + 0.5 * math.sin(time * 10 + ember * 0.5)
+        # Ember flicker
+        flicker = 0.5 + 0.5 * np.sin(time * 10 + ember * 0.5)
+        embers["amplitude"] = amplitude * flicker
+        embers["size"] = np.maximum(1, np.trunc(1 + amplitude * 3 * flicker))
 
-            # Ember color using new scheme
-            ember_color = self._get_particle_color(
-                ember,
-                base_hue,
-                amplitude * flicker,
-                time,
-                gradient_style,
-                custom_colors,
-                particle_color_scheme,
-                particle_gradient_style,
-                particle_custom_colors,
-            )
-
-            ember_size = max(1, int(1 + amplitude * 3 * flicker))
-            cv2.circle(frame, (ember_x, ember_y), ember_size, ember_color, -1)
+        # Ember color using new scheme
+        ember_colors = self._get_particle_colors(
+            ember,
+            base_hue,
+            embers["amplitude"],
+            time,
+            gradient_style,
+            custom_colors,
+            particle_color_scheme,
+            particle_gradient_style,
+            particle_custom_colors,
+        )
+        splat_circles(frame, embers["x"], embers["y"], embers["size"], ember_colors)
 
     def create_video(
         self,
@@ -5881,53 +5091,82 @@ class VerticalVideoCreator:
         particle_color_scheme: str = "multicolor",
         particle_gradient_style: str = None,
         particle_custom_colors: list = None,
+        workers: int = 1,
+        output_backend: str = "ffmpeg",
+        encoder_preset: str = "medium",
+        crf: int = 23,
+        encoder_threads: int = 0,
+        feature_cache: bool = True,
+        background_scale: float = 1.0,
+        proxy_scale: float = None,
+        render_report: bool = False,
+        background_cache: bool = True,
     ) -> bool:
         """Create vertical video with waveform animation.
 
         Args:
             preview_duration: If provided, limits video to this duration in seconds for preview mode
+            workers: Number of render processes. With more than one, the timeline is
+                split into frame ranges that are rendered and encoded in parallel and
+                then joined losslessly. Use 0 to use all available cores.
+            output_backend: "ffmpeg" streams raw frames into ffmpeg, which encodes
+                H.264 and muxes the audio in a single pass. "opencv" writes an mp4v
+                temp file with cv2.VideoWriter and re-encodes it afterwards.
+            encoder_preset: libx264 preset (ultrafast ... veryslow)
+            crf: libx264 constant rate factor (lower is better quality)
+            encoder_threads: libx264 threads (0 lets ffmpeg decide)
+            feature_cache: Reuse cached audio analysis stored next to the audio
+            background_scale: Resolution scale (0-1] the dynamic background is
+                computed at before being upscaled to the output size
+            proxy_scale: If provided, render a quick draft instead: frames are
+                sampled at ``PROXY_FPS``, the dynamic background is computed at
+                (at most) this scale, and the video is encoded at this fraction
+                of the output size with the ``PROXY_ENCODER_PRESET`` preset.
+                Styles are drawn by the same code at the full frame geometry,
+                so the draft shows the final composition.
+            render_report: Time every render stage and write p50/p95/max per
+                stage, the effective fps and the wall time to a JSON report
+                next to the output (``<name>.render.json``)
+            background_cache: Reuse the prepared static background stored in
+                ``self.background_cache_dir`` for the same size and settings
         """
         try:
             print("🎬 Starting video creation...")
+            self.stats = RenderStats() if render_report else None
+
+            # Local to this render, so a proxy doesn't change later renders
+            fps = self.fps
+            encode_size = (self.width, self.height)
+            if proxy_scale is not None:
+                fps = PROXY_FPS
+                background_scale = min(background_scale, proxy_scale)
+                encoder_preset = PROXY_ENCODER_PRESET
+                encode_size = proxy_size(self.width, self.height, proxy_scale)
+                print(
+                    f"🧪 Proxy render: {encode_size[0]}x{encode_size[1]} "
+                    f"at {fps} fps ({encoder_preset})"
+                )
 
-            # Get background image
             # Prepare background - static or dynamic
-            bg_image = None
-            bg_path = None
-            use_dynamic_bg = dynamic_background != "none"
-
-            if use_dynamic_bg:
+            if dynamic_background != "none":
                 print(f"🌊 Using dynamic background: {dynamic_background}")
                 # Create a dummy background for the first frame
                 bg_image = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-                bg_path = None
             else:
-                if no_unsplash:
-                    print(f"🌈 Using gradient background: {gradient_style}...")
-                    bg_path = self.create_fallback_background(
-                        gradient_style, custom_colors
+                with self._stage("background_image"):
+                    bg_image = self.get_static_background(
+                        gradient_style,
+                        custom_colors,
+                        no_unsplash,
+                        background_keywords,
+                        use_cache=background_cache,
                     )
-                else:
-                    print("🖼️  Downloading background image...")
-                    bg_path = self.get_random_unsplash_image(background_keywords)
-                    if not bg_path:
-                        print(f"📸 Using gradient background: {gradient_style}...")
-                        bg_path = self.create_fallback_background(
-                            gradient_style, custom_colors
-                        )
-
-                # Load and resize background
-                bg_image = cv2.imread(str(bg_path))
-                bg_image = cv2.resize(bg_image, (self.width, self.height))
-
-                # Add slight blur and darken for better contrast
-                bg_image = cv2.GaussianBlur(bg_image, (15, 15), 0)
-                bg_image = cv2.addWeighted(
-                    bg_image, 0.7, np.zeros_like(bg_image), 0.3, 0
-                )
 
             print("🎵 Extracting audio features...")
-            audio_features = self.extract_audio_features(audio_path, preview_duration)
+            with self._stage("features"):
+                audio_features = self.extract_audio_features(
+                    audio_path, preview_duration, use_cache=feature_cache, fps=fps
+                )
 
             if not audio_features:
                 print("❌ Failed to extract audio features")
@@ -5941,73 +5180,288 @@ class VerticalVideoCreator:
                 duration = preview_duration
                 print(f"🎞️  Preview mode: limiting to {preview_duration} seconds")
 
-            total_frames = int(duration * self.fps)
+            total_frames = int(duration * fps)
 
             print(f"🎥 Creating video: {duration:.1f}s, {total_frames} frames")
 
-            # Create temporary video file
-            temp_video = tempfile.NamedTemporaryFile(suffix=".mp4", delete=False)
-            temp_video_path = temp_video.name
-            temp_video.close()
-
-            # Initialize video writer
-            fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-            out = cv2.VideoWriter(
-                temp_video_path, fourcc, self.fps, (self.width, self.height)
-            )
-
-            # Generate frames
-            for frame_idx in range(total_frames):
-                if frame_idx % 30 == 0:  # Progress every second
-                    print(
-                        f"🎬 Progress: {frame_idx}/{total_frames} frames ({frame_idx/total_frames*100:.1f}%)"
-                    )
+            if workers == 0:
+                workers = os.cpu_count() or 1
+
+            render_options = {
+                "waveform_style": waveform_style,
+                "dynamic_background": dynamic_background,
+                "background_scale": background_scale,
+                "gradient_style": gradient_style,
+                "custom_colors": custom_colors,
+                "particle_color_scheme": particle_color_scheme,
+                "particle_gradient_style": particle_gradient_style,
+                "particle_custom_colors": particle_custom_colors,
+                # Without render processes, fractal tiles can use every core
+                "fractal_threads": 1 if workers > 1 else (os.cpu_count() or 1),
+            }
 
-                # Generate dynamic background if needed
-                current_bg = bg_image
-                if use_dynamic_bg:
-                    # Calculate current time and amplitude for dynamic background
-                    current_time = (frame_idx / total_frames) * duration
-                    rms_idx = min(
-                        int(
-                            current_time
-                            * len(audio_features["rms"])
-                            / audio_features["duration"]
-                        ),
-                        len(audio_features["rms"]) - 1,
-                    )
-                    current_amplitude = audio_features["rms"][rms_idx]
-                    max_amplitude = np.max(audio_features["rms"])
-                    normalized_amplitude = (
-                        current_amplitude / max_amplitude if max_amplitude > 0 else 0
-                    )
+            encoder_options = {
+                "backend": output_backend,
+                "size": encode_size,
+                "fps": fps,
+                "preset": encoder_preset,
+                "crf": crf,
+                "threads": encoder_threads,
+            }
 
-                    current_bg = self.create_dynamic_background(
-                        dynamic_background,
-                        normalized_amplitude,
-                        current_time,
-                        frame_idx,
-                        total_frames,
-                        gradient_style,
-                        custom_colors,
-                    )
+            if self.stats is not None:
+                self.stats.begin_frames(total_frames)
 
-                frame = self.create_waveform_frame(
-                    current_bg,
+            if workers > 1 and total_frames > fps:
+                print(f"⚡ Parallel render with {workers} workers")
+                if not self._render_frames_parallel(
+                    output_path,
+                    audio_path,
+                    total_frames,
+                    duration,
+                    bg_image,
                     audio_features,
-                    frame_idx,
+                    render_options,
+                    encoder_options,
+                    workers,
+                ):
+                    return False
+            elif output_backend == "ffmpeg":
+                # Encode and mux the audio while frames are being rendered
+                self._render_frames_to_file(
+                    output_path,
+                    0,
                     total_frames,
-                    style=waveform_style,
-                    gradient_style=gradient_style,
-                    custom_colors=custom_colors,
-                    particle_color_scheme=particle_color_scheme,
-                    particle_gradient_style=particle_gradient_style,
-                    particle_custom_colors=particle_custom_colors,
+                    total_frames,
+                    duration,
+                    bg_image,
+                    audio_features,
+                    render_options,
+                    encoder_options,
+                    audio_path=audio_path,
+                )
+            elif not self._render_with_opencv(
+                output_path,
+                audio_path,
+                total_frames,
+                duration,
+                bg_image,
+                audio_features,
+                render_options,
+                encoder_options,
+            ):
+                return False
+
+            if self.stats is not None:
+                report_path = self.stats.write_report(
+                    render_report_path(output_path),
+                    output=output_path,
+                    orientation=self.orientation,
+                    waveform_style=waveform_style,
+                    dynamic_background=dynamic_background,
+                    fps=fps,
+                    total_frames=total_frames,
+                    duration=duration,
+                    workers=workers,
+                    encoder=encoder_options,
+                )
+                print(f"📊 Render report: {report_path}")
+
+            print(f"✅ Video created successfully: {output_path}")
+            return True
+
+        except Exception as e:
+            print(f"❌ Error creating video: {e}")
+            return False
+
+    def create_styles(
+        self, render_options: dict, total_frames: int, duration: float
+    ) -> tuple:
+        """Set up the ``(background, waveform)`` style renderers of one render.
+
+        The background renderer is None when a static image is used.
+        """
+        return (
+            create_background_style(self, render_options, total_frames, duration),
+            create_waveform_style(self, render_options, total_frames, duration),
+        )
+
+    def _render_frame(
+        self,
+        frame_idx: int,
+        styles: tuple,
+        bg_image: np.ndarray,
+        audio_features: dict,
+        out: np.ndarray = None,
+    ) -> np.ndarray:
+        """Render a single output frame (background plus waveform) into ``out``."""
+        frame = out
+        if frame is None:
+            frame = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        self._render_background(frame_idx, styles, bg_image, audio_features, frame)
+        styles[1].render(frame_idx, audio_features, frame)
+        return frame
+
+    def _render_background(
+        self,
+        frame_idx: int,
+        styles: tuple,
+        bg_image: np.ndarray,
+        audio_features: dict,
+        out: np.ndarray,
+    ):
+        """Write one frame's background (static image or dynamic) into ``out``."""
+        background = styles[0]
+        if background is None:
+            np.copyto(out, bg_image)
+        else:
+            background.render(frame_idx, audio_features, out)
+
+    def _render_frames_to_file(
+        self,
+        video_path: Path,
+        start_frame: int,
+        end_frame: int,
+        total_frames: int,
+        duration: float,
+        bg_image: np.ndarray,
+        audio_features: dict,
+        render_options: dict,
+        encoder_options: dict,
+        audio_path: Path = None,
+        show_progress: bool = True,
+    ):
+        """Render frames [start_frame, end_frame) into a video file.
+
+        With the ffmpeg backend the frames are encoded to H.264 as they are
+        rendered and ``audio_path`` (if given) is muxed in the same pass.
+        """
+        styles = self.create_styles(render_options, total_frames, duration)
+        out = self._open_frame_writer(video_path, encoder_options, audio_path)
+        frames = FramePool((self.height, self.width, 3))
+        encoded = self._encode_buffer(encoder_options)
+
+        def render_background(frame_idx: int) -> tuple:
+            frame = frames.acquire()
+            with self._stage("background"):
+                self._render_background(
+                    frame_idx, styles, bg_image, audio_features, frame
+                )
+            return frame_idx, frame
+
+        def render_waveform(job: tuple) -> np.ndarray:
+            frame_idx, frame = job
+            if show_progress and frame_idx % 30 == 0:  # Progress every second
+                timing = f", {self.stats.progress_text()}" if self.stats else ""
+                print(
+                    f"🎬 Progress: {frame_idx}/{total_frames} frames ({frame_idx/total_frames*100:.1f}%){timing}"
                 )
-                out.write(frame)
+            with self._stage("foreground"):
+                styles[1].render(frame_idx, audio_features, frame)
+            return frame
+
+        def write_frame(frame: np.ndarray):
+            with self._stage("write"):
+                out.write(self._to_encode_size(frame, encoded))
+            frames.release(frame)
+            if self.stats is not None:
+                self.stats.frames_written()
 
+        try:
+            frame_indices = range(start_frame, end_frame)
+            if self.pipeline_depth > 0:
+                # Background, waveform and encoder write overlap on threads
+                run_pipeline(
+                    frame_indices,
+                    [render_background, render_waveform, write_frame],
+                    depth=self.pipeline_depth,
+                )
+            else:
+                for frame_idx in frame_indices:
+                    write_frame(render_waveform(render_background(frame_idx)))
+        except BaseException:
+            # Still reap the encoder, but don't let its failure (ffmpeg exits
+            # non-zero on a truncated stream) replace the original error
+            try:
+                out.release()
+            except Exception as e:
+                print(f"⚠️  Encoder cleanup failed for {video_path}: {e}")
+            raise
+        finally:
+            self._close_fractal_pool()
+
+        # Waits for the encoder (and the audio mux, if any) to finish
+        with self._stage("encoder_flush"):
             out.release()
 
+    def _encode_buffer(self, encoder_options: dict) -> Optional[np.ndarray]:
+        """Buffer for frames downscaled to the encoded size (None if not needed)."""
+        width, height = encoder_options["size"]
+        if (width, height) == (self.width, self.height):
+            return None
+        return np.empty((height, width, 3), dtype=np.uint8)
+
+    @staticmethod
+    def _to_encode_size(frame: np.ndarray, encoded: np.ndarray) -> np.ndarray:
+        """``frame`` downscaled into ``encoded``, or as is without a buffer."""
+        if encoded is None:
+            return frame
+        return cv2.resize(
+            frame, encoded.shape[1::-1], dst=encoded, interpolation=cv2.INTER_AREA
+        )
+
+    def _open_frame_writer(
+        self, video_path: Path, encoder_options: dict, audio_path: Path = None
+    ):
+        """Open a frame sink for the configured output backend."""
+        width, height = encoder_options["size"]
+        if encoder_options["backend"] == "ffmpeg":
+            return FFmpegPipeWriter(
+                video_path,
+                width,
+                height,
+                encoder_options["fps"],
+                audio_path=audio_path,
+                preset=encoder_options["preset"],
+                crf=encoder_options["crf"],
+                threads=encoder_options["threads"],
+            )
+
+        fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+        return cv2.VideoWriter(
+            str(video_path), fourcc, encoder_options["fps"], (width, height)
+        )
+
+    def _render_with_opencv(
+        self,
+        output_path: Path,
+        audio_path: Path,
+        total_frames: int,
+        duration: float,
+        bg_image: np.ndarray,
+        audio_features: dict,
+        render_options: dict,
+        encoder_options: dict,
+    ) -> bool:
+        """Render to an mp4v temp file, then re-encode to H.264 with the audio."""
+        # Create temporary video file
+        temp_video = tempfile.NamedTemporaryFile(suffix=".mp4", delete=False)
+        temp_video_path = temp_video.name
+        temp_video.close()
+
+        try:
+            self._render_frames_to_file(
+                Path(temp_video_path),
+                0,
+                total_frames,
+                total_frames,
+                duration,
+                bg_image,
+                audio_features,
+                render_options,
+                encoder_options,
+            )
+
             print("🎵 Adding audio to video...")
             # Use ffmpeg to add audio
             cmd = [
@@ -6019,6 +5473,12 @@ class VerticalVideoCreator:
                 str(audio_path),
                 "-c:v",
                 "libx264",
+                "-preset",
+                encoder_options["preset"],
+                "-crf",
+                str(encoder_options["crf"]),
+                "-threads",
+                str(encoder_options["threads"]),
                 "-c:a",
                 "aac",
                 "-strict",
@@ -6027,24 +5487,218 @@ class VerticalVideoCreator:
                 str(output_path),
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            with self._stage("mux"):
+                result = subprocess.run(cmd, capture_output=True, text=True)
 
             if result.returncode != 0:
                 print(f"❌ FFmpeg error: {result.stderr}")
                 return False
 
-            # Cleanup
+            return True
+        finally:
             os.unlink(temp_video_path)
-            if bg_path and bg_path.exists():
-                os.unlink(bg_path)
 
-            print(f"✅ Video created successfully: {output_path}")
-            return True
+    def _render_frames_parallel(
+        self,
+        output_path: Path,
+        audio_path: Path,
+        total_frames: int,
+        duration: float,
+        bg_image: np.ndarray,
+        audio_features: dict,
+        render_options: dict,
+        encoder_options: dict,
+        workers: int,
+    ) -> bool:
+        """Render the timeline as independent segments in a process pool.
 
-        except Exception as e:
-            print(f"❌ Error creating video: {e}")
+        Frames are pure functions of ``frame_idx`` and the audio features, so each
+        worker renders and encodes its own frame range. The encoded segments are
+        joined with ffmpeg's concat demuxer, which also muxes in the audio.
+        """
+        # Keep segment boundaries on whole seconds so styles that keep state
+        # across frames render exactly as in a sequential pass
+        fps = encoder_options["fps"]
+        frame_ranges = _split_frame_ranges(total_frames, workers * 4, fps)
+
+        segment_dir = Path(tempfile.mkdtemp(prefix="voice_papers_segments_"))
+        try:
+            segment_paths = [
+                segment_dir / f"segment_{i:04d}.mp4" for i in range(len(frame_ranges))
+            ]
+
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_segment_worker,
+                initargs=(
+                    self.orientation,
+                    fps,
+                    total_frames,
+                    duration,
+                    bg_image,
+                    audio_features,
+                    render_options,
+                    encoder_options,
+                    self.stats is not None,
+                ),
+            ) as pool:
+                futures = {
+                    pool.submit(_render_segment, str(path), start, end): end - start
+                    for path, (start, end) in zip(segment_paths, frame_ranges)
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    _, segment_stats = future.result()
+                    timing = ""
+                    if self.stats is not None:
+                        # Per-frame stages were timed inside the workers
+                        self.stats.merge(segment_stats)
+                        self.stats.frames_written(futures[future])
+                        timing = f", {self.stats.progress_text()}"
+                    print(
+                        f"🎬 Progress: {done}/{len(futures)} segments ({done/len(futures)*100:.1f}%){timing}"
+                    )
+
+            print("🎵 Joining segments and adding audio...")
+            return self._concat_segments(
+                segment_paths, output_path, audio_path, encoder_options
+            )
+        finally:
+            shutil.rmtree(segment_dir, ignore_errors=True)
+
+    def _concat_segments(
+        self,
+        segment_paths: list,
+        output_path: Path,
+        audio_path: Path,
+        encoder_options: dict,
+    ) -> bool:
+        """Join encoded segments with ffmpeg's concat demuxer and add the audio.
+
+        H.264 segments from the ffmpeg backend are copied without re-encoding;
+        mp4v segments from the opencv backend are encoded to H.264 here.
+        """
+        list_path = segment_paths[0].parent / "segments.txt"
+        with open(list_path, "w") as f:
+            for segment_path in segment_paths:
+                f.write(f"file '{segment_path}'\n")
+
+        cmd = [
+            "ffmpeg",
+            "-y",
+            "-f",
+            "concat",
+            "-safe",
+            "0",
+            "-i",
+            str(list_path),
+            "-i",
+            str(audio_path),
+            "-map",
+            "0:v",
+            "-map",
+            "1:a",
+        ]
+        if encoder_options["backend"] == "ffmpeg":
+            cmd += ["-c:v", "copy"]
+        else:
+            cmd += [
+                "-c:v",
+                "libx264",
+                "-preset",
+                encoder_options["preset"],
+                "-crf",
+                str(encoder_options["crf"]),
+                "-threads",
+                str(encoder_options["threads"]),
+            ]
+        cmd += ["-c:a", "aac", "-shortest", str(output_path)]
+        with self._stage("mux"):
+            result = subprocess.run(cmd, capture_output=True, text=True)
+
+        if result.returncode != 0:
+            print(f"❌ FFmpeg concat error: {result.stderr}")
             return False
 
+        return True
+
+
+# Per-process render state for parallel segment rendering
+_segment_context = {}
+
+
+def _split_frame_ranges(total_frames: int, num_segments: int, align: int) -> list:
+    """Split [0, total_frames) into contiguous ranges aligned to ``align`` frames."""
+    blocks = max(1, math.ceil(total_frames / align))
+    num_segments = max(1, min(num_segments, blocks))
+    blocks_per_segment = math.ceil(blocks / num_segments)
+
+    ranges = []
+    for start_block in range(0, blocks, blocks_per_segment):
+        start = start_block * align
+        end = min(total_frames, (start_block + blocks_per_segment) * align)
+        ranges.append((start, end))
+    return ranges
+
+
+def proxy_size(width: int, height: int, scale: float) -> tuple:
+    """Encoded size of a proxy render (even sides, as yuv420p requires)."""
+    proxy_width, proxy_height = scaled_size(width, height, scale)
+    return max(2, proxy_width // 2 * 2), max(2, proxy_height // 2 * 2)
+
+
+def _init_segment_worker(
+    orientation,
+    fps,
+    total_frames,
+    duration,
+    bg_image,
+    audio_features,
+    render_options,
+    encoder_options,
+    collect_stats=False,
+):
+    """Initialize a render worker process with the state shared by all segments."""
+    # Parallelism comes from the process pool, avoid oversubscribing cores
+    cv2.setNumThreads(1)
+
+    creator = VerticalVideoCreator(orientation=orientation)
+    creator.fps = fps
+    creator.pipeline_depth = 0
+    _segment_context.update(
+        creator=creator,
+        total_frames=total_frames,
+        duration=duration,
+        bg_image=bg_image,
+        audio_features=audio_features,
+        render_options=render_options,
+        encoder_options=encoder_options,
+        collect_stats=collect_stats,
+    )
+
+
+def _render_segment(segment_path: str, start_frame: int, end_frame: int) -> tuple:
+    """Render one frame range inside a worker process.
+
+    Returns:
+        ``(segment_path, stats)``; ``stats`` holds the segment's stage timings
+        when the render collects them and is None otherwise.
+    """
+    ctx = _segment_context
+    ctx["creator"].stats = RenderStats() if ctx["collect_stats"] else None
+    ctx["creator"]._render_frames_to_file(
+        Path(segment_path),
+        start_frame,
+        end_frame,
+        ctx["total_frames"],
+        ctx["duration"],
+        ctx["bg_image"],
+        ctx["audio_features"],
+        ctx["render_options"],
+        ctx["encoder_options"],
+        show_progress=False,
+    )
+    return segment_path, ctx["creator"].stats
+
 
 def create_vertical_video(
     audio_path: Path,
@@ -6060,6 +5714,16 @@ def create_vertical_video(
     particle_color_scheme: str = "multicolor",
     particle_gradient_style: str = None,
     particle_custom_colors: list = None,
+    workers: int = 1,
+    output_backend: str = "ffmpeg",
+    encoder_preset: str = "medium",
+    crf: int = 23,
+    encoder_threads: int = 0,
+    feature_cache: bool = True,
+    background_scale: float = 1.0,
+    proxy_scale: float = None,
+    render_report: bool = False,
+    background_cache: bool = True,
 ) -> bool:
     """Convenience function to create vertical or horizontal video.
 
@@ -6105,6 +5769,18 @@ def create_vertical_video(
             - "dissonant": Contrasting/clashing colors
             - "triadic": Triadic complementary color scheme
             - "monochrome": All particles use exact background gradient colors
+        workers: Number of parallel render processes (0 uses all cores)
+        output_backend: "ffmpeg" (single-pass pipe encode) or "opencv" (legacy temp file)
+        encoder_preset: libx264 preset used for the final encode
+        crf: libx264 constant rate factor
+        encoder_threads: libx264 threads (0 lets ffmpeg decide)
+        feature_cache: Reuse cached audio analysis stored next to the audio
+        background_scale: Resolution scale of the dynamic background (1.0 = full)
+        proxy_scale: Render a fast low-resolution draft at this fraction of the
+            output size (None for the final render)
+        render_report: Write per-stage timings to ``<output>.render.json``
+        background_cache: Reuse cached static backgrounds (see
+            ``background_cache``)
     """
     creator = VerticalVideoCreator(orientation=orientation)
     return creator.create_video(
@@ -6120,6 +5796,16 @@ def create_vertical_video(
         particle_color_scheme,
         particle_gradient_style,
         particle_custom_colors,
+        workers,
+        output_backend,
+        encoder_preset,
+        crf,
+        encoder_threads,
+        feature_cache,
+        background_scale,
+        proxy_scale,
+        render_report,
+        background_cache,
     )
 
 
@@ -6136,6 +5822,16 @@ def create_horizontal_video(
     particle_color_scheme: str = "multicolor",
     particle_gradient_style: str = None,
     particle_custom_colors: list = None,
+    workers: int = 1,
+    output_backend: str = "ffmpeg",
+    encoder_preset: str = "medium",
+    crf: int = 23,
+    encoder_threads: int = 0,
+    feature_cache: bool = True,
+    background_scale: float = 1.0,
+    proxy_scale: float = None,
+    render_report: bool = False,
+    background_cache: bool = True,
 ) -> bool:
     """Convenience function to create horizontal video (1920x1080).
 
@@ -6183,6 +5879,18 @@ def create_horizontal_video(
             - "monochrome": All particles use exact background gradient colors
         particle_gradient_style: Specific gradient style for particles (overrides gradient_style)
         particle_custom_colors: Custom colors specific for particles (overrides custom_colors)
+        workers: Number of parallel render processes (0 uses all cores)
+        output_backend: "ffmpeg" (single-pass pipe encode) or "opencv" (legacy temp file)
+        encoder_preset: libx264 preset used for the final encode
+        crf: libx264 constant rate factor
+        encoder_threads: libx264 threads (0 lets ffmpeg decide)
+        feature_cache: Reuse cached audio analysis stored next to the audio
+        background_scale: Resolution scale of the dynamic background (1.0 = full)
+        proxy_scale: Render a fast low-resolution draft at this fraction of the
+            output size (None for the final render)
+        render_report: Write per-stage timings to ``<output>.render.json``
+        background_cache: Reuse cached static backgrounds (see
+            ``background_cache``)
     """
     return create_vertical_video(
         audio_path,
@@ -6198,4 +5906,269 @@ def create_horizontal_video(
         particle_color_scheme=particle_color_scheme,
         particle_gradient_style=particle_gradient_style,
         particle_custom_colors=particle_custom_colors,
+        workers=workers,
+        output_backend=output_backend,
+        encoder_preset=encoder_preset,
+        crf=crf,
+        encoder_threads=encoder_threads,
+        feature_cache=feature_cache,
+        background_scale=background_scale,
+        proxy_scale=proxy_scale,
+        render_report=render_report,
+        background_cache=background_cache,
+    )
+
+
+# Per-output settings of create_videos() and their defaults
+OUTPUT_SPEC_DEFAULTS = {
+    "orientation": "vertical",
+    "waveform_style": "circular",
+    "gradient_style": "default",
+    "custom_colors": None,
+    "dynamic_background": "none",
+    "particle_color_scheme": "multicolor",
+    "particle_gradient_style": None,
+    "particle_custom_colors": None,
+}
+
+
+def create_videos(
+    audio_path: Path,
+    outputs: list,
+    background_keywords: str = "abstract,gradient,minimal",
+    no_unsplash: bool = False,
+    preview_duration: float = None,
+    encoder_preset: str = "medium",
+    crf: int = 23,
+    encoder_threads: int = 0,
+    feature_cache: bool = True,
+    background_scale: float = 1.0,
+    proxy_scale: float = None,
+    background_cache: bool = True,
+) -> bool:
+    """Render several videos of one audio file in a single pass.
+
+    The audio is decoded and analysed once, the Unsplash image is downloaded
+    once and shared by every output, and each frame's dynamic background is
+    computed once per orientation and style. Every output streams into its
+    own ffmpeg encoder, so the encoders run side by side while the timeline
+    is walked a single time.
+
+    Args:
+        audio_path: Path to the audio file
+        outputs: List of output specs. Each is a dict with an ``output_path``
+            and any of the keys of ``OUTPUT_SPEC_DEFAULTS`` (``orientation``,
+            ``waveform_style``, ``gradient_style``, ``custom_colors``,
+            ``dynamic_background`` and the ``particle_*`` options), with the
+            same meaning as in ``create_vertical_video``
+        background_keywords: Keywords for the shared Unsplash background
+        no_unsplash: Skip Unsplash download and use only gradient backgrounds
+        preview_duration: Maximum duration in seconds for preview mode (None for full video)
+        encoder_preset: libx264 preset used for every output
+        crf: libx264 constant rate factor
+        encoder_threads: libx264 threads per output (0 lets ffmpeg decide)
+        feature_cache: Reuse cached audio analysis stored next to the audio
+        background_scale: Resolution scale of the dynamic backgrounds (1.0 = full)
+        proxy_scale: Render fast low-resolution drafts at this fraction of the
+            output size (None for the final render)
+        background_cache: Reuse cached static backgrounds (see
+            ``background_cache``)
+
+    Returns:
+        True if every output was written.
+    """
+    if not outputs:
+        print("❌ No outputs to render")
+        return False
+
+    specs = [{**OUTPUT_SPEC_DEFAULTS, **spec} for spec in outputs]
+    temp_paths = []
+    writers = []
+    # One creator per orientation, shared by the outputs that use it
+    creators = {}
+
+    try:
+        print(f"🎬 Starting batch render of {len(specs)} videos...")
+
+        for spec in specs:
+            orientation = spec["orientation"]
+            if orientation not in creators:
+                creators[orientation] = VerticalVideoCreator(orientation=orientation)
+
+        fps = next(iter(creators.values())).fps
+        if proxy_scale is not None:
+            fps = PROXY_FPS
+            background_scale = min(background_scale, proxy_scale)
+            encoder_preset = PROXY_ENCODER_PRESET
+            print(f"🧪 Proxy render at {PROXY_FPS} fps ({encoder_preset})")
+
+        # Static backgrounds: at most one download, then one image per size and
+        # gradient (each taken from the background cache when possible)
+        downloads = {}
+
+        def download(keywords):
+            if keywords not in downloads:
+                print("🖼️  Downloading background image...")
+                unsplash_path = next(iter(creators.values())).get_random_unsplash_image(
+                    keywords
+                )
+                if unsplash_path:
+                    temp_paths.append(unsplash_path)
+                downloads[keywords] = unsplash_path
+            return downloads[keywords]
+
+        static_backgrounds = {}
+        for spec in specs:
+            if spec["dynamic_background"] != "none":
+                continue
+            key = _background_key(spec)
+            if key in static_backgrounds:
+                continue
+            static_backgrounds[key] = creators[
+                spec["orientation"]
+            ].get_static_background(
+                spec["gradient_style"],
+                spec["custom_colors"],
+                no_unsplash,
+                background_keywords,
+                use_cache=background_cache,
+                download=download,
+            )
+
+        print("🎵 Extracting audio features...")
+        # The timeline only depends on the frame rate, which all creators share
+        audio_features = next(iter(creators.values())).extract_audio_features(
+            audio_path, preview_duration, use_cache=feature_cache, fps=fps
+        )
+        if not audio_features:
+            print("❌ Failed to extract audio features")
+            return False
+
+        duration = audio_features["duration"]
+        if preview_duration is not None and duration > preview_duration:
+            duration = preview_duration
+            print(f"🎞️  Preview mode: limiting to {preview_duration} seconds")
+
+        total_frames = int(duration * fps)
+        print(f"🎥 Creating videos: {duration:.1f}s, {total_frames} frames each")
+
+        jobs = []
+        for spec in specs:
+            creator = creators[spec["orientation"]]
+            encode_size = (creator.width, creator.height)
+            if proxy_scale is not None:
+                encode_size = proxy_size(creator.width, creator.height, proxy_scale)
+
+            render_options = {
+                key: spec[key] for key in OUTPUT_SPEC_DEFAULTS if key != "orientation"
+            }
+            render_options["background_scale"] = background_scale
+            render_options["fractal_threads"] = os.cpu_count() or 1
+            encoder_options = {
+                "backend": "ffmpeg",
+                "size": encode_size,
+                "fps": fps,
+                "preset": encoder_preset,
+                "crf": crf,
+                "threads": encoder_threads,
+            }
+
+            print(
+                f"📁 {spec['output_path']}: {spec['orientation']}, "
+                f"{spec['waveform_style']}, {encode_size[0]}x{encode_size[1]}"
+            )
+            writer = creator._open_frame_writer(
+                Path(spec["output_path"]), encoder_options, audio_path
+            )
+            writers.append(writer)
+            jobs.append(
+                {
+                    "creator": creator,
+                    "writer": writer,
+                    "frame": np.empty(
+                        (creator.height, creator.width, 3), dtype=np.uint8
+                    ),
+                    "encoded": creator._encode_buffer(encoder_options),
+                    "styles": creator.create_styles(
+                        render_options, total_frames, duration
+                    ),
+                    "background_key": _background_key(spec),
+                    "bg_image": static_backgrounds.get(_background_key(spec)),
+                }
+            )
+
+        # Backgrounds used by several outputs are rendered once into their own
+        # buffer and copied into each output's frame
+        background_users = {}
+        for job in jobs:
+            key = job["background_key"]
+            background_users[key] = background_users.get(key, 0) + 1
+        shared_backgrounds = {
+            job["background_key"]: np.empty_like(job["frame"])
+            for job in jobs
+            if background_users[job["background_key"]] > 1
+        }
+
+        for frame_idx in range(total_frames):
+            if frame_idx % 30 == 0:  # Progress every second
+                print(
+                    f"🎬 Progress: {frame_idx}/{total_frames} frames ({frame_idx/total_frames*100:.1f}%)"
+                )
+
+            rendered = set()
+            for job in jobs:
+                creator, frame = job["creator"], job["frame"]
+                key = job["background_key"]
+                background = shared_backgrounds.get(key)
+                if background is None:
+                    creator._render_background(
+                        frame_idx, job["styles"], job["bg_image"], audio_features, frame
+                    )
+                else:
+                    if key not in rendered:
+                        creator._render_background(
+                            frame_idx,
+                            job["styles"],
+                            job["bg_image"],
+                            audio_features,
+                            background,
+                        )
+                        rendered.add(key)
+                    np.copyto(frame, background)
+
+                job["styles"][1].render(frame_idx, audio_features, frame)
+                job["writer"].write(creator._to_encode_size(frame, job["encoded"]))
+
+        print("🎵 Finishing encodes...")
+        while writers:
+            writers.pop().release()
+
+        for spec in specs:
+            print(f"✅ Video created successfully: {spec['output_path']}")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error creating videos: {e}")
+        return False
+    finally:
+        for writer in writers:
+            try:
+                writer.release()
+            except Exception:
+                pass
+        for creator in creators.values():
+            creator._close_fractal_pool()
+        for path in temp_paths:
+            if path.exists():
+                os.unlink(path)
+
+
+def _background_key(spec: dict) -> tuple:
+    """Outputs with equal keys can share their per-frame background."""
+    custom_colors = spec["custom_colors"]
+    return (
+        spec["orientation"],
+        spec["dynamic_background"],
+        spec["gradient_style"],
+        tuple(map(tuple, custom_colors)) if custom_colors else None,
     )
@@ -0,0 +1,213 @@
+"""Content-addressed cache of synthesized TTS chunks.
+
+A chunk's audio only depends on its text, the voice, the model and the voice
+settings, so it is stored under a hash of those (with whitespace normalised)
+and shared by every script (in ``projects/tts_cache``, or ``$TTS_CACHE_DIR``).
+When a script is edited, the chunks whose text did not change are copied
+from the cache instead of being synthesized and billed again.
+
+That only works if an edit does not move the boundaries of the chunks after
+it, so ``reuse_chunk_boundaries`` keeps the chunks of the previous run that
+still appear in the new text (sentence for sentence, whitespace aside) and
+only re-splits the text between them.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import unicodedata
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..config import TTS_CACHE_DIR
+
+# Bump when the way chunks are synthesized changes
+CHUNK_CACHE_VERSION = 1
+
+# Under the project root, whatever the working directory
+DEFAULT_CHUNK_CACHE_DIR = TTS_CACHE_DIR
+
+
+def normalize_chunk_text(text: str) -> str:
+    """Text as far as the audio is concerned: NFC, whitespace runs collapsed."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def chunk_cache_key(
+    text: str,
+    voice_id: str,
+    model_id: str,
+    voice_settings: Dict,
+    output_format: str,
+) -> str:
+    """Cache key from the chunk text and everything that shapes its audio."""
+    payload = json.dumps(
+        {
+            "version": CHUNK_CACHE_VERSION,
+            "text": normalize_chunk_text(text),
+            "voice": voice_id,
+            "model": model_id,
+            "voice_settings": voice_settings,
+            "output_format": output_format,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def chunk_cache_path(cache_dir: Path, key: str) -> Path:
+    """Location of the cached audio for ``key`` (metadata sits next to it)."""
+    return Path(cache_dir) / key[:2] / f"{key}.mp3"
+
+
+def load_chunk(cache_path: Path, destination: Path) -> Optional[Dict]:
+    """Copy cached audio to ``destination``; returns its metadata or None on a miss."""
+    metadata_path = cache_path.with_suffix(".json")
+    if not cache_path.exists() or not metadata_path.exists():
+        return None
+
+    try:
+        metadata = json.loads(metadata_path.read_text())
+        shutil.copyfile(cache_path, destination)
+        return metadata
+    except Exception as e:
+        print(f"⚠️  Ignoring unreadable chunk cache {cache_path.name}: {e}")
+        return None
+
+
+def _write_atomic(target: Path, data: bytes):
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=target.name, suffix=".tmp", dir=target.parent
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, target)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def save_chunk(cache_path: Path, source: Path, metadata: Dict) -> bool:
+    """Store ``source`` and its metadata atomically; failure is not fatal."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Audio first, metadata last: a chunk only counts once both exist
+        _write_atomic(cache_path, Path(source).read_bytes())
+        _write_atomic(
+            cache_path.with_suffix(".json"), json.dumps(metadata, indent=2).encode()
+        )
+        return True
+    except Exception as e:
+        print(f"⚠️  Could not write chunk cache {cache_path.name}: {e}")
+        return False
+
+
+# Where a chunk may start or end: paragraph breaks and the spaces after a
+# sentence's closing punctuation (the chunk splitter only cuts there)
+_SENTENCE_BREAK = re.compile(r"\n\s*\n|(?<=[.!?])\s+")
+
+
+def _sentence_spans(text: str) -> List[Tuple[int, int]]:
+    """``(start, end)`` of every sentence of ``text``."""
+    spans = []
+    start = 0
+    for match in _SENTENCE_BREAK.finditer(text):
+        if text[start : match.start()].strip():
+            spans.append((start, match.start()))
+        start = match.end()
+    if text[start:].strip():
+        spans.append((start, len(text)))
+    return spans
+
+
+def _find_chunk(
+    sentences: List[str], chunk: str, first: int
+) -> Optional[Tuple[int, int]]:
+    """Range of the sentences (from ``first`` on) that spell out ``chunk``."""
+    target = normalize_chunk_text(chunk)
+    for start in range(first, len(sentences)):
+        if not target.startswith(sentences[start]):
+            continue
+        length = len(sentences[start])
+        end = start + 1
+        while (
+            length < len(target)
+            and end < len(sentences)
+            and target[length] == " "
+            and target.startswith(sentences[end], length + 1)
+        ):
+            length += 1 + len(sentences[end])
+            end += 1
+        if length == len(target):
+            return start, end
+    return None
+
+
+def reuse_chunk_boundaries(
+    text: str,
+    previous_chunks: List[str],
+    split_text: Callable[[str], List[str]],
+) -> List[str]:
+    """Split ``text`` keeping the previous run's chunks that are still in it.
+
+    Previous chunks are found (in order) as runs of whole sentences, compared
+    with whitespace normalised, and kept as they are; the text between them
+    is split with ``split_text``. An edit therefore only changes the chunks
+    around it.
+
+    Text between kept chunks is merged with a neighbouring kept chunk when
+    the two split into fewer chunks together than apart (an edit that leaves
+    a piece under half the chunk limit next to a short chunk), so repeated
+    small edits do not keep adding chunks.
+    """
+    spans = _sentence_spans(text)
+    sentences = [normalize_chunk_text(text[start:end]) for start, end in spans]
+
+    # (start, end, kept) spans of the chunks and of the text between them
+    segments = []
+    position = 0
+    first = 0
+    for previous in previous_chunks:
+        found = _find_chunk(sentences, previous, first)
+        if found is None:
+            continue
+        start, end = spans[found[0]][0], spans[found[1] - 1][1]
+        if text[position:start].strip():
+            segments.append((position, start, False))
+        segments.append((start, end, True))
+        position = end
+        first = found[1]
+    if text[position:].strip():
+        segments.append((position, len(text), False))
+
+    def count(start: int, end: int) -> int:
+        return len(split_text(text[start:end]))
+
+    # Merge text between kept chunks into a kept neighbour when that does
+    # not take more chunks than the text alone
+    i = 0
+    while i < len(segments):
+        start, end, kept = segments[i]
+        for neighbour in (i - 1, i + 1):
+            if kept or not 0 <= neighbour < len(segments) or not segments[neighbour][2]:
+                continue
+            low, high = sorted((i, neighbour))
+            merged = (segments[low][0], segments[high][1], False)
+            if count(merged[0], merged[1]) <= count(start, end):
+                segments[low : high + 1] = [merged]
+                i = low
+                break
+        else:
+            i += 1
+
+    chunks = []
+    for start, end, kept in segments:
+        if kept:
+            chunks.append(text[start:end].strip())
+        else:
+            chunks.extend(split_text(text[start:end]))
+    return chunks
@@ -2,13 +2,25 @@
 
 import os
 import json
-import time
+import re
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
 from datetime import datetime
 import hashlib
-from elevenlabs import ElevenLabs
+from .chunk_cache import (
+    DEFAULT_CHUNK_CACHE_DIR,
+    chunk_cache_key,
+    chunk_cache_path,
+    load_chunk,
+    reuse_chunk_boundaries,
+    save_chunk,
+)
+from .http_clients import get_elevenlabs_client
+from .mp3_stitch import stitch_mp3_files
+from .rate_limiter import call_with_retries, get_rate_limiter
 
 # Try to import pydub for better audio stitching, fallback to direct concatenation
 try:
@@ -77,15 +89,25 @@ class ElevenLabsImprovedSynthesizer:
         "default": 0.0009,
     }
 
+    # Audio format requested for every chunk (part of the chunk cache key)
+    OUTPUT_FORMAT = "mp3_44100_128"
+
+    # Chunks linked through previous_request_ids per window in concurrent mode
+    DEFAULT_STITCH_WINDOW = 3
+
     # Note: Actual credits are returned by the API in the 'character-cost' header
     # Flash models have discounted pricing (~0.5 credits per character)
     # The API will return the actual credits charged
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None):
         self.api_key = api_key or os.getenv("ELEVENLABS_API_KEY")
         if not self.api_key:
             raise ValueError("ELEVENLABS_API_KEY not found")
-        self.client = ElevenLabs(api_key=self.api_key, timeout=None)
+        # base_url points the client at another server (e.g. a local test stub)
+        self.client = get_elevenlabs_client(self.api_key, base_url)
+        # Shared by every synthesizer using this API key in the process
+        self.rate_limiter = get_rate_limiter("elevenlabs", self.api_key)
+        self.chunk_cache_dir = DEFAULT_CHUNK_CACHE_DIR
 
     def synthesize_with_state(
         self,
@@ -99,10 +121,24 @@ class ElevenLabsImprovedSynthesizer:
         style: Optional[float] = None,
         use_speaker_boost: Optional[bool] = None,
         resume: bool = True,
+        max_concurrency: int = 1,
+        stitch_window: Optional[int] = None,
+        chunk_cache: bool = True,
     ) -> Tuple[bool, Dict]:
         """
         Synthesize text with state management for recovery and cost tracking.
 
+        Args:
+            max_concurrency: Chunk requests in flight at once (1 = serial)
+            stitch_window: Consecutive chunks synthesized in order and linked
+                through previous_request_ids; windows run in parallel. None
+                links every chunk when serial and uses DEFAULT_STITCH_WINDOW
+                when concurrent.
+            chunk_cache: Reuse chunks already synthesized (by any script) with
+                the same text, voice, model and settings, and keep the chunk
+                boundaries of the previous run so an edit only re-synthesizes
+                the chunks it touches.
+
         Returns:
             Tuple of (success: bool, stats: dict with cost and chunk info)
         """
@@ -110,8 +146,10 @@ class ElevenLabsImprovedSynthesizer:
         state_dir = output_path.parent / f".{output_path.stem}_state"
         state_dir.mkdir(parents=True, exist_ok=True)
 
-        # Generate unique ID for this synthesis job
-        job_id = hashlib.md5(f"{text[:100]}{output_path}".encode()).hexdigest()[:8]
+        # Generate unique ID for this synthesis job (the whole text, so an
+        # edited script never resumes with the chunks of the old one)
+        job_id = hashlib.md5(f"{text}{output_path}".encode()).hexdigest()[:8]
+        plan_file = state_dir / "chunk_plan.json"
         state_file = state_dir / f"synthesis_state_{job_id}.json"
         chunks_dir = state_dir / "chunks"
         chunks_dir.mkdir(exist_ok=True)
@@ -176,78 +214,77 @@ class ElevenLabsImprovedSynthesizer:
                 "ttd_stability": 0.5,
             }
 
-            # Split text into chunks
-            chunks = self._split_text_into_chunks(text, max_chars)
+            # Split text into chunks, keeping the unchanged chunks of the
+            # previous run so they hit the chunk cache
+            previous_chunks = (
+                self._load_chunk_plan(plan_file, max_chars) if chunk_cache else []
+            )
+            chunks = reuse_chunk_boundaries(
+                text,
+                previous_chunks,
+                lambda part: self._split_text_into_chunks(part, max_chars),
+            )
+            self._save_chunk_plan(plan_file, chunks, max_chars)
             state["total_chunks"] = len(chunks)
+            cache_dir = self.chunk_cache_dir if chunk_cache else None
 
             print(
                 f"Text split into {len(chunks)} chunks for ~{len(chunks) * 5}-{len(chunks) * 6} minutes total"
             )
 
-            # Process chunks
-            for i, chunk in enumerate(chunks):
-                chunk_id = f"chunk_{i:03d}"
-
-                # Skip if already completed
-                if chunk_id in state["completed_chunks"]:
-                    print(f"Skipping already completed {chunk_id}")
-                    continue
-
-                chunk_path = chunks_dir / f"{chunk_id}.mp3"
-                chunk_info = {
-                    "id": chunk_id,
-                    "index": i,
-                    "characters": len(chunk),
-                    "credits": 0,  # Will be updated with actual from API
-                    "path": str(chunk_path),
-                    "status": "processing",
-                }
-
+            # Process chunks. Each stitch window is a run of consecutive chunks
+            # synthesized in order (sharing previous_request_ids for continuity);
+            # windows are independent, so up to max_concurrency run at once.
+            # Pacing between requests is left to the shared rate limiter
+            if stitch_window is None and max_concurrency > 1:
+                stitch_window = self.DEFAULT_STITCH_WINDOW
+            windows = self._stitch_windows(len(chunks), stitch_window)
+            workers = max(1, min(max_concurrency, len(windows)))
+            if workers > 1:
                 print(
-                    f"\nProcessing {chunk_id} ({i + 1}/{len(chunks)}) - {len(chunk)} chars (estimated)"
+                    f"Synthesizing {len(windows)} stitch windows with {workers} requests in flight"
                 )
+            state_lock = threading.Lock()
 
-                # Synthesize chunk with retries
-                success, request_id, cost, credits_used = self._synthesize_chunk(
-                    chunk,
-                    chunk_path,
-                    used_voice,
-                    model_id,
-                    voice_settings,
-                    state["request_ids"][-3:] if state["request_ids"] else None,
-                )
+            def process_window(indices: List[int]):
+                for position, i in enumerate(indices):
+                    chunk_id = f"chunk_{i:03d}"
 
-                if success:
-                    chunk_info["status"] = "completed"
-                    chunk_info["request_id"] = request_id
-                    chunk_info["cost"] = cost
-                    chunk_info["credits"] = credits_used
-                    chunk_info["estimated_credits"] = len(
-                        chunk
-                    )  # Store original estimate for comparison
-                    state["completed_chunks"].append(chunk_id)
-                    if request_id:
-                        state["request_ids"].append(request_id)
-                    state["total_cost"] += cost
-                    state["total_credits"] += credits_used
-                    print(
-                        f"✅ {chunk_id} completed - Cost: ${cost:.4f} | Credits: {credits_used:,} actual (estimated: {len(chunk):,})"
-                    )
-                else:
-                    chunk_info["status"] = "failed"
-                    state["failed_chunks"].append(chunk_id)
-                    print(f"❌ {chunk_id} failed")
+                    # Skip if already completed
+                    if chunk_id in state["completed_chunks"]:
+                        print(f"Skipping already completed {chunk_id}")
+                        continue
 
-                state["chunks_info"].append(chunk_info)
+                    # Continuity only with the chunks before it in this window
+                    with state_lock:
+                        previous_request_ids = self._window_request_ids(
+                            state, indices[:position]
+                        )
 
-                # Save state after each chunk
-                self._save_state(state_file, state)
+                    self._process_chunk(
+                        i,
+                        chunks,
+                        chunks_dir,
+                        used_voice,
+                        model_id,
+                        voice_settings,
+                        previous_request_ids,
+                        state,
+                        state_file,
+                        state_lock,
+                        cache_dir,
+                    )
 
-                # Delay between chunks
-                if i < len(chunks) - 1 and success:
-                    delay = 2 if model == "flash" else 5
-                    print(f"Waiting {delay}s before next chunk...")
-                    time.sleep(delay)
+            if workers == 1:
+                for indices in windows:
+                    process_window(indices)
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(process_window, indices) for indices in windows
+                    ]
+                    for future in as_completed(futures):
+                        future.result()
 
             # Stitch chunks together
             if state["completed_chunks"]:
@@ -265,6 +302,10 @@ class ElevenLabsImprovedSynthesizer:
                     print(
                         f"💰 Total cost: ${state['total_cost']:.4f} | Credits used: {state['total_credits']:,} (actual from API)"
                     )
+                    if state.get("cached_chunks"):
+                        print(
+                            f"♻️  {len(state['cached_chunks'])} chunks reused from the chunk cache"
+                        )
                     print(
                         f"⏱️  Estimated duration: {len(state['completed_chunks']) * 5}-{len(state['completed_chunks']) * 6} minutes"
                     )
@@ -290,6 +331,153 @@ class ElevenLabsImprovedSynthesizer:
             self._save_state(state_file, state)
             return False, state
 
+    def _process_chunk(
+        self,
+        index: int,
+        chunks: List[str],
+        chunks_dir: Path,
+        voice_id: str,
+        model_id: str,
+        voice_settings: Dict,
+        previous_request_ids: Optional[List[str]],
+        state: Dict,
+        state_file: Path,
+        state_lock: threading.Lock,
+        cache_dir: Optional[Path] = None,
+    ) -> bool:
+        """Synthesize one chunk and record it in the state file. Returns success."""
+        chunk = chunks[index]
+        chunk_id = f"chunk_{index:03d}"
+        chunk_path = chunks_dir / f"{chunk_id}.mp3"
+        chunk_info = {
+            "id": chunk_id,
+            "index": index,
+            "characters": len(chunk),
+            "credits": 0,  # Will be updated with actual from API
+            "path": str(chunk_path),
+            "status": "processing",
+        }
+
+        cache_path = None
+        if cache_dir is not None:
+            cache_path = chunk_cache_path(
+                cache_dir,
+                chunk_cache_key(
+                    chunk, voice_id, model_id, voice_settings, self.OUTPUT_FORMAT
+                ),
+            )
+            cached = load_chunk(cache_path, chunk_path)
+            if cached is not None:
+                # Same audio as a chunk synthesized before: nothing to bill
+                chunk_info["status"] = "completed"
+                chunk_info["cached"] = True
+                chunk_info["cost"] = 0.0
+                chunk_info["estimated_credits"] = len(chunk)
+                chunk_info["saved_credits"] = cached.get("credits", len(chunk))
+                print(f"♻️  {chunk_id} reused from chunk cache")
+                self._record_chunk(state, state_file, state_lock, chunk_info)
+                return True
+
+        print(
+            f"\nProcessing {chunk_id} ({index + 1}/{len(chunks)}) - {len(chunk)} chars (estimated)"
+        )
+
+        # Synthesize chunk with retries
+        success, request_id, cost, credits_used = self._synthesize_chunk(
+            chunk,
+            chunk_path,
+            voice_id,
+            model_id,
+            voice_settings,
+            previous_request_ids,
+        )
+
+        if success:
+            chunk_info["status"] = "completed"
+            chunk_info["request_id"] = request_id
+            chunk_info["cost"] = cost
+            chunk_info["credits"] = credits_used
+            chunk_info["estimated_credits"] = len(
+                chunk
+            )  # Store original estimate for comparison
+            print(
+                f"✅ {chunk_id} completed - Cost: ${cost:.4f} | Credits: {credits_used:,} actual (estimated: {len(chunk):,})"
+            )
+            if cache_path is not None:
+                save_chunk(
+                    cache_path,
+                    chunk_path,
+                    {
+                        "characters": len(chunk),
+                        "credits": credits_used,
+                        "model": model_id,
+                        "voice": voice_id,
+                        "created_at": datetime.now().isoformat(),
+                    },
+                )
+        else:
+            chunk_info["status"] = "failed"
+            print(f"❌ {chunk_id} failed")
+
+        self._record_chunk(state, state_file, state_lock, chunk_info)
+        return success
+
+    def _record_chunk(
+        self,
+        state: Dict,
+        state_file: Path,
+        state_lock: threading.Lock,
+        chunk_info: Dict,
+    ):
+        """Add a finished chunk to the state totals and save the state file."""
+        chunk_id = chunk_info["id"]
+        with state_lock:
+            if chunk_info["status"] == "completed":
+                state["completed_chunks"].append(chunk_id)
+                if chunk_id in state["failed_chunks"]:
+                    state["failed_chunks"].remove(chunk_id)
+                if chunk_info.get("request_id"):
+                    state["request_ids"].append(chunk_info["request_id"])
+                state["total_cost"] += chunk_info["cost"]
+                state["total_credits"] += chunk_info["credits"]
+                if chunk_info.get("cached"):
+                    state.setdefault("cached_chunks", []).append(chunk_id)
+            elif chunk_id not in state["failed_chunks"]:
+                state["failed_chunks"].append(chunk_id)
+
+            # Replace the entry of an earlier (failed) attempt, keep text order
+            state["chunks_info"] = [
+                info for info in state["chunks_info"] if info["id"] != chunk_id
+            ]
+            state["chunks_info"].append(chunk_info)
+            state["chunks_info"].sort(key=lambda info: info["index"])
+
+            # Save state after each chunk
+            self._save_state(state_file, state)
+
+    @staticmethod
+    def _stitch_windows(
+        chunk_count: int, stitch_window: Optional[int]
+    ) -> List[List[int]]:
+        """Group chunk indices into runs of ``stitch_window`` (all in one if None)."""
+        if not stitch_window or stitch_window >= chunk_count:
+            return [list(range(chunk_count))] if chunk_count else []
+        return [
+            list(range(start, min(start + stitch_window, chunk_count)))
+            for start in range(0, chunk_count, stitch_window)
+        ]
+
+    @staticmethod
+    def _window_request_ids(state: Dict, indices: List[int]) -> Optional[List[str]]:
+        """Request IDs of the last (up to 3) completed chunks among ``indices``."""
+        request_ids = {
+            info["index"]: info.get("request_id")
+            for info in state.get("chunks_info", [])
+            if info.get("status") == "completed"
+        }
+        previous = [request_ids[i] for i in indices if request_ids.get(i)]
+        return previous[-3:] if previous else None
+
     def _synthesize_chunk(
         self,
         text: str,
@@ -300,85 +488,89 @@ class ElevenLabsImprovedSynthesizer:
         previous_request_ids: Optional[List[str]] = None,
     ) -> Tuple[bool, Optional[str], float, int]:
         """Synthesize a single chunk with retries. Returns (success, request_id, cost, credits)."""
-        max_retries = 3
-
-        for attempt in range(max_retries):
-            try:
-                # Calculate estimated cost and credits (will be updated with actual from API)
-                char_count = len(text)
-                cost = (char_count / 1000) * self.PRICING_PER_1K_CHARS.get(
-                    model_id, self.PRICING_PER_1K_CHARS["default"]
-                )
-                credits = char_count  # Initial estimate, API will return actual
-                print(f"Voice settings: {voice_settings}")
-                # Make API call
-                with self.client.text_to_speech.with_raw_response.convert(
-                    voice_id=voice_id,
-                    text=text,
-                    model_id=model_id,
-                    voice_settings=voice_settings,
-                    output_format="mp3_44100_128",
-                    previous_request_ids=previous_request_ids if model_id != "eleven_v3" else None,
-                ) as response:
-                    # Extract various useful headers from API response
-                    headers = response._response.headers
-                    request_id = headers.get("request-id")
-                    history_item_id = headers.get("history-item-id")
-                    tts_latency = headers.get("tts-latency-ms")
-
-                    # Extract actual character cost from API (credits used)
-                    actual_credits = headers.get("character-cost")
-                    if actual_credits:
-                        actual_credits = int(actual_credits)
-                        # Recalculate cost based on actual credits charged
-                        cost = (actual_credits / 1000) * self.PRICING_PER_1K_CHARS.get(
-                            model_id, self.PRICING_PER_1K_CHARS["default"]
+        # Calculate estimated cost and credits (will be updated with actual from API)
+        char_count = len(text)
+        credits = char_count  # Initial estimate, API will return actual
+        print(f"Voice settings: {voice_settings}")
+
+        def request():
+            cost = (char_count / 1000) * self.PRICING_PER_1K_CHARS.get(
+                model_id, self.PRICING_PER_1K_CHARS["default"]
+            )
+            # Make API call (retries are left to the shared retry policy)
+            with self.client.text_to_speech.with_raw_response.convert(
+                voice_id=voice_id,
+                text=text,
+                model_id=model_id,
+                voice_settings=voice_settings,
+                output_format=self.OUTPUT_FORMAT,
+                previous_request_ids=previous_request_ids if model_id != "eleven_v3" else None,
+                request_options={"max_retries": 0},
+            ) as response:
+                # Extract various useful headers from API response
+                headers = response._response.headers
+                request_id = headers.get("request-id")
+                tts_latency = headers.get("tts-latency-ms")
+
+                # Extract actual character cost from API (credits used)
+                actual_credits = headers.get("character-cost")
+                if actual_credits:
+                    actual_credits = int(actual_credits)
+                    # Recalculate cost based on actual credits charged
+                    cost = (actual_credits / 1000) * self.PRICING_PER_1K_CHARS.get(
+                        model_id, self.PRICING_PER_1K_CHARS["default"]
+                    )
+                    # Log if actual credits differ significantly from estimate
+                    if (
+                        abs(actual_credits - credits) > credits * 0.1
+                    ):  # More than 10% difference
+                        discount_rate = (credits - actual_credits) / credits * 100
+                        print(
+                            f"  💸 Credit discount applied: {discount_rate:.1f}% ({credits} estimated → {actual_credits} actual)"
                         )
-                        # Log if actual credits differ significantly from estimate
-                        if (
-                            abs(actual_credits - credits) > credits * 0.1
-                        ):  # More than 10% difference
-                            discount_rate = (credits - actual_credits) / credits * 100
-                            print(
-                                f"  💸 Credit discount applied: {discount_rate:.1f}% ({credits} estimated → {actual_credits} actual)"
-                            )
-                    else:
-                        # Fallback to calculated credits if header not available
-                        actual_credits = credits
+                else:
+                    # Fallback to calculated credits if header not available
+                    actual_credits = credits
 
-                    # Log performance info if available
-                    if tts_latency:
-                        print(f"  ⏱️  TTS latency: {tts_latency}ms")
+                # Log performance info if available
+                if tts_latency:
+                    print(f"  ⏱️  TTS latency: {tts_latency}ms")
 
-                    # Save audio
-                    with open(output_path, "wb") as f:
-                        for chunk in response.data:
-                            f.write(chunk)
+                # Save audio
+                with open(output_path, "wb") as f:
+                    for chunk in response.data:
+                        f.write(chunk)
 
-                    return True, request_id, cost, actual_credits
+                return True, request_id, cost, actual_credits
 
-            except Exception as e:
-                error_msg = str(e).lower()
-                if "timeout" in error_msg or "timed out" in error_msg:
-                    if attempt < max_retries - 1:
-                        wait_time = 10 * (attempt + 1)
-                        print(
-                            f"  Timeout on attempt {attempt + 1}, waiting {wait_time}s..."
-                        )
-                        time.sleep(wait_time)
-                    else:
-                        print(f"  Failed after {max_retries} timeout attempts")
-                        return False, None, 0.0, 0
-                else:
-                    print(f"  Non-timeout error: {str(e)}")
-                    return False, None, 0.0, 0
-
-        return False, None, 0.0, 0
+        try:
+            return call_with_retries(
+                self.rate_limiter, request, label=f"chunk {output_path.stem}"
+            )
+        except Exception as e:
+            print(f"  Chunk synthesis failed: {str(e)[:200]}")
+            return False, None, 0.0, 0
 
     def _stitch_chunks(
         self, chunks_dir: Path, chunk_ids: List[str], output_path: Path
     ) -> bool:
         """Stitch audio chunks together."""
+        # Join the MP3 frames directly: no decoding, re-encoding or quality loss
+        chunk_paths = []
+        for chunk_id in sorted(chunk_ids):
+            chunk_path = chunks_dir / f"{chunk_id}.mp3"
+            if chunk_path.exists():
+                chunk_paths.append(chunk_path)
+            else:
+                print(f"Warning: Missing chunk {chunk_id}")
+        try:
+            frames = stitch_mp3_files(chunk_paths, output_path)
+            print(f"Joined {frames:,} MP3 frames from {len(chunk_paths)} chunks")
+            return True
+        except Exception as e:
+            print(f"Frame-level stitching failed: {e}")
+            # Fall through to pydub (decodes and re-encodes)
+
         if HAS_PYDUB:
             try:
                 combined = AudioSegment.empty()
@@ -430,17 +622,20 @@ class ElevenLabsImprovedSynthesizer:
                 chunks.append(current_chunk.strip())
                 current_chunk = ""
 
-            # If single paragraph is too long, split by sentences
+            # If single paragraph is too long, split by sentences. Cut after
+            # each full stop so the chunks keep the text as written (and can
+            # be found again in the next run, see reuse_chunk_boundaries)
             if len(paragraph) > max_chars:
-                sentences = paragraph.split(". ")
+                sentences = re.split(r"(?<=\.) +", paragraph.strip())
                 for sentence in sentences:
                     if (
-                        len(current_chunk) + len(sentence) + 2 > max_chars
+                        len(current_chunk) + len(sentence) + 1 > max_chars
                         and current_chunk
                     ):
                         chunks.append(current_chunk.strip())
                         current_chunk = ""
-                    current_chunk += sentence + ". "
+                    current_chunk += sentence + " "
+                current_chunk = current_chunk.rstrip(" ") + "\n\n"
             else:
                 current_chunk += paragraph + "\n\n"
 
@@ -450,6 +645,28 @@ class ElevenLabsImprovedSynthesizer:
 
         return chunks
 
+    def _load_chunk_plan(self, plan_file: Path, max_chars: int) -> List[str]:
+        """Chunks of the previous run for this output, if split with the same limit."""
+        try:
+            with open(plan_file, "r") as f:
+                plan = json.load(f)
+            if plan.get("max_chars") != max_chars:
+                return []
+            return plan.get("chunks", [])
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            print(f"Could not load chunk plan: {e}")
+            return []
+
+    def _save_chunk_plan(self, plan_file: Path, chunks: List[str], max_chars: int):
+        """Remember the chunk boundaries so the next run can keep them."""
+        try:
+            with open(plan_file, "w") as f:
+                json.dump({"max_chars": max_chars, "chunks": chunks}, f, indent=2)
+        except Exception as e:
+            print(f"Could not save chunk plan: {e}")
+
     def _load_state(self, state_file: Path) -> Dict:
         """Load synthesis state from file."""
         try:
@@ -485,6 +702,14 @@ class ElevenLabsImprovedSynthesizer:
                 f.write(f"- Total chunks: {state['total_chunks']}\n")
                 f.write(f"- Completed chunks: {len(state['completed_chunks'])}\n")
                 f.write(f"- Failed chunks: {len(state['failed_chunks'])}\n")
+                cached_chunks = [
+                    c for c in state.get("chunks_info", []) if c.get("cached")
+                ]
+                if cached_chunks:
+                    saved_credits = sum(c.get("saved_credits", 0) for c in cached_chunks)
+                    f.write(
+                        f"- Reused from chunk cache: {len(cached_chunks)} ({saved_credits:,} credits not billed again)\n"
+                    )
                 f.write(f"- Model used: {state['model']}\n")
                 f.write(f"- Voice used: {state['voice']}\n\n")
 
@@ -524,7 +749,8 @@ class ElevenLabsImprovedSynthesizer:
                             f.write(
                                 f" (saved {credits_est - credits_actual:,} credits)"
                             )
-                        f.write(f", status: {chunk['status']}\n")
+                        f.write(f", status: {chunk['status']}")
+                        f.write(" (cached)\n" if chunk.get("cached") else "\n")
 
                 # Estimate audio duration
                 completed_chunks = len(state["completed_chunks"])
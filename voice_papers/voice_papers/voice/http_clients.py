@@ -0,0 +1,107 @@
+"""Process-wide HTTP clients for the TTS providers.
+
+Creating an ``ElevenLabs`` client (or calling bare ``requests.post``) opens a
+new connection pool, so every synthesizer instance paid for fresh TCP and TLS
+handshakes. The clients here are created once per provider (and API key) and
+shared by every synthesizer in the process, keeping connections alive between
+chunks, episodes and ``get_synthesizer`` calls.
+
+Pool size and timeouts can be set with ``TTS_HTTP_POOL_SIZE``,
+``TTS_HTTP_CONNECT_TIMEOUT`` and ``TTS_HTTP_TIMEOUT`` (seconds).
+"""
+
+import atexit
+import hashlib
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import httpx
+import requests
+from elevenlabs import ElevenLabs
+from requests.adapters import HTTPAdapter
+
+# Connections kept per provider; above the rate limiter's concurrency cap
+HTTP_POOL_SIZE = int(os.getenv("TTS_HTTP_POOL_SIZE", "10"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("TTS_HTTP_CONNECT_TIMEOUT", "10"))
+# Seconds without data before a request fails (the ElevenLabs SDK default)
+HTTP_TIMEOUT = float(os.getenv("TTS_HTTP_TIMEOUT", "240"))
+# Idle connections are closed after this many seconds
+HTTP_KEEPALIVE_EXPIRY = 60.0
+
+_httpx_clients: Dict[str, httpx.Client] = {}
+_elevenlabs_clients: Dict[Tuple[str, Optional[str]], ElevenLabs] = {}
+_sessions: Dict[str, requests.Session] = {}
+_lock = threading.Lock()
+
+
+def _key_hash(api_key: Optional[str]) -> str:
+    return hashlib.sha256((api_key or "").encode()).hexdigest()[:16]
+
+
+def get_httpx_client(provider: str) -> httpx.Client:
+    """Shared keep-alive ``httpx`` client for ``provider``."""
+    provider = provider.lower()
+    with _lock:
+        client = _httpx_clients.get(provider)
+        if client is None:
+            client = _httpx_clients[provider] = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=HTTP_POOL_SIZE,
+                    max_keepalive_connections=HTTP_POOL_SIZE,
+                    keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+                ),
+                timeout=httpx.Timeout(HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+                follow_redirects=True,
+            )
+        return client
+
+
+def get_elevenlabs_client(api_key: str, base_url: Optional[str] = None) -> ElevenLabs:
+    """Shared ``ElevenLabs`` client for an API key, on the pooled connection."""
+    key = (_key_hash(api_key), base_url)
+    # Build the pooled client outside _lock (get_httpx_client takes it too)
+    httpx_client = get_httpx_client("elevenlabs")
+    with _lock:
+        client = _elevenlabs_clients.get(key)
+        if client is None:
+            client = _elevenlabs_clients[key] = ElevenLabs(
+                api_key=api_key,
+                base_url=base_url,
+                timeout=HTTP_TIMEOUT,
+                httpx_client=httpx_client,
+            )
+        return client
+
+
+def get_requests_session(provider: str) -> requests.Session:
+    """Shared keep-alive ``requests`` session for ``provider``."""
+    provider = provider.lower()
+    with _lock:
+        session = _sessions.get(provider)
+        if session is None:
+            session = _sessions[provider] = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        return session
+
+
+def request_timeout() -> Tuple[float, float]:
+    """``(connect, read)`` timeout for ``requests`` calls."""
+    return HTTP_CONNECT_TIMEOUT, HTTP_TIMEOUT
+
+
+@atexit.register
+def close_http_clients():
+    """Close every shared client (their pools are reopened on next use)."""
+    with _lock:
+        for client in _httpx_clients.values():
+            client.close()
+        for session in _sessions.values():
+            session.close()
+        _httpx_clients.clear()
+        _elevenlabs_clients.clear()
+        _sessions.clear()
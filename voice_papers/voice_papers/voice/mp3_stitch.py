@@ -0,0 +1,207 @@
+"""Join MP3 files at the frame level, without decoding them.
+
+Each chunk from the TTS API is a complete MP3 file: an optional ID3v2 tag,
+often a Xing/Info (or VBRI) frame describing that file alone, the audio
+frames, and possibly an ID3v1/APE tag at the end. Gluing the files together
+byte for byte leaves those headers in the middle of the stream, and decoding
+everything to PCM to re-encode it costs time, memory and quality.
+
+``stitch_mp3_files`` instead copies only the audio frames of every file into
+the output, one file at a time, and writes a single Info (CBR) or Xing (VBR)
+frame at the start with the frame and byte counts of the whole episode, so
+players report the right duration and can seek.
+"""
+
+import struct
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# Bitrates in kbps by (MPEG-1?, layer)
+_BITRATES = {
+    (True, 1): [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+    (True, 2): [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+    (True, 3): [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    (False, 1): [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+    (False, 2): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    (False, 3): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+
+# Sample rates by version bits (0 = MPEG-2.5, 2 = MPEG-2, 3 = MPEG-1)
+_SAMPLE_RATES = {
+    0: (11025, 12000, 8000),
+    2: (22050, 24000, 16000),
+    3: (44100, 48000, 32000),
+}
+
+_XING_FLAG_FRAMES = 0x1
+_XING_FLAG_BYTES = 0x2
+
+
+class FrameHeader:
+    """Fields of a 4-byte MPEG audio frame header that stitching needs."""
+
+    __slots__ = ("raw", "mpeg1", "layer", "bitrate", "sample_rate", "mono", "length")
+
+    def __init__(self, raw: bytes):
+        b1, b2, b3 = raw[1], raw[2], raw[3]
+        version = (b1 >> 3) & 0x3
+        layer = 4 - ((b1 >> 1) & 0x3)
+        bitrate_index = b2 >> 4
+        rate_index = (b2 >> 2) & 0x3
+        if (
+            raw[0] != 0xFF
+            or (b1 & 0xE0) != 0xE0
+            or version == 1
+            or layer == 4
+            or bitrate_index in (0, 15)
+            or rate_index == 3
+        ):
+            raise ValueError("not an MPEG audio frame header")
+
+        self.raw = bytes(raw[:4])
+        self.mpeg1 = version == 3
+        self.layer = layer
+        self.bitrate = _BITRATES[(self.mpeg1, layer)][bitrate_index] * 1000
+        self.sample_rate = _SAMPLE_RATES[version][rate_index]
+        self.mono = (b3 >> 6) == 3
+        padding = (b2 >> 1) & 0x1
+        if layer == 1:
+            self.length = (12 * self.bitrate // self.sample_rate + padding) * 4
+        elif layer == 3 and not self.mpeg1:
+            self.length = 72 * self.bitrate // self.sample_rate + padding
+        else:
+            self.length = 144 * self.bitrate // self.sample_rate + padding
+
+    @property
+    def side_info_size(self) -> int:
+        if self.mpeg1:
+            return 17 if self.mono else 32
+        return 9 if self.mono else 17
+
+    def stream_format(self) -> Tuple[bool, int, int, bool]:
+        """What must match between files for their frames to be joined."""
+        return self.mpeg1, self.layer, self.sample_rate, self.mono
+
+
+def _id3v2_size(data: bytes) -> int:
+    """Bytes taken by a leading ID3v2 tag (0 if there is none)."""
+    if len(data) < 10 or data[:3] != b"ID3":
+        return 0
+    size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _trailing_tags_size(data: bytes, end: int) -> int:
+    """Bytes taken by ID3v1 and APEv2 tags at the end of the file."""
+    size = 0
+    if end - size >= 128 and data[end - 128 : end - 125] == b"TAG":
+        size += 128
+    if end - size >= 32 and data[end - size - 32 : end - size - 24] == b"APETAGEX":
+        footer = end - size - 32
+        tag_size = struct.unpack("<I", data[footer + 12 : footer + 16])[0]
+        flags = struct.unpack("<I", data[footer + 20 : footer + 24])[0]
+        size += tag_size + (32 if flags & 0x80000000 else 0)
+    return size
+
+
+def _is_info_frame(data: bytes, offset: int, header: FrameHeader) -> bool:
+    """Whether the frame at ``offset`` is a Xing/Info/VBRI header, not audio."""
+    tag_offset = offset + 4 + header.side_info_size
+    return (
+        data[tag_offset : tag_offset + 4] in (b"Xing", b"Info")
+        or data[offset + 36 : offset + 40] == b"VBRI"
+    )
+
+
+def audio_frames(data: bytes) -> Tuple[int, int, List[FrameHeader]]:
+    """Locate the audio frames of one MP3 file.
+
+    Returns ``(start, end, headers)`` such that ``data[start:end]`` is exactly
+    the file's audio frames. Raises ValueError if the data is not a clean
+    sequence of MPEG audio frames.
+    """
+    position = _id3v2_size(data)
+    end = len(data) - _trailing_tags_size(data, len(data))
+    headers = []
+    start = None
+
+    while position + 4 <= end:
+        header = FrameHeader(data[position : position + 4])
+        if position + header.length > end:
+            # Truncated last frame: keep what decodes, drop the rest
+            break
+        if start is None:
+            if _is_info_frame(data, position, header):
+                position += header.length
+                continue
+            start = position
+        headers.append(header)
+        position += header.length
+
+    if not headers:
+        raise ValueError("no MPEG audio frames found")
+    return start, position, headers
+
+
+def _info_frame(template: FrameHeader, vbr: bool, frames: int, size: int) -> bytes:
+    """An empty frame carrying a Xing/Info tag for the whole stream."""
+    raw = bytearray(template.raw)
+    raw[1] |= 0x01  # No CRC
+    raw[2] &= ~0x02  # No padding
+    header = FrameHeader(bytes(raw))
+
+    frame = bytearray(header.length)
+    frame[:4] = raw
+    tag_offset = 4 + header.side_info_size
+    frame[tag_offset : tag_offset + 16] = (b"Xing" if vbr else b"Info") + struct.pack(
+        ">III", _XING_FLAG_FRAMES | _XING_FLAG_BYTES, frames, size
+    )
+    return bytes(frame)
+
+
+def stitch_mp3_files(paths: List[Path], output_path: Path) -> int:
+    """Concatenate the audio frames of ``paths`` into ``output_path``.
+
+    Files are read one at a time, so memory use is bounded by the largest
+    input rather than the episode length. Every file must share the sample
+    rate, channel mode and layer of the first one (bitrates may differ; the
+    result is then tagged as VBR). Returns the number of frames written.
+    """
+    stream_format = None
+    template: Optional[FrameHeader] = None
+    bitrates = set()
+    frames = 0
+
+    with open(output_path, "wb") as out:
+        for path in paths:
+            data = Path(path).read_bytes()
+            try:
+                start, end, headers = audio_frames(data)
+            except ValueError as e:
+                raise ValueError(f"{Path(path).name}: {e}") from None
+
+            if stream_format is None:
+                stream_format = headers[0].stream_format()
+                template = headers[0]
+                # Reserve room for the Info frame, filled in at the end
+                out.write(_info_frame(template, False, 0, 0))
+            for header in headers:
+                if header.stream_format() != stream_format:
+                    raise ValueError(
+                        f"{Path(path).name}: {header.sample_rate} Hz frames "
+                        f"don't match the {stream_format[2]} Hz stream"
+                    )
+                bitrates.add(header.bitrate)
+
+            out.write(memoryview(data)[start:end])
+            frames += len(headers)
+
+        if template is None:
+            raise ValueError("no input files")
+
+        size = out.tell()
+        out.seek(0)
+        out.write(_info_frame(template, len(bitrates) > 1, frames, size))
+
+    return frames
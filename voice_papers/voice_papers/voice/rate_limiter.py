@@ -0,0 +1,276 @@
+"""Shared rate limiting and retry policy for the TTS providers.
+
+Every request to a provider goes through the ``RateLimiter`` of its
+(provider, API key) pair, which is shared by all synthesizer instances in the
+process. The limiter combines a token bucket (requests per second, with a
+burst) and a cap on requests in flight. Both adapt to the account's quota:
+a 429 halves the request rate, lowers the concurrency cap by one and pauses
+new requests for the ``Retry-After`` time the server asked for; successful
+requests then raise them again step by step up to the configured values.
+
+``RetryPolicy`` separates errors worth retrying (429, 408/409, 5xx, timeouts
+and dropped connections) from fatal ones (bad requests, auth, quota) and
+waits with jittered exponential backoff, or as long as ``Retry-After`` says.
+"""
+
+import email.utils
+import hashlib
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional, Tuple
+
+import httpx
+import requests
+from elevenlabs.core.api_error import ApiError
+
+# Default limits per provider, overridable with <PROVIDER>_REQUESTS_PER_SECOND
+# and <PROVIDER>_MAX_CONCURRENT_REQUESTS (e.g. ELEVENLABS_MAX_CONCURRENT_REQUESTS)
+PROVIDER_LIMITS = {
+    "elevenlabs": {"requests_per_second": 2.0, "burst": 4, "max_concurrent": 4},
+    "cartesia": {"requests_per_second": 2.0, "burst": 4, "max_concurrent": 2},
+    "default": {"requests_per_second": 1.0, "burst": 2, "max_concurrent": 2},
+}
+
+# Status codes worth retrying; other 4xx (bad input, auth, quota) are fatal
+RETRYABLE_STATUS_CODES = {408, 409, 429}
+
+# Errors raised before any response arrived (timeouts, refused or dropped
+# connections); httpx.TimeoutException is a TransportError, listed for clarity
+TRANSIENT_ERRORS = (
+    httpx.TransportError,
+    httpx.TimeoutException,
+    requests.ConnectionError,
+    requests.Timeout,
+    TimeoutError,
+    ConnectionError,
+)
+
+# Successful requests needed to raise the concurrency cap again after a 429
+_RECOVERY_SUCCESSES = 5
+
+# 429s arriving within this many seconds of a back-off count as the same
+# congestion event (concurrent requests are usually rejected together)
+_THROTTLE_COOLDOWN = 1.0
+
+
+class RateLimiter:
+    """Adaptive token bucket plus a cap on concurrent requests."""
+
+    def __init__(
+        self,
+        requests_per_second: float,
+        burst: int,
+        max_concurrent: int,
+        min_requests_per_second: float = 0.05,
+    ):
+        self.max_rate = requests_per_second
+        self.min_rate = min(min_requests_per_second, requests_per_second)
+        self.rate = requests_per_second
+        self.burst = max(1, burst)
+        self.max_concurrent = max(1, max_concurrent)
+        self.concurrent_limit = self.max_concurrent
+
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._in_flight = 0
+        self._successes = 0
+        self._last_throttled = -_THROTTLE_COOLDOWN
+        self._condition = threading.Condition()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """Block until a request may start (token available, no pause)."""
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    wait = (1 - self._tokens) / self.rate
+                self._condition.wait(wait)
+
+    @contextmanager
+    def slot(self):
+        """Hold one of the concurrent request slots for the enclosed request."""
+        with self._condition:
+            while self._in_flight >= self.concurrent_limit:
+                self._condition.wait()
+            self._in_flight += 1
+        try:
+            self.acquire()
+            yield
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def on_success(self):
+        """Additively raise the rate (and the cap) back towards the maximum."""
+        with self._condition:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+            self._successes += 1
+            if (
+                self._successes >= _RECOVERY_SUCCESSES
+                and self.concurrent_limit < self.max_concurrent
+            ):
+                self.concurrent_limit += 1
+                self._successes = 0
+                self._condition.notify_all()
+
+    def on_throttled(self, retry_after: Optional[float] = None):
+        """Back off after a 429: halve the rate, shrink the cap, honour Retry-After."""
+        with self._condition:
+            now = time.monotonic()
+            if now - self._last_throttled >= _THROTTLE_COOLDOWN:
+                self.rate = max(self.min_rate, self.rate / 2)
+                self.concurrent_limit = max(1, self.concurrent_limit - 1)
+                self._last_throttled = now
+            self._successes = 0
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+            self._condition.notify_all()
+
+
+_limiters: Dict[Tuple[str, str], RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str, api_key: Optional[str] = None) -> RateLimiter:
+    """Process-wide limiter for one provider and API key."""
+    provider = provider.lower()
+    key = (provider, hashlib.sha256((api_key or "").encode()).hexdigest()[:16])
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limits = PROVIDER_LIMITS.get(provider, PROVIDER_LIMITS["default"])
+            prefix = provider.upper()
+            limiter = _limiters[key] = RateLimiter(
+                requests_per_second=float(
+                    os.getenv(
+                        f"{prefix}_REQUESTS_PER_SECOND", limits["requests_per_second"]
+                    )
+                ),
+                burst=limits["burst"],
+                max_concurrent=int(
+                    os.getenv(
+                        f"{prefix}_MAX_CONCURRENT_REQUESTS", limits["max_concurrent"]
+                    )
+                ),
+            )
+        return limiter
+
+
+def parse_retry_after(headers) -> Optional[float]:
+    """Seconds to wait from ``retry-after-ms`` / ``Retry-After`` (delta or date)."""
+    if not headers:
+        return None
+    headers = {str(name).lower(): value for name, value in dict(headers).items()}
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms is not None:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000)
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if retry_after is None:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        retry_date = email.utils.parsedate_to_datetime(retry_after)
+        return max(0.0, retry_date.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """Decides whether a failed request is retried and how long to wait."""
+
+    def __init__(
+        self, max_retries: int = 5, base_delay: float = 1.0, max_delay: float = 60.0
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    @staticmethod
+    def _status_and_headers(error: Exception):
+        # ApiError (ElevenLabs SDK) carries them directly, the HTTP clients'
+        # status errors on their response
+        if isinstance(error, ApiError):
+            return error.status_code, error.headers
+        if isinstance(error, (requests.HTTPError, httpx.HTTPStatusError)):
+            if error.response is not None:
+                return error.response.status_code, error.response.headers
+        return None, None
+
+    def classify(self, error: Exception) -> Tuple[bool, bool, Optional[float]]:
+        """Returns (retryable, throttled, retry_after seconds)."""
+        status, headers = self._status_and_headers(error)
+        if status is not None:
+            retryable = status in RETRYABLE_STATUS_CODES or status >= 500
+            return retryable, status == 429, parse_retry_after(headers)
+
+        # No status: only timeouts and connection problems are transient
+        return isinstance(error, TRANSIENT_ERRORS), False, None
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Full-jitter exponential delay, never shorter than ``retry_after``."""
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+def call_with_retries(
+    limiter: RateLimiter,
+    request: Callable,
+    policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    label: str = "request",
+):
+    """Run ``request()`` through ``limiter``, retrying transient failures.
+
+    Raises the last error once it is fatal or the retries are used up.
+    """
+    for attempt in range(policy.max_retries + 1):
+        try:
+            with limiter.slot():
+                result = request()
+            limiter.on_success()
+            return result
+        except Exception as e:
+            retryable, throttled, retry_after = policy.classify(e)
+            if throttled:
+                limiter.on_throttled(retry_after)
+            if not retryable:
+                print(f"  Non-retryable error on {label}: {str(e)[:200]}")
+                raise
+            if attempt >= policy.max_retries:
+                print(f"  {label} failed after {attempt + 1} attempts")
+                raise
+
+            wait_time = policy.backoff(attempt, retry_after)
+            reason = "Rate limited" if throttled else f"{type(e).__name__}"
+            print(
+                f"  {reason} on {label} (attempt {attempt + 1}), retrying in {wait_time:.1f}s..."
+            )
+            time.sleep(wait_time)
@@ -4,11 +4,10 @@ import os
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Optional, Tuple, Dict
-import requests
-from elevenlabs import ElevenLabs
-import time
 from ..config import ELEVENLABS_API_KEY, CARTESIA_API_KEY
 from .elevenlabs_improved import ElevenLabsImprovedSynthesizer
+from .http_clients import get_elevenlabs_client, get_requests_session, request_timeout
+from .rate_limiter import call_with_retries, get_rate_limiter
 
 
 class VoiceSynthesizer(ABC):
@@ -61,6 +60,13 @@ class ElevenLabsSynthesizer(VoiceSynthesizer):
     # Option to use improved synthesizer with duration-based chunking
     USE_IMPROVED_SYNTHESIZER = os.getenv("ELEVENLABS_USE_IMPROVED", "true").lower() == "true"
 
+    # Chunk requests in flight and chunks per stitch window for the improved
+    # synthesizer (read per call, like ELEVENLABS_USE_IMPROVED in the CLI)
+    CONCURRENCY_ENV = "ELEVENLABS_CONCURRENCY"
+    STITCH_WINDOW_ENV = "ELEVENLABS_STITCH_WINDOW"
+    # Set to "false" to synthesize every chunk instead of reusing cached ones
+    CHUNK_CACHE_ENV = "ELEVENLABS_CHUNK_CACHE"
+
     # Voice mapping from short names to ElevenLabs voice IDs
     VOICE_MAP = {
         "ana": "m7yTemJqdIqrcNleANfX",  # Ana - Spanish female voice
@@ -81,7 +87,10 @@ class ElevenLabsSynthesizer(VoiceSynthesizer):
     def __init__(self):
         if not ELEVENLABS_API_KEY:
             raise ValueError("ELEVENLABS_API_KEY not found in environment")
-        self.client = ElevenLabs(api_key=ELEVENLABS_API_KEY, timeout=None)
+        # Shared, keep-alive client: connections are reused across instances
+        self.client = get_elevenlabs_client(ELEVENLABS_API_KEY)
+        self._improved_synth = None
+        self.rate_limiter = get_rate_limiter("elevenlabs", ELEVENLABS_API_KEY)
 
     def synthesize(
         self,
@@ -99,8 +108,9 @@ class ElevenLabsSynthesizer(VoiceSynthesizer):
         # Use improved synthesizer if enabled (default)
         if self.USE_IMPROVED_SYNTHESIZER:
             print("🚀 Using improved ElevenLabs synthesizer with duration-based chunking")
-            improved_synth = ElevenLabsImprovedSynthesizer(ELEVENLABS_API_KEY)
-            success, stats = improved_synth.synthesize_with_state(
+            if self._improved_synth is None:
+                self._improved_synth = ElevenLabsImprovedSynthesizer(ELEVENLABS_API_KEY)
+            success, stats = self._improved_synth.synthesize_with_state(
                 text=text,
                 output_path=output_path,
                 voice_id=voice_id,
@@ -111,7 +121,10 @@ class ElevenLabsSynthesizer(VoiceSynthesizer):
                 similarity_boost=similarity_boost,
                 style=style,
                 use_speaker_boost=use_speaker_boost,
-                resume=True
+                resume=True,
+                max_concurrency=int(os.getenv(self.CONCURRENCY_ENV, "1")),
+                stitch_window=int(os.getenv(self.STITCH_WINDOW_ENV, "0")) or None,
+                chunk_cache=os.getenv(self.CHUNK_CACHE_ENV, "true").lower() == "true",
             )
             return success
         
@@ -167,14 +180,21 @@ class ElevenLabsSynthesizer(VoiceSynthesizer):
                 print(
                     f"Text length ({len(text)} chars) within limit, synthesizing directly"
                 )
-                audio = self.client.text_to_speech.convert(
-                    voice_id=used_voice,
-                    text=text,
-                    model_id=model_id,
-                    voice_settings=voice_settings,
-                    output_format="mp3_44100_128",  # High quality output
+                audio = call_with_retries(
+                    self.rate_limiter,
+                    lambda: b"".join(
+                        self.client.text_to_speech.convert(
+                            voice_id=used_voice,
+                            text=text,
+                            model_id=model_id,
+                            voice_settings=voice_settings,
+                            output_format="mp3_44100_128",  # High quality output
+                            request_options={"max_retries": 0},
+                        )
+                    ),
+                    label="synthesis",
                 )
-                audio_chunks.append(audio)
+                audio_chunks.append([audio])
             else:
                 # Split text into chunks
                 chunks = self._split_text_into_chunks(text, max_chars)
@@ -187,61 +207,37 @@ class ElevenLabsSynthesizer(VoiceSynthesizer):
 
                 for i, chunk in enumerate(chunks):
                     print(f"Synthesizing chunk {i+1}/{len(chunks)}...")
-                    # Add retry logic for timeous
-                    max_retries = 3
-                    for attempt in range(max_retries):
-                        try:
-                            # Use with_raw_response to get request-id from headers
-                            with self.client.text_to_speech.with_raw_response.convert(
-                                voice_id=used_voice,
-                                text=chunk,
-                                model_id=model_id,
-                                voice_settings=voice_settings,
-                                output_format="mp3_44100_128",  # High quality output
-                                previous_request_ids=request_ids[-3:] if model != "flash" else None,  # Max 3 IDs
-                            ) as response:
-                                # Extract request-id from headers for stitching
-                                request_id = response._response.headers.get(
-                                    "request-id"
-                                )
-                                if request_id:
-                                    request_ids.append(request_id)
-                                    print(
-                                        f"✅ Chunk {i+1} generated with request-id: {request_id}"
-                                    )
-                                else:
-                                    print(f"⚠️  No request-id received for chunk {i+1}")
-                                # Get audio data from response and create iterable wrapper
-                                audio_data = response.data
-                                audio_chunks.append(audio_data)
-                            break
-                        except Exception as e:
-                            error_msg = str(e).lower()
-                            if "timeout" in error_msg or "timed out" in error_msg:
-                                if attempt < max_retries - 1:
-                                    wait_time = 10 * (
-                                        attempt + 1
-                                    )  # Longer wait for timeouts: 10, 20, 30 seconds
-                                    print(
-                                        f"Timeout on attempt {attempt + 1}, waiting {wait_time}s before retry..."
-                                    )
-                                    time.sleep(wait_time)
-                                else:
-                                    print(
-                                        f"❌ Failed after {max_retries} timeout attempts"
-                                    )
-                                    raise e
-                            else:
-                                # Non-timeout errors, fail immediately
-                                print(f"❌ Non-timeout error: {str(e)[:100]}...")
-                                raise e
-
-                    # Add delay between chunks to avoid rate limiting
-                    # (shorter delay for flash model, longer for quality models)
-                    if i < len(chunks) - 1:
-                        delay = 2 if model == "flash" else 5
-                        print(f"Waiting {delay} seconds before next chunk...")
-                        time.sleep(delay)
+                    # Retries and pacing come from the shared rate limiter
+                    def request():
+                        # Use with_raw_response to get request-id from headers
+                        with self.client.text_to_speech.with_raw_response.convert(
+                            voice_id=used_voice,
+                            text=chunk,
+                            model_id=model_id,
+                            voice_settings=voice_settings,
+                            output_format="mp3_44100_128",  # High quality output
+                            previous_request_ids=request_ids[-3:] if model != "flash" else None,  # Max 3 IDs
+                            request_options={"max_retries": 0},
+                        ) as response:
+                            # Read the audio inside the retried call so a dropped
+                            # stream is retried as well
+                            return (
+                                response._response.headers.get("request-id"),
+                                b"".join(response.data),
+                            )
+
+                    request_id, audio_data = call_with_retries(
+                        self.rate_limiter, request, label=f"chunk {i+1}"
+                    )
+                    # Extract request-id from headers for stitching
+                    if request_id:
+                        request_ids.append(request_id)
+                        print(
+                            f"✅ Chunk {i+1} generated with request-id: {request_id}"
+                        )
+                    else:
+                        print(f"⚠️  No request-id received for chunk {i+1}")
+                    audio_chunks.append([audio_data])
 
                 # Log stitching summary
                 if len(request_ids) > 1:
@@ -304,6 +300,8 @@ class CartesiaSynthesizer(VoiceSynthesizer):
         if not CARTESIA_API_KEY:
             raise ValueError("CARTESIA_API_KEY not found in environment")
         self.api_key = CARTESIA_API_KEY
+        self.rate_limiter = get_rate_limiter("cartesia", self.api_key)
+        self.session = get_requests_session("cartesia")
 
     def synthesize(
         self,
@@ -332,9 +330,19 @@ class CartesiaSynthesizer(VoiceSynthesizer):
             }
 
             # Note: This is a placeholder URL - replace with actual Cartesia endpoint
-            response = requests.post(
-                "https://api.cartesia.ai/tts/stream", headers=headers, json=data
-            )
+            def request():
+                response = self.session.post(
+                    "https://api.cartesia.ai/tts/stream",
+                    headers=headers,
+                    json=data,
+                    timeout=request_timeout(),
+                )
+                # Raise on 429/5xx so the retry policy can back off
+                if response.status_code == 429 or response.status_code >= 500:
+                    response.raise_for_status()
+                return response
+
+            response = call_with_retries(self.rate_limiter, request, label="Cartesia")
 
             if response.status_code == 200:
                 output_path.parent.mkdir(parents=True, exist_ok=True)